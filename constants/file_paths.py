@@ -89,6 +89,13 @@ class GraphQLSettings:
             config = json.load(json_content)
         return config.get('graphql_endpoint', '')
 
+    @staticmethod
+    def persisted_queries_enabled() -> bool:
+        """Opt-in automatic persisted queries (send query hash, full text only on cache miss)."""
+        with open(ConfigPaths.CONFIG, "r", encoding="utf-8") as json_content:
+            config = json.load(json_content)
+        return bool(config.get('persisted_queries', False))
+
 
 
 
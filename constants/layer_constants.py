@@ -19,4 +19,9 @@ SHP_LAYER_SUFFIX = "_shp"
 GEOPACKAGE_EXTENSION = ".gpkg"
 GEOPACKAGE_DRIVER = "GPKG"
 
+# Shapefile import modes: in-memory copy or streamed into an on-disk GeoPackage
+SHP_IMPORT_MODE_MEMORY = "memory"
+SHP_IMPORT_MODE_GEOPACKAGE = "geopackage"
 
+# Attribute columns indexed in GeoPackage imports (cadastral number, county, municipality, settlement)
+IMPORT_INDEXED_FIELDS = ("tunnus", "mk_nimi", "ov_nimi", "ay_nimi")
@@ -11,22 +11,25 @@ This engine provides comprehensive layer management services including:
 """
 
 import os
-from typing import Optional, List
+import sqlite3
+from contextlib import closing
+from typing import Callable, Optional, List
 from qgis.core import (
     QgsProject, QgsVectorLayer, QgsLayerTreeGroup,
     QgsVectorFileWriter, QgsCoordinateReferenceSystem, QgsFields,
-    Qgis
+    QgsApplication, QgsCoordinateTransformContext, QgsFeatureSink, QgsWkbTypes, Qgis
 )
-from qgis.PyQt.QtWidgets import QFileDialog, QWidget
-from qgis.PyQt.QtCore import QTimer, QCoreApplication
+from qgis.PyQt.QtWidgets import QFileDialog
 from qgis.PyQt.QtXml import QDomDocument
 
 # Local imports
 from ..constants.file_paths import QmlPaths
 
-from ..constants.layer_constants import DEFAULT_CRS, GEOPACKAGE_EXTENSION, GEOPACKAGE_DRIVER
+from ..constants.layer_constants import (
+    DEFAULT_CRS, GEOPACKAGE_EXTENSION, GEOPACKAGE_DRIVER, IMPORT_INDEXED_FIELDS
+)
 # Prefer module-level imports for clarity. Kept here to avoid accidental circular imports when possible.
-from ..widgets.ProgressDialogModern import ProgressDialogModern
+from ..Logs.python_fail_logger import PythonFailLogger
 from ..utils.messagesHelper import ModernMessageDialog
 
 # Global layer engine instance
@@ -56,6 +59,7 @@ class LayerCreationEngine:
     - Persisting layers to GeoPackage
     - Copying virtual layers for properties
     - Importing Shapefile data to memory layers with batch processing
+    - Streaming Shapefile data into on-disk GeoPackage layers
     """
 
     def __init__(self):
@@ -267,6 +271,34 @@ class LayerCreationEngine:
         Returns:
             Optional[str]: Name of created layer or None if failed
         """
+        group = self._resolve_target_group(group_name)
+
+        # Create memory layer
+        memory_layer = self.create_memory_layer_from_template(
+            new_layer_name, template_layer
+        )
+        print(f"[LayerCreationEngine] Created memory layer: {memory_layer}")
+        if not memory_layer:
+            return None
+
+        # Add to group
+        group.addLayer(memory_layer)
+
+        # Apply default QML style for property layers
+        self.apply_qml_style(memory_layer, QmlPaths.MAAMET_IMPORT)
+
+        return memory_layer
+
+    def _resolve_target_group(self, group_name: str) -> QgsLayerTreeGroup:
+        """
+        Resolve a layer tree group by name, nesting Mailabl subgroups under the main group.
+
+        Args:
+            group_name: Target group name (can be main group or subgroup)
+
+        Returns:
+            QgsLayerTreeGroup: Existing or newly created group
+        """
         # Check if the requested group is one of the Mailabl subgroups
         mailabl_subgroups = [
             MailablGroupFolders.NEW_PROPERTIES,
@@ -294,21 +326,7 @@ class LayerCreationEngine:
                 # Create as a top-level group
                 group = self.get_or_create_group(group_name)
 
-        # Create memory layer
-        memory_layer = self.create_memory_layer_from_template(
-            new_layer_name, template_layer
-        )
-        print(f"[LayerCreationEngine] Created memory layer: {memory_layer}")
-        if not memory_layer:
-            return None
-
-        # Add to group
-        group.addLayer(memory_layer)
-
-        # Apply default QML style for property layers
-        self.apply_qml_style(memory_layer, QmlPaths.MAAMET_IMPORT)
-
-        return memory_layer
+        return group
 
     def save_memory_layer_to_geopackage(
         self,
@@ -560,191 +578,319 @@ class LayerCreationEngine:
         else:
             return False
 
-    def import_shapefile_to_memory_layer(
-        self,
-        shp_layer: QgsVectorLayer,
+    @classmethod
+    def write_geopackage(
+        cls,
+        source_layer: QgsVectorLayer,
+        part_path: str,
         layer_name: str,
-        group_name: str,
-        parent_widget: Optional['QWidget'] = None,
         batch_size: Optional[int] = None,
-        progress_update_interval: Optional[int] = None,
-    ) -> Optional[QgsVectorLayer]:
+        on_progress: Optional[Callable[[int, int], bool]] = None,
+        transform_context: Optional[QgsCoordinateTransformContext] = None,
+    ) -> Optional[int]:
         """
-        Import Shapefile data to a new memory layer with optimized batch processing.
+        Write all source features into a new GeoPackage file with spatial and attribute indexes.
+
+        Touches no project or widget state, so it may run off the UI thread.
 
         Args:
-            shp_layer: Source Shapefile layer
-            layer_name: Name for the new memory layer
-            group_name: Target group name
-            parent_widget: Optional parent widget for progress dialog
+            source_layer: Layer to read features from
+            part_path: GeoPackage file to create (overwritten if present)
+            layer_name: Table (layer) name inside the GeoPackage
+            batch_size: Features per writer batch
+            on_progress: Called as on_progress(features_read, features_written);
+                returning False cancels the write
+            transform_context: Transform context to write with; pass the project's
+                from the main thread when running in a task
 
         Returns:
-            Optional[QgsVectorLayer]: Created memory layer or None if failed
+            Optional[int]: Features written, or None if failed or cancelled (the file is removed)
         """
-        memory_layer_name = f"{layer_name}_memory"
-
-        print(f"[LayerCreationEngine] Import start: layer={layer_name}, group={group_name}")
+        cls.discard_file(part_path)
+        batch_size = batch_size if batch_size and batch_size > 0 else 5000
 
-        # Create memory layer with correct structure using existing method
-        result = self.copy_virtual_layer_for_properties(
-            memory_layer_name,
-            group_name,
-            shp_layer
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = GEOPACKAGE_DRIVER
+        options.layerName = layer_name
+        options.layerOptions = ["SPATIAL_INDEX=YES"]
+        options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteFile
+
+        writer = QgsVectorFileWriter.create(
+            part_path,
+            source_layer.fields(),
+            source_layer.wkbType(),
+            source_layer.crs(),
+            transform_context or QgsProject.instance().transformContext(),
+            options,
         )
-        print(f"[LayerCreationEngine] Memory layer creation result: {result}")
-        if result== None:
-            return None
-
-        # Get the created memory layer
-        memory_layer = None
-        for layer in self.project.mapLayers().values():
-            if layer.name() == memory_layer_name:
-                memory_layer = layer
-                break
+        features_added = 0
+        completed = False
+        try:
+            if writer.hasError() != QgsVectorFileWriter.NoError:
+                PythonFailLogger.log(
+                    "gpkg_writer_failed", module="property", extra={"layer": layer_name, "error": writer.errorMessage()}
+                )
+                return None
 
-        if not memory_layer:
-            return None
+            features_batch = []
+            for i, feature in enumerate(source_layer.getFeatures()):
+                features_batch.append(feature)
 
-        # Validate it's a memory layer
-        if memory_layer.providerType() != "memory":
-            return None
+                if len(features_batch) >= batch_size:
+                    if not writer.addFeatures(features_batch, QgsFeatureSink.FastInsert):
+                        PythonFailLogger.log(
+                            "gpkg_write_batch_failed",
+                            module="property",
+                            extra={"layer": layer_name, "error": writer.errorMessage()},
+                        )
+                        return None
+                    features_added += len(features_batch)
+                    features_batch.clear()
 
-        # Get total feature count
-        total_features = shp_layer.featureCount()
+                if on_progress and not on_progress(i + 1, features_added):
+                    PythonFailLogger.log("gpkg_import_cancelled", module="property", extra={"layer": layer_name})
+                    return None
 
-        print(f"[LayerCreationEngine] Source features: {total_features}")
+            if features_batch:
+                if not writer.addFeatures(features_batch, QgsFeatureSink.FastInsert):
+                    PythonFailLogger.log(
+                        "gpkg_write_batch_failed",
+                        module="property",
+                        extra={"layer": layer_name, "error": writer.errorMessage(), "final": True},
+                    )
+                    return None
+                features_added += len(features_batch)
+                features_batch.clear()
+
+            # Closing the writer commits the data and builds the spatial index
+            del writer
+            writer = None
+            cls._create_attribute_indexes(part_path, layer_name, source_layer.fields().names())
+            completed = True
+            return features_added
+        except Exception as e:
+            PythonFailLogger.log_exception(e, module="property", event="gpkg_write_failed", extra={"layer": layer_name})
+            return None
+        finally:
+            if writer is not None:
+                del writer
+            if not completed:
+                cls.discard_file(part_path)
 
-        if total_features == 0:
-            # No features to import, just finalize
-            memory_layer.updateExtents()
-            return memory_layer
+    def install_geopackage(
+        self,
+        part_path: str,
+        file_path: str,
+        layer_name: str,
+        group_name: str,
+    ) -> Optional[QgsVectorLayer]:
+        """
+        Move a finished GeoPackage into place and load its layer into the target group.
 
-        # Create progress dialog
-        progress = None
-        progress_title = "Importing Shapefile" 
-        progress = ProgressDialogModern(
-            title=progress_title,
-            maximum=total_features,
-            parent=parent_widget,
-        )
-        progress.show()
-        print("[LayerCreationEngine] Progress dialog created")
-        # Get data provider for batch operations
-        provider = memory_layer.dataProvider()
-        if not provider:
-            print("[LayerCreationEngine] No data provider for memory layer")
-            return None
+        Layers still reading a previous import are removed only once the new layer
+        has loaded, so a failed swap never loses the old data. When the previous file
+        is still held open (the OGR connection pool on Windows) and cannot be replaced,
+        the import is installed under a fresh sibling name instead.
 
-        # Disable undo stack for bulk operations (still useful for memory management)
-        original_undo_stack = memory_layer.undoStack()
-        if original_undo_stack:
-            memory_layer.setUndoStack(None)
+        Args:
+            part_path: GeoPackage written by write_geopackage
+            file_path: Final GeoPackage path (replaced if present)
+            layer_name: Table (layer) name inside the GeoPackage
+            group_name: Target group name
 
-        # For memory layers, we don't need edit mode since we use provider.addFeatures() directly
+        Returns:
+            Optional[QgsVectorLayer]: Loaded GeoPackage layer or None if failed
+        """
+        target_path = file_path
+        try:
+            os.replace(part_path, target_path)
+        except OSError as e:
+            target_path = self._free_sibling_path(file_path)
+            PythonFailLogger.log_exception(
+                e,
+                module="property",
+                event="gpkg_replace_in_use",
+                extra={"file": file_path, "fallback": target_path},
+            )
+            try:
+                os.replace(part_path, target_path)
+            except OSError as fallback_error:
+                PythonFailLogger.log_exception(
+                    fallback_error, module="property", event="gpkg_install_failed", extra={"file": target_path}
+                )
+                self.discard_file(part_path)
+                return None
 
-        # Batch processing setup - configurable for different environments
-        batch_size = batch_size if batch_size and batch_size > 0 else 5000
-        features_added = 0
-        progress_update_interval = progress_update_interval if progress_update_interval and progress_update_interval > 0 else 2000
+        gpkg_layer = QgsVectorLayer(f"{target_path}|layername={layer_name}", layer_name, "ogr")
+        if not gpkg_layer.isValid():
+            PythonFailLogger.log("gpkg_layer_invalid", module="property", extra={"file": target_path, "layer": layer_name})
+            return None
 
-        print(f"[LayerCreationEngine] Using batch_size={batch_size}, progress_interval={progress_update_interval}")
+        stale_ids = [
+            layer.id()
+            for layer in self.project.mapLayers().values()
+            if self._is_import_file(layer.source().split("|", 1)[0], file_path)
+        ]
+        if stale_ids:
+            self.project.removeMapLayers(stale_ids)
+
+        self.project.addMapLayer(gpkg_layer, False)
+        self._resolve_target_group(group_name).addLayer(gpkg_layer)
+        self.apply_qml_style(gpkg_layer, QmlPaths.MAAMET_IMPORT)
+        return gpkg_layer
+
+    @staticmethod
+    def _free_sibling_path(file_path: str) -> str:
+        """First ``<stem>-<n><ext>`` next to ``file_path`` that does not exist yet."""
+        stem, extension = os.path.splitext(file_path)
+        index = 1
+        while os.path.exists(f"{stem}-{index}{extension}"):
+            index += 1
+        return f"{stem}-{index}{extension}"
+
+    @staticmethod
+    def _is_import_file(source: str, file_path: str) -> bool:
+        """True for ``file_path`` itself or one of its ``_free_sibling_path`` fallbacks."""
+        source = os.path.normcase(os.path.abspath(source))
+        stem, extension = os.path.splitext(os.path.normcase(os.path.abspath(file_path)))
+        if source == stem + extension:
+            return True
+        suffix = source[len(stem) + 1:-len(extension)] if source.endswith(extension) else ""
+        return source.startswith(stem + "-") and suffix.isdigit()
 
-        # Disable signals during bulk operations for maximum performance
-        memory_layer.blockSignals(True)
-        try:
-            features_batch = []
+    @staticmethod
+    def build_memory_copy(
+        source_layer: QgsVectorLayer,
+        layer_name: str,
+        batch_size: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], bool]] = None,
+    ) -> Optional[QgsVectorLayer]:
+        """
+        Copy all source features into a new memory layer that is not yet part of the project.
 
-            for i, feature in enumerate(shp_layer.getFeatures()):
-                features_batch.append(feature)
+        Touches no project or widget state, so it may run off the UI thread.
 
-                # Process batch when it reaches the limit
-                if len(features_batch) >= batch_size:
-                    success = provider.addFeatures(features_batch)
-                    if success:
-                        features_added += len(features_batch)
-                        features_batch.clear()  # More efficient than reassigning []
-                    else:
-                        print(f"Error: Failed to add features batch of size {len(features_batch)}")
-                        memory_layer.blockSignals(False)  # Re-enable signals on error
-                        return None
+        Args:
+            source_layer: Layer to read features from
+            layer_name: Name for the memory layer
+            batch_size: Features per provider batch
+            on_progress: Called as on_progress(features_read, features_copied);
+                returning False cancels the copy
 
-                # Update progress very infrequently to minimize overhead
-                if i % progress_update_interval == 0 or i == total_features - 1:
-                    if progress:
-                        progress_pct = int((i + 1) / total_features * 100)
-                        progress.update(
-                            value=i + 1,
-                            text1=f"Processing features: {i + 1}/{total_features} ({progress_pct}%)",
-                            text2=f"Features copied: {features_added}"
-                        )
-                        QCoreApplication.processEvents()
+        Returns:
+            Optional[QgsVectorLayer]: Filled memory layer, or None if failed or cancelled
+        """
+        batch_size = batch_size if batch_size and batch_size > 0 else 5000
+        geometry_type = QgsWkbTypes.displayString(source_layer.wkbType())
+        memory_layer = QgsVectorLayer(
+            f"{geometry_type}?crs={source_layer.crs().authid() or DEFAULT_CRS}", layer_name, "memory"
+        )
+        if not memory_layer.isValid():
+            return None
+        provider = memory_layer.dataProvider()
+        provider.addAttributes(source_layer.fields())
+        memory_layer.updateFields()
 
-            # Flush remaining features
-            if features_batch:
-                success = provider.addFeatures(features_batch)
-                if not success:
-                    print(f"Error: Failed to flush final features batch of size {len(features_batch)}")
-                    memory_layer.blockSignals(False)  # Re-enable signals on error
+        features_added = 0
+        features_batch = []
+        for i, feature in enumerate(source_layer.getFeatures()):
+            features_batch.append(feature)
+            if len(features_batch) >= batch_size:
+                if not provider.addFeatures(features_batch):
+                    PythonFailLogger.log(
+                        "memory_copy_batch_failed", module="property", extra={"layer": layer_name, "batch": len(features_batch)}
+                    )
                     return None
                 features_added += len(features_batch)
+                features_batch.clear()
+            if on_progress and not on_progress(i + 1, features_added):
+                return None
+
+        if features_batch:
+            if not provider.addFeatures(features_batch):
+                PythonFailLogger.log(
+                    "memory_copy_batch_failed",
+                    module="property",
+                    extra={"layer": layer_name, "batch": len(features_batch), "final": True},
+                )
+                return None
+            features_added += len(features_batch)
 
-            print(f"[LayerCreationEngine] Features imported: {features_added}")
+        memory_layer.updateExtents()
+        provider.createSpatialIndex()
+        return memory_layer
 
-            # Update progress to indicate finalization (reuse progress UI instead of a separate dialog)
-            if progress:
-                final_touches_text = "Adding final touches..." if not self.lang_manager else \
-                    (self.lang_manager.translate("Adding final touches...") or "Adding final touches...")
-                progress.update(
-                    value=total_features,
-                    text1=final_touches_text,
-                    text2=f"Features copied: {features_added}"
-                )
-                QCoreApplication.processEvents()
+    def install_memory_layer(self, memory_layer: QgsVectorLayer, group_name: str) -> QgsVectorLayer:
+        """
+        Add a memory layer built by build_memory_copy to the project and target group.
 
-            memory_layer.updateExtents()
+        Existing memory layers with the same name are replaced.
 
-            provider.createSpatialIndex()
+        Args:
+            memory_layer: Layer to add
+            group_name: Target group name
 
-            style_path = QmlPaths.MAAMET_IMPORT
-            memory_layer.loadNamedStyle(style_path)
-            print(f"[LayerCreationEngine] Style applied: {style_path}")
+        Returns:
+            QgsVectorLayer: The added layer
+        """
+        for layer in self.project.mapLayersByName(memory_layer.name()):
+            if layer.providerType() == 'memory':
+                self.project.removeMapLayer(layer.id())
+        self.project.addMapLayer(memory_layer, False)
+        self._resolve_target_group(group_name).addLayer(memory_layer)
+        self.apply_qml_style(memory_layer, QmlPaths.MAAMET_IMPORT)
+        return memory_layer
 
-            if progress:
-                complete_text = "Import complete!" if not self.lang_manager else \
-                    (self.lang_manager.translate("Import complete!") or "Import complete!")
-                progress.update(
-                    value=total_features,
-                    text1=complete_text,
-                    text2=f"{features_added} features imported"
-                )
-                # Close progress after a short delay to let user see the final state
-                QTimer.singleShot(1200, lambda: progress.close())
+    def default_import_path(self, layer_name: str) -> str:
+        """
+        Default GeoPackage location for imports: next to the project file, else the QGIS profile.
 
-            # Restore undo stack
-            if original_undo_stack:
-                try:
-                    memory_layer.setUndoStack(original_undo_stack)
-                    print("Undo stack restored successfully")
-                except Exception as e:
-                    print(f"Warning: Failed to restore undo stack: {e}")
+        Args:
+            layer_name: Imported layer name used as the file name
 
-            return memory_layer
+        Returns:
+            str: Absolute GeoPackage file path
+        """
+        folder = self.project.homePath()
+        if not folder:
+            folder = os.path.join(QgsApplication.qgisSettingsDirPath(), "kavitro", "imports")
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, f"{layer_name}{GEOPACKAGE_EXTENSION}")
 
-        except Exception as e:
-            print(f"Unexpected error during Shapefile import: {e}")
-            import traceback
-            traceback.print_exc()
-            # Close any open progress dialog on unexpected error
-            if progress:
-                progress.close()
-            return None
-        finally:
-            # Always restore signals and undo stack
-            memory_layer.blockSignals(False)
-            if original_undo_stack:
-                memory_layer.setUndoStack(original_undo_stack)
-            if progress:
-                progress.close()
+    @staticmethod
+    def _create_attribute_indexes(file_path: str, table_name: str, field_names: List[str]) -> None:
+        """
+        Create indexes on the lookup columns of an imported GeoPackage table.
+
+        Args:
+            file_path: GeoPackage file path
+            table_name: Table (layer) name inside the GeoPackage
+            field_names: Field names of the imported layer
+        """
+        by_lower = {name.lower(): name for name in field_names}
+
+        def quote(identifier: str) -> str:
+            return '"' + identifier.replace('"', '""') + '"'
+
+        with closing(sqlite3.connect(file_path)) as conn, conn:
+            for wanted in IMPORT_INDEXED_FIELDS:
+                column = by_lower.get(wanted)
+                if not column:
+                    continue
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {quote(f'idx_{table_name}_{wanted}')} "
+                    f"ON {quote(table_name)} ({quote(column)})"
+                )
+
+    @staticmethod
+    def discard_file(file_path: str) -> None:
+        """Remove a (partial) GeoPackage file and its SQLite side files, if present."""
+        for path in (file_path, f"{file_path}-wal", f"{file_path}-shm", f"{file_path}-journal"):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                PythonFailLogger.log_exception(e, module="property", event="gpkg_discard_failed", extra={"path": path})
 
 def get_layer_engine() -> LayerCreationEngine:
     """
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Background Shapefile import for Mailabl QGIS Plugin
+
+Runs the feature copy of a Shapefile import as a QgsTask so the map canvas
+stays usable. The task reads from its own, detached copy of the source and
+builds the target (memory layer or GeoPackage side file) outside the project;
+only ``finished`` - which QGIS runs on the main thread - touches the layer tree.
+A cancelled or failed import therefore leaves nothing behind.
+"""
+
+from typing import Optional
+
+from qgis.core import QgsApplication, QgsTask, QgsVectorLayer
+from qgis.PyQt.QtCore import pyqtSignal
+
+from ..constants.layer_constants import MEMORY_LAYER_SUFFIX, SHP_IMPORT_MODE_GEOPACKAGE
+from ..Logs.python_fail_logger import PythonFailLogger
+from .LayerCreationEngine import get_layer_engine
+
+
+class ShapefileImportTask(QgsTask):
+    """
+    Copy a Shapefile into a memory layer or an on-disk GeoPackage in the background.
+
+    Signals (emitted on the main thread):
+        imported(QgsVectorLayer): import finished and the layer is in the project
+        failed(bool): import did not complete; True when it was cancelled
+        featuresProcessed(int, int): features read so far and the source total
+    """
+
+    imported = pyqtSignal(object)
+    failed = pyqtSignal(bool)
+    featuresProcessed = pyqtSignal(int, int)
+
+    # QgsTaskManager holds no Python reference; keep running tasks alive here.
+    _active: set = set()
+
+    def __init__(
+        self,
+        source_path: str,
+        layer_name: str,
+        group_name: str,
+        import_mode: str,
+        gpkg_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            source_path: Shapefile path; the task opens its own layer on it
+            layer_name: Name for the imported layer
+            group_name: Target group name
+            import_mode: SHP_IMPORT_MODE_MEMORY or SHP_IMPORT_MODE_GEOPACKAGE
+            gpkg_path: Optional GeoPackage target (GeoPackage mode only)
+            batch_size: Features per write batch
+        """
+        super().__init__(f"Importing Shapefile: {layer_name}", QgsTask.CanCancel)
+        self.source_path = source_path
+        self.layer_name = layer_name
+        self.group_name = group_name
+        self.import_mode = import_mode
+        self.batch_size = batch_size
+        self.engine = get_layer_engine()
+        self.gpkg_path = gpkg_path
+        if import_mode == SHP_IMPORT_MODE_GEOPACKAGE and not gpkg_path:
+            self.gpkg_path = self.engine.default_import_path(layer_name)
+        self.transform_context = self.engine.project.transformContext()
+        self.total_features = 0
+        self.features_written = 0
+        self._memory_layer: Optional[QgsVectorLayer] = None
+        self._error: Optional[Exception] = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """True while an import task is queued or running."""
+        return bool(cls._active)
+
+    def start(self) -> "ShapefileImportTask":
+        """Queue the task in the QGIS task manager."""
+        ShapefileImportTask._active.add(self)
+        QgsApplication.taskManager().addTask(self)
+        return self
+
+    def run(self) -> bool:
+        """Worker thread: copy features; never touches the project."""
+        try:
+            # Detached source: a fresh provider, independent of any layer the UI holds
+            source = QgsVectorLayer(self.source_path, self.layer_name, "ogr")
+            if not source.isValid():
+                return False
+            self.total_features = max(int(source.featureCount()), 0)
+            report_every = max(1, self.total_features // 200)
+
+            def on_progress(done: int, written: int) -> bool:
+                self.features_written = written
+                if done % report_every == 0 or done == self.total_features:
+                    if self.total_features:
+                        self.setProgress(done * 100.0 / self.total_features)
+                    self.featuresProcessed.emit(done, self.total_features)
+                return not self.isCanceled()
+
+            if self.import_mode == SHP_IMPORT_MODE_GEOPACKAGE:
+                written = self.engine.write_geopackage(
+                    source,
+                    self._part_path(),
+                    self.layer_name,
+                    batch_size=self.batch_size,
+                    on_progress=on_progress,
+                    transform_context=self.transform_context,
+                )
+                if written is None:
+                    return False
+                self.features_written = written
+                return not self.isCanceled()
+
+            memory_layer = self.engine.build_memory_copy(
+                source,
+                f"{self.layer_name}{MEMORY_LAYER_SUFFIX}",
+                batch_size=self.batch_size,
+                on_progress=on_progress,
+            )
+            if memory_layer is None or self.isCanceled():
+                return False
+            self.features_written = memory_layer.featureCount()
+            # Hand the layer's QObject over to the main thread before finished() adds it
+            memory_layer.moveToThread(QgsApplication.instance().thread())
+            self._memory_layer = memory_layer
+            return True
+        except Exception as exc:
+            self._error = exc
+            return False
+
+    def finished(self, result: bool) -> None:
+        """Main thread: insert the result into the layer tree, or discard it."""
+        ShapefileImportTask._active.discard(self)
+        layer = None
+        try:
+            if result and not self.isCanceled():
+                if self.import_mode == SHP_IMPORT_MODE_GEOPACKAGE:
+                    layer = self.engine.install_geopackage(
+                        self._part_path(), self.gpkg_path, self.layer_name, self.group_name
+                    )
+                elif self._memory_layer is not None:
+                    layer = self.engine.install_memory_layer(self._memory_layer, self.group_name)
+        except Exception as exc:
+            self._error = exc
+            layer = None
+        finally:
+            self._memory_layer = None
+            if layer is None and self.import_mode == SHP_IMPORT_MODE_GEOPACKAGE:
+                self.engine.discard_file(self._part_path())
+
+        if self._error is not None:
+            PythonFailLogger.log_exception(
+                self._error,
+                module="property",
+                event="shp_import_task_failed",
+                extra={"layer": self.layer_name, "mode": self.import_mode},
+            )
+        if layer is not None:
+            self.imported.emit(layer)
+        else:
+            self.failed.emit(self.isCanceled())
+
+    def _part_path(self) -> str:
+        return f"{self.gpkg_path}.part"
@@ -1,13 +1,33 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
 from ..python.api_client import APIClient
 from ..python.GraphQLQueryLoader import GraphQLQueryLoader
 from ..python.responses import JsonResponseHandler
+from ..python.feed_records import FeedItemRecord, FeedRecordDecoder
+from ..python.response_cache import ResponseCache
+from ..python.request_executor import RequestExecutor
 # from ..utils.logger import debug as log_debug
 from ..utils.api_error_handling import ApiErrorKind, parse_tagged_message
 from ..Logs.python_fail_logger import PythonFailLogger
 
+@dataclass
+class FeedFetch:
+    """One page request: snapshotted on the UI thread, filled in by ``run_fetch``."""
+
+    generation: int
+    single_item: bool
+    query: str
+    variables: Dict[str, Any]
+    payload: Optional[Dict[str, Any]] = None
+    records: List[FeedItemRecord] = field(default_factory=list)
+    end_cursor: Optional[str] = None
+    has_more: bool = False
+    total_count: Optional[int] = None
+    error: Optional[Exception] = None
+
+
 class UnifiedFeedLogic:
     """
     Ühtne GraphQL feed-loogika (paginatsioon + where), sobib Projects/Contracts jms.
@@ -57,6 +77,12 @@ class UnifiedFeedLogic:
         self.last_error_kind: Optional[ApiErrorKind] = None
         self.last_error_message: Optional[str] = None
         self.total_count: Optional[int] = None
+        # Bumped by reset(); a fetch that started under an older generation
+        # (e.g. on a worker thread before a filter change) must not touch
+        # pagination state when its response arrives.
+        self._generation: int = 0
+        # Called from a worker thread with records whose cached page content changed on revalidation.
+        self.on_revalidated: Optional[Callable[[List[FeedItemRecord]], None]] = None
 
     # --- Query mode management -------------------------------------------------
     def configure_single_item_query(self, query_name: str) -> None:
@@ -92,6 +118,8 @@ class UnifiedFeedLogic:
 
     def reset(self) -> None:
         """Reset pagination/loading flags without changing current 'where'."""
+        self._generation += 1
+        self.is_loading = False
         self.end_cursor = None
         self.has_more = True
         self.total_count = None
@@ -115,11 +143,19 @@ class UnifiedFeedLogic:
         self._extra_args = cleaned
         self.reset()
 
-    def fetch_next_batch(self) -> List[Dict[str, Any]]:
+    def fetch_next_batch(self) -> List[FeedItemRecord]:
+        """Synchronous begin_fetch + run_fetch + finish_fetch, all on the calling thread."""
+        fetch = self.begin_fetch()
+        if fetch is None:
+            return []
+        return self.finish_fetch(self.run_fetch(fetch))
+
+    def begin_fetch(self) -> Optional[FeedFetch]:
+        """Claim the next page and snapshot its query. UI thread; None when there is nothing to fetch."""
         if self.is_loading or (not self.has_more and not self._single_item_mode):
             self.last_error_kind = None
             self.last_error_message = None
-            return []
+            return None
 
         self.is_loading = True
         self.last_error = None
@@ -154,23 +190,33 @@ class UnifiedFeedLogic:
                 self._base_query_name,
             )
 
+        return FeedFetch(
+            generation=self._generation,
+            single_item=self._single_item_mode,
+            query=self.query,
+            variables=variables,
+        )
+
+    def run_fetch(self, fetch: FeedFetch) -> FeedFetch:
+        """Send the request and decode the page into ``fetch``. Safe on a worker thread:
+        pagination and error state are left for ``finish_fetch``."""
         try:
-            payload: Dict[str, Any] = self.api_client.send_query(
-                self.query,
-                variables,
-                return_raw=True,
-            ) or {}
-            #print(f"[FeedLogic] Fetch payload: {payload}")
-            # Debug logging for single-item mode removed after verification
-            self.last_response = payload
+            if fetch.single_item:
+                payload: Dict[str, Any] = self.api_client.send_query(
+                    fetch.query,
+                    fetch.variables,
+                    return_raw=True,
+                ) or {}
+            else:
+                payload = self._fetch_page_payload(fetch.query, fetch.variables)
+            fetch.payload = payload
 
             # In single-item mode, many queries return a single object
             # instead of an edges list. Handle that here and bypass the
             # generic edges/pageInfo logic so modules receive a list with
             # exactly one node (or an empty list if nothing was found).
-            if self._single_item_mode:
+            if fetch.single_item:
                 data = payload.get("data") or {}
-                #print(f"[FeedLogic] Single-item mode payload data: {data}")
                 single: Optional[Dict[str, Any]] = None
 
                 # Heuristic: look for common single-item roots by module.
@@ -199,18 +245,9 @@ class UnifiedFeedLogic:
                         single = value
                         break
 
-                if isinstance(single, dict):
-                    self.end_cursor = None
-                    self.has_more = False
-                    node = self.map_node(single) if self.map_node else single
-                    result = [node]
-                else:
-                    # No single object found; treat as empty result
-                    self.end_cursor = None
-                    self.has_more = False
-                    result = []
-
-                return result
+                # No single object found: an empty result. Either way there is no next page.
+                fetch.records = self._decode_nodes([single]) if isinstance(single, dict) else []
+                return fetch
 
             path = [self.root_field]
             root: Dict[str, Any] = JsonResponseHandler.walk_path(
@@ -219,62 +256,28 @@ class UnifiedFeedLogic:
             ) or {}
             edges: List[Dict[str, Any]] = JsonResponseHandler.get_edges_from_path(payload, path)
             page_info: Dict[str, Any] = JsonResponseHandler.get_page_info_from_path(payload, path)
-            #print(f"[FeedLogic] GraphQL pageInfo: {page_info}")
             # Prefer item totalCount on root if available; some APIs put page count in pageInfo.total
             root_total = root.get("totalCount") if isinstance(root, dict) else None
             page_total = page_info.get("total") if isinstance(page_info, dict) else None
-            self.total_count = root_total if root_total is not None else page_total
+            fetch.total_count = root_total if root_total is not None else page_total
+            fetch.end_cursor = page_info.get("endCursor") if isinstance(page_info, dict) else None
+            fetch.has_more = bool(page_info.get("hasNextPage", False)) if isinstance(page_info, dict) else False
 
-            # Heuristic: if total looks like a small number of pages (<= number of fetched pages) while
-            # we have already loaded more items than that number, invalidate it so UI can adapt.
-            try:
-                if isinstance(self.total_count, int):
-                    # pages_seen approximated by (loaded_items // batch_size) + 1
-                    loaded_items_guess = getattr(self, '_loaded_items_debug', 0)
-                    if loaded_items_guess == 0:
-                        loaded_items_guess = 0
-                    pages_seen = (loaded_items_guess // max(1, self.batch_size)) + 1 if loaded_items_guess else 1
-                    if self.total_count <= pages_seen and loaded_items_guess > self.total_count:
-                        # Mark unknown so counter can show only loaded or loaded+
-                        self.total_count = None
-            except Exception as exc:
-                PythonFailLogger.log_exception(
-                    exc,
-                    module=self._module_name,
-                    event="feed_total_count_heuristic_failed",
-                )
+            fetch.records = self._decode_nodes(
+                edge.get("node") for edge in edges if isinstance(edge, dict) and isinstance(edge.get("node"), dict)
+            )
+        except Exception as e:
+            fetch.error = e
+        return fetch
 
-            # In single-item mode we expect only one page; mark as finished.
-            if self._single_item_mode:
-                self.end_cursor = None
-                self.has_more = False
-            else:
-                self.end_cursor = page_info.get("endCursor") if isinstance(page_info, dict) else None
-                self.has_more = bool(page_info.get("hasNextPage", False)) if isinstance(page_info, dict) else False
-
-            result: List[Dict[str, Any]] = []
-            for edge in edges:
-                if not isinstance(edge, dict):
-                    continue
-                node = edge.get("node")
-                if not isinstance(node, dict):
-                    continue
-                result.append(self.map_node(node) if self.map_node else node)
-
-            # Track loaded items for heuristics
-            try:
-                prev = getattr(self, '_loaded_items_debug', 0)
-                setattr(self, '_loaded_items_debug', prev + len(result))
-            except Exception as exc:
-                PythonFailLogger.log_exception(
-                    exc,
-                    module=self._module_name,
-                    event="feed_loaded_items_debug_failed",
-                )
-            #print(f"[UnifiedFeedLogic] fetched {len(result)} items (has_more={self.has_more})")
-            return result
+    def finish_fetch(self, fetch: FeedFetch) -> List[FeedItemRecord]:
+        """Apply a fetched page to pagination and error state. UI thread; pages from before a reset are dropped."""
+        if fetch.generation != self._generation:
+            return []
+        self.is_loading = False
 
-        except Exception as e:
+        if fetch.error is not None:
+            e = fetch.error
             self.last_error = e
             try:
                 _kind, friendly = parse_tagged_message(e)
@@ -295,8 +298,87 @@ class UnifiedFeedLogic:
                 event="feed_fetch_failed",
             )
             return []
-        finally:
-            self.is_loading = False
+
+        self.last_response = fetch.payload
+        result = fetch.records
+        # In single-item mode we expect only one page; mark as finished.
+        if fetch.single_item:
+            self.end_cursor = None
+            self.has_more = False
+            return result
+
+        self.total_count = fetch.total_count
+        # Heuristic: if total looks like a small number of pages (<= number of fetched pages) while
+        # we have already loaded more items than that number, invalidate it so UI can adapt.
+        try:
+            if isinstance(self.total_count, int):
+                # pages_seen approximated by (loaded_items // batch_size) + 1
+                loaded_items_guess = getattr(self, '_loaded_items_debug', 0)
+                if loaded_items_guess == 0:
+                    loaded_items_guess = 0
+                pages_seen = (loaded_items_guess // max(1, self.batch_size)) + 1 if loaded_items_guess else 1
+                if self.total_count <= pages_seen and loaded_items_guess > self.total_count:
+                    # Mark unknown so counter can show only loaded or loaded+
+                    self.total_count = None
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module=self._module_name,
+                event="feed_total_count_heuristic_failed",
+            )
+
+        self.end_cursor = fetch.end_cursor
+        self.has_more = fetch.has_more
+
+        # Track loaded items for heuristics
+        try:
+            prev = getattr(self, '_loaded_items_debug', 0)
+            setattr(self, '_loaded_items_debug', prev + len(result))
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module=self._module_name,
+                event="feed_loaded_items_debug_failed",
+            )
+        return result
+
+    def _fetch_page_payload(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve list pages from ResponseCache; stale hits are returned and revalidated in the background."""
+        key = ResponseCache.make_key(self._module_name, self._base_query_name, variables)
+        cached = ResponseCache.get(key)
+        if cached is not None:
+            if not cached.fresh:
+                self._revalidate_page(key, query, variables, cached.payload)
+            return cached.payload
+
+        payload = self.api_client.send_query(query, variables, return_raw=True) or {}
+        ResponseCache.put(key, self._module_name, payload)
+        return payload
+
+    def _revalidate_page(self, key: str, query: str, variables: Dict[str, Any], cached_payload: Dict[str, Any]) -> None:
+        path = [self.root_field]
+
+        def _run() -> None:
+            try:
+                payload = self.api_client.send_query(query, variables, return_raw=True) or {}
+            except Exception as exc:
+                PythonFailLogger.log_exception(
+                    exc,
+                    module=self._module_name,
+                    event="feed_revalidate_failed",
+                )
+                return
+            ResponseCache.put(key, self._module_name, payload)
+            changed = ResponseCache.changed_nodes(cached_payload, payload, path)
+            callback = self.on_revalidated
+            if changed and callable(callback):
+                callback(self._decode_nodes(changed))
+
+        RequestExecutor.instance().submit(_run, priority=RequestExecutor.PRIORITY_LOW)
+
+    def _decode_nodes(self, nodes) -> List[FeedItemRecord]:
+        mapped = (self.map_node(node) if self.map_node else node for node in nodes)
+        return FeedRecordDecoder.decode_page(mapped)
 
     # Introspection
     def has_more_items(self) -> bool:
@@ -1,7 +1,8 @@
 from collections import deque
 
-from PyQt5.QtCore import QTimer, QCoreApplication
+from PyQt5.QtCore import QTimer
 from ..Logs.switch_logger import SwitchLogger
+from ..python.workers import FunctionWorker, start_worker
 
 
 class FeedLoadEngine:
@@ -13,12 +14,26 @@ class FeedLoadEngine:
     - Optional parent_ui attachment to cooperate with viewport fullness logic.
     - Safer initial insert (delegates "fill" decisions to UI, avoids runaway loops).
     - Keeps one fetch in flight; debounced scheduling remains intact.
+    - When fetch_batch/apply_batch are given, the network half runs on a worker
+      thread and the next page is prefetched while the current one drips in.
+      prepare_batch() runs on the UI thread first and its result is passed to
+      fetch_batch, so the worker never touches feed state.
     """
 
-    def __init__(self, load_next_batch, debounce_ms=80, progressive_insert_func=None, buffer_size=20):
+    def __init__(self, load_next_batch, debounce_ms=80, progressive_insert_func=None, buffer_size=20,
+                 fetch_batch=None, apply_batch=None, prepare_batch=None):
         # Core inputs
         self.load_next_batch = load_next_batch
         self.debounce_ms = debounce_ms
+        # Split loader: prepare_batch() and apply_batch(result) run on the UI thread,
+        # fetch_batch(request) between them on a worker
+        self.prepare_batch = prepare_batch
+        self.fetch_batch = fetch_batch
+        self.apply_batch = apply_batch
+
+        # Bumped on reset() so late worker results from a previous session are dropped
+        self._generation = 0
+        self._workers = set()
 
         # State flags
         self._load_pending = False
@@ -128,6 +143,9 @@ class FeedLoadEngine:
             return
         self._is_loading = True
     # Debug print removed
+        if callable(self.fetch_batch) and callable(self.apply_batch):
+            self._start_fetch_worker(token)
+            return
         if not callable(self.load_next_batch):
             raise TypeError(
                 "FeedLoadEngine: load_next_batch is not callable. Did you pass a valid function? Value: {}".format(self.load_next_batch)
@@ -140,6 +158,50 @@ class FeedLoadEngine:
         self._start_progressive_insert(token=token)
         self._is_loading = False
 
+    def _start_fetch_worker(self, token: int | None):
+        generation = self._generation
+        args = ()
+        if callable(self.prepare_batch):
+            request = self.prepare_batch()
+            if request is None:
+                self._on_batch_fetched(None, token, generation)
+                return
+            args = (request,)
+        worker = FunctionWorker(self.fetch_batch, *args)
+        self._workers.add(worker)
+        worker.finished.connect(
+            lambda items, t=token, g=generation, w=worker: self._on_batch_fetched(items, t, g, w)
+        )
+        worker.error.connect(
+            lambda message, t=token, g=generation, w=worker: self._on_batch_failed(message, t, g, w)
+        )
+        start_worker(worker)
+
+    def _on_batch_fetched(self, items, token: int | None, generation: int, worker=None):
+        self._workers.discard(worker)
+        if generation != self._generation:
+            SwitchLogger.log("feed_load_async_stale_generation")
+            return
+        self._is_loading = False
+        if not self._is_token_active(token):
+            SwitchLogger.log("feed_load_async_inactive_token")
+            return
+        new_items = self.apply_batch(items) or []
+        SwitchLogger.log("feed_load_async_done", extra={"count": len(new_items)})
+        if new_items:
+            self.buffer.extend(new_items)
+        self._start_progressive_insert(token=token)
+        # Pipeline: fetch page N+1 while page N is still dripping out of the buffer
+        if self.buffer and len(self.buffer) < self.buffer_size and self._upstream_has_more():
+            self.schedule_load()
+
+    def _on_batch_failed(self, message: str, token: int | None, generation: int, worker=None):
+        self._workers.discard(worker)
+        if generation != self._generation:
+            return
+        self._is_loading = False
+        SwitchLogger.log("feed_load_async_failed", extra={"error": str(message)})
+
     # -------------------- Buffer API --------------------
     def has_buffer(self) -> bool:
         return bool(self.buffer)
@@ -235,7 +297,6 @@ class FeedLoadEngine:
         finally:
             if ui:
                 ui._ignore_scroll_event = False
-        QCoreApplication.processEvents()
 
         # If buffer is low, we may prefetch; UI still governs when to render them
         if self._should_prefetch():
@@ -243,6 +304,7 @@ class FeedLoadEngine:
 
     # -------------------- Reset --------------------
     def reset(self):
+        self._generation += 1
         self._load_pending = False
         self._is_loading = False
         self.buffer.clear()
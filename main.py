@@ -22,6 +22,10 @@ from .utils.MapTools.MapHelpers import MapHelpers
 from .constants.layer_constants import IMPORT_PROPERTY_TAG
 from .ui.window_state.DialogCoordinator import get_dialog_coordinator
 from .constants.file_paths import ConfigPaths
+from .python.http_session import HttpSessionPool
+from .python.request_executor import RequestExecutor
+from .python.reference_cache import ReferenceCache
+from .python.reference_kinds import register_reference_kinds
 
 
 
@@ -47,6 +51,7 @@ class WildCodePlugin:
     def initGui(self):
         # Force final garbage collection
         gc.collect()
+        register_reference_kinds()
         icon_path = IconNames.KAVITRO_ICON
         
         plugin_title = ConfigPaths.PLUGIN_NAME or LanguageManager.translate_static(TranslationKeys.KAVITRO_PLUGIN_TITLE)
@@ -75,6 +80,8 @@ class WildCodePlugin:
                     pass
         finally:
             self.pluginDialog = None
+        RequestExecutor.shutdown_instance()
+        HttpSessionPool.close_all()
         gc.collect()
 
     def run(self):
@@ -215,6 +222,8 @@ class WildCodePlugin:
         else:
             self.pluginDialog = dlg
             self._show_existing_dialog(dlg)
+        # Revalidate the reference lists stored by earlier sessions in the background.
+        ReferenceCache.warm()
 
     def reset_login_dialog(self):
         self.loginDialog = None
@@ -1,50 +1,86 @@
 from __future__ import annotations
 
-from typing import List
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 import sip
 
+from ....constants.layer_constants import IMPORT_PROPERTY_TAG
 from ....utils.mapandproperties.PropertyTableManager import PropertyTableManager
-from .MainAddProperties import MainAddPropertiesFlow
+from ....utils.mapandproperties.property_feature_fetcher import PropertyFeatureFetcher
+from ....utils.MapTools.MapHelpers import MapHelpers
+from ....python.request_executor import CancellationToken, RequestExecutor
+from ....languages.language_manager import LanguageManager
+from .MainAddProperties import BackendPropertyVerifier, MainAddPropertiesFlow
 from ....Logs.python_fail_logger import PythonFailLogger
 
 
 class AddBatchRunner(QObject):
-    """Runs property adds in small batches on the UI thread.
+    """Runs property adds as a staged pipeline driven from the UI thread.
 
-    Keeps UI responsive by chunking work and scheduling the next batch via QTimer.
+    1. lookup: features are fetched by id in windows and each window is verified
+       against the backend with one bulk query, off the UI thread;
+    2. backend: creates/updates run on the shared RequestExecutor with at most
+       ``max_in_flight`` requests of this run at a time;
+    3. map: features to copy are inserted into the main layer in batches, one
+       commit per batch.
+
+    Stages hand over through bounded queues, so a slow stage holds back the
+    ones before it instead of buffering the whole run. Prompts (archived match,
+    copy to map, yes-to-all) are asked on the UI thread between stages 1 and 2.
     """
 
     progress = pyqtSignal(int, int, str, str)  # done, total, phase, last_tunnus
     finished = pyqtSignal(dict)  # {"canceled": bool, "done": int, "total": int}
+    # Emitted from executor threads when a request of this run completes; delivered queued on the UI thread.
+    _request_done = pyqtSignal()
 
     def __init__(
         self,
         table,
         *,
         use_filtered_rows: bool = False,
-        batch_size: int = 1,
-        rest_every: int = 25,
-        rest_ms: int = 1000,
+        lookup_size: int = 50,
+        max_in_flight: int = 4,
+        map_batch_size: int = 50,
+        poll_ms: int = 250,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._table = table
         self._use_filtered_rows = bool(use_filtered_rows)
-        self._batch_size = max(1, int(batch_size or 1))
-        self._rest_every = max(1, int(rest_every or 1))
-        self._rest_ms = max(0, int(rest_ms or 0))
+        self._lookup_size = max(1, int(lookup_size or 1))
+        self._max_in_flight = max(1, int(max_in_flight or 1))
+        self._map_batch_size = max(1, int(map_batch_size or 1))
+        self._poll_ms = max(1, int(poll_ms or 1))
+
+        # Stage inputs; each is bounded by the pump before it is refilled.
+        self._queue: Deque[int] = deque()
+        self._lookups: Deque[Tuple[List[dict], object]] = deque()  # (items, future of tunnus -> backend info)
+        self._to_plan: Deque[Tuple[dict, Optional[dict]]] = deque()
+        self._to_backend: Deque[dict] = deque()
+        self._in_flight: List[Tuple[dict, object]] = []
+        self._to_map: Deque[dict] = deque()
+        self._warmup = None  # future of the status-id preload; lookups wait for it
+
+        self._target_layer = None
+        self._map_muudet: dict = {}
+        self._claimed: set[str] = set()
+        self._lm = LanguageManager()
+        self._token = CancellationToken()
 
-        self._queue: List = []
         self._done = 0
         self._total = 0
+        self._last_tunnus = ""
         self._timer = QTimer(self)
         self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._tick)
+        self._timer.timeout.connect(self._pump)
+        self._request_done.connect(self._on_request_done)
         self._stop_requested = False
         self._paused = False
-        self._batches_processed = 0
+        self._pumping = False
+        self._finished_emitted = False
 
     def _dispose_timer(self) -> None:
         if sip.isdeleted(self):
@@ -83,129 +119,286 @@ class AddBatchRunner(QObject):
         MainAddPropertiesFlow.reset_yes_to_all_flags()
         mgr = PropertyTableManager()
         try:
+            # Queue feature ids only; the lookup stage fetches features window by window.
             if self._use_filtered_rows:
-                self._queue = list(mgr.get_all_features(self._table) or [])
+                fids = list(mgr.get_all_feature_ids(self._table) or [])
             else:
-                self._queue = list(mgr.get_selected_features(self._table) or [])
+                fids = list(mgr.get_selected_feature_ids(self._table) or [])
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
                 module="property",
                 event="add_batch_get_scope_failed",
             )
-            self._queue = []
+            fids = []
 
+        self._queue = deque(fids)
         self._total = len(self._queue)
         self._done = 0
-        self._batches_processed = 0
         self._stop_requested = False
         self._paused = False
 
         if not self._queue:
-            self.finished.emit({"canceled": False, "done": 0, "total": 0})
+            self._finish(canceled=False)
+            return
+
+        # Select the run's scope so the import-layer filter set by _prepare_layers keeps every queued id.
+        import_layer = MapHelpers.get_layer_by_tag(IMPORT_PROPERTY_TAG)
+        if import_layer is not None:
+            MapHelpers.select_features_by_ids(import_layer, fids)
+
+        layers = MainAddPropertiesFlow._prepare_layers()
+        import_layer, target_layer, archive_layer = layers if layers else (None, None, None)
+        if not import_layer or not target_layer or not archive_layer:
+            self._finish(canceled=True)
             return
+        self._target_layer = target_layer
+
+        # Preload backend status ids once for this run so lookups do not race to resolve them;
+        # it runs as the first executor task and the lookup stage starts when it completes.
+        self._warmup = RequestExecutor.instance().submit(BackendPropertyVerifier.warm_status_cache, token=self._token)
+        self._warmup.add_done_callback(self._notify_request_done)
 
         self.progress.emit(0, self._total, "starting", "")
-        self._timer.start(0)
+        self._schedule(0)
 
     def pause(self) -> None:
+        # In-flight requests still complete; their results wait in the stage queues.
         self._paused = True
 
     def resume(self) -> None:
         if not self._paused:
             return
         self._paused = False
-        if not self._timer.isActive():
-            self._timer.start(0)
+        self._schedule(0)
 
     def cancel(self) -> None:
+        """Stop feeding the pipeline.
+
+        Queued lookups and backend writes are dropped. Backend writes already
+        running are awaited and their map copies committed, so the main layer
+        stays in step with the backend.
+        """
         self._stop_requested = True
-        self._queue = []
+        self._paused = False
         MainAddPropertiesFlow.request_cancel()
+        self._token.cancel()
+        self._drop_pending()
+
+        if not self._in_flight and not self._pumping:
+            self._flush_map(force=True)
+            self._finish(canceled=True)
+            return
+        self._schedule(0)
+
+    # ------------------------------------------------------------------
+    def _drop_pending(self) -> None:
+        """Forget work that has not reached the backend yet."""
+        self._queue.clear()
+        self._lookups.clear()
+        self._to_plan.clear()
+        self._to_backend.clear()
+
+    def _schedule(self, delay_ms: int) -> None:
+        if sip.isdeleted(self) or self._timer is None or sip.isdeleted(self._timer):
+            return
+        if self._timer.isActive() and self._timer.remainingTime() <= delay_ms:
+            return
+        self._timer.start(delay_ms)
+
+    def _notify_request_done(self, _future) -> None:
+        # Executor thread: only hand over to the UI thread.
         try:
-            self._timer.stop()
-        except Exception as exc:
-            PythonFailLogger.log_exception(
-                exc,
-                module="property",
-                event="add_batch_timer_stop_failed",
-            )
+            if not sip.isdeleted(self):
+                self._request_done.emit()
+        except RuntimeError:
+            pass
+
+    def _on_request_done(self) -> None:
+        if not self._finished_emitted:
+            self._schedule(0)
+
+    def _finish(self, *, canceled: bool) -> None:
+        if self._finished_emitted:
+            return
+        self._finished_emitted = True
+        self._dispose_timer()
+        if not sip.isdeleted(self):
+            self.finished.emit({"canceled": bool(canceled), "done": self._done, "total": self._total})
+
+    def _advance(self, count: int, tunnus: str = "") -> None:
+        if count <= 0:
+            return
+        self._done += count
+        if tunnus:
+            self._last_tunnus = tunnus
+        if not sip.isdeleted(self):
+            self.progress.emit(self._done, self._total, "processing", self._last_tunnus)
 
+    def _pump(self) -> None:
+        if sip.isdeleted(self) or self._timer is None or self._finished_emitted:
+            return
+        if self._paused or self._pumping:
+            return
+
+        # Prompts open nested event loops; never re-enter the pump from them.
+        self._pumping = True
         try:
-            if self._timer is not None:
-                self._timer.timeout.disconnect()
+            if not self._stop_requested:
+                self._collect_lookups()
+                self._start_lookups()
+                self._plan_items()
+            self._collect_backend()
+            if self._stop_requested:
+                # Cancel may have arrived from inside a prompt while this pump was planning.
+                self._drop_pending()
+            else:
+                self._start_backend()
+            self._flush_map(force=self._upstream_idle())
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
                 module="property",
-                event="add_batch_timer_disconnect_failed",
+                event="add_batch_pipeline_failed",
             )
+            self.cancel()
+        finally:
+            self._pumping = False
 
-        # If no tick is pending, emit finished now so UI can unwind immediately.
-        if not self._timer.isActive():
-            self._dispose_timer()
-            if not sip.isdeleted(self):
-                self.finished.emit({"canceled": True, "done": self._done, "total": self._total})
-
-    # ------------------------------------------------------------------
-    def _tick(self) -> None:
-        if sip.isdeleted(self) or self._timer is None or sip.isdeleted(getattr(self, "_timer", None)):
+        if self._finished_emitted:
             return
-
-        if self._stop_requested:
-            self._dispose_timer()
-            if not sip.isdeleted(self):
-                self.finished.emit({"canceled": True, "done": self._done, "total": self._total})
+        if self._upstream_idle() and not self._to_map:
+            self._finish(canceled=self._stop_requested)
             return
-
         if self._paused:
-            # Stay idle until resumed.
             return
+        # Go again immediately while there is UI-side work; otherwise wait for a request to complete
+        # (the poll is only a fallback for a missed wake-up).
+        ready = bool(self._to_plan) and len(self._to_backend) < self._max_in_flight * 2
+        self._schedule(0 if ready else self._poll_ms)
 
-        if not self._queue:
-            self._dispose_timer()
-            if not sip.isdeleted(self):
-                self.finished.emit({"canceled": False, "done": self._done, "total": self._total})
+    def _upstream_idle(self) -> bool:
+        return not (self._queue or self._lookups or self._to_plan or self._to_backend or self._in_flight)
+
+    # --- Stage 1: bulk backend lookup ------------------------------------
+    def _start_lookups(self) -> None:
+        if self._warmup is not None and not self._warmup.done():
             return
+        # At most two windows ahead of the planner.
+        while self._queue and len(self._lookups) < 2 and len(self._to_plan) < self._lookup_size * 2:
+            window = [self._queue.popleft() for _ in range(min(self._lookup_size, len(self._queue)))]
+            features = PropertyFeatureFetcher.fetch(window)
+            # Ids that are no longer on the import layer are logged by the fetcher; count them as done.
+            self._advance(len(window) - len(features))
 
-        # Process one batch.
-        batch = self._queue[: self._batch_size]
-        self._queue = self._queue[self._batch_size :]
+            items = MainAddPropertiesFlow.prepare_import_items(features)
+            self._advance(len(features) - len(items))
+            if not items:
+                continue
 
-        last_tunnus = ""
-        try:
-            for f in batch:
-                try:
-                    last_tunnus = str(f.attribute("tunnus")) if f is not None else ""
-                except Exception:
-                    last_tunnus = ""
-
-            # This call is synchronous but limited to the batch size to keep UI responsive.
-            MainAddPropertiesFlow.start_adding_properties(selected_features=batch)
-        except Exception:
-            # Continue; errors are surfaced via dialogs in the flow.
-            pass
+            tunnus_list = [item["tunnus"] for item in items]
+            self._map_muudet.update(MainAddPropertiesFlow.map_muudet_by_tunnus(self._target_layer, tunnus_list))
+            future = RequestExecutor.instance().submit(
+                BackendPropertyVerifier.verify_properties_bulk,
+                tunnus_list,
+                token=self._token,
+            )
+            future.add_done_callback(self._notify_request_done)
+            self._lookups.append((items, future))
 
-        self._done += len(batch)
-        self._batches_processed += 1
+    def _collect_lookups(self) -> None:
+        # Keep input order: only the oldest window may hand over.
+        while self._lookups and self._lookups[0][1].done():
+            items, future = self._lookups.popleft()
+            try:
+                backend_infos = future.result() or {}
+            except Exception as exc:
+                PythonFailLogger.log_exception(
+                    exc,
+                    module="property",
+                    event="add_batch_lookup_failed",
+                    extra={"count": len(items)},
+                )
+                backend_infos = {}
+            for item in items:
+                self._to_plan.append((item, backend_infos.get(item["tunnus"])))
 
-        if not sip.isdeleted(self):
-            self.progress.emit(self._done, self._total, "processing", last_tunnus)
+    # --- Between stages: decisions and prompts (UI thread) ---------------
+    def _plan_items(self) -> None:
+        while self._to_plan and len(self._to_backend) < self._max_in_flight * 2:
+            if self._stop_requested or self._paused:
+                return
+            item, backend_info = self._to_plan.popleft()
+            tunnus = item["tunnus"]
+            plan = MainAddPropertiesFlow.plan_property_add(
+                item,
+                backend_info,
+                exists_map=tunnus in self._map_muudet,
+                main_layer_muudet=self._map_muudet.get(tunnus),
+                claimed=self._claimed,
+                lm=self._lm,
+            )
+            if plan is None:
+                self._advance(1, tunnus)
+            elif plan.get("action") is not None:
+                self._to_backend.append(plan)
+            else:
+                self._queue_for_map(plan)
 
-        if self._stop_requested:
-            self._dispose_timer()
-            if not sip.isdeleted(self):
-                self.finished.emit({"canceled": True, "done": self._done, "total": self._total})
-            return
+    # --- Stage 2: concurrent backend writes ------------------------------
+    def _start_backend(self) -> None:
+        while self._to_backend and len(self._in_flight) < self._max_in_flight:
+            plan = self._to_backend.popleft()
+            future = RequestExecutor.instance().submit(
+                MainAddPropertiesFlow.run_backend_plan,
+                plan,
+                token=self._token,
+            )
+            future.add_done_callback(self._notify_request_done)
+            self._in_flight.append((plan, future))
 
-        if not self._queue:
-            self._dispose_timer()
-            if not sip.isdeleted(self):
-                self.finished.emit({"canceled": bool(self._stop_requested), "done": self._done, "total": self._total})
+    def _collect_backend(self) -> None:
+        pending: List[Tuple[dict, object]] = []
+        for plan, future in self._in_flight:
+            if not future.done():
+                pending.append((plan, future))
+                continue
+            try:
+                failed_step = future.result()
+            except Exception as exc:
+                # Cancelled before it started, or raised: nothing reached the backend we can rely on.
+                if not self._stop_requested:
+                    PythonFailLogger.log_exception(
+                        exc,
+                        module="property",
+                        event="add_batch_backend_failed",
+                        extra={"tunnus": plan.get("tunnus")},
+                    )
+                self._advance(1, plan.get("tunnus"))
+                continue
+            if MainAddPropertiesFlow.finish_backend_plan(plan, failed_step, self._lm):
+                self._queue_for_map(plan)
+            else:
+                self._advance(1, plan.get("tunnus"))
+        self._in_flight = pending
+
+    # --- Stage 3: batched map inserts ------------------------------------
+    def _queue_for_map(self, plan: dict) -> None:
+        if plan.get("copy") is None:
+            self._advance(1, plan.get("tunnus"))
             return
+        # Later items with the same tunnus must see it as already on the map.
+        self._map_muudet.setdefault(plan["tunnus"], None)
+        self._to_map.append(plan)
+        if len(self._to_map) >= self._map_batch_size:
+            self._flush_map(force=True)
 
-        # Respect backend rest window: after N batches, wait rest_ms before next batch.
-        if self._batches_processed % self._rest_every == 0:
-            self._timer.start(self._rest_ms)
-        else:
-            self._timer.start(0)
+    def _flush_map(self, *, force: bool = False) -> None:
+        if not self._to_map or self._target_layer is None:
+            return
+        if not force and len(self._to_map) < self._map_batch_size:
+            return
+        batch = list(self._to_map)
+        self._to_map.clear()
+        MainAddPropertiesFlow.copy_plans_to_layer(batch, self._target_layer, self._lm)
+        self._advance(len(batch), batch[-1].get("tunnus"))
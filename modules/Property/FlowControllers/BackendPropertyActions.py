@@ -20,37 +20,56 @@ class BackendPropertyActions:
 
         tag_id = TagsHelpers.check_if_tag_exists(tag_name=archive_tag_name, module=module_name)
 
+        backend_infos = BackendPropertyVerifier.verify_properties_bulk(tunnused)
+        property_ids_by_tunnus: dict[str, str] = {}
         for tunnus in tunnused:
-            backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
+            backend_info = backend_infos.get(str(tunnus or "").strip())
             if not isinstance(backend_info, dict) or backend_info.get("exists") is None:
-                print({"archive_backend": {"tunnus": tunnus, "ok": False, "reason": "backend_lookup_failed", "backend_info": backend_info}})
+                BackendPropertyActions._log_archive_skip(tunnus, "backend_lookup_failed")
                 continue
 
             if not backend_info.get("exists"):
-                print({"archive_backend": {"tunnus": tunnus, "ok": False, "reason": "no_active_backend_property"}})
+                BackendPropertyActions._log_archive_skip(tunnus, "no_active_backend_property")
                 continue
 
             active_count = backend_info.get("active_count")
             if isinstance(active_count, int) and active_count > 1:
-                print({"archive_backend": {"tunnus": tunnus, "ok": False, "reason": "multiple_active_backend_matches", "active_count": active_count}})
+                BackendPropertyActions._log_archive_skip(tunnus, "multiple_active_backend_matches", active_count=active_count)
                 continue
 
             prop = backend_info.get("property") if isinstance(backend_info.get("property"), dict) else None
             prop_id = (prop.get("id") if isinstance(prop, dict) else None) if prop else None
             if not prop_id:
-                print({"archive_backend": {"tunnus": tunnus, "ok": False, "reason": "missing_property_id"}})
+                BackendPropertyActions._log_archive_skip(tunnus, "missing_property_id")
                 continue
 
-            ok = UpdatePropertyData._archive_a_propertie(item_id=str(prop_id), archive_tag=tag_id)
-            print({"archive_backend": {"tunnus": tunnus, "property_id": str(prop_id), "ok": bool(ok)}})
+            property_ids_by_tunnus[tunnus] = str(prop_id)
+
+        archived = UpdatePropertyData.archive_properties_bulk(property_ids_by_tunnus.values(), archive_tag=tag_id)
+        failed = {tunnus: prop_id for tunnus, prop_id in property_ids_by_tunnus.items() if not archived.get(prop_id)}
+        if failed:
+            PythonFailLogger.log(
+                "archive_backend_failed",
+                module="property",
+                extra={"count": len(failed), "property_ids_by_tunnus": failed},
+            )
+
+    @staticmethod
+    def _log_archive_skip(tunnus: str, reason: str, **extra) -> None:
+        PythonFailLogger.log(
+            "archive_backend_skipped",
+            module="property",
+            extra={"tunnus": tunnus, "reason": reason, **extra},
+        )
 
     @staticmethod
     def unarchive_properties_by_tunnused(tunnused: list[str]) -> None:
         if not tunnused:
             return
 
+        backend_infos = BackendPropertyVerifier.verify_properties_bulk(tunnused)
         for tunnus in tunnused:
-            backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
+            backend_info = backend_infos.get(str(tunnus or "").strip())
             if not isinstance(backend_info, dict) or backend_info.get("exists") is None:
                 print({"unarchive_backend": {"tunnus": tunnus, "ok": False, "reason": "backend_lookup_failed", "backend_info": backend_info}})
                 continue
@@ -77,8 +96,9 @@ class BackendPropertyActions:
         if not tunnused:
             return
 
+        backend_infos = BackendPropertyVerifier.verify_properties_bulk(tunnused)
         for tunnus in tunnused:
-            backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
+            backend_info = backend_infos.get(str(tunnus or "").strip())
             if not isinstance(backend_info, dict) or backend_info.get("exists") is None:
                 print({"delete_backend": {"tunnus": tunnus, "ok": False, "reason": "backend_lookup_failed", "backend_info": backend_info}})
                 continue
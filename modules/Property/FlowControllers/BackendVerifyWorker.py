@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import time
-
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from .MainAddProperties import BackendPropertyVerifier, MainAddPropertiesFlow
@@ -11,7 +9,8 @@ from ....Logs.python_fail_logger import PythonFailLogger
 class BackendVerifyWorker(QObject):
     """Background worker for verifying backend state per cadastral tunnus.
 
-    Emits row-by-row results so UI can update progressively.
+    Resolves tunnused in chunked bulk queries and emits row-by-row results
+    per chunk so UI can update progressively.
     """
 
     rowResult = pyqtSignal(int, str, dict)
@@ -30,135 +29,95 @@ class BackendVerifyWorker(QObject):
         self._backend_last_updated_override_by_tunnus = backend_last_updated_override_by_tunnus or {}
         self._stop = False
 
-        total = len(rows or [])
-        if total <= 50:
-            self._sleep_every = 0
-            self._sleep_secs = 0.0
-        elif total <= 150:
-            self._sleep_every = 20
-            self._sleep_secs = 0.03
-        else:
-            self._sleep_every = 25
-            self._sleep_secs = 0.05
-        self._no_sleep_until = 50  # process first chunk quickly
-
     def stop(self) -> None:
         self._stop = True
 
+    def _classify(self, tunnus: str, import_muudet: str, backend_info: dict) -> tuple[str, list[str]]:
+        """Return (bucket, attention causes) for one row; bucket is '' for lookup failures."""
+        if not isinstance(backend_info, dict) or backend_info.get("exists") is None:
+            return "", ["backend lookup failed"]
+
+        if not (backend_info.get("exists") or backend_info.get("archived_only")):
+            return "missing_backend", ["missing in backend"]
+        if backend_info.get("archived_only"):
+            return "archived_only", ["archived only"]
+
+        backend_last_updated = str(backend_info.get("LastUpdated") or "")
+        try:
+            effective_backend_last_updated = self._backend_last_updated_override_by_tunnus.get(tunnus, "") or backend_last_updated
+            import_newer = bool(
+                MainAddPropertiesFlow._is_import_newer(import_muudet, effective_backend_last_updated, None)
+            )
+        except Exception:
+            import_newer = False
+
+        if import_newer:
+            return "outdated_backend", ["import newer"]
+        return "ok_fresh", []
+
     @pyqtSlot()
     def run(self) -> None:
-        ok_fresh: list[str] = []
-        missing_backend: list[str] = []
-        archived_only_backend: list[str] = []
-        outdated_backend: list[str] = []
+        buckets: dict[str, list[str]] = {
+            "ok_fresh": [],
+            "missing_backend": [],
+            "archived_only": [],
+            "outdated_backend": [],
+        }
         errors: list[dict] = []
 
-        call_count = 0
-
-        for row, tunnus, import_muudet in self._rows:
-            if self._stop:
-                break
-
-            try:
-                backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
-            except Exception as e:
-                errors.append({"tunnus": tunnus, "error": str(e)})
-                self.rowResult.emit(
-                    row,
-                    tunnus,
-                    {
-                        "attention": True,
-                        "causes": ["backend lookup failed"],
-                        "backend_info": None,
-                    },
-                )
-                continue
-
-            exists_backend_any = False
-            archived_only_val = None
-            backend_last_updated = ""
-
-            if isinstance(backend_info, dict):
-                exists_val = backend_info.get("exists")
-                archived_only_val = backend_info.get("archived_only")
-                backend_last_updated = str(backend_info.get("LastUpdated") or "")
-
-                active_count = backend_info.get("active_count")
-                archived_count = backend_info.get("archived_count")
-                prop = backend_info.get("property")
-
-                if exists_val is not None:
-                    exists_backend_any = bool(exists_val or archived_only_val)
-                else:
-                    try:
-                        exists_backend_any = bool((int(active_count or 0) + int(archived_count or 0)) > 0)
-                    except Exception:
-                        exists_backend_any = bool(prop)
-
-            attention = False
-            attention_causes: list[str] = []
-
-            if isinstance(backend_info, dict) and backend_info.get("exists") is None:
-                attention = True
-                attention_causes.append("backend lookup failed")
-            elif not exists_backend_any:
-                attention = True
-                missing_backend.append(tunnus)
-                attention_causes.append("missing in backend")
-            elif archived_only_val:
-                attention = True
-                archived_only_backend.append(tunnus)
-                attention_causes.append("archived only")
-            else:
-                import_newer = False
-                try:
-                    effective_backend_last_updated = self._backend_last_updated_override_by_tunnus.get(tunnus, "") or backend_last_updated
-                    import_newer = bool(
-                        MainAddPropertiesFlow._is_import_newer(import_muudet, effective_backend_last_updated, None)
+        rows_by_tunnus: dict[str, list[tuple[int, str]]] = {}
+        for row, tunnus, import_muudet in self._rows or []:
+            rows_by_tunnus.setdefault(str(tunnus or "").strip(), []).append((row, import_muudet))
+        emitted: set[str] = set()
+
+        def _emit_chunk(chunk_results: dict[str, dict]) -> None:
+            for tunnus, backend_info in chunk_results.items():
+                emitted.add(tunnus)
+                if backend_info.get("error"):
+                    errors.append({"tunnus": tunnus, "error": str(backend_info.get("error"))})
+                for row, import_muudet in rows_by_tunnus.get(tunnus, []):
+                    bucket, causes = self._classify(tunnus, import_muudet, backend_info)
+                    if bucket:
+                        buckets[bucket].append(tunnus)
+                    self.rowResult.emit(
+                        row,
+                        tunnus,
+                        {
+                            "attention": bool(causes),
+                            "causes": causes,
+                            "backend_info": backend_info if isinstance(backend_info, dict) else None,
+                        },
                     )
-                except Exception:
-                    import_newer = False
-
-                if import_newer:
-                    attention = True
-                    outdated_backend.append(tunnus)
-                    attention_causes.append("import newer")
-                else:
-                    ok_fresh.append(tunnus)
-
-            self.rowResult.emit(
-                row,
-                tunnus,
-                {
-                    "attention": attention,
-                    "causes": attention_causes,
-                    "backend_info": backend_info if isinstance(backend_info, dict) else None,
-                },
-            )
 
-            call_count += 1
-            if (
-                not self._stop
-                and self._sleep_every
-                and call_count > self._no_sleep_until
-                and call_count % self._sleep_every == 0
-            ):
-                try:
-                    time.sleep(self._sleep_secs)
-                except Exception as exc:
-                    PythonFailLogger.log_exception(
-                        exc,
-                        module="property",
-                        event="backend_verify_sleep_failed",
-                    )
+        if "" in rows_by_tunnus:
+            _emit_chunk({"": BackendPropertyVerifier.verify_properties_by_cadastral_number("")})
+
+        try:
+            BackendPropertyVerifier.verify_properties_bulk(
+                list(rows_by_tunnus.keys()),
+                on_chunk=_emit_chunk,
+                should_stop=lambda: self._stop,
+            )
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="property",
+                event="backend_bulk_verify_failed",
+                extra={"count": len(rows_by_tunnus)},
+            )
+            errors.append({"tunnus": "", "error": str(exc)})
+            # Rows the bulk lookup never reached still get their per-row result.
+            lookup_failed = {"attention": True, "causes": ["backend lookup failed"], "backend_info": None}
+            for tunnus, rows in rows_by_tunnus.items():
+                if tunnus in emitted or self._stop:
+                    continue
+                for row, _import_muudet in rows:
+                    self.rowResult.emit(row, tunnus, dict(lookup_failed))
 
         self.finished.emit(
             {
                 "source": self._source,
-                "ok_fresh": ok_fresh,
-                "missing_backend": missing_backend,
-                "archived_only": archived_only_backend,
-                "outdated_backend": outdated_backend,
+                **buckets,
                 "errors": errors,
                 "stopped": bool(self._stop),
             }
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from PyQt5.QtCore import QCoreApplication
 
@@ -14,6 +14,7 @@ from ....languages.language_manager import LanguageManager
 from ....utils.MapTools.MapHelpers import MapHelpers, FeatureActions
 from ....utils.url_manager import Module, ModuleSupports
 from ....python.GraphQLQueryLoader import GraphQLQueryLoader
+from ....python.request_executor import CancellationToken, RequestExecutor
 from .UpdatePropertyData import UpdatePropertyData
 from ....widgets.DateHelpers import DateHelpers
 from ....utils.TagsEngines import TagsEngines
@@ -34,6 +35,14 @@ class MainAddPropertiesFlow:
     # Persist "yes to all" choice across batch invocations.
     _yes_to_all_copy_missing_map: bool = False
 
+    # Backend steps of an add plan (see plan_property_add).
+    BACKEND_CREATE = "create"
+    BACKEND_UPDATE = "update"
+    BACKEND_UNARCHIVE = "unarchive"
+    # When a planned feature is copied import -> main layer.
+    COPY_ALWAYS = "always"
+    COPY_IF_BACKEND_OK = "if_backend_ok"
+
     @staticmethod
     def request_cancel() -> None:
         MainAddPropertiesFlow._cancel_requested = True
@@ -110,345 +119,408 @@ class MainAddPropertiesFlow:
             return False
 
         layers = MainAddPropertiesFlow._prepare_layers()
-        if layers:
-            import_layer, target_layer, archive_layer = layers
-            if not import_layer or not target_layer or not archive_layer:
-                return False
+        if not layers:
+            return False
+        import_layer, target_layer, archive_layer = layers
+        if not import_layer or not target_layer or not archive_layer:
+            return False
 
-            # Reset cooperative cancel at the start of each call.
-            MainAddPropertiesFlow.reset_cancel()
-            # Do not reset yes-to-all here; batch runner handles it so choice persists across invocations within a run.
+        # Reset cooperative cancel at the start of each call.
+        MainAddPropertiesFlow.reset_cancel()
+        # Do not reset yes-to-all here; batch runner handles it so choice persists across invocations within a run.
 
-            # Preload backend status ids once for this run to avoid repeating GraphQL calls per property.
-            BackendPropertyVerifier.warm_status_cache()
+        # Preload backend status ids once for this run to avoid repeating GraphQL calls per property.
+        BackendPropertyVerifier.warm_status_cache()
 
-            lm = LanguageManager()
+        lm = LanguageManager()
 
-            if not target_layer.isEditable():
-                target_layer.startEditing()
+        try:
+            # Same stages as AddBatchRunner, run inline: one bulk lookup, then per-property backend work,
+            # then a single map commit.
+            items = MainAddPropertiesFlow.prepare_import_items(selected_features)
+            tunnus_list = [item["tunnus"] for item in items]
+            backend_infos = BackendPropertyVerifier.verify_properties_bulk(
+                tunnus_list,
+                should_stop=lambda: MainAddPropertiesFlow._cancel_requested,
+            )
+            map_muudet = MainAddPropertiesFlow.map_muudet_by_tunnus(target_layer, tunnus_list)
 
-            if archive_layer and not archive_layer.isEditable():
-                archive_layer.startEditing()
+            claimed: set[str] = set()
+            to_copy: list[dict] = []
+            for item in items:
+                if MainAddPropertiesFlow._cancel_requested:
+                    return False
 
-            try:
-                for feature in selected_features:
-                    if MainAddPropertiesFlow._cancel_requested:
-                        if target_layer.isEditable():
-                            target_layer.rollBack()
-                        if archive_layer and archive_layer.isEditable():
-                            archive_layer.rollBack()
-                        return False
-
-                    QCoreApplication.processEvents()
-                    data, tunnus, siht_data, last_updated_str = PropertyDataLoader().prepare_data_for_import_stage1(feature)
+                QCoreApplication.processEvents()
+                tunnus = item["tunnus"]
+                plan = MainAddPropertiesFlow.plan_property_add(
+                    item,
+                    backend_infos.get(tunnus),
+                    exists_map=tunnus in map_muudet,
+                    main_layer_muudet=map_muudet.get(tunnus),
+                    claimed=claimed,
+                    lm=lm,
+                )
+                if plan is None:
+                    continue
+
+                failed_step = MainAddPropertiesFlow.run_backend_plan(plan)
+                if MainAddPropertiesFlow.finish_backend_plan(plan, failed_step, lm):
+                    to_copy.append(plan)
+
+            if MainAddPropertiesFlow._cancel_requested:
+                return False
+
+            return MainAddPropertiesFlow.copy_plans_to_layer(to_copy, target_layer, lm)
+        except Exception as e:
+            if target_layer.isEditable():
+                target_layer.rollBack()
+            PythonFailLogger.log_exception(
+                e,
+                module=Module.PROPERTY.value,
+                event="add_property_start_failed",
+            )
+            return False
+
+    @staticmethod
+    def prepare_import_items(features) -> list[dict]:
+        """Import payloads for `features`; features without a cadastral number are skipped."""
+        loader = PropertyDataLoader()
+        items: list[dict] = []
+        for feature in features or []:
+            data, tunnus, siht_data, last_updated_str = loader.prepare_data_for_import_stage1(feature)
+            tunnus = ("" if tunnus is None else str(tunnus)).strip()
+            if not tunnus:
+                PythonFailLogger.log(
+                    "add_property_missing_tunnus_skip",
+                    module=Module.PROPERTY.value,
+                    extra={"fid": feature.id() if feature is not None else None},
+                )
+                continue
+            items.append(
+                {
+                    "feature": feature,
+                    "tunnus": tunnus,
+                    "data": data,
+                    "siht_data": siht_data,
                     # last updated str is iso format string
-                    #check if property with tunnus already exists in Kavtro
-                    backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
-                    exists_backend = backend_info.get("exists")
-                    backend_prop = backend_info.get("property") or {}
-                    backend_id = backend_prop.get("id")
-                    backend_cadastral = backend_prop.get("cadastralUnitNumber")
-                    backend_name = (backend_prop.get("displayAddress") or "").strip()
-                    import_name = (data.get("address") or {}).get("street")
-                    identifiers_unchanged = bool(
-                        exists_backend
-                        and backend_id
-                        and str(tunnus) == str(backend_cadastral)
-                        and (import_name or "").strip() == backend_name
-                    )
-                    archived_only_backend = bool(backend_info.get("archived_only"))
-                    backend_last_updated = backend_info.get("LastUpdated") #is iso format string
-
-                    if MainAddPropertiesFlow._cancel_requested:
-                        if target_layer.isEditable():
-                            target_layer.rollBack()
-                        if archive_layer and archive_layer.isEditable():
-                            archive_layer.rollBack()
-                        return False
-
-                    matches = MapHelpers.find_features_by_fields_and_values(target_layer, Katastriyksus.tunnus, [tunnus])
-                    exists_map = bool(matches)
-                    existing_map_feature = matches[0] if matches else None
-                    main_layer_muudet = None
-                    if existing_map_feature:
-                        try:
-                            main_layer_muudet = existing_map_feature.attribute(Katastriyksus.muudet)
-                        except Exception:
-                            main_layer_muudet = None
-
-                    if exists_backend is None:
-                        # Backend lookup failed; don't accidentally create duplicates.
-                        err = backend_info.get("error")
-                        PythonFailLogger.log(
-                            "add_property_backend_lookup_failed_skip",
-                            module=Module.PROPERTY.value,
-                            extra={"tunnus": str(tunnus or ""), "error": str(err or "")},
-                        )
-                        continue
+                    "last_updated": last_updated_str,
+                }
+            )
+        return items
 
-                    is_import_newer = MainAddPropertiesFlow._is_import_newer(
-                        last_updated_str,
-                        backend_last_updated,
-                        main_layer_muudet,
-                    )
+    @staticmethod
+    def map_muudet_by_tunnus(target_layer, tunnus_list) -> dict:
+        """Main-layer presence for many cadastral numbers: tunnus -> `muudet` of its first match.
+
+        Tunnus missing from the result are not on the main layer.
+        """
+        matches = ArchiveLayerHandler.features_by_field_values(target_layer, Katastriyksus.tunnus, list(tunnus_list or []))
+        muudet_by_tunnus = {}
+        for tunnus, features in matches.items():
+            try:
+                muudet_by_tunnus[tunnus] = features[0].attribute(Katastriyksus.muudet)
+            except Exception:
+                muudet_by_tunnus[tunnus] = None
+        return muudet_by_tunnus
+
+    @staticmethod
+    def plan_property_add(
+        item: dict,
+        backend_info: Optional[dict],
+        *,
+        exists_map: bool,
+        main_layer_muudet=None,
+        claimed: Optional[set] = None,
+        lm: Optional[LanguageManager] = None,
+    ) -> Optional[dict]:
+        """Decide what to do with one import item; UI thread only (may prompt).
+
+        Applies the decision matrix of `start_adding_properties` and returns the
+        item extended with:
+            - "action": None | BACKEND_CREATE | BACKEND_UPDATE | BACKEND_UNARCHIVE
+            - "backend_id": target of update/unarchive
+            - "copy": None | COPY_ALWAYS | COPY_IF_BACKEND_OK (import -> main layer)
+        Returns None when there is nothing to do. `claimed` collects the tunnus
+        planned in the current run so duplicates are handled once.
+        """
+        lm = lm or LanguageManager()
+        tunnus = item["tunnus"]
+        data = item["data"]
+
+        if claimed is not None:
+            if tunnus in claimed:
+                PythonFailLogger.log(
+                    "add_property_duplicate_in_run_skip",
+                    module=Module.PROPERTY.value,
+                    extra={"tunnus": tunnus},
+                )
+                return None
+            claimed.add(tunnus)
+
+        backend_info = backend_info if isinstance(backend_info, dict) else {"exists": None, "error": "not verified"}
+        exists_backend = backend_info.get("exists")
+        if exists_backend is None:
+            # Backend lookup failed; don't accidentally create duplicates.
+            err = backend_info.get("error")
+            PythonFailLogger.log(
+                "add_property_backend_lookup_failed_skip",
+                module=Module.PROPERTY.value,
+                extra={"tunnus": tunnus, "error": str(err or "")},
+            )
+            return None
 
-                    # If identifiers are unchanged, prefer in-place backend update and skip archive/replace.
-                    updated_in_place = False
-                    if identifiers_unchanged:
-                        if backend_id:
-                            ok = UpdatePropertyData.update_single_property_item(backend_id, data, siht_data)
-                            if ok:
-                                updated_in_place = True
-                            else:
-                                PythonFailLogger.log(
-                                    "add_property_backend_update_failed",
-                                    module=Module.PROPERTY.value,
-                                    extra={
-                                        "tunnus": str(tunnus or ""),
-                                        "backend_id": str(backend_id or ""),
-                                        "path": "identifiers_unchanged",
-                                    },
-                                )
-                        # When only backend is updated, still allow map handling below.
-
-                    # Step 2: decision matrix 
-                    # A) Backend missing => create backend; copy import -> main if missing on map
-                    if exists_backend is False:
-                        archived_backend_id = None
-                        try:
-                            archived_backend_id = ((backend_info.get("property") or {}).get("id"))
-                        except Exception:
-                            archived_backend_id = None
-
-                        if archived_only_backend and archived_backend_id:
-                            btn_unarchive = lm.translate(TranslationKeys.UNARCHIVE_EXISTING)
-                            btn_create_new = lm.translate(TranslationKeys.CREATE_NEW)
-                            btn_skip = lm.translate(TranslationKeys.SKIP)
-
-                            choice = ModernMessageDialog.ask_choice_modern(
-                                lm.translate(TranslationKeys.PROPERTY_ARCHIVED_BACKEND_MATCH_TITLE),
-                                lm.translate(TranslationKeys.PROPERTY_ARCHIVED_BACKEND_MATCH_BODY).format(
-                                    tunnus=tunnus
-                                ),
-                                buttons=[btn_unarchive, btn_create_new, btn_skip],
-                                default=btn_unarchive,
-                                cancel=btn_skip,
-                            )
-
-                            if choice == btn_skip or choice is None:
-                                continue
-
-                            if choice == btn_unarchive:
-                                if not UpdatePropertyData._unarchive_property_data(item_id=archived_backend_id):
-                                    ModernMessageDialog.Error_messages_modern(
-                                        lm.translate(TranslationKeys.PROPERTY_UNARCHIVE_FAILED_TITLE),
-                                        lm.translate(TranslationKeys.PROPERTY_UNARCHIVE_FAILED_BODY).format(
-                                            backend_id=archived_backend_id,
-                                            tunnus=tunnus,
-                                        ),
-                                    )
-                                    continue
-
-                                ok = UpdatePropertyData.update_single_property_item(
-                                    archived_backend_id,
-                                    data,
-                                    siht_data,
-                                )
-                                if not ok:
-                                    ModernMessageDialog.Warning_messages_modern(
-                                        lm.translate(TranslationKeys.PROPERTY_BACKEND_UPDATE_FAILED_TITLE),
-                                        lm.translate(TranslationKeys.PROPERTY_BACKEND_UPDATE_FAILED_BODY).format(
-                                            tunnus=tunnus
-                                        ),
-                                    )
-
-                                # Now treat it as backend-existing for map decisions.
-                                if not exists_map:
-                                    title = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_TITLE)
-                                    text = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_BODY).format(
-                                        tunnus=tunnus
-                                    )
-                                    reply = ModernMessageDialog.ask_choice_modern(
-                                        title,
-                                        text,
-                                        buttons=[lm.translate(TranslationKeys.YES), lm.translate(TranslationKeys.NO)],
-                                        default=lm.translate(TranslationKeys.YES),
-                                        cancel=lm.translate(TranslationKeys.NO),
-                                    )
-                                    if reply == lm.translate(TranslationKeys.YES):
-                                        ok2, msg2 = FeatureActions.copy_feature_to_layer(feature, target_layer)
-                                        if not ok2:
-                                            ModernMessageDialog.Error_messages_modern(
-                                                lm.translate(TranslationKeys.PROPERTY_COPY_FAILED_TITLE),
-                                                msg2,
-                                            )
-
-                                # If main already has feature, nothing to do on map here.
-                                continue
-
-                            # If user chose Create new, fall through to existing creation logic.
-
-                        if exists_map:
-                            title = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_TITLE)
-                            if archived_only_backend:
-                                text = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_ARCHIVED_BODY).format(
-                                    tunnus=tunnus
-                                )
-                            else:
-                                text = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_BODY).format(
-                                    tunnus=tunnus
-                                )
-                            reply = ModernMessageDialog.ask_choice_modern(
-                                title,
-                                text,
-                                buttons=[lm.translate(TranslationKeys.YES), lm.translate(TranslationKeys.NO)],
-                                default=lm.translate(TranslationKeys.YES),
-                                cancel=lm.translate(TranslationKeys.NO),
-                            )
-                            if reply != (lm.translate(TranslationKeys.YES)):
-                                continue
-
-                        MainAddPropertiesFlow.add_single_property_item(data, siht_data)
-
-                        if not exists_map:
-                            ok, msg = FeatureActions.copy_feature_to_layer(feature, target_layer)
-                            if not ok:
-                                PythonFailLogger.log(
-                                    "add_property_copy_to_main_failed",
-                                    module=Module.PROPERTY.value,
-                                    extra={"tunnus": str(tunnus or ""), "error": str(msg or "")},
-                                )
-                        continue
-
-                    # B) Backend exists
-                    if exists_backend is True and not exists_map:
-                        if is_import_newer and not updated_in_place:
-                            backend_prop = backend_info.get("property") or {}
-                            backend_id = backend_prop.get("id")
-                            if backend_id:
-                                ok = UpdatePropertyData.update_single_property_item(backend_id, data, siht_data)
-                                if not ok:
-                                    PythonFailLogger.log(
-                                        "add_property_backend_update_failed",
-                                        module=Module.PROPERTY.value,
-                                        extra={
-                                            "tunnus": str(tunnus or ""),
-                                            "backend_id": str(backend_id or ""),
-                                            "path": "backend_exists_map_missing",
-                                        },
-                                    )
-                            else:
-                                PythonFailLogger.log(
-                                    "add_property_backend_id_missing",
-                                    module=Module.PROPERTY.value,
-                                    extra={"tunnus": str(tunnus or "")},
-                                )
-
-                        # Step 3: ask user what to do when backend exists but map is missing
+        backend_prop = backend_info.get("property") or {}
+        backend_id = backend_prop.get("id")
+        backend_cadastral = backend_prop.get("cadastralUnitNumber")
+        backend_name = (backend_prop.get("displayAddress") or "").strip()
+        import_name = (data.get("address") or {}).get("street")
+        identifiers_unchanged = bool(
+            exists_backend
+            and backend_id
+            and str(tunnus) == str(backend_cadastral)
+            and (import_name or "").strip() == backend_name
+        )
+        archived_only_backend = bool(backend_info.get("archived_only"))
+        backend_last_updated = backend_info.get("LastUpdated")  # is iso format string
+
+        is_import_newer = MainAddPropertiesFlow._is_import_newer(
+            item.get("last_updated"),
+            backend_last_updated,
+            main_layer_muudet,
+        )
+
+        plan = dict(item, action=None, backend_id=None, copy=None, path=None)
+
+        # A) Backend missing => create backend; copy import -> main if missing on map
+        if exists_backend is False:
+            archived_backend_id = backend_id
+            if archived_only_backend and archived_backend_id:
+                btn_unarchive = lm.translate(TranslationKeys.UNARCHIVE_EXISTING)
+                btn_create_new = lm.translate(TranslationKeys.CREATE_NEW)
+                btn_skip = lm.translate(TranslationKeys.SKIP)
+
+                choice = ModernMessageDialog.ask_choice_modern(
+                    lm.translate(TranslationKeys.PROPERTY_ARCHIVED_BACKEND_MATCH_TITLE),
+                    lm.translate(TranslationKeys.PROPERTY_ARCHIVED_BACKEND_MATCH_BODY).format(
+                        tunnus=tunnus
+                    ),
+                    buttons=[btn_unarchive, btn_create_new, btn_skip],
+                    default=btn_unarchive,
+                    cancel=btn_skip,
+                )
+
+                if choice == btn_skip or choice is None:
+                    return None
+
+                if choice == btn_unarchive:
+                    plan.update(action=MainAddPropertiesFlow.BACKEND_UNARCHIVE, backend_id=archived_backend_id)
+                    # Treated as backend-existing for map decisions; copied only if the unarchive succeeds.
+                    if not exists_map:
                         title = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_TITLE)
                         text = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_BODY).format(
                             tunnus=tunnus
                         )
-                        reply = None
-                        if MainAddPropertiesFlow._yes_to_all_copy_missing_map:
-                            reply = lm.translate(TranslationKeys.YES)
-                        else:
-                            btn_yes = lm.translate(TranslationKeys.YES)
-                            btn_no = lm.translate(TranslationKeys.NO)
-                            btn_yes_all = lm.translate(TranslationKeys.YES_TO_ALL)
-
-                            reply = ModernMessageDialog.ask_choice_modern(
-                                title,
-                                text,
-                                buttons=[btn_yes, btn_no, btn_yes_all],
-                                default=btn_yes,
-                                cancel=btn_no,
-                            )
-
-                            if reply == btn_yes_all:
-                                MainAddPropertiesFlow._yes_to_all_copy_missing_map = True
-                                reply = btn_yes
+                        reply = ModernMessageDialog.ask_choice_modern(
+                            title,
+                            text,
+                            buttons=[lm.translate(TranslationKeys.YES), lm.translate(TranslationKeys.NO)],
+                            default=lm.translate(TranslationKeys.YES),
+                            cancel=lm.translate(TranslationKeys.NO),
+                        )
                         if reply == lm.translate(TranslationKeys.YES):
-                            ok, msg = FeatureActions.copy_feature_to_layer(feature, target_layer)
-                            if not ok:
-                                ModernMessageDialog.Error_messages_modern(
-                                    lm.translate(TranslationKeys.PROPERTY_COPY_FAILED_TITLE),
-                                    msg,
-                                )
-                        continue
-
-                    # C) Backend exists and map exists
-                    if exists_backend is True and exists_map:
-                        # Identifiers unchanged: only update when newer; no archiving here.
-                        if identifiers_unchanged:
-                            if is_import_newer and not updated_in_place and backend_id:
-                                ok = UpdatePropertyData.update_single_property_item(backend_id, data, siht_data)
-                                if not ok:
-                                    PythonFailLogger.log(
-                                        "add_property_backend_update_failed",
-                                        module=Module.PROPERTY.value,
-                                        extra={
-                                            "tunnus": str(tunnus or ""),
-                                            "backend_id": str(backend_id or ""),
-                                            "path": "backend_exists_map_exists_identifiers_unchanged",
-                                        },
-                                    )
-                            continue
+                            plan["copy"] = MainAddPropertiesFlow.COPY_IF_BACKEND_OK
+                    return plan
 
-                        # Identifiers differ: update backend if import is newer; do not archive in this flow.
-                        if is_import_newer and backend_id:
-                            ok = UpdatePropertyData.update_single_property_item(backend_id, data, siht_data)
-                            if not ok:
-                                PythonFailLogger.log(
-                                    "add_property_backend_update_failed",
-                                    module=Module.PROPERTY.value,
-                                    extra={
-                                        "tunnus": str(tunnus or ""),
-                                        "backend_id": str(backend_id or ""),
-                                        "path": "backend_exists_map_exists_identifiers_differ",
-                                    },
-                                )
-                        continue
-
-                if archive_layer and archive_layer.isEditable():
-                    if not archive_layer.commitChanges():
-                        msg = "; ".join(archive_layer.commitErrors() or [])
-                        archive_layer.rollBack()
-                        if target_layer.isEditable():
-                            target_layer.rollBack()
-                        PythonFailLogger.log(
-                            "add_property_archive_layer_commit_failed",
-                            module=Module.PROPERTY.value,
-                            extra={"error": str(msg or "")},
-                        )
-                        return False
+                # If user chose Create new, fall through to existing creation logic.
 
-                if not target_layer.commitChanges():
-                    msg = "; ".join(target_layer.commitErrors() or [])
-                    target_layer.rollBack()
-                    if archive_layer and archive_layer.isEditable():
-                        archive_layer.rollBack()
+            if exists_map:
+                title = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_TITLE)
+                if archived_only_backend:
+                    text = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_ARCHIVED_BODY).format(
+                        tunnus=tunnus
+                    )
+                else:
+                    text = lm.translate(TranslationKeys.PROPERTY_BACKEND_MISSING_BODY).format(
+                        tunnus=tunnus
+                    )
+                reply = ModernMessageDialog.ask_choice_modern(
+                    title,
+                    text,
+                    buttons=[lm.translate(TranslationKeys.YES), lm.translate(TranslationKeys.NO)],
+                    default=lm.translate(TranslationKeys.YES),
+                    cancel=lm.translate(TranslationKeys.NO),
+                )
+                if reply != (lm.translate(TranslationKeys.YES)):
+                    return None
+
+            plan["action"] = MainAddPropertiesFlow.BACKEND_CREATE
+            if not exists_map:
+                plan["copy"] = MainAddPropertiesFlow.COPY_ALWAYS
+            return plan
+
+        # B/C) Backend exists: update in place when identifiers are unchanged or the import is newer;
+        # never archive in this flow.
+        if backend_id and (identifiers_unchanged or is_import_newer):
+            if identifiers_unchanged:
+                path = "identifiers_unchanged"
+            elif not exists_map:
+                path = "backend_exists_map_missing"
+            else:
+                path = "backend_exists_map_exists_identifiers_differ"
+            plan.update(action=MainAddPropertiesFlow.BACKEND_UPDATE, backend_id=backend_id, path=path)
+        elif is_import_newer and not exists_map:
+            PythonFailLogger.log(
+                "add_property_backend_id_missing",
+                module=Module.PROPERTY.value,
+                extra={"tunnus": tunnus},
+            )
+
+        # B) Backend exists but map is missing: ask user whether to copy
+        if not exists_map:
+            title = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_TITLE)
+            text = lm.translate(TranslationKeys.PROPERTY_BACKEND_EXISTS_MISSING_MAP_BODY).format(
+                tunnus=tunnus
+            )
+            reply = None
+            if MainAddPropertiesFlow._yes_to_all_copy_missing_map:
+                reply = lm.translate(TranslationKeys.YES)
+            else:
+                btn_yes = lm.translate(TranslationKeys.YES)
+                btn_no = lm.translate(TranslationKeys.NO)
+                btn_yes_all = lm.translate(TranslationKeys.YES_TO_ALL)
+
+                reply = ModernMessageDialog.ask_choice_modern(
+                    title,
+                    text,
+                    buttons=[btn_yes, btn_no, btn_yes_all],
+                    default=btn_yes,
+                    cancel=btn_no,
+                )
+
+                if reply == btn_yes_all:
+                    MainAddPropertiesFlow._yes_to_all_copy_missing_map = True
+                    reply = btn_yes
+            if reply == lm.translate(TranslationKeys.YES):
+                plan["copy"] = MainAddPropertiesFlow.COPY_ALWAYS
+
+        if plan["action"] is None and plan["copy"] is None:
+            return None
+        return plan
+
+    @staticmethod
+    def run_backend_plan(plan: dict) -> Optional[str]:
+        """Run the backend part of a plan; safe to call from worker threads (no UI).
+
+        Returns the name of the step that failed, or None.
+        """
+        action = plan.get("action")
+        tunnus = plan.get("tunnus")
+        backend_id = plan.get("backend_id")
+
+        if action == MainAddPropertiesFlow.BACKEND_CREATE:
+            property_id = MainAddPropertiesFlow.add_single_property_item(plan["data"], plan["siht_data"])
+            return None if property_id else MainAddPropertiesFlow.BACKEND_CREATE
+
+        if action == MainAddPropertiesFlow.BACKEND_UNARCHIVE:
+            if not UpdatePropertyData._unarchive_property_data(item_id=backend_id):
+                return MainAddPropertiesFlow.BACKEND_UNARCHIVE
+            if not UpdatePropertyData.update_single_property_item(backend_id, plan["data"], plan["siht_data"]):
+                return MainAddPropertiesFlow.BACKEND_UPDATE
+            return None
+
+        if action == MainAddPropertiesFlow.BACKEND_UPDATE:
+            if UpdatePropertyData.update_single_property_item(backend_id, plan["data"], plan["siht_data"]):
+                return None
+            PythonFailLogger.log(
+                "add_property_backend_update_failed",
+                module=Module.PROPERTY.value,
+                extra={
+                    "tunnus": str(tunnus or ""),
+                    "backend_id": str(backend_id or ""),
+                    "path": str(plan.get("path") or ""),
+                },
+            )
+            return MainAddPropertiesFlow.BACKEND_UPDATE
+
+        return None
+
+    @staticmethod
+    def finish_backend_plan(plan: dict, failed_step: Optional[str], lm: Optional[LanguageManager] = None) -> bool:
+        """Report backend failures of a plan (UI thread); True when its feature should be copied to the map."""
+        lm = lm or LanguageManager()
+        tunnus = plan.get("tunnus")
+
+        if plan.get("action") == MainAddPropertiesFlow.BACKEND_UNARCHIVE:
+            if failed_step == MainAddPropertiesFlow.BACKEND_UNARCHIVE:
+                ModernMessageDialog.Error_messages_modern(
+                    lm.translate(TranslationKeys.PROPERTY_UNARCHIVE_FAILED_TITLE),
+                    lm.translate(TranslationKeys.PROPERTY_UNARCHIVE_FAILED_BODY).format(
+                        backend_id=plan.get("backend_id"),
+                        tunnus=tunnus,
+                    ),
+                )
+                return False
+            if failed_step == MainAddPropertiesFlow.BACKEND_UPDATE:
+                ModernMessageDialog.Warning_messages_modern(
+                    lm.translate(TranslationKeys.PROPERTY_BACKEND_UPDATE_FAILED_TITLE),
+                    lm.translate(TranslationKeys.PROPERTY_BACKEND_UPDATE_FAILED_BODY).format(
+                        tunnus=tunnus
+                    ),
+                )
+
+        copy = plan.get("copy")
+        if copy == MainAddPropertiesFlow.COPY_IF_BACKEND_OK:
+            return failed_step != MainAddPropertiesFlow.BACKEND_UNARCHIVE
+        return copy == MainAddPropertiesFlow.COPY_ALWAYS
+
+    @staticmethod
+    def copy_plans_to_layer(plans: list[dict], target_layer, lm: Optional[LanguageManager] = None) -> bool:
+        """Copy the import features of `plans` to the main layer with one commit (UI thread)."""
+        if not plans:
+            return True
+        lm = lm or LanguageManager()
+
+        if not target_layer.isEditable():
+            target_layer.startEditing()
+
+        try:
+            for plan in plans:
+                ok, msg = FeatureActions.copy_feature_to_layer(plan["feature"], target_layer)
+                if ok:
+                    continue
+                if plan.get("action") == MainAddPropertiesFlow.BACKEND_CREATE:
                     PythonFailLogger.log(
-                        "add_property_main_layer_commit_failed",
+                        "add_property_copy_to_main_failed",
                         module=Module.PROPERTY.value,
-                        extra={"error": str(msg or "")},
+                        extra={"tunnus": str(plan.get("tunnus") or ""), "error": str(msg or "")},
                     )
-                    return False
-                
-                return True
-            except Exception as e:
-                if target_layer.isEditable():
-                    target_layer.rollBack()
-                if archive_layer and archive_layer.isEditable():
-                    archive_layer.rollBack()
-                PythonFailLogger.log_exception(
-                    e,
+                else:
+                    ModernMessageDialog.Error_messages_modern(
+                        lm.translate(TranslationKeys.PROPERTY_COPY_FAILED_TITLE),
+                        msg,
+                    )
+
+            if not target_layer.commitChanges():
+                msg = "; ".join(target_layer.commitErrors() or [])
+                target_layer.rollBack()
+                PythonFailLogger.log(
+                    "add_property_main_layer_commit_failed",
                     module=Module.PROPERTY.value,
-                    event="add_property_start_failed",
+                    extra={"error": str(msg or ""), "count": len(plans)},
                 )
                 return False
-
-        return False
+            return True
+        except Exception as e:
+            if target_layer.isEditable():
+                target_layer.rollBack()
+            PythonFailLogger.log_exception(
+                e,
+                module=Module.PROPERTY.value,
+                event="add_property_copy_batch_failed",
+                extra={"count": len(plans)},
+            )
+            return False
 
     @staticmethod
     def preflight_archive_layer_before_dialog() -> bool:
@@ -652,6 +724,7 @@ class MainAddPropertiesFlow:
             "total": len(unique_tunnus),
             "archived_backend": 0,
             "moved_map": 0,
+            "backend_results": {},
             "errors": [],
         }
 
@@ -674,59 +747,38 @@ class MainAddPropertiesFlow:
             archive_layer.startEditing()
 
         try:
-            for tunnus in unique_tunnus:
+            try:
+                matches_by_tunnus = ArchiveLayerHandler.features_by_field_values(
+                    target_layer, Katastriyksus.tunnus, unique_tunnus
+                )
+            except Exception as exc:
+                PythonFailLogger.log_exception(
+                    exc,
+                    module=Module.PROPERTY.value,
+                    event="archive_find_matches_failed",
+                    extra={"count": len(unique_tunnus)},
+                )
+                matches_by_tunnus = {}
+
+            # Move map features into archive layer and remove from main layer.
+            matched_features = [feat for tunnus in unique_tunnus for feat in matches_by_tunnus.get(tunnus, [])]
+            moved_ids, copy_errors = ArchiveLayerHandler.copy_features_to_archive(archive_layer, matched_features)
+            summary["moved_map"] += len(moved_ids)
+            summary["errors"].extend(copy_errors)
+            if moved_ids:
                 try:
-                    matches = MapHelpers.find_features_by_fields_and_values(target_layer, Katastriyksus.tunnus, [tunnus])
-                except Exception as exc:
-                    PythonFailLogger.log_exception(
-                        exc,
-                        module=Module.PROPERTY.value,
-                        event="archive_find_matches_failed",
-                        extra={"tunnus": tunnus},
-                    )
-                    matches = []
-
-                if not matches:
-                    continue
+                    target_layer.deleteFeatures(moved_ids)
+                except Exception as e:
+                    summary["errors"].append(f"Delete archived features failed: {e}")
 
-                # Move map features into archive layer and remove from main layer.
-                moved_ids = []
-                for feat in matches:
-                    ok, msg = FeatureActions.copy_feature_to_layer(feat, archive_layer)
-                    if ok:
-                        summary["moved_map"] += 1
-                        moved_ids.append(feat.id())
-                    else:
-                        summary["errors"].append(f"Copy {tunnus} failed: {msg}")
-
-                if moved_ids:
-                    try:
-                        target_layer.deleteFeatures(moved_ids)
-                    except Exception as e:
-                        summary["errors"].append(f"Delete {tunnus} failed: {e}")
-
-                # Archive backend property best-effort.
-                # Backend archive is optional per tunnus when backend_allowed is provided.
-                backend_ok = (backend_allowed is None) or (tunnus in backend_allowed)
-                if backend_ok:
-                    try:
-                        backend_info = BackendPropertyVerifier.verify_properties_by_cadastral_number(tunnus)
-                    except Exception as e:
-                        backend_info = None
-                        summary["errors"].append(f"Backend lookup {tunnus} failed: {e}")
-
-                    ids = []
-                    if isinstance(backend_info, dict):
-                        ids = backend_info.get("active_ids") or []
-                        # If already archived, skip; only archive active ones.
-                    for pid in ids:
-                        ok = False
-                        try:
-                            ok = UpdatePropertyData._archive_a_propertie(pid)
-                        except Exception as e:
-                            summary["errors"].append(f"Archive backend {tunnus}/{pid} failed: {e}")
-                        if ok:
-                            summary["archived_backend"] += 1
+            # Archive backend properties best-effort, only for tunnus that were on the map.
+            # Backend archive is optional per tunnus when backend_allowed is provided.
+            backend_tunnus = [
+                tunnus
+                for tunnus in unique_tunnus
+                if matches_by_tunnus.get(tunnus) and (backend_allowed is None or tunnus in backend_allowed)
+            ]
+            summary["backend_results"] = MainAddPropertiesFlow._archive_backend_properties(backend_tunnus, summary)
 
             if archive_layer.isEditable():
                 if not archive_layer.commitChanges():
@@ -762,6 +814,40 @@ class MainAddPropertiesFlow:
         return summary
     
 
+    @staticmethod
+    def _archive_backend_properties(tunnus_list: list[str], summary: dict) -> dict[str, dict[str, bool]]:
+        """Archive the active backend properties of `tunnus_list` in batches.
+
+        Returns {tunnus: {property_id: ok}} and updates `summary` counters/errors.
+        """
+        if not tunnus_list:
+            return {}
+
+        try:
+            backend_infos = BackendPropertyVerifier.verify_properties_bulk(tunnus_list)
+        except Exception as e:
+            backend_infos = {}
+            summary["errors"].append(f"Backend lookup failed: {e}")
+
+        ids_by_tunnus: dict[str, list[str]] = {}
+        for tunnus in tunnus_list:
+            backend_info = backend_infos.get(tunnus)
+            if not isinstance(backend_info, dict):
+                continue
+            if backend_info.get("error"):
+                summary["errors"].append(f"Backend lookup {tunnus} failed: {backend_info.get('error')}")
+            # If already archived, skip; only archive active ones.
+            ids_by_tunnus[tunnus] = [str(pid) for pid in backend_info.get("active_ids") or []]
+
+        archived = UpdatePropertyData.archive_properties_bulk(
+            [pid for ids in ids_by_tunnus.values() for pid in ids]
+        )
+        results: dict[str, dict[str, bool]] = {}
+        for tunnus, ids in ids_by_tunnus.items():
+            results[tunnus] = {pid: bool(archived.get(pid)) for pid in ids}
+            summary["archived_backend"] += sum(1 for ok in results[tunnus].values() if ok)
+        return results
+
     @staticmethod
     def add_single_property_item(item, siht_data):
 
@@ -907,266 +993,189 @@ class BackendPropertyVerifier:
         return None
 
     @staticmethod
-    def verify_properties_by_cadastral_number(item):
-
-        item = ("" if item is None else str(item)).strip()
-        if not item:
-            return {"exists": False, "property": None, "tags": [], "error": None}
+    def _compact_node(node: dict) -> dict:
+        return {
+            "id": node.get("id"),
+            "cadastralUnitNumber": node.get("cadastralUnitNumber"),
+            "displayAddress": node.get("displayAddress"),
+        }
 
-        module = Module.PROPERTY.name
+    @staticmethod
+    def _build_backend_info(active_nodes: list[dict], archived_nodes: list[dict]) -> dict:
+        """Shape classified backend nodes into the `verify_properties_by_cadastral_number` result dict."""
+        active_count = len(active_nodes)
+        archived_count = len(archived_nodes)
+        if active_count == 0 and archived_count == 0:
+            return {
+                "exists": False,
+                "archived_only": False,
+                "active_count": 0,
+                "archived_count": 0,
+                "property": None,
+                "tags": [],
+                "error": None,
+            }
 
-        file =  "id_number.graphql"
-        query = GraphQLQueryLoader().load_query_by_module(module, file)
+        chosen = active_nodes[0] if active_nodes else archived_nodes[0]
+        tags = []
+        for edge in ((chosen.get("tags") or {}).get("edges") or []):
+            tag_node = (edge or {}).get("node")
+            if isinstance(tag_node, dict) and tag_node:
+                tags.append(tag_node)
+
+        active_props = [BackendPropertyVerifier._compact_node(n) for n in active_nodes]
+        archived_props = [BackendPropertyVerifier._compact_node(n) for n in archived_nodes]
+
+        # Backwards-compatible `exists`: True only if an ACTIVE backend property exists.
+        return {
+            "exists": active_count > 0,
+            "archived_only": active_count == 0 and archived_count > 0,
+            "active_count": active_count,
+            "archived_count": archived_count,
+            "active_ids": [p.get("id") for p in active_props if p.get("id")],
+            "archived_ids": [p.get("id") for p in archived_props if p.get("id")],
+            "active_properties": active_props,
+            "archived_properties": archived_props,
+            "property": BackendPropertyVerifier._compact_node(chosen),
+            "FirstRegistration": chosen.get("cadastralUnitFirstRegistration"),
+            "LastUpdated": chosen.get("cadastralUnitLastUpdated"),
+            "tags": tags,
+            "error": None,
+        }
 
+    @staticmethod
+    def _is_archived_property(node_dict: dict) -> bool:
+        if not isinstance(node_dict, dict):
+            return False
+        tag_name = (TagsEngines.ARHIVEERITUD_TAG_NAME or "").strip().lower()
+
+        for te in ((node_dict.get("tags") or {}).get("edges") or []):
+            tag_node = (te or {}).get("node")
+            if not isinstance(tag_node, dict):
+                continue
+            name = (tag_node.get("name") or "").strip().lower()
+            if name == tag_name and tag_name:
+                return True
 
-        end_cursor = None
+        display = (node_dict.get("displayAddress") or "").strip().lower()
+        prefix = (TagsEngines.ARHIVEERITUD_NAME_ADDITION or "").strip().lower()
+        return bool(prefix and display.startswith(prefix))
 
-        # NOTE:
-        # - This query is `properties(...)` (see python/queries/graphql/properties/id_number.graphql)
-        # - For operator `IN`, backend typically expects an array.
-        # - For a single cadastral number, `EQ` is the safest.
-        variables = {
-            # IMPORTANT: backend can contain both archived and active records for the same cadastral number.
-            # Fetch enough rows (and paginate if needed) so we can correctly classify.
-            "first": 50,
-            "after": end_cursor,
-            "search": None,
-            "where": {
-                "AND": [
-                    {
-                        "column": "CADASTRAL_UNIT_NUMBER",
-                        "operator": "EQ",
-                        "value": item,
-                    }
-                ]
-            },
-        }
+    @staticmethod
+    def _fetch_property_nodes(client: APIClient, query: str, where_obj: dict) -> list[dict]:
+        """All nodes matching `where_obj`, following pageInfo to the last page.
 
-        try:
-            client = APIClient()
+        A chunk cut short would report its remaining numbers as missing and lead
+        to duplicate creates, so there is no size cap; a cursor that stops
+        advancing raises instead.
+        """
+        nodes: list[dict] = []
+        variables = {"first": 50, "after": None, "search": None, "where": where_obj}
+        seen_cursors: set[str] = set()
+        while True:
+            siblings: dict = {}
+            for node in client.send_query_stream(query, variables=variables, path=["properties", "edges"], siblings=siblings):
+                if isinstance(node, dict) and node:
+                    nodes.append(node)
+
+            page_info = siblings.get("pageInfo") or {}
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                break
+            if cursor in seen_cursors:
+                raise RuntimeError(f"Property paging did not advance past cursor {cursor!r}")
+            seen_cursors.add(cursor)
+            variables["after"] = cursor
+        return nodes
 
-            def _fetch_nodes_for_where(where_obj: dict) -> list[dict]:
-                nodes_local: list[dict] = []
-                end_cursor_local = None
-                safety_cap_local = 200
-                vars_local = {
-                    "first": 50,
-                    "after": None,
-                    "search": None,
-                    "where": where_obj,
-                }
+    @staticmethod
+    def verify_properties_bulk(
+        numbers: list[str],
+        *,
+        chunk_size: int = 25,
+        on_chunk: Optional[Callable[[dict[str, dict]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> dict[str, dict]:
+        """Verify many cadastral numbers with chunked `IN` queries.
+
+        Returns tunnus -> backend info in the same shape as
+        `verify_properties_by_cadastral_number`. `on_chunk` receives each
+        chunk's results as soon as they are classified so callers can stream
+        progress; `should_stop` is checked between chunks.
+        """
+        cleaned = list(dict.fromkeys(str(n).strip() for n in (numbers or []) if str(n or "").strip()))
+        results: dict[str, dict] = {}
+        if not cleaned:
+            return results
+
+        client = APIClient()
+        query = GraphQLQueryLoader().load_query_by_module(Module.PROPERTY.name, "id_number.graphql")
+        active_status_id = BackendPropertyVerifier._resolve_property_status_id_by_name("ACTIVE", client)
+        archived_status_id = BackendPropertyVerifier._resolve_property_status_id_by_name("ARCHIVED", client)
+        by_status = bool(active_status_id and archived_status_id)
+
+        def _verify_chunk(chunk: list[str]) -> dict[str, dict]:
+            active_by_number: dict[str, list[dict]] = {number: [] for number in chunk}
+            archived_by_number: dict[str, list[dict]] = {number: [] for number in chunk}
+            number_condition = {"column": "CADASTRAL_UNIT_NUMBER", "operator": "IN", "value": chunk}
 
-                while True:
-                    QCoreApplication.processEvents()
-                    vars_local["after"] = end_cursor_local
-                    payload = client.send_query(query, variables=vars_local)
-                    props = (payload or {}).get("properties") or {}
-                    page_info = props.get("pageInfo") or {}
-                    edges = props.get("edges") or []
-                    for e in edges:
-                        n = (e or {}).get("node")
-                        if isinstance(n, dict) and n:
-                            nodes_local.append(n)
-
-                    has_next = bool(page_info.get("hasNextPage"))
-                    end_cursor_local = page_info.get("endCursor")
-                    if not has_next or not end_cursor_local:
-                        break
-                    if len(nodes_local) >= safety_cap_local:
-                        break
-
-                return nodes_local
-
-            # Preferred (new backend): classify by STATUS
-            active_status_id = BackendPropertyVerifier._resolve_property_status_id_by_name("ACTIVE", client)
-            archived_status_id = BackendPropertyVerifier._resolve_property_status_id_by_name("ARCHIVED", client)
-
-            if active_status_id and archived_status_id:
-                base_conditions = [
-                    {"column": "CADASTRAL_UNIT_NUMBER", "operator": "EQ", "value": item},
-                ]
-                active_where = {"AND": base_conditions + [{"column": "STATUS", "operator": "IN", "value": [active_status_id]}]}
-                archived_where = {"AND": base_conditions + [{"column": "STATUS", "operator": "IN", "value": [archived_status_id]}]}
-
-                active_nodes = _fetch_nodes_for_where(active_where)
-                archived_nodes = _fetch_nodes_for_where(archived_where)
-
-                active_count = len(active_nodes)
-                archived_count = len(archived_nodes)
-                archived_only = (active_count == 0 and archived_count > 0)
-
-                if active_count == 0 and archived_count == 0:
-                    return {
-                        "exists": False,
-                        "archived_only": False,
-                        "active_count": 0,
-                        "archived_count": 0,
-                        "property": None,
-                        "tags": [],
-                        "error": None,
-                    }
-
-                chosen = (active_nodes[0] if active_nodes else (archived_nodes[0] if archived_nodes else {}))
-                tags_edges = ((chosen.get("tags") or {}).get("edges") or [])
-                tags = []
-                for edge in tags_edges:
-                    tag_node = (edge or {}).get("node")
-                    if isinstance(tag_node, dict) and tag_node:
-                        tags.append(tag_node)
-
-                def _compact(n: dict) -> dict:
-                    return {
-                        "id": n.get("id"),
-                        "cadastralUnitNumber": n.get("cadastralUnitNumber"),
-                        "displayAddress": n.get("displayAddress"),
-                    }
-
-                active_props = [_compact(n) for n in active_nodes if isinstance(n, dict)]
-                archived_props = [_compact(n) for n in archived_nodes if isinstance(n, dict)]
+            try:
+                if by_status:
+                    for status_id, bucket in (
+                        (active_status_id, active_by_number),
+                        (archived_status_id, archived_by_number),
+                    ):
+                        where = {"AND": [number_condition, {"column": "STATUS", "operator": "IN", "value": [status_id]}]}
+                        for node in BackendPropertyVerifier._fetch_property_nodes(client, query, where):
+                            number = str(node.get("cadastralUnitNumber") or "").strip()
+                            if number in bucket:
+                                bucket[number].append(node)
+                else:
+                    where = {"AND": [number_condition]}
+                    for node in BackendPropertyVerifier._fetch_property_nodes(client, query, where):
+                        number = str(node.get("cadastralUnitNumber") or "").strip()
+                        if number not in active_by_number:
+                            continue
+                        if BackendPropertyVerifier._is_archived_property(node):
+                            archived_by_number[number].append(node)
+                        else:
+                            active_by_number[number].append(node)
 
                 return {
-                    "exists": active_count > 0,
-                    "archived_only": archived_only,
-                    "active_count": active_count,
-                    "archived_count": archived_count,
-                    "active_ids": [p.get("id") for p in active_props if p.get("id")],
-                    "archived_ids": [p.get("id") for p in archived_props if p.get("id")],
-                    "active_properties": active_props,
-                    "archived_properties": archived_props,
-                    "property": {
-                        "id": chosen.get("id"),
-                        "cadastralUnitNumber": chosen.get("cadastralUnitNumber"),
-                        "displayAddress": chosen.get("displayAddress"),
-                    },
-                    "FirstRegistration": chosen.get("cadastralUnitFirstRegistration"),
-                    "LastUpdated": chosen.get("cadastralUnitLastUpdated"),
-                    "tags": tags,
-                    "error": None,
+                    number: BackendPropertyVerifier._build_backend_info(active_by_number[number], archived_by_number[number])
+                    for number in chunk
                 }
-
-            # Legacy fallback: fetch everything and classify by archived tag/prefix
-            nodes = []
-            safety_cap = 200
-            while True:
-                QCoreApplication.processEvents()
-                variables["after"] = end_cursor
-                data = client.send_query(query, variables=variables)
-
-                props = data.get("properties") or {}
-                page_info = props.get("pageInfo") or {}
-                edges = props.get("edges") or []
-                if edges:
-                    for e in edges:
-                        n = (e or {}).get("node")
-                        if isinstance(n, dict) and n:
-                            nodes.append(n)
-
-                has_next = bool(page_info.get("hasNextPage"))
-                end_cursor = page_info.get("endCursor")
-                if not has_next:
-                    break
-                if not end_cursor:
-                    break
-                if len(nodes) >= safety_cap:
-                    break
-
-            if not nodes:
+            except Exception as exc:
+                PythonFailLogger.log_exception(
+                    exc,
+                    module=Module.PROPERTY.value,
+                    event="backend_bulk_verify_chunk_failed",
+                    extra={"count": len(chunk), "first": chunk[0]},
+                )
                 return {
-                    "exists": False,
-                    "archived_only": False,
-                    "active_count": 0,
-                    "archived_count": 0,
-                    "property": None,
-                    "tags": [],
-                    "error": None,
+                    number: {"exists": None, "property": None, "FirstRegistration": None, "LastUpdated": None, "tags": [], "error": str(exc)}
+                    for number in chunk
                 }
 
-            def _is_archived_property(node_dict: dict) -> bool:
-                if not isinstance(node_dict, dict):
-                    return False
-                tag_name = (TagsEngines.ARHIVEERITUD_TAG_NAME or "").strip().lower()
-
-                tags_edges_local = ((node_dict.get("tags") or {}).get("edges") or [])
-                for te in tags_edges_local:
-                    tag_node = (te or {}).get("node")
-                    if not isinstance(tag_node, dict):
-                        continue
-                    name = (tag_node.get("name") or "").strip().lower()
-                    if name == tag_name and tag_name:
-                        return True
-
-                display = (node_dict.get("displayAddress") or "").strip().lower()
-                prefix = (TagsEngines.ARHIVEERITUD_NAME_ADDITION or "").strip().lower()
-                if prefix and display.startswith(prefix):
-                    return True
-                return False
-
-            archived_nodes = [n for n in nodes if _is_archived_property(n)]
-            active_nodes = [n for n in nodes if n not in archived_nodes]
-
-            active_props = []
-            for n in active_nodes:
-                if isinstance(n, dict):
-                    active_props.append(
-                        {
-                            "id": n.get("id"),
-                            "cadastralUnitNumber": n.get("cadastralUnitNumber"),
-                            "displayAddress": n.get("displayAddress"),
-                        }
-                    )
-
-            archived_props = []
-            for n in archived_nodes:
-                if isinstance(n, dict):
-                    archived_props.append(
-                        {
-                            "id": n.get("id"),
-                            "cadastralUnitNumber": n.get("cadastralUnitNumber"),
-                            "displayAddress": n.get("displayAddress"),
-                        }
-                    )
-
-            chosen = (active_nodes[0] if active_nodes else (archived_nodes[0] if archived_nodes else {}))
-
-            tags_edges = ((chosen.get("tags") or {}).get("edges") or [])
-            tags = []
-            for edge in tags_edges:
-                tag_node = (edge or {}).get("node")
-                if isinstance(tag_node, dict) and tag_node:
-                    tags.append(tag_node)
+        chunks = [cleaned[start:start + chunk_size] for start in range(0, len(cleaned), chunk_size)]
+        token = CancellationToken()
+        chunk_iter = RequestExecutor.instance().iter_results(_verify_chunk, chunks, token=token)
+        try:
+            for chunk_results in chunk_iter:
+                results.update(chunk_results)
+                if on_chunk is not None:
+                    on_chunk(chunk_results)
+                if should_stop is not None and should_stop():
+                    token.cancel()
+                    break
+        finally:
+            chunk_iter.close()
 
-            active_count = len(active_nodes)
-            archived_count = len(archived_nodes)
-            archived_only = (active_count == 0 and archived_count > 0)
+        return results
 
-            # Backwards-compatible `exists`: True only if an ACTIVE backend property exists.
-            return {
-                "exists": active_count > 0,
-                "archived_only": archived_only,
-                "active_count": active_count,
-                "archived_count": archived_count,
-                "active_ids": [p.get("id") for p in active_props if p.get("id")],
-                "archived_ids": [p.get("id") for p in archived_props if p.get("id")],
-                "active_properties": active_props,
-                "archived_properties": archived_props,
-                "property": {
-                    "id": chosen.get("id"),
-                    "cadastralUnitNumber": chosen.get("cadastralUnitNumber"),
-                    "displayAddress": chosen.get("displayAddress"),
-                },
-                "FirstRegistration": chosen.get("cadastralUnitFirstRegistration"),
-                "LastUpdated": chosen.get("cadastralUnitLastUpdated"),
-                "tags": tags,
-                "error": None,
-            }
-        
-        
-        except Exception as e:
-            PythonFailLogger.log_exception(
-                e,
-                module=Module.PROPERTY.value,
-                event="backend_verify_query_failed",
-                extra={"tunnus": str(item or "")},
-            )
-            return {"exists": None, "property": None, "FirstRegistration": None, "LastUpdated": None, "tags": [], "error": str(e)}
-        
\ No newline at end of file
+    @staticmethod
+    def verify_properties_by_cadastral_number(item):
+        item = ("" if item is None else str(item)).strip()
+        if not item:
+            return {"exists": False, "property": None, "tags": [], "error": None}
+        return BackendPropertyVerifier.verify_properties_bulk([item])[item]
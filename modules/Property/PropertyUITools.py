@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from typing import Optional
 import sys
 
@@ -30,8 +31,7 @@ class PropertyUITools:
     def __init__(self, property_ui, data_service: Optional[PropertyDataService] = None):
         self.property_ui = property_ui
         self._settings = SettingsService()
-        self._connection_thread: Optional[QThread] = None
-        self._connection_worker: Optional[FunctionWorker] = None
+        self._connection_future: Optional[Future] = None
         self._data_service = data_service or PropertyDataService()
         self.lang_manager = LanguageManager()
         self._selection_orchestrator = MapSelectionOrchestrator(parent=property_ui)
@@ -338,27 +338,23 @@ class PropertyUITools:
         tree_widget.show_loading()
         token = self._current_token()
 
-        worker = FunctionWorker(self._data_service.build_connections_for_cadastral, cadastral_number)
-        worker.active_token = token
-
-        # eeldus: FunctionWorker.finished emiteerib payload (nt dict)
-        worker.finished.connect(
-            lambda payload, tok=token: self.handle_success(payload, tok)
-        )
-
-        # eeldus: FunctionWorker.error emiteerib error_message (str)
-        worker.error.connect(
-            lambda error_message, tok=token: self.handle_error(
-                error_message, tok
-            )
-        )
-
-        thread = start_worker(worker)
-        self._connection_thread = thread
-        self._connection_worker = worker
-
-        # kui see konkreetne thread lõpetab, siis puhastame viited
-        thread.finished.connect(lambda t=thread, w=worker: self.cleanup(t, w))
+        # Päringud käivad QGIS-i võrgukihi kaudu; tulemus saabub UI lõimes, eraldi threadi pole vaja.
+        if self._connection_future is not None:
+            self._connection_future.cancel()
+        future = self._data_service.build_connections_for_cadastral_async(cadastral_number)
+        self._connection_future = future
+        future.add_done_callback(lambda done, tok=token: self._handle_connections_done(done, tok))
+
+    def _handle_connections_done(self, future, token: int | None):
+        if self._connection_future is future:
+            self._connection_future = None
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.handle_error(str(error), token)
+            return
+        self.handle_success(future.result(), token)
 
     def open_property_from_search(self, item_id: str):
         ui = self._get_active_ui()
@@ -547,10 +543,3 @@ class PropertyUITools:
         tree_widget.show_message(
             self._t(TranslationKeys.PROPERTY_CONNECTIONS_LOAD_ERROR).format(error=error_text)
         )
-
-    def cleanup(self, thread, worker):
-        """Puhasta viited aktiivsele workerile/threadile, kui just see eksemplar lõpetas."""
-        if self._connection_worker is worker:
-            self._connection_worker = None
-        if self._connection_thread is thread:
-            self._connection_thread = None
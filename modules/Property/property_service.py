@@ -2,8 +2,10 @@ import copy
 import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, List, Optional
 
+from ...python.async_api_client import AsyncAPIClient
 from ...utils.SessionManager import SessionManager
 
 from .query_cordinator import (
@@ -25,22 +27,56 @@ class PropertyDataService:
         self._cache_lock = threading.RLock()
         self._connections_cache: OrderedDict = OrderedDict()
 
-    def build_connections_for_cadastral(self, cadastral_number: str) -> Dict[str, object]:
+    def build_connections_for_cadastral_async(self, cadastral_number: str) -> Future:
+        """Connection entries for a cadastral number without blocking; resolves on the UI thread."""
         normalized = (cadastral_number or "").strip()
         cache_key = ("cadastral", normalized, self._session_signature())
+        result: Future = Future()
         cached_payload = self._read_cache(cache_key)
         if cached_payload is not None:
-            return cached_payload
-
-        property_id = self._lookup.property_id_by_cadastral(normalized)
-        if not property_id:
-            payload = {"entries": [], "message": "Kinnistut ei leitud"}
-            self._write_cache(cache_key, payload)
-            return payload
-
-        payload = self._build_entry_payload(normalized, property_id)
-        self._write_cache(cache_key, payload)
-        return payload
+            result.set_result(cached_payload)
+            return result
+
+        def _on_modules(future: Future, property_id: str) -> None:
+            if result.done() or future.cancelled():
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+                return
+            try:
+                entry = self._formatter.build_entry(normalized, property_id, future.result())
+                payload = {"entries": [entry]}
+                self._write_cache(cache_key, payload)
+                result.set_result(payload)
+            except Exception as exc:
+                if not result.done():
+                    result.set_exception(exc)
+
+        def _on_property_id(future: Future) -> None:
+            if result.done() or future.cancelled():
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+                return
+            try:
+                property_id = future.result()
+                if not property_id:
+                    payload = {"entries": [], "message": "Kinnistut ei leitud"}
+                    self._write_cache(cache_key, payload)
+                    result.set_result(payload)
+                    return
+                modules_future = self._connections.fetch_all_module_data_async(property_id)
+                AsyncAPIClient.cancel_with(result, modules_future)
+                modules_future.add_done_callback(lambda modules: _on_modules(modules, property_id))
+            except Exception as exc:
+                if not result.done():
+                    result.set_exception(exc)
+
+        # Cancelling ``result`` cancels whichever inner future is running, which aborts its replies.
+        lookup_future = self._lookup.property_id_by_cadastral_async(normalized)
+        AsyncAPIClient.cancel_with(result, lookup_future)
+        lookup_future.add_done_callback(_on_property_id)
+        return result
 
     def build_connections_for_property_id(
         self,
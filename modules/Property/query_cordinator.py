@@ -1,10 +1,14 @@
-from typing import Any, Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
+import os
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ...module_manager import Module
 from ...constants.file_paths import QueryPaths
 
 from ...python.api_client import APIClient
+from ...python.async_api_client import AsyncAPIClient
+from ...python.graphql_batch import GraphQLBatcher
+from ...python.request_executor import RequestExecutor
 from ...python.responses import HandlePropertiesResponses
 from ...python.GraphQLQueryLoader import GraphQLQueryLoader
 
@@ -20,7 +24,6 @@ class PropertiesConnectedElementsQueries:
     }
 
     def __init__(self):
-        self.query_loader = QueryPaths()
         self.handle_response = HandlePropertiesResponses()
         self._processor = ProcessElementData()
 
@@ -40,16 +43,14 @@ class PropertiesConnectedElementsQueries:
             return None
         return str(module_name).lower()
 
-    def fetch_module_data(self, module_name, propertie_id):
-        module_key = self._normalize_module_key(module_name)
-        if not module_key:
-            return []
-
+    def _module_query(self, module_key: str, propertie_id) -> Optional[Tuple[str, Dict[str, Any]]]:
         module_file = self.module_to_filename.get(module_key)
         if not module_file:
-            return []
+            return None
 
-        query = self.query_loader.load_query_properties_connected_elements(module_file)
+        query = GraphQLQueryLoader.load_query_file(
+            os.path.join(QueryPaths.PROPERTIES_CONNECTIONFOLDER, module_file)
+        )
 
         variables = {
             "id": propertie_id,
@@ -62,28 +63,78 @@ class PropertiesConnectedElementsQueries:
                 }
             ]
         }
+        return query, variables
+
+    def fetch_module_data(self, module_name, propertie_id):
+        module_key = self._normalize_module_key(module_name)
+        if not module_key:
+            return []
+
+        module_query = self._module_query(module_key, propertie_id)
+        if module_query is None:
+            return []
 
+        query, variables = module_query
         payload = APIClient().send_query(query, variables=variables, return_raw=True) or {}
         return self._processor.process_response_data(module_key, payload)
 
+    def fetch_module_data_batch(self, requests: List[Tuple[Any, Any]]) -> List[List[Dict[str, Any]]]:
+        """Connected nodes for many (module, property id) pairs, sent as a few aliased documents.
+
+        Pairs that fail or have no query come back as empty lists.
+        """
+        batcher, slots = self._build_batch(requests)
+        results = batcher.execute() if len(batcher) else []
+        return self._unpack_batch(slots, results)
+
+    def _build_batch(self, requests: List[Tuple[Any, Any]]):
+        batcher = GraphQLBatcher("PropertyConnectedElements")
+        slots: List[Tuple[Optional[str], Optional[int]]] = []
+        for module_name, propertie_id in requests:
+            module_key = self._normalize_module_key(module_name)
+            module_query = self._module_query(module_key, propertie_id) if module_key else None
+            if module_query is None:
+                slots.append((None, None))
+                continue
+            query, variables = module_query
+            slots.append((module_key, batcher.add(query, variables)))
+        return batcher, slots
+
+    def _unpack_batch(self, slots, results) -> List[List[Dict[str, Any]]]:
+        nodes_per_request: List[List[Dict[str, Any]]] = []
+        for module_key, index in slots:
+            data = results[index] if index is not None else None
+            if module_key is None or not isinstance(data, dict):
+                nodes_per_request.append([])
+                continue
+            nodes_per_request.append(self._processor.process_response_data(module_key, {"data": data}))
+        return nodes_per_request
+
     def fetch_all_module_data(self, propertie_id):
         aggregated: Dict[str, List[Dict[str, Any]]] = {}
         module_keys = list(self.module_to_filename.keys())
-        with ThreadPoolExecutor(max_workers=min(4, len(module_keys))) as executor:
-            future_by_module = {
-                module_key: executor.submit(self.fetch_module_data, module_key, propertie_id)
-                for module_key in module_keys
-            }
+        results = self.fetch_module_data_batch([(module_key, propertie_id) for module_key in module_keys])
 
-        for module_key in module_keys:
-            try:
-                nodes = future_by_module[module_key].result()
-            except Exception:
-                nodes = []
+        for module_key, nodes in zip(module_keys, results):
             if nodes:
                 aggregated[module_key] = nodes
         return aggregated
 
+    def fetch_all_module_data_async(self, propertie_id) -> Future:
+        """Non-blocking ``fetch_all_module_data``: one aliased document, no threads."""
+        module_keys = list(self.module_to_filename.keys())
+        batcher, slots = self._build_batch([(module_key, propertie_id) for module_key in module_keys])
+
+        def _aggregate(results):
+            aggregated: Dict[str, List[Dict[str, Any]]] = {}
+            # Modules whose alias failed or returned nothing are left out, as in fetch_all_module_data.
+            for module_key, nodes in zip(module_keys, self._unpack_batch(slots, results)):
+                if nodes:
+                    aggregated[module_key] = nodes
+            return aggregated
+
+        return AsyncAPIClient.then(batcher.execute_async(), _aggregate)
+
 class ProcessElementData:
     def process_response_data(self, module_key: str, payload: Dict[str, Any]):
         module_key = module_key or ""
@@ -110,31 +161,89 @@ class PropertyLookupService:
             "id_number.graphql",
         )
 
-    def property_id_by_cadastral(self, cadastral_number: str) -> Optional[str]:
+    def property_ids_by_cadastral(self, cadastral_numbers: List[str]) -> Dict[str, Optional[str]]:
+        """Property ids for many cadastral numbers: exact matches in aliased documents, search fallback per miss.
+
+        Numbers whose lookup failed stay None; only numbers the exact match
+        genuinely did not find are searched.
+        """
+        numbers = list(dict.fromkeys(str(number).strip() for number in cadastral_numbers if str(number or "").strip()))
+        batcher = GraphQLBatcher("PropertyIdsByCadastral")
+        for number in numbers:
+            where_condition = {
+                "column": "CADASTRAL_UNIT_NUMBER",
+                "operator": "EQ",
+                "value": number,
+            }
+            batcher.add(self._property_id_query, {"first": 1, "where": {"AND": [where_condition]}})
+
+        resolved: Dict[str, Optional[str]] = {}
+        misses: List[str] = []
+        for number, data in zip(numbers, batcher.execute() if numbers else []):
+            if not isinstance(data, dict):
+                resolved[number] = None
+                continue
+            edges = self._extract_edges({"data": data})
+            resolved[number] = edges[0].get("node", {}).get("id") if edges else None
+            if not edges:
+                misses.append(number)
+        # Same fallback as property_id_by_cadastral_async: generic search when the column filter misses.
+        for number, property_id in zip(misses, RequestExecutor.instance().map(self._search_property_id, misses)):
+            resolved[number] = property_id
+        return resolved
+
+    def _search_property_id(self, cadastral_number: str) -> Optional[str]:
+        edges = self._extract_edges(self._execute_property_query({"first": 1, "search": cadastral_number}))
+        return edges[0].get("node", {}).get("id") if edges else None
+
+    def property_id_by_cadastral_async(self, cadastral_number: str) -> Future:
+        """Resolve a cadastral number to a property id without blocking.
+
+        Falls back to a generic search to cover cases where the column
+        filter does not match the schema.
+        """
+        result: Future = Future()
         if not cadastral_number:
-            return None
+            result.set_result(None)
+            return result
 
+        client = AsyncAPIClient()
         where_condition = {
             "column": "CADASTRAL_UNIT_NUMBER",
             "operator": "EQ",
             "value": cadastral_number,
         }
-        variables = {
-            "first": 1,
-            "where": {"AND": [where_condition]},
-        }
 
-        payload = self._execute_property_query(variables)
-        edges = self._extract_edges(payload)
-
-        if not edges:
-            # Fallback to generic search to cover cases where the column filter does not match schema
-            payload = self._execute_property_query({"first": 1, "search": cadastral_number})
-            edges = self._extract_edges(payload)
-
-        if not edges:
-            return None
-        return edges[0].get("node", {}).get("id")
+        def _first_id(edges: List[Dict[str, Any]]) -> Optional[str]:
+            return edges[0].get("node", {}).get("id") if edges else None
+
+        def _send(variables: Dict[str, Any], callback: Callable[[Future], None]) -> None:
+            sent = client.send_query(self._property_id_query, variables=variables, return_raw=True)
+            AsyncAPIClient.cancel_with(result, sent)
+            sent.add_done_callback(callback)
+
+        def _on_search(future: Future) -> None:
+            if result.done() or future.cancelled():
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+                return
+            result.set_result(_first_id(self._extract_edges(future.result() or {})))
+
+        def _on_exact(future: Future) -> None:
+            if result.done() or future.cancelled():
+                return
+            if future.exception() is not None:
+                result.set_exception(future.exception())
+                return
+            edges = self._extract_edges(future.result() or {})
+            if edges:
+                result.set_result(_first_id(edges))
+                return
+            _send({"first": 1, "search": cadastral_number}, _on_search)
+
+        _send({"first": 1, "where": {"AND": [where_condition]}}, _on_exact)
+        return result
 
     def _execute_property_query(self, variables: Dict[str, Any]) -> Dict[str, Any]:
         return self._api_client.send_query(
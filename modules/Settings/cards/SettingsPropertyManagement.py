@@ -8,7 +8,7 @@ from qgis.core import QgsProject
 
 from .SettingsBaseCard import SettingsBaseCard
 from ..settings_layer_helper import SettingsLayerHelper
-from ....constants.layer_constants import IMPORT_PROPERTY_TAG
+from ....constants.layer_constants import IMPORT_PROPERTY_TAG, SHP_IMPORT_MODE_GEOPACKAGE
 from ....utils.SHPLayerLoader import SHPLayerLoader
 from ....utils.MapTools.MapHelpers import MapHelpers, ActiveLayersHelper
 from ....widgets.AddUpdatePropertyDialog import AddPropertyDialog, PropertyDialogMode
@@ -39,6 +39,7 @@ class PropertyManagementUI(SettingsBaseCard):
         self._import_selection_controller = None
         self._delete_selection_controller = None
         self._add_from_map_dialog = None
+        self._shp_loader = None
 
         self._map_action_parent_window = None
         self._restore_parent_after_map_action = False
@@ -285,13 +286,22 @@ class PropertyManagementUI(SettingsBaseCard):
 
     def _handle_file_import(self):
         """Handle file import for property data using existing SHPLayerLoader"""
-        # Use the existing SHPLayerLoader for proper import functionality
-        loader = SHPLayerLoader(self)
-        success = loader.load_shp_layer()
+        if self._shp_loader is not None:
+            return
+        # Country-wide cadastral data is streamed to a GeoPackage so it stays on disk, not in RAM
+        loader = SHPLayerLoader(self, import_mode=SHP_IMPORT_MODE_GEOPACKAGE)
+        if not loader.load_shp_layer_in_background(on_finished=self._on_file_import_finished):
+            return
+        # The progress dialog is non-modal; keep a second import off the same side file
+        self._shp_loader = loader
+        self.btn_add_shp.setEnabled(False)
+
+    def _on_file_import_finished(self, success: bool, cancelled: bool):
+        self._shp_loader = None
         if success:
             self._invalidate_shp_feature_cache()
-            self._update_button_states()
-        else:
+        self._update_button_states()
+        if not success and not cancelled:
             ModernMessageDialog.show_warning(
                 self.lang_manager.translate(TranslationKeys.SHAPEFILE_LOAD_FAILED),
                 self.lang_manager.translate(TranslationKeys.SHAPEFILE_LOAD_FAILED_MESSAGE),
@@ -354,7 +364,7 @@ class PropertyManagementUI(SettingsBaseCard):
         )
 
         # 3) Apply to buttons
-        self.btn_add_shp.setEnabled(shp_en)
+        self.btn_add_shp.setEnabled(shp_en and self._shp_loader is None)
         self.btn_add_property.setEnabled(add_en)
         # Primary delete depends on MAIN layer.
         self.btn_remove_property.setEnabled(rem_en)
@@ -6,8 +6,7 @@ Erinevus teiste moodulitega: FEED_LOGIC klass, pealkiri, ning TYPE filter ON lub
 
 from typing import Optional, Type, List
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel, QFrame
+from PyQt5.QtWidgets import QWidget, QFrame
 
 from ...ui.ModuleBaseUI import ModuleBaseUI
 from ...widgets.Filters.StatusFilterWidget import StatusFilterWidget
@@ -95,21 +94,7 @@ class ContractsModule(SearchOpenItemMixin, OverduePillsMixin, ModuleBaseUI):
         self._filter_refresh_widget = refresh_widget
         self.toolbar_area.set_refresh_widget(refresh_widget)
 
-        self.feed_content = QWidget()
-        self.feed_content.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.feed_layout = QVBoxLayout(self.feed_content)
-        self.feed_layout.setContentsMargins(0, 0, 0, 0)
-        self.feed_layout.setSpacing(6)
-
-        self._empty_state = QLabel(self.lang_manager.translate(TranslationKeys.NO_CONTRACTS_FOUND))
-        self._empty_state.setAlignment(Qt.AlignCenter)
-        self._empty_state.setVisible(False)
-        self.feed_layout.addWidget(self._empty_state)
-        self.feed_layout.addStretch(1)
-
-
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.feed_content)
+        self._init_feed_view(self.lang_manager.translate(TranslationKeys.NO_CONTRACTS_FOUND))
 
         # Configure optional single-item query for opening a contract by id
         try:
@@ -2,8 +2,7 @@
 """Coordination module UI – built on ModuleBaseUI."""
 
 from typing import Optional, Type, List, Any
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel, QFrame
+from PyQt5.QtWidgets import QWidget, QFrame
 
 from ...ui.ModuleBaseUI import ModuleBaseUI
 from ...widgets.Filters.StatusFilterWidget import StatusFilterWidget
@@ -81,21 +80,7 @@ class CoordinationModule(SearchOpenItemMixin, OverduePillsMixin, ModuleBaseUI):
         self._filter_refresh_widget = refresh_widget
         self.toolbar_area.set_refresh_widget(refresh_widget)
 
-        self.feed_content = QWidget()
-        self.feed_content.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.feed_layout = QVBoxLayout(self.feed_content)
-        self.feed_layout.setContentsMargins(0, 0, 0, 0)
-        self.feed_layout.setSpacing(6)
-
-        empty_text = self.lang_manager.translate(TranslationKeys.NO_COORDINATIONS_FOUND)
-        self._empty_state = QLabel(empty_text)
-        self._empty_state.setAlignment(Qt.AlignCenter)
-        self._empty_state.setVisible(False)
-        self.feed_layout.addWidget(self._empty_state)
-        self.feed_layout.addStretch(1)
-
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.feed_content)
+        self._init_feed_view(self.lang_manager.translate(TranslationKeys.NO_COORDINATIONS_FOUND))
 
     # ------------------------------------------------------------------
     # Lifecycle
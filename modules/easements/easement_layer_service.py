@@ -14,6 +14,7 @@ from ..Settings.setting_keys import SettingDialogPlaceholders
 from ...utils.MapTools.MapHelpers import MapHelpers
 from ...utils.SessionManager import SessionManager
 from ...utils.geometry_payload import GeometryPayloadService
+from ...utils.layers.layer_feature_index import LayerFeatureIndex
 from ...utils.url_manager import Module
 from ...utils.messagesHelper import ModernMessageDialog
 from ...Logs.python_fail_logger import PythonFailLogger
@@ -391,15 +392,7 @@ class EasementLayerService:
         item_number_text = str(item_number or "").strip()
 
         try:
-            for feature in layer.getFeatures():
-                if identity_field and item_id_text:
-                    current = str(feature.attribute(identity_field) or "").strip()
-                    if current == item_id_text:
-                        return feature
-                if number_field and item_number_text:
-                    current = str(feature.attribute(number_field) or "").strip()
-                    if current == item_number_text:
-                        return feature
+            return LayerFeatureIndex.find_feature(layer, ((identity_field, item_id_text), (number_field, item_number_text)))
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
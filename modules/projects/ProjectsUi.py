@@ -5,8 +5,7 @@ Erinevus teiste moodulitega: FEED_LOGIC klass, pealkiri, ning TYPE filtrit ei ka
 """
 
 from typing import Optional, Type, List, Any
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel, QFrame
+from PyQt5.QtWidgets import QWidget, QFrame
 
 from ...ui.ModuleBaseUI import ModuleBaseUI
 from ...widgets.Filters.StatusFilterWidget import StatusFilterWidget
@@ -87,20 +86,7 @@ class ProjectsModule(SearchOpenItemMixin, OverduePillsMixin, ModuleBaseUI):
 
 
         # Feed area
-        self.feed_content = QWidget()
-        self.feed_content.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.feed_layout = QVBoxLayout(self.feed_content)
-        self.feed_layout.setContentsMargins(0, 0, 0, 0)
-        self.feed_layout.setSpacing(6)
-
-        self._empty_state = QLabel(self.lang_manager.translate(TranslationKeys.NO_PROJECTS_FOUND))
-        self._empty_state.setAlignment(Qt.AlignCenter)
-        self._empty_state.setVisible(False)
-        self.feed_layout.addWidget(self._empty_state)
-        self.feed_layout.addStretch(1)
-
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.feed_content)
+        self._init_feed_view(self.lang_manager.translate(TranslationKeys.NO_PROJECTS_FOUND))
 
         if self.feed_logic is None:
             self.feed_logic = self.FEED_LOGIC_CLS(self.module_key, self.QUERY_FILE, self.lang_manager)
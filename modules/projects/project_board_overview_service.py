@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterable, Optional
 
 from ...languages.language_manager import LanguageManager
@@ -96,37 +95,29 @@ class ProjectBoardOverviewService:
 
     @classmethod
     def _load_connected_module_items(cls, property_numbers: Iterable[str], *, exclude_project_id: str) -> dict[str, list[dict[str, Any]]]:
-        lookup = PropertyLookupService()
         queries = PropertiesConnectedElementsQueries()
         tracked_modules = set(cls._tracked_modules())
-        property_ids = [lookup.property_id_by_cadastral(number) for number in property_numbers]
-        property_ids = [property_id for property_id in property_ids if property_id]
+        property_ids = cls._resolve_property_ids(property_numbers)
         if not property_ids:
             return {}
 
         aggregated: dict[str, dict[str, dict[str, Any]]] = {}
-        with ThreadPoolExecutor(max_workers=min(4, len(property_ids))) as executor:
-            futures = [executor.submit(queries.fetch_all_module_data, property_id) for property_id in property_ids]
-
-        for future in futures:
-            try:
-                module_data = future.result()
-            except Exception:
-                module_data = {}
-            for module_key, nodes in (module_data or {}).items():
-                if module_key not in tracked_modules:
+        module_keys = [module_key for module_key in queries.module_to_filename if module_key in tracked_modules]
+        requests = [(module_key, property_id) for property_id in property_ids for module_key in module_keys]
+        results = queries.fetch_module_data_batch(requests)
+
+        for (module_key, _property_id), nodes in zip(requests, results):
+            bucket = aggregated.setdefault(module_key, {})
+            for node in nodes or []:
+                normalized = cls._normalize_node_summary(node)
+                if not normalized:
+                    continue
+                if module_key == Module.PROJECT.value and normalized.get("id") == exclude_project_id:
                     continue
-                bucket = aggregated.setdefault(module_key, {})
-                for node in nodes or []:
-                    normalized = cls._normalize_node_summary(node)
-                    if not normalized:
-                        continue
-                    if module_key == Module.PROJECT.value and normalized.get("id") == exclude_project_id:
-                        continue
-                    item_id = str(normalized.get("id") or "").strip()
-                    dedupe_key = item_id or f"{normalized.get('number') or ''}|{normalized.get('title') or ''}"
-                    if dedupe_key:
-                        bucket[dedupe_key] = normalized
+                item_id = str(normalized.get("id") or "").strip()
+                dedupe_key = item_id or f"{normalized.get('number') or ''}|{normalized.get('title') or ''}"
+                if dedupe_key:
+                    bucket[dedupe_key] = normalized
 
         return {
             module_key: sorted(items.values(), key=lambda entry: str(entry.get("number") or entry.get("title") or "").lower())
@@ -134,6 +125,19 @@ class ProjectBoardOverviewService:
             if items
         }
 
+    @staticmethod
+    def _resolve_property_ids(property_numbers: Iterable[str]) -> list[str]:
+        numbers = [str(number).strip() for number in property_numbers if str(number or "").strip()]
+        if not numbers:
+            return []
+
+        resolved_map, missing = APIModuleActions.resolve_property_map_by_cadastral(numbers)
+        if missing:
+            for number, property_id in PropertyLookupService().property_ids_by_cadastral(missing).items():
+                if property_id:
+                    resolved_map[number] = str(property_id)
+        return [resolved_map[number] for number in numbers if resolved_map.get(number)]
+
     @staticmethod
     def _tracked_modules() -> list[str]:
         return ProjectBoardOverviewService._ordered_module_keys(
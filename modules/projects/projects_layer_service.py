@@ -25,6 +25,7 @@ from ...languages.translation_keys import TranslationKeys
 from ...utils.MapTools.MapHelpers import MapHelpers
 from ...utils.SessionManager import SessionManager
 from ...utils.geometry_payload import GeometryPayloadService
+from ...utils.layers.layer_feature_index import LayerFeatureIndex
 from ...utils.messagesHelper import ModernMessageDialog
 from ...utils.url_manager import Module
 from ...Logs.python_fail_logger import PythonFailLogger
@@ -454,19 +455,10 @@ class ProjectsLayerService:
         item_name_text = str(item_name or "").strip()
 
         try:
-            for feature in layer.getFeatures():
-                if id_field and item_id_text:
-                    current_id = str(feature.attribute(id_field) or "").strip()
-                    if current_id == item_id_text:
-                        return feature
-                if number_field and item_number_text:
-                    current_number = str(feature.attribute(number_field) or "").strip()
-                    if current_number == item_number_text:
-                        return feature
-                if name_field and item_name_text:
-                    current_name = str(feature.attribute(name_field) or "").strip()
-                    if current_name == item_name_text:
-                        return feature
+            return LayerFeatureIndex.find_feature(
+                layer,
+                ((id_field, item_id_text), (number_field, item_number_text), (name_field, item_name_text)),
+            )
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
@@ -3,8 +3,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QLabel, QFrame, QSizePolicy, QVBoxLayout, QWidget
+from PyQt5.QtWidgets import QFrame, QWidget
 
 from ...feed.FeedLogic import UnifiedFeedLogic as FeedLogic
 from ...module_manager import ModuleManager
@@ -69,20 +68,7 @@ class TaskModuleBaseUI(SearchOpenItemMixin, ModuleBaseUI):
         self._filter_refresh_widget = refresh_widget
         self.toolbar_area.set_refresh_widget(refresh_widget)
 
-        self.feed_content = QWidget()
-        self.feed_content.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.feed_layout = QVBoxLayout(self.feed_content)
-        self.feed_layout.setContentsMargins(0, 0, 0, 0)
-        self.feed_layout.setSpacing(6)
-
-        self._empty_state = QLabel(self.lang_manager.translate(empty_state_key))
-        self._empty_state.setAlignment(Qt.AlignCenter)
-        self._empty_state.setVisible(False)
-        self.feed_layout.addWidget(self._empty_state)
-        self.feed_layout.addStretch(1)
-
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.feed_content)
+        self._init_feed_view(self.lang_manager.translate(empty_state_key))
 
         feed_module_enum = getattr(self, "FEED_MODULE_ENUM", Module.TASK)
         feed_module_value = getattr(feed_module_enum, "value", Module.TASK.value)
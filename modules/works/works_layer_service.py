@@ -36,6 +36,7 @@ from ...languages.translation_keys import TranslationKeys
 from ...utils.SessionManager import SessionManager
 from ...utils.MapTools.MapHelpers import ActiveLayersHelper, MapHelpers
 from ...utils.geometry_payload import GeometryPayloadService
+from ...utils.layers.layer_feature_index import LayerFeatureIndex
 from ...utils.messagesHelper import ModernMessageDialog
 from ...utils.url_manager import Module
 from ...Logs.python_fail_logger import PythonFailLogger
@@ -553,10 +554,7 @@ class WorksLayerService:
             return None
 
         try:
-            for feature in layer.getFeatures():
-                value = str(feature.attribute(task_id_field) or "").strip()
-                if value == task_id_text:
-                    return feature
+            return LayerFeatureIndex.find_feature(layer, ((task_id_field, task_id_text),))
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
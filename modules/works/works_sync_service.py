@@ -8,16 +8,20 @@ from qgis.core import QgsFeatureRequest, QgsGeometry, QgsVectorLayer
 from ...Logs.python_fail_logger import PythonFailLogger
 from ...languages.language_manager import LanguageManager
 from ...python.api_actions import APIModuleActions
+from ...utils.layers.layer_feature_index import LayerFeatureIndex
 from ...utils.url_manager import Module
 from .works_layer_service import WorksLayerService
 
 
 class WorksSyncService:
+    SYNC_WATERMARK_PROPERTY = "wild_code/works_sync_updated_at"
+
     def __init__(self, *, lang_manager=None) -> None:
         self._lang = lang_manager or LanguageManager()
         self._layer: Optional[QgsVectorLayer] = None
         self._syncing_from_backend = False
         self._syncing_geometry = False
+        self._full_resync_pending = False
 
     def attach(self) -> Optional[QgsVectorLayer]:
         layer = WorksLayerService.resolve_main_layer(lang_manager=self._lang, silent=True)
@@ -39,6 +43,7 @@ class WorksSyncService:
             return None
 
         self._layer = layer
+        self._full_resync_pending = True
         return layer
 
     def detach(self) -> None:
@@ -51,7 +56,16 @@ class WorksSyncService:
         except Exception:
             return
 
-    def sync_from_backend(self) -> None:
+    def sync_from_backend(self, *, full_resync: bool = False) -> None:
+        """Pull backend task changes into the works layer.
+
+        By default only tasks updated since the layer's stored ``updatedAt``
+        watermark are requested, and only their features are read. A full
+        resync (or a layer without a watermark yet) refetches every task id
+        found in the layer. The first sync after attaching to a layer is
+        always a full resync, because the incremental query only returns
+        tasks that still exist and never reports backend deletions.
+        """
         if self._syncing_from_backend:
             return
 
@@ -62,44 +76,58 @@ class WorksSyncService:
             return
 
         task_id_field = WorksLayerService.resolve_task_id_field_name(layer)
-        if not task_id_field:
+        index = LayerFeatureIndex.for_field(layer, task_id_field)
+        if index is None:
             return
 
+        feature_ids_by_task_id = index.ids_by_value()
+        if not feature_ids_by_task_id:
+            return
+
+        self._log_duplicate_task_ids(feature_ids_by_task_id)
+
+        full_resync = full_resync or self._full_resync_pending
+        watermark = "" if full_resync else self._sync_watermark(layer)
         try:
-            features = list(layer.getFeatures())
+            if watermark:
+                fetched = APIModuleActions.get_tasks_updated_since(watermark)
+            else:
+                task_ids = list(feature_ids_by_task_id.keys())
+                fetched = APIModuleActions.get_tasks_by_ids(task_ids)
+                self._log_missing_backend_tasks(task_ids, fetched)
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
                 module=Module.WORKS.value,
-                event="works_sync_layer_read_failed",
+                event="works_sync_fetch_failed",
+                extra={"incremental": bool(watermark)},
             )
             return
 
-        if not features:
-            return
-
-        feature_ids_by_task_id = self._feature_ids_by_task_id(features, task_id_field)
-        if not feature_ids_by_task_id:
-            return
-
-        self._log_duplicate_task_ids(feature_ids_by_task_id)
-
-        task_ids = list(feature_ids_by_task_id.keys())
-        if not task_ids:
+        self._full_resync_pending = False
+        if not fetched:
             return
 
-        tasks_by_id = APIModuleActions.get_tasks_by_ids(task_ids)
-        self._log_missing_backend_tasks(task_ids, tasks_by_id)
-        if not tasks_by_id:
+        tasks_by_id = {task_id: task for task_id, task in fetched.items() if task_id in feature_ids_by_task_id}
+        feature_ids = [
+            feature_id
+            for task_id in tasks_by_id
+            for feature_id in feature_ids_by_task_id[task_id]
+        ]
+        try:
+            features = list(layer.getFeatures(QgsFeatureRequest().setFilterFids(feature_ids))) if feature_ids else []
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module=Module.WORKS.value,
+                event="works_sync_layer_read_failed",
+            )
             return
 
         pending_updates: list[tuple[int, dict[str, object], object]] = []
 
         for feature in features:
             task_id = str(feature.attribute(task_id_field) or "").strip()
-            if not task_id:
-                continue
-
             task = tasks_by_id.get(task_id)
             if not isinstance(task, dict):
                 continue
@@ -112,10 +140,8 @@ class WorksSyncService:
             if updates:
                 pending_updates.append((feature.id(), updates, feature))
 
-        if not pending_updates:
-            return
-
-        self._apply_pending_updates(layer=layer, pending_updates=pending_updates)
+        if self._apply_pending_updates(layer=layer, pending_updates=pending_updates):
+            self._store_sync_watermark(layer, fetched.values())
 
     def sync_task_from_backend(self, task_id: str, *, task: Optional[dict] = None) -> None:
         if self._syncing_from_backend:
@@ -154,30 +180,27 @@ class WorksSyncService:
         *,
         layer: QgsVectorLayer,
         pending_updates: list[tuple[int, dict[str, object], object]],
-    ) -> None:
+    ) -> bool:
+        """Write updates in one edit session; True when the layer now matches the backend."""
         if not pending_updates:
-            return
+            return True
 
         if self._is_layer_editable(layer, event="works_sync_apply_skipped_layer_editable"):
-            return
+            return False
 
         self._syncing_from_backend = True
         started_edit = False
         try:
             field_indices = {field.name().lower(): index for index, field in enumerate(layer.fields())}
 
-            started_edit = bool(layer.startEditing())
-            if not started_edit:
-                return
-
-            changed = False
+            geometry_changes: list[tuple[int, QgsGeometry]] = []
+            attribute_changes: list[tuple[int, int, object]] = []
             for feature_id, updates, feature in pending_updates:
                 geometry_update = updates.pop("__geometry", None)
                 if isinstance(geometry_update, QgsGeometry):
                     current_geometry = feature.geometry() if hasattr(feature, "geometry") else None
                     if not self._geometries_equal(current_geometry, geometry_update):
-                        if layer.changeGeometry(feature_id, geometry_update):
-                            changed = True
+                        geometry_changes.append((feature_id, geometry_update))
 
                 for canonical_name, new_value in updates.items():
                     field_index = field_indices.get(str(canonical_name).lower())
@@ -187,18 +210,28 @@ class WorksSyncService:
                     field = layer.fields()[field_index]
                     coerced_value = WorksLayerService.coerce_value_for_field(field, new_value)
                     current_value = feature.attribute(field_index)
-                    if self._values_equal(current_value, coerced_value):
-                        continue
+                    if not self._values_equal(current_value, coerced_value):
+                        attribute_changes.append((feature_id, field_index, coerced_value))
 
-                    if layer.changeAttributeValue(feature_id, field_index, coerced_value):
-                        changed = True
+            # Unchanged features never open an edit session.
+            if not geometry_changes and not attribute_changes:
+                return True
 
+            started_edit = bool(layer.startEditing())
             if not started_edit:
-                return
+                return False
+
+            changed = False
+            for feature_id, geometry_update in geometry_changes:
+                if layer.changeGeometry(feature_id, geometry_update):
+                    changed = True
+            for feature_id, field_index, coerced_value in attribute_changes:
+                if layer.changeAttributeValue(feature_id, field_index, coerced_value):
+                    changed = True
 
             if not changed:
                 layer.rollBack()
-                return
+                return False
 
             if not layer.commitChanges():
                 errors = "; ".join(layer.commitErrors() or [])
@@ -206,6 +239,7 @@ class WorksSyncService:
                 raise RuntimeError(errors or "Could not commit Works sync changes")
 
             layer.triggerRepaint()
+            return True
         except Exception as exc:
             if started_edit and layer.isEditable():
                 try:
@@ -221,6 +255,7 @@ class WorksSyncService:
                 module=Module.WORKS.value,
                 event="works_sync_from_backend_failed",
             )
+            return False
         finally:
             self._syncing_from_backend = False
 
@@ -311,22 +346,21 @@ class WorksSyncService:
 
         return updates
 
-    @staticmethod
-    def _feature_ids_by_task_id(features: list, task_id_field: str) -> dict[str, list[int]]:
-        feature_ids_by_task_id: dict[str, list[int]] = {}
-        for feature in features:
-            try:
-                task_id = str(feature.attribute(task_id_field) or "").strip()
-            except Exception:
-                continue
-            if not task_id:
-                continue
-            try:
-                feature_id = int(feature.id())
-            except Exception:
-                continue
-            feature_ids_by_task_id.setdefault(task_id, []).append(feature_id)
-        return feature_ids_by_task_id
+    @classmethod
+    def _sync_watermark(cls, layer: QgsVectorLayer) -> str:
+        return str(layer.customProperty(cls.SYNC_WATERMARK_PROPERTY) or "").strip()
+
+    @classmethod
+    def _store_sync_watermark(cls, layer: QgsVectorLayer, tasks) -> None:
+        latest_text = cls._sync_watermark(layer)
+        latest = WorksLayerService.parse_backend_datetime(latest_text)
+        for task in tasks:
+            updated_text = str((task or {}).get("updatedAt") or "").strip()
+            updated = WorksLayerService.parse_backend_datetime(updated_text)
+            if updated is not None and (latest is None or updated > latest):
+                latest, latest_text = updated, updated_text
+        if latest_text:
+            layer.setCustomProperty(cls.SYNC_WATERMARK_PROPERTY, latest_text)
 
     @staticmethod
     def _layer_name(layer: QgsVectorLayer) -> str:
@@ -1,13 +1,35 @@
+import hashlib
 import os
-from ..constants.file_paths import QueryPaths  # This should be defined in file_paths.py for all query folders
+import threading
+from typing import NamedTuple, Optional
+
+from ..constants.base_paths import PLUGIN_ROOT, PYTHON, QUERIES, GRAPHQL
+from ..constants.file_paths import ConfigPaths, QueryPaths  # This should be defined in file_paths.py for all query folders
 from ..languages.language_manager import LanguageManager
 
 
+class _CachedQuery(NamedTuple):
+    text: str
+    sha256: str
+    mtime: float
+
+
 class GraphQLQueryLoader:
     """
     Loads GraphQL query files by module and query name, using only paths from QueryPaths.
     All error messages use translation keys.
+
+    Every .graphql file under python/queries/graphql/ is read once into a
+    process-wide registry; dev builds re-read a file when its mtime changes.
     """
+    QUERY_ROOT = os.path.join(PLUGIN_ROOT, PYTHON, QUERIES, GRAPHQL)
+
+    _registry: dict[str, _CachedQuery] = {}
+    # Digests of registry texts only; dynamic documents are hashed on every call.
+    _hash_by_text: dict[str, str] = {}
+    _preloaded = False
+    _lock = threading.Lock()
+
     def __init__(self):
         self._lang = LanguageManager()
 
@@ -28,14 +50,60 @@ class GraphQLQueryLoader:
             message = f"unknown_module: {module}"
             raise ValueError(message)
         folder = getattr(QueryPaths, module_attr)
-        #print(f"[method load_query] Query folder found: {folder}")
-        query_path = os.path.join(folder, query_filename)
-        #print(f"[method load_query] Loading GraphQL query from: {query_path}")  # Debug log
-        #print(f"[method load_query] Query file exists: {os.path.exists(query_path)}")
-        if not os.path.exists(query_path):
+        return self.load_query_file(os.path.join(folder, query_filename))
+
+    @classmethod
+    def load_query_file(cls, query_path: str) -> str:
+        """Return the cached text of a .graphql file by absolute path."""
+        return cls._cached(query_path).text
+
+    @classmethod
+    def query_hash(cls, query: str) -> str:
+        """Stable SHA-256 hex digest of a query text (automatic persisted query id)."""
+        digest = cls._hash_by_text.get(query)
+        if digest is None:
+            digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return digest
+
+    @classmethod
+    def _cached(cls, query_path: str) -> _CachedQuery:
+        cls._preload()
+        key = os.path.normcase(os.path.abspath(query_path))
+        entry = cls._registry.get(key)
+        if entry is not None and not ConfigPaths.IS_DEV:
+            return entry
+
+        try:
+            mtime = os.path.getmtime(key)
+        except OSError:
             message = f"query_file_not_found: {query_path}"
             raise FileNotFoundError(message)
-        with open(query_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        if entry is not None and entry.mtime == mtime:
+            return entry
+        return cls._read(key, mtime)
 
+    @classmethod
+    def _read(cls, key: str, mtime: Optional[float] = None) -> _CachedQuery:
+        with open(key, 'r', encoding='utf-8') as f:
+            text = f.read()
+        entry = _CachedQuery(text, cls.query_hash(text), mtime if mtime is not None else os.path.getmtime(key))
+        with cls._lock:
+            previous = cls._registry.get(key)
+            if previous is not None and previous.text != text:
+                cls._hash_by_text.pop(previous.text, None)
+            cls._registry[key] = entry
+            cls._hash_by_text[text] = entry.sha256
+        return entry
 
+    @classmethod
+    def _preload(cls) -> None:
+        if cls._preloaded:
+            return
+        with cls._lock:
+            if cls._preloaded:
+                return
+            cls._preloaded = True
+        for root, _dirs, files in os.walk(cls.QUERY_ROOT):
+            for name in files:
+                if name.endswith(".graphql"):
+                    cls._read(os.path.normcase(os.path.abspath(os.path.join(root, name))))
@@ -1,9 +1,12 @@
 import json
 import os
 from typing import List, Optional, Set
-import requests
 
 from .api_client import APIClient
+from .http_session import HttpSessionPool
+from .reference_cache import ReferenceCache
+from .request_executor import RequestExecutor
+from .response_cache import ResponseCache
 
 from .GraphQLQueryLoader import GraphQLQueryLoader
 from ..languages.language_manager import LanguageManager
@@ -18,7 +21,6 @@ _PROPERTIES_PAGE_SIZE = 50
 
 class APIModuleActions:
     _TASK_PRIORITY_DEFAULTS = ("URGENT", "HIGH", "MEDIUM", "LOW")
-    _task_priority_values_cache: Optional[List[str]] = None
 
     @staticmethod
     def _geometry_input_value(geometry: dict) -> str:
@@ -109,6 +111,14 @@ class APIModuleActions:
         }
         return query_map.get(owner, "")
 
+    @staticmethod
+    def _invalidate_feed_cache(module: str) -> None:
+        owner = APIModuleActions._property_owner_module(module)
+        if owner == Module.TASK.value:
+            ResponseCache.invalidate((Module.TASK.value, Module.WORKS.value, Module.ASBUILT.value))
+        else:
+            ResponseCache.invalidate((owner,))
+
     @staticmethod
     def get_module_status_options(module_name: str, *, limit: int = 100) -> List[dict[str, object]]:
         status_module = APIModuleActions._status_module_value(module_name)
@@ -116,53 +126,8 @@ class APIModuleActions:
         if not status_module:
             return []
 
-        loader = GraphQLQueryLoader()
-        client = APIClient()
-        statuses_by_id: dict[str, dict[str, object]] = {}
-
         try:
-            query = loader.load_query_by_module(Module.STATUSES.value, "ListModuleStatuses.graphql")
-            after: Optional[str] = None
-
-            while len(statuses_by_id) < max_items:
-                remaining = max_items - len(statuses_by_id)
-                variables = {
-                    "first": min(50, remaining),
-                    "after": after,
-                    "where": {"column": "MODULE", "operator": "EQ", "value": status_module},
-                }
-                data = client.send_query(query, variables=variables) or {}
-                statuses_connection = (data.get("statuses") or {}) if isinstance(data, dict) else {}
-                edges = statuses_connection.get("edges") or []
-                if not isinstance(edges, list) or not edges:
-                    break
-
-                for edge in edges:
-                    node = (edge or {}).get("node") or {}
-                    if not isinstance(node, dict):
-                        continue
-
-                    status_id = str(node.get("id") or "").strip()
-                    name = str(node.get("name") or "").strip()
-                    if not status_id or not name:
-                        continue
-
-                    statuses_by_id[status_id] = {
-                        "id": status_id,
-                        "name": name,
-                        "color": str(node.get("color") or "cccccc").strip() or "cccccc",
-                        "type": str(node.get("type") or "").strip().upper(),
-                        "description": str(node.get("description") or "").strip(),
-                        "isDefault": bool(node.get("isDefault")),
-                        "sortOrder": node.get("sortOrder"),
-                    }
-                    if len(statuses_by_id) >= max_items:
-                        break
-
-                page_info = statuses_connection.get("pageInfo") or {}
-                after = str(page_info.get("endCursor") or "").strip()
-                if not page_info.get("hasNextPage") or not after:
-                    break
+            return ReferenceCache.get("module_statuses", f"{status_module}:{max_items}")
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
@@ -172,6 +137,74 @@ class APIModuleActions:
             )
             return []
 
+    @staticmethod
+    def peek_module_status_options(module_name: str, *, limit: int = 100) -> Optional[List[dict[str, object]]]:
+        """Disk-cached status options for ``module_name``, or None; never hits the network."""
+        status_module = APIModuleActions._status_module_value(module_name)
+        if not status_module:
+            return None
+        return ReferenceCache.peek("module_statuses", f"{status_module}:{max(1, int(limit or 0))}")
+
+    @staticmethod
+    def refresh_module_status_options(module_name: str, *, limit: int = 100) -> tuple[List[dict[str, object]], bool]:
+        """Refetch and store status options; returns ``(options, changed_since_stored_copy)``."""
+        status_module = APIModuleActions._status_module_value(module_name)
+        if not status_module:
+            return [], False
+        return ReferenceCache.refresh("module_statuses", f"{status_module}:{max(1, int(limit or 0))}")
+
+    @staticmethod
+    def _fetch_module_status_options(cache_key: str) -> List[dict[str, object]]:
+        status_module, _sep, limit = cache_key.rpartition(":")
+        max_items = max(1, int(limit or 0))
+
+        loader = GraphQLQueryLoader()
+        client = APIClient()
+        statuses_by_id: dict[str, dict[str, object]] = {}
+
+        query = loader.load_query_by_module(Module.STATUSES.value, "ListModuleStatuses.graphql")
+        after: Optional[str] = None
+
+        while len(statuses_by_id) < max_items:
+            remaining = max_items - len(statuses_by_id)
+            variables = {
+                "first": min(50, remaining),
+                "after": after,
+                "where": {"column": "MODULE", "operator": "EQ", "value": status_module},
+            }
+            data = client.send_query(query, variables=variables) or {}
+            statuses_connection = (data.get("statuses") or {}) if isinstance(data, dict) else {}
+            edges = statuses_connection.get("edges") or []
+            if not isinstance(edges, list) or not edges:
+                break
+
+            for edge in edges:
+                node = (edge or {}).get("node") or {}
+                if not isinstance(node, dict):
+                    continue
+
+                status_id = str(node.get("id") or "").strip()
+                name = str(node.get("name") or "").strip()
+                if not status_id or not name:
+                    continue
+
+                statuses_by_id[status_id] = {
+                    "id": status_id,
+                    "name": name,
+                    "color": str(node.get("color") or "cccccc").strip() or "cccccc",
+                    "type": str(node.get("type") or "").strip().upper(),
+                    "description": str(node.get("description") or "").strip(),
+                    "isDefault": bool(node.get("isDefault")),
+                    "sortOrder": node.get("sortOrder"),
+                }
+                if len(statuses_by_id) >= max_items:
+                    break
+
+            page_info = statuses_connection.get("pageInfo") or {}
+            after = str(page_info.get("endCursor") or "").strip()
+            if not page_info.get("hasNextPage") or not after:
+                break
+
         def _sort_key(option: dict[str, object]) -> tuple[int, str]:
             raw_sort = option.get("sortOrder")
             try:
@@ -184,25 +217,12 @@ class APIModuleActions:
 
     @staticmethod
     def get_task_priority_values(*, force_refresh: bool = False) -> List[str]:
-        if APIModuleActions._task_priority_values_cache and not force_refresh:
-            return list(APIModuleActions._task_priority_values_cache)
-
-        loader = GraphQLQueryLoader()
-        client = APIClient()
-
         try:
-            query = loader.load_query_by_module(Module.TASK.value, "taskPriorityEnum.graphql")
-            data = client.send_query(query) or {}
-            enum_payload = (data.get("__type") or {}) if isinstance(data, dict) else {}
-            enum_values = enum_payload.get("enumValues") or []
-
-            values = [
-                str(item.get("name") or "").strip().upper()
-                for item in enum_values
-                if isinstance(item, dict) and str(item.get("name") or "").strip()
-            ]
+            if force_refresh:
+                values, _changed = ReferenceCache.refresh("task_priorities")
+            else:
+                values = ReferenceCache.get("task_priorities")
             if values:
-                APIModuleActions._task_priority_values_cache = values
                 return list(values)
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -213,6 +233,19 @@ class APIModuleActions:
 
         return list(APIModuleActions._TASK_PRIORITY_DEFAULTS)
 
+    @staticmethod
+    def _fetch_task_priority_values(_key: str = "") -> List[str]:
+        loader = GraphQLQueryLoader()
+        query = loader.load_query_by_module(Module.TASK.value, "taskPriorityEnum.graphql")
+        data = APIClient().send_query(query) or {}
+        enum_payload = (data.get("__type") or {}) if isinstance(data, dict) else {}
+        enum_values = enum_payload.get("enumValues") or []
+        return [
+            str(item.get("name") or "").strip().upper()
+            for item in enum_values
+            if isinstance(item, dict) and str(item.get("name") or "").strip()
+        ]
+
     @staticmethod
     def task_priority_label(priority: str, *, lang_manager=None) -> str:
         lang = lang_manager or LanguageManager()
@@ -329,52 +362,13 @@ class APIModuleActions:
                 "displayName": current_user_name,
             }
 
-        loader = GraphQLQueryLoader()
-        client = APIClient()
-
         try:
-            query = loader.load_query_by_module(Module.USER.value, "users.graphql")
-            after: Optional[str] = None
-
-            while len(users_by_id) < max_items:
-                remaining = max_items - len(users_by_id)
-                variables = {
-                    "first": min(50, remaining),
-                    "after": after,
-                }
-                data = client.send_query(query, variables=variables) or {}
-                users_connection = (data.get("users") or {}) if isinstance(data, dict) else {}
-                edges = users_connection.get("edges") or []
-                if not isinstance(edges, list) or not edges:
-                    break
-
-                for edge in edges:
-                    node = (edge or {}).get("node") or {}
-                    if not isinstance(node, dict):
-                        continue
-
-                    user_id = str(node.get("id") or "").strip()
-                    if not user_id:
-                        continue
-
-                    if str(node.get("deletedAt") or "").strip():
-                        continue
-
-                    display_name = APIModuleActions.user_display_name(node)
-                    if not display_name:
-                        continue
-
-                    users_by_id[user_id] = {
-                        "id": user_id,
-                        "displayName": display_name,
-                    }
-                    if len(users_by_id) >= max_items:
-                        break
-
-                page_info = users_connection.get("pageInfo") or {}
-                after = str(page_info.get("endCursor") or "").strip()
-                if not page_info.get("hasNextPage") or not after:
+            for user in ReferenceCache.get("assignable_users", str(max_items)) or []:
+                if len(users_by_id) >= max_items:
                     break
+                user_id = str((user or {}).get("id") or "").strip()
+                if user_id and user_id not in users_by_id:
+                    users_by_id[user_id] = {"id": user_id, "displayName": str(user.get("displayName") or "")}
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
@@ -392,6 +386,58 @@ class APIModuleActions:
         )
         return users
 
+    @staticmethod
+    def _fetch_assignable_users(limit: str) -> list[dict[str, str]]:
+        max_items = max(1, int(limit or 0))
+        users_by_id: dict[str, dict[str, str]] = {}
+        loader = GraphQLQueryLoader()
+        client = APIClient()
+
+        query = loader.load_query_by_module(Module.USER.value, "users.graphql")
+        after: Optional[str] = None
+
+        while len(users_by_id) < max_items:
+            remaining = max_items - len(users_by_id)
+            variables = {
+                "first": min(50, remaining),
+                "after": after,
+            }
+            data = client.send_query(query, variables=variables) or {}
+            users_connection = (data.get("users") or {}) if isinstance(data, dict) else {}
+            edges = users_connection.get("edges") or []
+            if not isinstance(edges, list) or not edges:
+                break
+
+            for edge in edges:
+                node = (edge or {}).get("node") or {}
+                if not isinstance(node, dict):
+                    continue
+
+                user_id = str(node.get("id") or "").strip()
+                if not user_id:
+                    continue
+
+                if str(node.get("deletedAt") or "").strip():
+                    continue
+
+                display_name = APIModuleActions.user_display_name(node)
+                if not display_name:
+                    continue
+
+                users_by_id[user_id] = {
+                    "id": user_id,
+                    "displayName": display_name,
+                }
+                if len(users_by_id) >= max_items:
+                    break
+
+            page_info = users_connection.get("pageInfo") or {}
+            after = str(page_info.get("endCursor") or "").strip()
+            if not page_info.get("hasNextPage") or not after:
+                break
+
+        return list(users_by_id.values())
+
     @staticmethod
     def delete_item(module: str, item_id: str, lang_manager: LanguageManager) -> bool:
         """
@@ -416,6 +462,7 @@ class APIModuleActions:
         try:
             response = client.send_query(query, variables=variables)
             # You may want to check for errors in the response here
+            APIModuleActions._invalidate_feed_cache(module)
             return True
         except Exception as e:
             print(f"Failed to delete item {item_id} in module {module}: {e}")
@@ -510,12 +557,9 @@ class APIModuleActions:
         query = loader.load_query_by_module(Module.PROPERTY.value, "id_number.graphql")
         client = APIClient()
 
-        resolved_map: dict[str, str] = {}
-        resolved_numbers = set()
         chunk_size = 25
 
-        for start in range(0, len(cleaned), chunk_size):
-            chunk = cleaned[start:start + chunk_size]
+        def _fetch_chunk(chunk: List[str]) -> list:
             variables = {
                 "first": len(chunk),
                 "after": None,
@@ -530,9 +574,13 @@ class APIModuleActions:
                     ]
                 },
             }
-
             payload = client.send_query(query, variables=variables, return_raw=True) or {}
-            edges = JsonResponseHandler.get_edges_from_path(payload, ["properties"]) or []
+            return JsonResponseHandler.get_edges_from_path(payload, ["properties"]) or []
+
+        chunks = [cleaned[start:start + chunk_size] for start in range(0, len(cleaned), chunk_size)]
+        resolved_map: dict[str, str] = {}
+        resolved_numbers = set()
+        for edges in RequestExecutor.instance().map(_fetch_chunk, chunks):
             for edge in edges:
                 node = edge.get("node") or {}
                 pid = node.get("id")
@@ -644,6 +692,7 @@ class APIModuleActions:
         updated = (data.get(mutation_root) or {}) if isinstance(data, dict) else {}
         if not isinstance(updated, dict) or not updated.get("id"):
             raise RuntimeError(f"Property association did not return {mutation_root}.id")
+        APIModuleActions._invalidate_feed_cache(module_key)
         return response
 
     @staticmethod
@@ -688,6 +737,7 @@ class APIModuleActions:
         updated = (data.get("updateEasement") or {}) if isinstance(data, dict) else {}
         if not isinstance(updated, dict) or not updated.get("id"):
             raise RuntimeError("Easement property association did not return updateEasement.id")
+        APIModuleActions._invalidate_feed_cache(Module.EASEMENT.value)
         return response
 
     @staticmethod
@@ -807,7 +857,11 @@ class APIModuleActions:
 
     @staticmethod
     def get_tasks_by_ids(item_ids: List[str]) -> dict[str, dict]:
-        """Fetch multiple tasks by id using the list query in small chunks."""
+        """Fetch multiple tasks by id using the list query in small chunks.
+
+        Raises when any chunk fails, so callers never treat a partial result
+        as the full set (e.g. when advancing a sync watermark).
+        """
 
         cleaned = list(dict.fromkeys(str(item_id).strip() for item_id in (item_ids or []) if str(item_id).strip()))
         if not cleaned:
@@ -818,10 +872,8 @@ class APIModuleActions:
         client = APIClient()
 
         chunk_size = 25
-        tasks: dict[str, dict] = {}
 
-        for start in range(0, len(cleaned), chunk_size):
-            chunk = cleaned[start:start + chunk_size]
+        def _fetch_chunk(chunk: List[str]) -> list:
             variables = {
                 "first": len(chunk),
                 "after": None,
@@ -836,8 +888,12 @@ class APIModuleActions:
                 },
             }
 
+            nodes: list = []
             try:
-                data = client.send_query(query, variables=variables) or {}
+                # Streamed: geometry-heavy task pages are decoded node by node.
+                for node in client.send_query_stream(query, variables=variables, path=["tasks", "edges"]):
+                    if isinstance(node, dict):
+                        nodes.append(node)
             except Exception as exc:
                 PythonFailLogger.log_exception(
                     exc,
@@ -845,23 +901,57 @@ class APIModuleActions:
                     event="task_bulk_fetch_failed",
                     extra={"count": len(chunk)},
                 )
-                continue
+                raise
+            return nodes
 
-            tasks_conn = (data.get("tasks") or {}) if isinstance(data, dict) else {}
-            edges = tasks_conn.get("edges") or []
-            if not isinstance(edges, list):
-                continue
-
-            for edge in edges:
-                node = (edge or {}).get("node") or {}
-                if not isinstance(node, dict):
-                    continue
+        chunks = [cleaned[start:start + chunk_size] for start in range(0, len(cleaned), chunk_size)]
+        tasks: dict[str, dict] = {}
+        for nodes in RequestExecutor.instance().map(_fetch_chunk, chunks):
+            for node in nodes:
                 task_id = node.get("id")
                 if task_id:
                     tasks[str(task_id)] = node
 
         return tasks
 
+    @staticmethod
+    def get_tasks_updated_since(updated_since: str, *, page_size: int = 100) -> dict[str, dict]:
+        """Fetch every task whose updatedAt is at or after ``updated_since``.
+
+        Raises on request failure so callers never advance a sync watermark
+        past tasks they did not receive.
+        """
+
+        since_text = str(updated_since or "").strip()
+        if not since_text:
+            return {}
+
+        loader = GraphQLQueryLoader()
+        query = loader.load_query_by_module(Module.TASK.value, "ListFilteredTasks.graphql")
+        client = APIClient()
+
+        tasks: dict[str, dict] = {}
+        after = None
+        seen_cursors: set[str] = set()
+        while True:
+            variables = {
+                "first": page_size,
+                "after": after,
+                "where": {"AND": [{"column": "UPDATED_AT", "operator": "GTE", "value": since_text}]},
+            }
+            siblings: dict = {}
+            for node in client.send_query_stream(query, variables=variables, path=["tasks", "edges"], siblings=siblings):
+                if isinstance(node, dict) and node.get("id"):
+                    tasks[str(node.get("id"))] = node
+
+            page_info = siblings.get("pageInfo") or {}
+            after = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not after:
+                return tasks
+            if after in seen_cursors:
+                raise RuntimeError(f"Task paging did not advance past cursor {after!r}")
+            seen_cursors.add(after)
+
     @staticmethod
     def get_task_description(item_id: str) -> Optional[str]:
         """Fetch the latest task/asbuilt description from the backend."""
@@ -893,6 +983,8 @@ class APIModuleActions:
         try:
             data = client.send_query(query, variables=variables) or {}
             updated = (data.get("updateTask") or {}) if isinstance(data, dict) else {}
+            if updated.get("id"):
+                APIModuleActions._invalidate_feed_cache(Module.TASK.value)
             return bool(updated.get("id"))
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -1034,7 +1126,7 @@ class APIModuleActions:
         }
 
         try:
-            with requests.get(url, headers=headers, stream=True, timeout=60) as response:
+            with HttpSessionPool.lease() as http, http.get(url, headers=headers, stream=True, timeout=60) as response:
                 response.raise_for_status()
 
                 content = bytearray()
@@ -1167,6 +1259,7 @@ class APIModuleActions:
         try:
             data = client.send_query(query, variables=variables) or {}
             updated = (data.get("updateTask") or {}) if isinstance(data, dict) else {}
+            APIModuleActions._invalidate_feed_cache(Module.TASK.value)
             return updated if isinstance(updated, dict) and updated.get("id") else None
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -1199,6 +1292,8 @@ class APIModuleActions:
         try:
             data = client.send_query(query, variables=variables) or {}
             updated = (data.get("updateTask") or {}) if isinstance(data, dict) else {}
+            if updated.get("id"):
+                APIModuleActions._invalidate_feed_cache(Module.TASK.value)
             return bool(updated.get("id"))
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -1391,6 +1486,8 @@ class APIModuleActions:
                 APIModuleActions.update_task_members(task_id_text, member_payload)
             if task_id_text and status_payload and not sent_status_in_create:
                 APIModuleActions.update_task_status(task_id_text, status_payload)
+            if task_id_text:
+                APIModuleActions._invalidate_feed_cache(Module.TASK.value)
 
             return task_id_text
         except Exception as exc:
@@ -1401,5 +1498,3 @@ class APIModuleActions:
                 extra={"title": task_title, "type_id": task_type_id},
             )
             return None
-
-
@@ -1,11 +1,8 @@
 import os
-import platform
 import json
-import time
 import mimetypes
-import requests
+from typing import Iterator, Optional
 from requests import exceptions as requests_exceptions
-from qgis.core import Qgis
 from qgis.PyQt.QtCore import QVariant
 from qgis.PyQt.QtCore import QThread
 from qgis.PyQt.QtWidgets import QApplication
@@ -15,8 +12,19 @@ from ..languages.language_manager import LanguageManager
 from ..languages.translation_keys import TranslationKeys
 from ..utils.api_error_handling import ApiErrorKind, summarize_connection_error, tag_message
 from ..Logs.python_fail_logger import PythonFailLogger
+from .http_session import HttpSessionPool
+from .GraphQLQueryLoader import GraphQLQueryLoader
+from .json_stream import iter_array_items
+from .retry_policy import CircuitBreaker, RetryPolicy
+from .single_flight import SingleFlight
 
 class APIClient:
+    _PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+    _PERSISTED_QUERY_NOT_SUPPORTED = "PersistedQueryNotSupported"
+    # None until read from config; flipped to False if the backend rejects persisted queries.
+    _persisted_queries_enabled = None
+    _retry_policy = RetryPolicy()
+
     def __init__(self, session_manager=None, config_path=None):
         self.lang = LanguageManager()
         self.session_manager = session_manager or SessionManager()
@@ -36,6 +44,50 @@ class APIClient:
         timeout: int = 30,
         return_raw: bool = False,
         with_success: bool = False,
+    ):
+        def _send():
+            return self._send_query_once(
+                query,
+                variables,
+                require_auth=require_auth,
+                timeout=timeout,
+                return_raw=return_raw,
+                with_success=with_success,
+            )
+
+        if SingleFlight.is_mutation(query):
+            # Reads issued right after a write must not see the memoized pre-write result.
+            SingleFlight.forget()
+            return _send()
+
+        key = SingleFlight.make_key(query, variables, require_auth, return_raw, with_success)
+        return SingleFlight.do(
+            key,
+            _send,
+            # The UI thread never queues behind a worker's retry loop.
+            wait=not self._on_main_thread(),
+            remember=lambda result: not (with_success and not result.get("success")),
+        )
+
+    @staticmethod
+    def _on_main_thread() -> bool:
+        try:
+            app = QApplication.instance()
+            if app is not None:
+                return QThread.currentThread() == app.thread()
+        except Exception:
+            pass
+        return True
+
+    def _send_query_once(
+        self,
+        query: str,
+        variables: dict = None,
+        *,
+        require_auth: bool = True,
+        timeout: int = 30,
+        return_raw: bool = False,
+        with_success: bool = False,
     ):
         def _wrap_success(raw_json: dict):
             if return_raw:
@@ -50,50 +102,59 @@ class APIClient:
         if variables:
             sanitized_variables = requestBuilder.sanitize_for_json(variables)
             payload["variables"] = sanitized_variables
+        if self._use_persisted_queries():
+            payload["extensions"] = {
+                "persistedQuery": {"version": 1, "sha256Hash": GraphQLQueryLoader.query_hash(query)}
+            }
         api_url = GraphQLSettings.graphql_endpoint()
        
 
         # Determine retry behavior.
-        is_main_thread = True
-        try:
-            app = QApplication.instance()
-            if app is not None:
-                is_main_thread = QThread.currentThread() == app.thread()
-        except Exception:
-            is_main_thread = True
+        is_main_thread = self._on_main_thread()
 
         auth_attempts = 2 if require_auth else 1
-        # Avoid blocking the UI thread with network retries.
-        network_attempts = 3 if not is_main_thread else 1
+        # The UI thread never sleeps between attempts; an open breaker fails it fast instead.
+        # Synchronous UI-thread callers (login, folder/tag/filter helpers, ModuleConfig,
+        # property delete) therefore surface a transient 5xx/429 after one attempt;
+        # calls that should ride out outages belong on a worker or AsyncAPIClient.
+        network_attempts = self._retry_policy.max_attempts if not is_main_thread else 1
         attempts = max(auth_attempts, network_attempts)
         last_error = None
+        breaker = CircuitBreaker.for_endpoint(api_url)
+        is_mutation = SingleFlight.is_mutation(query)
 
-        for attempt in range(1, attempts + 1):
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "X-Requested-With": "XMLHttpRequest",
-                 "User-Agent": f"QGIS/{Qgis.QGIS_VERSION} ({platform.system()} {platform.release()})"
-            }
+        headers = dict(HttpSessionPool.base_headers())
+        headers["Content-Type"] = "application/json"
 
+        for attempt in range(1, attempts + 1):
             if require_auth:
                 token = self.session_manager.get_token()
                 if token:
                     headers["Authorization"] = f"Bearer {token}"
                 else:
+                    headers.pop("Authorization", None)
                     print("[DEBUG] No auth token available!")
 
             try:
-                response = requests.post(api_url, json=payload, headers=headers, timeout=timeout)
+                if not breaker.allow():
+                    raise Exception(self._circuit_open_message(breaker))
+                with HttpSessionPool.lease() as http:
+                    response = self._post_graphql(http, api_url, payload, headers, timeout)
 
                 if response.status_code in (401, 403):
+                    breaker.record_success()
                     raise Exception(tag_message(ApiErrorKind.AUTH, "Unauthenticated"))
 
-                if response.status_code >= 500:
-                    if attempt < network_attempts:
-                        time.sleep(0.4 * attempt)
+                if self._retry_policy.is_retryable_status(response.status_code):
+                    breaker.record_failure()
+                    if attempt < network_attempts and self._retry_policy.is_retryable_status(
+                        response.status_code, mutation=is_mutation
+                    ):
+                        self._retry_policy.wait(attempt, RetryPolicy.parse_retry_after(response.headers.get("Retry-After")))
                         continue
+                    RetryPolicy.record_gave_up()
                     raise Exception(tag_message(ApiErrorKind.SERVER, f"HTTP {response.status_code}"))
+                breaker.record_success()
 
                 if response.status_code == 200:
                     data = response.json()
@@ -118,9 +179,11 @@ class APIClient:
                 raise Exception(tag_message(ApiErrorKind.SERVER, template.format(error=body)))
 
             except requests_exceptions.RequestException as exc:
-                if attempt < network_attempts:
-                    time.sleep(0.4 * attempt)
+                breaker.record_failure()
+                if attempt < network_attempts and self._is_retryable_transport_error(exc, mutation=is_mutation):
+                    self._retry_policy.wait(attempt)
                     continue
+                RetryPolicy.record_gave_up()
                 summary = summarize_connection_error(str(exc))
                 template = self.lang.translate(TranslationKeys.NETWORK_ERROR) or "Network error: {error}"
                 raise Exception(tag_message(ApiErrorKind.NETWORK, template.format(error=summary)))
@@ -170,6 +233,128 @@ class APIClient:
             return _wrap_error(msg2)
         raise Exception(msg2)
 
+    def send_query_stream(
+        self,
+        query: str,
+        variables: dict = None,
+        *,
+        path: list,
+        node_key: Optional[str] = "node",
+        siblings: Optional[dict] = None,
+        require_auth: bool = True,
+        timeout: int = 30,
+    ) -> Iterator[dict]:
+        """Yield nodes of the connection at ``data.<path>`` while the body is still arriving.
+
+        ``path`` names the array, e.g. ``["tasks", "edges"]``; each element's
+        ``node_key`` value is yielded (the element itself when ``node_key`` is
+        None). ``siblings`` receives the array's neighbours such as
+        ``pageInfo`` once the iterator is exhausted. Errors are raised tagged
+        like ``send_query``; there are no automatic retries, since nodes may
+        already have been handed to the caller.
+        """
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = requestBuilder.sanitize_for_json(variables)
+
+        headers = dict(HttpSessionPool.base_headers())
+        headers["Content-Type"] = "application/json"
+        if require_auth:
+            token = self.session_manager.get_token()
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+
+        api_url = GraphQLSettings.graphql_endpoint()
+        breaker = CircuitBreaker.for_endpoint(api_url)
+        if not breaker.allow():
+            raise Exception(self._circuit_open_message(breaker))
+        with HttpSessionPool.lease() as http:
+            try:
+                response = http.post(
+                    api_url, json=payload, headers=headers, timeout=timeout, stream=True
+                )
+            except requests_exceptions.RequestException as exc:
+                breaker.record_failure()
+                template = self.lang.translate(TranslationKeys.NETWORK_ERROR) or "Network error: {error}"
+                raise Exception(tag_message(ApiErrorKind.NETWORK, template.format(error=summarize_connection_error(str(exc)))))
+
+            try:
+                if response.status_code in (401, 403):
+                    session_text = self.lang.translate(TranslationKeys.SESSION_EXPIRED) or "Session expired"
+                    raise Exception(tag_message(ApiErrorKind.AUTH, session_text))
+                if self._retry_policy.is_retryable_status(response.status_code):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if response.status_code != 200:
+                    raise Exception(tag_message(ApiErrorKind.SERVER, f"HTTP {response.status_code}"))
+
+                response.raw.decode_content = True
+                errors: list = []
+                for element in iter_array_items(response.raw, ["data", *path], siblings=siblings, errors=errors):
+                    if errors:
+                        break
+                    node = element.get(node_key) if node_key and isinstance(element, dict) else element
+                    if node is not None:
+                        yield node
+                if errors:
+                    if self._errors_include_unauthenticated(errors):
+                        raise Exception(tag_message(ApiErrorKind.AUTH, "Unauthenticated"))
+                    message = self._extract_error_message(errors)
+                    raise Exception(tag_message(ApiErrorKind.GRAPHQL, message or "GraphQL error"))
+            except requests_exceptions.RequestException as exc:
+                template = self.lang.translate(TranslationKeys.NETWORK_ERROR) or "Network error: {error}"
+                raise Exception(tag_message(ApiErrorKind.NETWORK, template.format(error=summarize_connection_error(str(exc)))))
+            finally:
+                response.close()
+
+    @staticmethod
+    def _is_retryable_transport_error(exc: Exception, *, mutation: bool) -> bool:
+        """A mutation is only re-sent when the request never reached the server."""
+        if not mutation:
+            return True
+        return isinstance(exc, (requests_exceptions.ConnectTimeout, requests_exceptions.ConnectionError))
+
+    @staticmethod
+    def _circuit_open_message(breaker: CircuitBreaker) -> str:
+        return tag_message(
+            ApiErrorKind.SERVER,
+            f"Backend unavailable, retrying in {int(breaker.retry_in()) + 1}s",
+        )
+
+    @staticmethod
+    def diagnostics() -> dict:
+        """Breaker state per endpoint plus retry and single-flight counters."""
+        return {
+            "breakers": CircuitBreaker.snapshots(),
+            "retries": RetryPolicy.stats(),
+            "single_flight": SingleFlight.stats(),
+        }
+
+    @classmethod
+    def _use_persisted_queries(cls) -> bool:
+        if cls._persisted_queries_enabled is None:
+            try:
+                cls._persisted_queries_enabled = GraphQLSettings.persisted_queries_enabled()
+            except Exception:
+                cls._persisted_queries_enabled = False
+        return bool(cls._persisted_queries_enabled)
+
+    def _post_graphql(self, http, api_url: str, payload: dict, headers: dict, timeout: int):
+        """POST a GraphQL payload; with persisted queries, send the hash first and the full text only on a miss."""
+        if "extensions" not in payload:
+            return http.post(api_url, json=payload, headers=headers, timeout=timeout)
+
+        hashed_payload = {key: value for key, value in payload.items() if key != "query"}
+        response = http.post(api_url, json=hashed_payload, headers=headers, timeout=timeout)
+        head = response.text[:1024]
+        if self._PERSISTED_QUERY_NOT_SUPPORTED in head:
+            APIClient._persisted_queries_enabled = False
+            payload.pop("extensions", None)
+        elif self._PERSISTED_QUERY_NOT_FOUND not in head:
+            return response
+        return http.post(api_url, json=payload, headers=headers, timeout=timeout)
+
     @staticmethod
     def _set_nested_variable(container, path: str, value) -> None:
         parts = [segment for segment in str(path or "").split(".") if segment]
@@ -253,34 +438,31 @@ class APIClient:
         }
         api_url = GraphQLSettings.graphql_endpoint()
 
-        is_main_thread = True
-        try:
-            app = QApplication.instance()
-            if app is not None:
-                is_main_thread = QThread.currentThread() == app.thread()
-        except Exception:
-            is_main_thread = True
+        is_main_thread = self._on_main_thread()
 
         auth_attempts = 2 if require_auth else 1
-        network_attempts = 3 if not is_main_thread else 1
+        network_attempts = self._retry_policy.max_attempts if not is_main_thread else 1
         attempts = max(auth_attempts, network_attempts)
         last_error = None
+        breaker = CircuitBreaker.for_endpoint(api_url)
+        # Multipart uploads are always writes.
+        is_mutation = True
 
-        for attempt in range(1, attempts + 1):
-            headers = {
-                "Accept": "application/json",
-                "X-Requested-With": "XMLHttpRequest",
-                "User-Agent": f"QGIS/{Qgis.QGIS_VERSION} ({platform.system()} {platform.release()})"
-            }
+        headers = dict(HttpSessionPool.base_headers())
 
+        for attempt in range(1, attempts + 1):
             if require_auth:
                 token = self.session_manager.get_token()
                 if token:
                     headers["Authorization"] = f"Bearer {token}"
+                else:
+                    headers.pop("Authorization", None)
 
             file_handles = []
             files_payload = {}
             try:
+                if not breaker.allow():
+                    raise Exception(self._circuit_open_message(breaker))
                 map_payload: dict[str, list[str]] = {}
                 files_payload["operations"] = (None, json.dumps(payload), "application/json")
                 files_payload["map"] = (None, json.dumps(map_payload), "application/json")
@@ -300,21 +482,28 @@ class APIClient:
 
                 files_payload["map"] = (None, json.dumps(map_payload), "application/json")
 
-                response = requests.post(
-                    api_url,
-                    files=files_payload,
-                    headers=headers,
-                    timeout=timeout,
-                )
+                with HttpSessionPool.lease() as http:
+                    response = http.post(
+                        api_url,
+                        files=files_payload,
+                        headers=headers,
+                        timeout=timeout,
+                    )
 
                 if response.status_code in (401, 403):
+                    breaker.record_success()
                     raise Exception(tag_message(ApiErrorKind.AUTH, "Unauthenticated"))
 
-                if response.status_code >= 500:
-                    if attempt < network_attempts:
-                        time.sleep(0.4 * attempt)
+                if self._retry_policy.is_retryable_status(response.status_code):
+                    breaker.record_failure()
+                    if attempt < network_attempts and self._retry_policy.is_retryable_status(
+                        response.status_code, mutation=is_mutation
+                    ):
+                        self._retry_policy.wait(attempt, RetryPolicy.parse_retry_after(response.headers.get("Retry-After")))
                         continue
+                    RetryPolicy.record_gave_up()
                     raise Exception(tag_message(ApiErrorKind.SERVER, f"HTTP {response.status_code}"))
+                breaker.record_success()
 
                 if response.status_code == 200:
                     data = response.json()
@@ -336,9 +525,11 @@ class APIClient:
                 raise Exception(tag_message(ApiErrorKind.SERVER, template.format(error=body)))
 
             except requests_exceptions.RequestException as exc:
-                if attempt < network_attempts:
-                    time.sleep(0.4 * attempt)
+                breaker.record_failure()
+                if attempt < network_attempts and self._is_retryable_transport_error(exc, mutation=is_mutation):
+                    self._retry_policy.wait(attempt)
                     continue
+                RetryPolicy.record_gave_up()
                 summary = summarize_connection_error(str(exc))
                 template = self.lang.translate(TranslationKeys.NETWORK_ERROR) or "Network error: {error}"
                 raise Exception(tag_message(ApiErrorKind.NETWORK, template.format(error=summary)))
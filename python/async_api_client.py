@@ -0,0 +1,288 @@
+"""Non-blocking GraphQL client on the QGIS network stack.
+
+Queries are posted through ``QgsNetworkAccessManager`` and complete on the
+calling thread's event loop (normally the UI thread), so hundreds of small
+requests can be in flight without a worker thread each. ``send_query``
+returns a ``concurrent.futures.Future`` resolved with the same values,
+tagged errors and ``with_success`` envelopes as ``APIClient.send_query``;
+done-callbacks run on the event-loop thread, so they may touch widgets.
+Transient failures are retried with ``RetryPolicy`` backoff on a QTimer
+instead of a sleeping thread; mutations only on 408/429, never after a
+transport failure or 5xx.
+"""
+
+import json
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, List, Optional
+
+from qgis.core import QgsNetworkAccessManager
+from qgis.PyQt.QtCore import QByteArray, QTimer, QUrl
+from qgis.PyQt.QtNetwork import QNetworkRequest
+
+from ..constants.file_paths import GraphQLSettings
+from ..languages.translation_keys import TranslationKeys
+from ..utils.api_error_handling import ApiErrorKind, summarize_connection_error, tag_message
+from .api_client import APIClient, requestBuilder
+from .http_session import HttpSessionPool
+from .retry_policy import CircuitBreaker, RetryPolicy
+from .single_flight import SingleFlight
+
+
+class _QueryCall:
+    """One logical query: owns its future and re-posts itself on retry."""
+
+    def __init__(
+        self,
+        client: APIClient,
+        body: bytes,
+        *,
+        require_auth: bool,
+        timeout: int,
+        return_raw: bool,
+        with_success: bool,
+        is_mutation: bool = False,
+    ) -> None:
+        self.client = client
+        self.body = QByteArray(body)
+        self.require_auth = require_auth
+        self.timeout = timeout
+        self.return_raw = return_raw
+        self.with_success = with_success
+        self.is_mutation = is_mutation
+        self.api_url = GraphQLSettings.graphql_endpoint()
+        self.breaker = CircuitBreaker.for_endpoint(self.api_url)
+        self.future: Future = Future()
+        self.future.add_done_callback(self._on_future_done)
+        self.reply = None
+        self.attempt = 0
+        self.token = None
+
+    def start(self) -> None:
+        if self.future.done():
+            return
+        if not self.breaker.allow():
+            self._fail(APIClient._circuit_open_message(self.breaker))
+            return
+        self.attempt += 1
+
+        request = QNetworkRequest(QUrl(self.api_url))
+        for name, value in HttpSessionPool.base_headers().items():
+            request.setRawHeader(str(name).encode("latin-1"), str(value).encode("latin-1"))
+        request.setRawHeader(b"Content-Type", b"application/json")
+        if self.require_auth:
+            self.token = self.client.session_manager.get_token()
+            if self.token:
+                request.setRawHeader(b"Authorization", f"Bearer {self.token}".encode("latin-1"))
+        request.setTransferTimeout(int(self.timeout * 1000))
+
+        self.reply = QgsNetworkAccessManager.instance().post(request, self.body)
+        self.reply.finished.connect(self._on_finished)
+        AsyncAPIClient._pending.add(self)
+
+    def _on_future_done(self, future: Future) -> None:
+        if future.cancelled() and self.reply is not None:
+            self.reply.abort()
+
+    def _on_finished(self) -> None:
+        reply, self.reply = self.reply, None
+        AsyncAPIClient._pending.discard(self)
+        if reply is None:
+            return
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        status_code = int(status) if status is not None else 0
+        retry_after = RetryPolicy.parse_retry_after(bytes(reply.rawHeader(b"Retry-After")).decode("latin-1"))
+        error_text = reply.errorString()
+        raw = bytes(reply.readAll())
+        reply.deleteLater()
+        if self.future.done():
+            return
+
+        policy = APIClient._retry_policy
+        if status_code == 0:
+            # Transport failure: DNS, refused connection, timeout. A mutation may
+            # already have been applied, so it is not re-posted.
+            self.breaker.record_failure()
+            if not self.is_mutation and self._retry(policy, None):
+                return
+            template = self.client.lang.translate(TranslationKeys.NETWORK_ERROR) or "Network error: {error}"
+            self._fail(tag_message(ApiErrorKind.NETWORK, template.format(error=summarize_connection_error(error_text))))
+            return
+
+        if status_code in (401, 403):
+            self.breaker.record_success()
+            self._fail_unauthenticated()
+            return
+
+        if policy.is_retryable_status(status_code, mutation=self.is_mutation):
+            self.breaker.record_failure()
+            if self._retry(policy, retry_after):
+                return
+            self._fail(tag_message(ApiErrorKind.SERVER, f"HTTP {status_code}"))
+            return
+        self.breaker.record_success()
+
+        if status_code != 200:
+            body = raw.decode("utf-8", "replace") or f"HTTP {status_code}"
+            template = self.client.lang.translate(TranslationKeys.LOGIN_FAILED_RESPONSE) or "Login failed: {error}"
+            self._fail(tag_message(ApiErrorKind.SERVER, template.format(error=body)))
+            return
+
+        try:
+            data = json.loads(raw or b"{}")
+        except ValueError as exc:
+            self._fail(tag_message(ApiErrorKind.SERVER, f"Invalid JSON response: {exc}"))
+            return
+
+        errors = data.get("errors") if isinstance(data, dict) else None
+        if errors:
+            if self.client._errors_include_unauthenticated(errors):
+                self._fail_unauthenticated()
+                return
+            message = self.client._extract_error_message(errors)
+            self._fail(tag_message(ApiErrorKind.GRAPHQL, message or "GraphQL error"))
+            return
+
+        if self.with_success:
+            response = data if self.return_raw else (data or {}).get("data", {})
+            self.future.set_result({"success": True, "response": response, "raw": data, "error": None})
+        else:
+            self.future.set_result(data if self.return_raw else data.get("data", {}))
+
+    def _retry(self, policy: RetryPolicy, retry_after: Optional[float]) -> bool:
+        if self.attempt >= policy.max_attempts:
+            RetryPolicy.record_gave_up()
+            return False
+        RetryPolicy.record_retry(retry_after)
+        QTimer.singleShot(int(policy.delay(self.attempt, retry_after) * 1000), self.start)
+        return True
+
+    def _fail_unauthenticated(self) -> None:
+        if self.require_auth:
+            # Every reply of a batch sent with the same token fails alike; invalidate the session once.
+            if self.token != AsyncAPIClient._unauthenticated_token:
+                AsyncAPIClient._unauthenticated_token = self.token
+                self.client._handle_unauthenticated()
+            session_text = self.client.lang.translate(TranslationKeys.SESSION_EXPIRED) or "Session expired"
+            self._fail(tag_message(ApiErrorKind.AUTH, session_text))
+        else:
+            self._fail(tag_message(ApiErrorKind.AUTH, "Unauthenticated"))
+
+    def _fail(self, message: str) -> None:
+        if self.future.done():
+            return
+        if self.with_success:
+            self.future.set_result({"success": False, "response": None, "raw": None, "error": message})
+        else:
+            self.future.set_exception(Exception(message))
+
+
+class AsyncAPIClient:
+    """Future-returning counterpart of ``APIClient`` for event-loop threads."""
+
+    # Keeps calls (and their replies) alive until the reply finishes.
+    _pending: set = set()
+    # Token whose 401 already invalidated the session.
+    _unauthenticated_token: Optional[str] = None
+
+    def __init__(self, session_manager=None) -> None:
+        self._client = APIClient(session_manager=session_manager)
+
+    def send_query(
+        self,
+        query: str,
+        variables: dict = None,
+        *,
+        require_auth: bool = True,
+        timeout: int = 30,
+        return_raw: bool = False,
+        with_success: bool = False,
+    ) -> Future:
+        is_mutation = SingleFlight.is_mutation(query)
+        if is_mutation:
+            SingleFlight.forget()
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = requestBuilder.sanitize_for_json(variables)
+        call = _QueryCall(
+            self._client,
+            json.dumps(payload).encode("utf-8"),
+            require_auth=require_auth,
+            timeout=timeout,
+            return_raw=return_raw,
+            with_success=with_success,
+            is_mutation=is_mutation,
+        )
+        call.start()
+        return call.future
+
+    @staticmethod
+    def in_flight() -> int:
+        return len(AsyncAPIClient._pending)
+
+    @staticmethod
+    def cancel_with(outer: Future, *inner: Future) -> None:
+        """Cancel ``inner`` (aborting their replies) once ``outer`` is cancelled."""
+
+        def _done(source: Future) -> None:
+            if source.cancelled():
+                for future in inner:
+                    future.cancel()
+
+        outer.add_done_callback(_done)
+
+    @staticmethod
+    def then(future: Future, fn: Callable[[Any], Any]) -> Future:
+        """Future of ``fn(result)``; an exception from either step propagates.
+
+        Cancelling the returned future cancels ``future`` as well.
+        """
+        chained: Future = Future()
+        AsyncAPIClient.cancel_with(chained, future)
+
+        def _done(source: Future) -> None:
+            if chained.done():
+                return
+            if source.cancelled():
+                chained.cancel()
+                return
+            try:
+                chained.set_result(fn(source.result()))
+            except Exception as exc:
+                chained.set_exception(exc)
+
+        future.add_done_callback(_done)
+        return chained
+
+    @staticmethod
+    def gather(futures: Iterable[Future], *, return_exceptions: bool = False) -> Future:
+        """Future of all results in input order, like ``asyncio.gather``.
+
+        Cancelling the returned future cancels every input future.
+        """
+        futures = list(futures)
+        combined: Future = Future()
+        AsyncAPIClient.cancel_with(combined, *futures)
+        results: List[Any] = [None] * len(futures)
+        remaining = [len(futures)]
+        if not futures:
+            combined.set_result([])
+            return combined
+
+        def _collect(index: int, source: Future) -> None:
+            if combined.done():
+                return
+            if source.cancelled():
+                error: Optional[BaseException] = Exception("cancelled")
+            else:
+                error = source.exception()
+            if error is not None and not return_exceptions:
+                combined.set_exception(error)
+                return
+            results[index] = error if error is not None else source.result()
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                combined.set_result(results)
+
+        for index, future in enumerate(futures):
+            future.add_done_callback(lambda source, i=index: _collect(i, source))
+        return combined
@@ -0,0 +1,86 @@
+"""Compact, typed records for module feed items.
+
+A page of GraphQL nodes is decoded once into slotted records. The list view
+and dedupe read the few pre-formatted attributes below instead of re-walking
+the nested node dicts; only the expanded card reads ``node``, which keeps just
+the keys the card and its actions read. No Qt imports.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Mapping, Optional
+
+from .responses import DataDisplayExtractors, GqlKeys
+
+# Node keys read by the expanded card (header, dates, members, contacts,
+# status, actions, previews); everything else, e.g. geometry, is dropped.
+_CARD_KEYS = frozenset({
+    GqlKeys.ID,
+    GqlKeys.NUMBER,
+    GqlKeys.PROJECT_NUMBER,
+    GqlKeys.JOB_NAME,
+    GqlKeys.NAME,
+    GqlKeys.STATUS,
+    GqlKeys.TYPE,
+    "typeName",
+    GqlKeys.PRIORITY,
+    GqlKeys.TAGS,
+    GqlKeys.MEMBERS,
+    GqlKeys.CONTACTS,
+    GqlKeys.CLIENT,
+    GqlKeys.PROPERTIES,
+    GqlKeys.FILES_PATH,
+    GqlKeys.IS_PUBLIC,
+    GqlKeys.START_AT,
+    GqlKeys.DUE_AT,
+    GqlKeys.CREATED_AT,
+    GqlKeys.UPDATED_AT,
+    "description",
+})
+
+
+@dataclass(frozen=True, slots=True)
+class FeedItemRecord:
+    """One feed row.
+
+    ``node`` holds the ``_CARD_KEYS`` of the mapped GraphQL node, which the
+    expanded card is built from; the other fields are what the collapsed row
+    paints and dedupes on.
+    """
+
+    item_id: str
+    title: str
+    status_name: str
+    status_color: str
+    due_at: Optional[str]
+    client_name: str
+    node: Mapping[str, Any]
+
+
+class FeedRecordDecoder:
+    """Single-pass decoder from feed nodes to records."""
+
+    @staticmethod
+    def decode(node: Mapping[str, Any]) -> Optional[FeedItemRecord]:
+        if not isinstance(node, Mapping) or node.get(GqlKeys.ID) is None:
+            return None
+        number = DataDisplayExtractors.extract_item_number(node) or ""
+        name = DataDisplayExtractors.extract_item_name(node) or ""
+        status = DataDisplayExtractors.extract_status(node)
+        return FeedItemRecord(
+            item_id=str(node.get(GqlKeys.ID)),
+            title=" ".join(part for part in (number, name) if part) or "-",
+            status_name=status.name if status.name != "-" else "",
+            status_color=f"#{str(status.color).lstrip('#')}",
+            due_at=DataDisplayExtractors.extract_dates(node).due_at,
+            client_name=DataDisplayExtractors.extract_client_display_name(node) or "",
+            node={key: value for key, value in node.items() if key in _CARD_KEYS},
+        )
+
+    @classmethod
+    def decode_page(cls, nodes: Iterable[Mapping[str, Any]]) -> List[FeedItemRecord]:
+        records: List[FeedItemRecord] = []
+        for node in nodes or []:
+            record = cls.decode(node)
+            if record is not None:
+                records.append(record)
+        return records
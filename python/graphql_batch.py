@@ -0,0 +1,239 @@
+"""Merge several GraphQL operations into one aliased document."""
+
+import json
+import re
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .api_client import APIClient
+from .async_api_client import AsyncAPIClient
+from .request_executor import RequestExecutor
+from ..utils.api_error_handling import ApiErrorKind, parse_tagged_message
+
+_HEADER_RE = re.compile(r"^\s*(query|mutation)\b[^({]*", re.IGNORECASE)
+_VARIABLE_RE = re.compile(r"\$(\w+)")
+_ROOT_FIELD_RE = re.compile(r"^\s*(\w+)")
+
+
+class AliasedOperation(NamedTuple):
+    alias: str
+    operation_type: str
+    variable_definitions: str
+    selection: str
+    variables: Dict[str, Any]
+
+
+def _matching_close(text: str, open_index: int, open_char: str, close_char: str) -> int:
+    depth = 0
+    for index in range(open_index, len(text)):
+        char = text[index]
+        if char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("unbalanced GraphQL document")
+
+
+def alias_operation(query: str, alias: str, variables: Optional[Dict[str, Any]] = None) -> AliasedOperation:
+    """Rewrite a single-root operation so it can live next to others in one document.
+
+    Every ``$var`` is renamed to ``$<alias>_var`` and the root field is prefixed
+    with ``<alias>:``. Variables not declared by the operation are dropped.
+    """
+    header = _HEADER_RE.match(query)
+    if header is None:
+        raise ValueError("expected a query or mutation operation")
+    operation_type = header.group(1).lower()
+    cursor = header.end()
+
+    definitions = ""
+    if query[cursor] == "(":
+        close = _matching_close(query, cursor, "(", ")")
+        definitions = query[cursor + 1:close]
+        cursor = close + 1
+
+    body_open = query.index("{", cursor)
+    body_close = _matching_close(query, body_open, "{", "}")
+    selection = query[body_open + 1:body_close].strip()
+
+    declared = list(dict.fromkeys(_VARIABLE_RE.findall(definitions)))
+    for name in declared:
+        pattern = re.compile(r"\$" + re.escape(name) + r"\b")
+        definitions = pattern.sub(f"${alias}_{name}", definitions)
+        selection = pattern.sub(f"${alias}_{name}", selection)
+
+    renamed = {f"{alias}_{name}": value for name, value in (variables or {}).items() if name in declared}
+    return AliasedOperation(alias, operation_type, definitions.strip(), f"{alias}: {selection}", renamed)
+
+
+def build_aliased_document(name: str, operations: List[AliasedOperation]) -> tuple[str, Dict[str, Any]]:
+    """Combine aliased operations of the same type into (document, variables)."""
+    if not operations:
+        raise ValueError("no operations to combine")
+    operation_type = operations[0].operation_type
+    if any(op.operation_type != operation_type for op in operations):
+        raise ValueError("cannot mix queries and mutations in one document")
+
+    definitions = ",\n  ".join(op.variable_definitions for op in operations if op.variable_definitions)
+    header = f"{operation_type} {name}({definitions})" if definitions else f"{operation_type} {name}"
+    body = "\n".join(op.selection for op in operations)
+    variables: Dict[str, Any] = {}
+    for op in operations:
+        variables.update(op.variables)
+    return f"{header} {{\n{body}\n}}", variables
+
+
+class GraphQLBatcher:
+    """Send many single-root queries as a few aliased documents.
+
+    ``add`` returns the operation's index; ``execute``/``execute_async``
+    produce one entry per added operation, in that order: the ``data`` the
+    operation would have returned alone (``{root_field: value}``), or the
+    exception it failed with. Documents are packed up to ``max_operations``
+    and ``max_document_bytes``; a document rejected with a GraphQL error is
+    bisected so one bad operation cannot sink its neighbours, while network,
+    auth and server failures fail every operation of the document with the
+    original error. Queries only, since a bisected retry would re-run
+    mutations that already succeeded.
+    """
+
+    MAX_OPERATIONS = 20
+    MAX_DOCUMENT_BYTES = 60_000
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_operations: Optional[int] = None,
+        max_document_bytes: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.max_operations = max(1, int(max_operations or self.MAX_OPERATIONS))
+        self.max_document_bytes = max(1, int(max_document_bytes or self.MAX_DOCUMENT_BYTES))
+        self._operations: List[AliasedOperation] = []
+        self._root_fields: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, query: str, variables: Optional[Dict[str, Any]] = None) -> int:
+        index = len(self._operations)
+        operation = alias_operation(query, f"b{index}", variables)
+        if operation.operation_type != "query":
+            raise ValueError("GraphQLBatcher only batches queries")
+        root = _ROOT_FIELD_RE.match(operation.selection[len(operation.alias) + 1:])
+        if root is None:
+            raise ValueError("operation has no root field")
+        self._operations.append(operation)
+        self._root_fields.append(root.group(1))
+        return index
+
+    def chunks(self) -> List[List[int]]:
+        """Operation indexes grouped into documents that respect both limits."""
+        chunks: List[List[int]] = []
+        current: List[int] = []
+        current_size = 0
+        for index, operation in enumerate(self._operations):
+            size = (
+                len(operation.selection.encode("utf-8"))
+                + len(operation.variable_definitions.encode("utf-8"))
+                + len(json.dumps(operation.variables, default=str).encode("utf-8"))
+            )
+            if current and (len(current) >= self.max_operations or current_size + size > self.max_document_bytes):
+                chunks.append(current)
+                current, current_size = [], 0
+            current.append(index)
+            current_size += size
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def document(self, indexes: List[int]) -> tuple[str, Dict[str, Any]]:
+        return build_aliased_document(self.name, [self._operations[index] for index in indexes])
+
+    def split(self, indexes: List[int], data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Hand each operation its own slice of an aliased response."""
+        data = data if isinstance(data, dict) else {}
+        return [{self._root_fields[index]: data.get(self._operations[index].alias)} for index in indexes]
+
+    def execute(self, send: Optional[Callable[[str, Dict[str, Any]], Dict[str, Any]]] = None) -> List[Any]:
+        """Send every document (in parallel on the request executor) and return per-operation results."""
+        client = APIClient() if send is None else None
+        send = send or (lambda document, variables: client.send_query(document, variables=variables))
+        chunks = self.chunks()
+        results: List[Any] = [None] * len(self._operations)
+        outcomes = RequestExecutor.instance().map(lambda indexes: self._run_chunk(send, indexes), chunks)
+        for indexes, outcome in zip(chunks, outcomes):
+            for index, result in zip(indexes, outcome):
+                results[index] = result
+        return results
+
+    def _run_chunk(self, send, indexes: List[int]) -> List[Any]:
+        document, variables = self.document(indexes)
+        try:
+            data = send(document, variables) or {}
+        except Exception as exc:
+            if len(indexes) == 1 or not self._is_bisectable(exc):
+                return [exc] * len(indexes)
+            middle = len(indexes) // 2
+            return self._run_chunk(send, indexes[:middle]) + self._run_chunk(send, indexes[middle:])
+        return self.split(indexes, data)
+
+    @staticmethod
+    def _is_bisectable(error: BaseException) -> bool:
+        """Only a GraphQL error can come from one operation; anything else hits the whole document."""
+        kind, _message = parse_tagged_message(error)
+        return kind == ApiErrorKind.GRAPHQL
+
+    def execute_async(self, client: Optional[AsyncAPIClient] = None) -> Future:
+        """Non-blocking ``execute``: a Future of the per-operation results."""
+        client = client or AsyncAPIClient()
+        chunks = self.chunks()
+
+        def _reassemble(outcomes: List[List[Any]]) -> List[Any]:
+            results: List[Any] = [None] * len(self._operations)
+            for indexes, outcome in zip(chunks, outcomes):
+                for index, result in zip(indexes, outcome):
+                    results[index] = result
+            return results
+
+        futures = [self._run_chunk_async(client, indexes) for indexes in chunks]
+        return AsyncAPIClient.then(AsyncAPIClient.gather(futures), _reassemble)
+
+    def _run_chunk_async(self, client: AsyncAPIClient, indexes: List[int]) -> Future:
+        document, variables = self.document(indexes)
+        result: Future = Future()
+
+        def _done(future: Future) -> None:
+            if result.done():
+                return
+            error = Exception("cancelled") if future.cancelled() else future.exception()
+            if error is None:
+                result.set_result(self.split(indexes, future.result() or {}))
+                return
+            if len(indexes) == 1 or not self._is_bisectable(error):
+                result.set_result([error] * len(indexes))
+                return
+            middle = len(indexes) // 2
+            halves = [
+                self._run_chunk_async(client, indexes[:middle]),
+                self._run_chunk_async(client, indexes[middle:]),
+            ]
+            combined = AsyncAPIClient.then(AsyncAPIClient.gather(halves), lambda parts: parts[0] + parts[1])
+            AsyncAPIClient.cancel_with(result, combined)
+            combined.add_done_callback(_on_halves)
+
+        def _on_halves(combined: Future) -> None:
+            if result.done() or combined.cancelled():
+                return
+            if combined.exception() is not None:
+                result.set_exception(combined.exception())
+                return
+            result.set_result(combined.result())
+
+        sent = client.send_query(document, variables=variables)
+        AsyncAPIClient.cancel_with(result, sent)
+        sent.add_done_callback(_done)
+        return result
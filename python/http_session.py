@@ -0,0 +1,94 @@
+"""Shared keep-alive HTTP sessions for backend requests."""
+
+import platform
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from qgis.core import Qgis
+
+from ..Logs.python_fail_logger import PythonFailLogger
+
+
+class HttpSessionPool:
+    """Lends pooled keep-alive ``requests.Session`` objects to callers.
+
+    ``requests.Session`` is not documented as thread-safe, so a session is
+    used by one caller at a time: ``lease()`` hands out an idle session (or a
+    new one) and takes it back when the block ends. At most ``MAX_IDLE``
+    sessions are kept between calls; extras are closed on return, so
+    short-lived worker threads never leave sessions behind. Connections inside
+    a session are reused via urllib3's pool, which removes the TCP+TLS
+    handshake from every GraphQL call.
+    """
+
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+    MAX_IDLE = 4
+
+    _lock = threading.Lock()
+    _idle: "list[requests.Session]" = []
+    _leased: "set[requests.Session]" = set()
+    _base_headers: Optional[dict] = None
+
+    @classmethod
+    @contextmanager
+    def lease(cls) -> Iterator[requests.Session]:
+        with cls._lock:
+            session = cls._idle.pop() if cls._idle else None
+            if session is None:
+                session = cls._new_session()
+            cls._leased.add(session)
+        try:
+            yield session
+        finally:
+            with cls._lock:
+                # close_all() drops leased sessions from the set; those are not pooled again.
+                pooled = session in cls._leased and len(cls._idle) < cls.MAX_IDLE
+                cls._leased.discard(session)
+                if pooled:
+                    cls._idle.append(session)
+            if not pooled:
+                cls._close(session)
+
+    @classmethod
+    def _new_session(cls) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def base_headers(cls) -> dict:
+        """Static request headers, built once per process. Callers must copy before mutating."""
+        if cls._base_headers is None:
+            cls._base_headers = {
+                "Accept": "application/json",
+                "X-Requested-With": "XMLHttpRequest",
+                "User-Agent": f"QGIS/{Qgis.QGIS_VERSION} ({platform.system()} {platform.release()})",
+            }
+        return cls._base_headers
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close idle sessions now and leased ones when they are returned (plugin unload / logout)."""
+        with cls._lock:
+            sessions = list(cls._idle)
+            cls._idle.clear()
+            cls._leased.clear()
+        for session in sessions:
+            cls._close(session)
+
+    @staticmethod
+    def _close(session: requests.Session) -> None:
+        try:
+            session.close()
+        except Exception as exc:
+            PythonFailLogger.log_exception(exc, module="api", event="http_session_close_failed")
@@ -0,0 +1,95 @@
+"""Incremental decoding of GraphQL responses.
+
+``iter_array_items`` yields the elements of one array inside a JSON document
+as they are parsed, so callers can start on the first node before the body
+has finished downloading. ijson (with its C backend when installed) does the
+parsing; without it the whole body is decoded with ``json`` and walked, which
+keeps the same interface at the old memory cost.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import ijson
+except ImportError:  # optional dependency
+    ijson = None
+
+
+def streaming_available() -> bool:
+    return ijson is not None
+
+
+def _walk(document: Any, path: List[str]) -> Any:
+    current = document
+    for key in path:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(key)
+    return current
+
+
+def iter_array_items(
+    source,
+    path: List[str],
+    *,
+    siblings: Optional[Dict[str, Any]] = None,
+    errors: Optional[List[Any]] = None,
+) -> Iterator[Any]:
+    """Yield the items of the array at ``path`` (e.g. ``["data", "tasks", "edges"]``).
+
+    ``source`` is a binary file-like object or bytes. When given, ``siblings``
+    is filled with the other keys of the array's parent object (``pageInfo``
+    and the like) and ``errors`` with the document's top-level GraphQL
+    errors; both are complete only once the iterator is exhausted.
+    """
+    if not path:
+        raise ValueError("path must name the array to stream")
+
+    if ijson is None:
+        raw = source if isinstance(source, (bytes, bytearray, str)) else source.read()
+        document = json.loads(raw) if raw else {}
+        parent = _walk(document, path[:-1])
+        if isinstance(parent, dict) and siblings is not None:
+            siblings.update({key: value for key, value in parent.items() if key != path[-1]})
+        if isinstance(document, dict) and errors is not None:
+            errors.extend(document.get("errors") or [])
+        items = parent.get(path[-1]) if isinstance(parent, dict) else None
+        yield from items if isinstance(items, list) else []
+        return
+
+    parent_prefix = ".".join(path[:-1])
+    array_prefix = ".".join(path)
+    item_prefix = f"{array_prefix}.item"
+    parent_builder = ijson.ObjectBuilder() if siblings is not None else None
+    errors_builder = None
+    item_builder = None
+
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        if prefix == item_prefix or prefix.startswith(item_prefix + "."):
+            if prefix == item_prefix and event in ("start_map", "start_array"):
+                item_builder = ijson.ObjectBuilder()
+            if item_builder is None:
+                yield value  # scalar array element
+                continue
+            item_builder.event(event, value)
+            if prefix == item_prefix and event in ("end_map", "end_array"):
+                yield item_builder.value
+                item_builder = None
+            continue
+
+        if parent_builder is not None and (not parent_prefix or prefix == parent_prefix or prefix.startswith(parent_prefix + ".")):
+            parent_builder.event(event, value)
+
+        if errors is not None and (prefix == "errors" or prefix.startswith("errors.")):
+            if prefix == "errors" and event == "start_array":
+                errors_builder = ijson.ObjectBuilder()
+            if errors_builder is not None:
+                errors_builder.event(event, value)
+                if prefix == "errors" and event == "end_array":
+                    errors.extend(errors_builder.value or [])
+                    errors_builder = None
+
+    if parent_builder is not None and isinstance(getattr(parent_builder, "value", None), dict):
+        parent = parent_builder.value
+        siblings.update({key: val for key, val in parent.items() if key != path[-1]})
@@ -0,0 +1,222 @@
+"""Persistent cache for slow-changing reference lists.
+
+Statuses, types, tags, assignable users and the task priority enum are kept
+in a SQLite file in the QGIS profile directory, scoped by user and backend
+endpoint. Readers get the stored value at once; entries older than
+``MAX_AGE_SECONDS`` (and every entry at startup, see ``warm``) are refetched
+in the background and rewritten only when their content fingerprint changed.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from qgis.core import QgsApplication
+
+from ..constants.file_paths import GraphQLSettings
+from ..Logs.python_fail_logger import PythonFailLogger
+from ..utils.SessionManager import SessionManager
+from .request_executor import RequestExecutor
+
+
+class ReferenceCache:
+    """Kind-keyed reference data with stale-while-revalidate reads.
+
+    Each kind registers a fetcher once at plugin start (``register``, see
+    ``reference_kinds``); the fetcher receives
+    the entry key (usually a module name) and must raise on failure so a
+    backend error never overwrites good cached data.
+    """
+
+    SCHEMA_VERSION = 1
+    MAX_AGE_SECONDS = 10 * 60
+    DIR_NAME = "kavitro"
+    FILE_NAME = "reference_cache.sqlite"
+
+    _lock = threading.Lock()
+    _fetchers: Dict[str, Callable[[str], Any]] = {}
+    _refreshing: set = set()
+    _db_path: Optional[str] = None
+
+    @classmethod
+    def register(cls, kind: str, fetch: Callable[[str], Any]) -> None:
+        cls._fetchers[kind] = fetch
+
+    @classmethod
+    def peek(cls, kind: str, key: str = "") -> Optional[Any]:
+        """Stored value for ``kind``/``key`` regardless of age, or None. No network."""
+        row = cls._read(cls._scope(), kind, key)
+        return row[0] if row is not None else None
+
+    @classmethod
+    def get(cls, kind: str, key: str = "", *, max_age: Optional[float] = None) -> Any:
+        """Stored value (revalidated in the background when stale), else fetched now."""
+        scope = cls._scope()
+        row = cls._read(scope, kind, key)
+        if row is not None:
+            value, fetched_at = row
+            limit = cls.MAX_AGE_SECONDS if max_age is None else max_age
+            if time.time() - fetched_at > limit:
+                cls.refresh_async(kind, key)
+            return value
+        value, _changed = cls.refresh(kind, key)
+        return value
+
+    @classmethod
+    def refresh(cls, kind: str, key: str = "") -> Tuple[Any, bool]:
+        """Fetch now and store; returns ``(value, changed)``."""
+        scope = cls._scope()
+        value = cls._fetchers[kind](key)
+        return value, cls._store(scope, kind, key, value)
+
+    @classmethod
+    def refresh_async(cls, kind: str, key: str = "") -> None:
+        if kind not in cls._fetchers:
+            return
+        job = (cls._scope(), kind, key)
+        with cls._lock:
+            if job in cls._refreshing:
+                return
+            cls._refreshing.add(job)
+
+        def _run() -> None:
+            try:
+                cls.refresh(kind, key)
+            except Exception as exc:
+                PythonFailLogger.log_exception(
+                    exc,
+                    module="reference_cache",
+                    event="reference_cache_refresh_failed",
+                    extra={"kind": kind, "key": key},
+                )
+            finally:
+                with cls._lock:
+                    cls._refreshing.discard(job)
+
+        RequestExecutor.instance().submit(_run, priority=RequestExecutor.PRIORITY_LOW)
+
+    @classmethod
+    def warm(cls) -> None:
+        """Revalidate every stored entry of the current scope in the background."""
+        scope = cls._scope()
+        try:
+            with closing(cls._connect()) as conn:
+                rows = conn.execute("SELECT kind, key FROM entries WHERE scope = ?", (scope,)).fetchall()
+        except Exception as exc:
+            PythonFailLogger.log_exception(exc, module="reference_cache", event="reference_cache_warm_failed")
+            return
+        for kind, key in rows:
+            cls.refresh_async(kind, key)
+
+    @classmethod
+    def invalidate(cls, kind: str, key: Optional[str] = None) -> None:
+        """Drop stored entries of ``kind`` (one ``key`` or all) for the current scope."""
+        scope = cls._scope()
+        try:
+            with closing(cls._connect()) as conn, conn:
+                if key is None:
+                    conn.execute("DELETE FROM entries WHERE scope = ? AND kind = ?", (scope, kind))
+                else:
+                    conn.execute("DELETE FROM entries WHERE scope = ? AND kind = ? AND key = ?", (scope, kind, key))
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="reference_cache",
+                event="reference_cache_invalidate_failed",
+                extra={"kind": kind, "key": key or ""},
+            )
+
+    @staticmethod
+    def fingerprint(value: Any) -> str:
+        text = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    # Storage -------------------------------------------------------------
+    @classmethod
+    def _scope(cls) -> str:
+        user = SessionManager().loggedInUser
+        user_key = str(user.get("id") or "") if isinstance(user, dict) else str(user or "")
+        # Read per call, like APIClient, so an endpoint switch moves to its own scope.
+        endpoint = GraphQLSettings.graphql_endpoint() or ""
+        return hashlib.sha1(f"{user_key}|{endpoint}".encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def _path(cls) -> str:
+        if cls._db_path is None:
+            folder = os.path.join(QgsApplication.qgisSettingsDirPath(), cls.DIR_NAME)
+            os.makedirs(folder, exist_ok=True)
+            cls._db_path = os.path.join(folder, cls.FILE_NAME)
+        return cls._db_path
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        conn = sqlite3.connect(cls._path(), timeout=5)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != cls.SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS entries")
+                conn.execute(
+                    "CREATE TABLE entries ("
+                    " scope TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL,"
+                    " version TEXT NOT NULL, payload TEXT NOT NULL, fetched_at REAL NOT NULL,"
+                    " PRIMARY KEY (scope, kind, key))"
+                )
+                conn.execute(f"PRAGMA user_version = {int(cls.SCHEMA_VERSION)}")
+        return conn
+
+    @classmethod
+    def _read(cls, scope: str, kind: str, key: str) -> Optional[Tuple[Any, float]]:
+        try:
+            with closing(cls._connect()) as conn:
+                row = conn.execute(
+                    "SELECT payload, fetched_at FROM entries WHERE scope = ? AND kind = ? AND key = ?",
+                    (scope, kind, key),
+                ).fetchone()
+            return (json.loads(row[0]), float(row[1])) if row else None
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="reference_cache",
+                event="reference_cache_read_failed",
+                extra={"kind": kind, "key": key},
+            )
+            return None
+
+    @classmethod
+    def _store(cls, scope: str, kind: str, key: str, value: Any) -> bool:
+        """Write ``value`` unless its fingerprint is unchanged; returns whether it changed."""
+        if value is None:
+            return False
+        version = cls.fingerprint(value)
+        now = time.time()
+        try:
+            with closing(cls._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT version FROM entries WHERE scope = ? AND kind = ? AND key = ?",
+                    (scope, kind, key),
+                ).fetchone()
+                if row is not None and row[0] == version:
+                    conn.execute(
+                        "UPDATE entries SET fetched_at = ? WHERE scope = ? AND kind = ? AND key = ?",
+                        (now, scope, kind, key),
+                    )
+                    return False
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (scope, kind, key, version, payload, fetched_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (scope, kind, key, version, json.dumps(value, default=str), now),
+                )
+            return True
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="reference_cache",
+                event="reference_cache_write_failed",
+                extra={"kind": kind, "key": key},
+            )
+            return True
@@ -0,0 +1,21 @@
+"""Reference-cache kinds and their fetchers.
+
+``register_reference_kinds`` runs once when the plugin GUI initialises, so
+importing a module never mutates the shared ReferenceCache registry.
+"""
+
+from ..utils.FilterHelpers.FilterHelper import FilterHelper
+from ..utils.url_manager import ModuleSupports
+from .api_actions import APIModuleActions
+from .reference_cache import ReferenceCache
+
+
+def register_reference_kinds() -> None:
+    ReferenceCache.register("module_statuses", APIModuleActions._fetch_module_status_options)
+    ReferenceCache.register("task_priorities", APIModuleActions._fetch_task_priority_values)
+    ReferenceCache.register("assignable_users", APIModuleActions._fetch_assignable_users)
+    for support_key in (ModuleSupports.TAGS.value, ModuleSupports.STATUSES.value, ModuleSupports.TYPES.value):
+        ReferenceCache.register(
+            f"filter.{support_key}",
+            lambda module, key=support_key: FilterHelper.get_filter_edges_by_key_and_module(key, module),
+        )
@@ -0,0 +1,182 @@
+"""Shared bounded executor for independent backend requests."""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+
+class RequestCancelled(Exception):
+    """Raised for queued requests whose cancellation token was cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancel flag shared by every request submitted with it."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class RequestExecutor:
+    """Process-wide request pool with a global concurrency cap.
+
+    Every module submits through the same pool so concurrent loads can never
+    put more than ``MAX_CONCURRENCY`` requests on the backend at once. Lower
+    ``priority`` values run first; FIFO within the same priority.
+    """
+
+    MAX_CONCURRENCY = 6
+    SHUTDOWN_TIMEOUT = 5.0
+
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 10
+    PRIORITY_LOW = 20
+
+    _instance: Optional["RequestExecutor"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY) -> None:
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._local = threading.local()
+        self._shutdown = False
+
+    @classmethod
+    def instance(cls) -> "RequestExecutor":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Shut the shared pool down (plugin unload); the next ``instance()`` starts a fresh one."""
+        with cls._instance_lock:
+            executor, cls._instance = cls._instance, None
+        if executor is not None:
+            executor.shutdown(timeout)
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Cancel queued requests, wake idle workers and join them.
+
+        Requests already running finish first; ``timeout`` bounds the total
+        wait so a hung request cannot block the caller (workers are daemons).
+        """
+        with self._condition:
+            self._shutdown = True
+            queued, self._queue = self._queue, []
+            threads = list(self._threads)
+            self._condition.notify_all()
+        for entry in queued:
+            entry[2].cancel()
+
+        deadline = time.monotonic() + max(0.0, timeout)
+        for thread in threads:
+            if thread is threading.current_thread():
+                continue
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_NORMAL,
+        token: Optional[CancellationToken] = None,
+        **kwargs: Any,
+    ) -> Future:
+        future: Future = Future()
+        if token is not None and token.is_cancelled:
+            future.set_exception(RequestCancelled())
+            return future
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("RequestExecutor has been shut down")
+            heapq.heappush(self._queue, (priority, next(self._sequence), future, func, args, kwargs, token))
+            self._ensure_workers()
+            self._condition.notify()
+        return future
+
+    def iter_results(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        priority: int = PRIORITY_NORMAL,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterator[Any]:
+        """Run ``func`` for every item concurrently and yield results in input order.
+
+        Calls made from inside a pool worker run inline, so nested fan-out
+        cannot deadlock the bounded pool. The first raised exception propagates;
+        closing the generator early cancels requests that have not started.
+        """
+        items = list(items)
+        if getattr(self._local, "is_worker", False) or len(items) <= 1:
+            for item in items:
+                if token is not None and token.is_cancelled:
+                    raise RequestCancelled()
+                yield func(item)
+            return
+
+        futures = [self.submit(func, item, priority=priority, token=token) for item in items]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        priority: int = PRIORITY_NORMAL,
+        token: Optional[CancellationToken] = None,
+    ) -> List[Any]:
+        """Like ``iter_results`` but collects every result into a list."""
+        return list(self.iter_results(func, items, priority=priority, token=token))
+
+    def _ensure_workers(self) -> None:
+        if len(self._threads) >= self._max_concurrency:
+            return
+        thread = threading.Thread(
+            target=self._worker_loop,
+            name=f"wc-request-{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _worker_loop(self) -> None:
+        self._local.is_worker = True
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if self._shutdown:
+                    return
+                _, _, future, func, args, kwargs, token = heapq.heappop(self._queue)
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            if token is not None and token.is_cancelled:
+                future.set_exception(RequestCancelled())
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as exc:  # noqa: BLE001 - delivered to the waiting caller
+                future.set_exception(exc)
@@ -0,0 +1,95 @@
+"""Bounded in-memory cache for feed page responses (stale-while-revalidate)."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, NamedTuple, Optional
+
+
+class CachedResponse(NamedTuple):
+    payload: dict
+    fresh: bool
+
+
+class _Entry(NamedTuple):
+    module: str
+    payload: dict
+    stored_at: float
+
+
+class ResponseCache:
+    """Process-wide LRU of raw GraphQL page payloads.
+
+    Entries younger than ``FRESH_SECONDS`` are served as-is; older entries up to
+    ``MAX_AGE_SECONDS`` are served as stale so the caller can render them
+    immediately and revalidate in the background.
+    """
+
+    MAX_ENTRIES = 64
+    FRESH_SECONDS = 30.0
+    MAX_AGE_SECONDS = 15 * 60.0
+
+    _entries: "OrderedDict[str, _Entry]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def make_key(module: str, query_name: str, variables: Optional[dict]) -> str:
+        variables_text = json.dumps(variables or {}, sort_keys=True, default=str, separators=(",", ":"))
+        return f"{str(module or '').strip().lower()}|{query_name}|{variables_text}"
+
+    @classmethod
+    def get(cls, key: str) -> Optional[CachedResponse]:
+        now = time.monotonic()
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            age = now - entry.stored_at
+            if age > cls.MAX_AGE_SECONDS:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return CachedResponse(entry.payload, age <= cls.FRESH_SECONDS)
+
+    @classmethod
+    def put(cls, key: str, module: str, payload: dict) -> None:
+        with cls._lock:
+            cls._entries[key] = _Entry(str(module or "").strip().lower(), payload, time.monotonic())
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, modules: Optional[Iterable[str]] = None) -> None:
+        """Drop entries for the given module keys, or everything when None."""
+        with cls._lock:
+            if modules is None:
+                cls._entries.clear()
+                return
+            targets = {str(module or "").strip().lower() for module in modules}
+            for key in [key for key, entry in cls._entries.items() if entry.module in targets]:
+                del cls._entries[key]
+
+    @staticmethod
+    def changed_nodes(old_payload: Any, new_payload: Any, path: list) -> list:
+        """Nodes from ``new_payload`` whose id exists in ``old_payload`` with different content."""
+
+        def _nodes(payload: Any) -> dict:
+            root = (payload or {}).get("data") or {}
+            for part in path:
+                root = root.get(part) if isinstance(root, dict) else None
+            edges = (root or {}).get("edges") if isinstance(root, dict) else None
+            nodes = {}
+            for edge in edges or []:
+                node = edge.get("node") if isinstance(edge, dict) else None
+                if isinstance(node, dict) and node.get("id") is not None:
+                    nodes[str(node.get("id"))] = node
+            return nodes
+
+        old_nodes = _nodes(old_payload)
+        return [
+            node
+            for node_id, node in _nodes(new_payload).items()
+            if node_id in old_nodes and old_nodes[node_id] != node
+        ]
@@ -0,0 +1,177 @@
+"""Retry timing and per-endpoint circuit breaking for backend calls."""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter; a server ``Retry-After`` wins when present.
+
+    Mutations are only retried on statuses where the server did not process
+    the request (408, 429); a 5xx may come after the write was applied.
+    """
+
+    RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+    MUTATION_RETRYABLE_STATUS = frozenset({408, 429})
+
+    _stats_lock = threading.Lock()
+    _stats = {"retries": 0, "retry_after": 0, "gave_up": 0}
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.4,
+        max_delay: float = 8.0,
+        jitter: float = 0.5,
+    ) -> None:
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+
+    def is_retryable_status(self, status_code: int, *, mutation: bool = False) -> bool:
+        code = int(status_code)
+        if mutation:
+            return code in self.MUTATION_RETRYABLE_STATUS
+        return code in self.RETRYABLE_STATUS or code >= 500
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before attempt ``attempt + 1``."""
+        if retry_after is not None:
+            return min(self.max_delay, max(0.0, retry_after))
+        ceiling = min(self.max_delay, self.base_delay * (2 ** max(0, attempt - 1)))
+        return ceiling * random.uniform(1.0 - self.jitter, 1.0)
+
+    def wait(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        """Back off before the next attempt. Only ever called off the UI thread."""
+        self.record_retry(retry_after)
+        time.sleep(self.delay(attempt, retry_after))
+
+    @classmethod
+    def record_retry(cls, retry_after: Optional[float] = None) -> None:
+        with cls._stats_lock:
+            cls._stats["retries"] += 1
+            if retry_after is not None:
+                cls._stats["retry_after"] += 1
+
+    @classmethod
+    def record_gave_up(cls) -> None:
+        with cls._stats_lock:
+            cls._stats["gave_up"] += 1
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        with cls._stats_lock:
+            return dict(cls._stats)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """``Retry-After`` as seconds; accepts delta-seconds or an HTTP date."""
+        text = str(value or "").strip()
+        if not text:
+            return None
+        try:
+            return max(0.0, float(text))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(text).timestamp() - time.time())
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+
+class CircuitBreaker:
+    """Per-endpoint breaker: opens after consecutive failures, probes once half-open.
+
+    While open, callers fail fast instead of waiting on a degraded backend.
+    After ``RESET_SECONDS`` a single probe request is let through; its
+    outcome closes the breaker or re-opens it for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    FAILURE_THRESHOLD = 5
+    RESET_SECONDS = 30.0
+
+    _registry_lock = threading.Lock()
+    _breakers: Dict[str, "CircuitBreaker"] = {}
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @classmethod
+    def for_endpoint(cls, endpoint: str) -> "CircuitBreaker":
+        with cls._registry_lock:
+            breaker = cls._breakers.get(endpoint)
+            if breaker is None:
+                breaker = cls(endpoint)
+                cls._breakers[endpoint] = breaker
+            return breaker
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == self.OPEN and now - self._opened_at >= self.RESET_SECONDS:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # A probe that never reported back does not pin the breaker half-open.
+            probe_lost = self._probe_in_flight and now - self._probe_started_at >= self.RESET_SECONDS
+            if self._state == self.HALF_OPEN and (not self._probe_in_flight or probe_lost):
+                self._probe_in_flight = True
+                self._probe_started_at = now
+                return True
+            self._rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.RESET_SECONDS - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.FAILURE_THRESHOLD:
+                if self._state != self.OPEN:
+                    self._times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+    @classmethod
+    def snapshots(cls) -> Dict[str, Dict[str, object]]:
+        """Diagnostics for every endpoint seen so far."""
+        with cls._registry_lock:
+            breakers = list(cls._breakers.values())
+        return {breaker.endpoint: breaker.snapshot() for breaker in breakers}
@@ -0,0 +1,127 @@
+"""Share one network call between identical concurrent GraphQL queries."""
+
+import copy
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+_MUTATION_RE = re.compile(r"^(?:\s*#[^\n]*\n)*\s*mutation\b", re.IGNORECASE)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Process-wide single-flight for read-only queries.
+
+    The first caller for a key runs the request and gets its result as is;
+    callers arriving while it is in flight wait and get a copy of it (or the
+    same error). Successful results are also served, copied, for
+    ``MEMO_SECONDS`` afterwards. The memo holds the leader's object, so
+    callers treat query results as read-only.
+    Any mutation clears the memo so reads after a write go to the network;
+    reads already in flight then neither take new followers nor fill the memo.
+    """
+
+    MEMO_SECONDS = 2.0
+
+    _lock = threading.Lock()
+    _in_flight: Dict[str, _Call] = {}
+    _memo: Dict[str, tuple] = {}
+    _generation = 0
+    _stats = {"executed": 0, "coalesced": 0, "memo_hits": 0}
+
+    @staticmethod
+    def is_mutation(query: str) -> bool:
+        return bool(_MUTATION_RE.match(query or ""))
+
+    @staticmethod
+    def make_key(query: str, variables: Optional[dict], *extra: Any) -> str:
+        variables_text = json.dumps(variables or {}, sort_keys=True, default=str, separators=(",", ":"))
+        return f"{query}|{variables_text}|{extra!r}"
+
+    @classmethod
+    def do(
+        cls,
+        key: str,
+        fn: Callable[[], Any],
+        *,
+        wait: bool = True,
+        remember: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Run ``fn`` once for all concurrent callers of ``key``.
+
+        ``wait=False`` callers use the memo but run their own call instead of
+        joining one in flight. ``remember`` decides whether a result is memoized.
+        """
+        now = time.monotonic()
+        with cls._lock:
+            memo = cls._memo.get(key)
+            if memo is not None and now - memo[1] <= cls.MEMO_SECONDS:
+                cls._stats["memo_hits"] += 1
+                return copy.deepcopy(memo[0])
+            call = cls._in_flight.get(key)
+            if call is not None and not wait:
+                cls._stats["executed"] += 1
+                call = None
+                leader = False
+            else:
+                leader = call is None
+            if leader:
+                call = _Call()
+                cls._in_flight[key] = call
+                cls._stats["executed"] += 1
+            elif call is not None:
+                cls._stats["coalesced"] += 1
+            generation = cls._generation
+
+        if call is None:
+            return fn()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with cls._lock:
+                if cls._in_flight.get(key) is call:
+                    del cls._in_flight[key]
+                fresh = generation == cls._generation
+                if fresh and call.error is None and (remember is None or remember(call.result)):
+                    cls._memo[key] = (call.result, time.monotonic())
+                    cls._prune_memo()
+            call.done.set()
+        return call.result
+
+    @classmethod
+    def forget(cls) -> None:
+        """Drop the memo and detach in-flight reads, which may predate a write."""
+        with cls._lock:
+            cls._memo.clear()
+            cls._in_flight.clear()
+            cls._generation += 1
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        with cls._lock:
+            return dict(cls._stats, in_flight=len(cls._in_flight), memo=len(cls._memo))
+
+    @classmethod
+    def _prune_memo(cls) -> None:
+        cutoff = time.monotonic() - cls.MEMO_SECONDS
+        for key in [key for key, (_result, stored_at) in cls._memo.items() if stored_at < cutoff]:
+            del cls._memo[key]
@@ -0,0 +1,40 @@
+"""Shared pytest setup for the plugin's unit tests.
+
+The plugin directory is registered as the ``wild_code`` package without
+running its ``__init__`` (which boots the QGIS plugin), so modules can be
+imported as ``wild_code.<path>``. Tests that need QGIS/PyQt skip themselves
+with ``pytest.importorskip`` when those are not available.
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = "wild_code"
+
+if PACKAGE_NAME not in sys.modules:
+    _package = types.ModuleType(PACKAGE_NAME)
+    _package.__path__ = [PLUGIN_ROOT]
+    sys.modules[PACKAGE_NAME] = _package
+
+
+@pytest.fixture(autouse=True)
+def fail_log(monkeypatch):
+    """Capture PythonFailLogger events instead of writing log files."""
+    from wild_code.Logs.python_fail_logger import PythonFailLogger
+
+    events = []
+    monkeypatch.setattr(
+        PythonFailLogger,
+        "log",
+        staticmethod(lambda event, **kwargs: events.append((event, kwargs))),
+    )
+    monkeypatch.setattr(
+        PythonFailLogger,
+        "log_exception",
+        staticmethod(lambda exc, **kwargs: events.append((kwargs.get("event"), dict(kwargs, exc=exc)))),
+    )
+    return events
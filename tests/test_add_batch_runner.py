@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.modules.Property.FlowControllers import AddBatchRunner as runner_module
+from wild_code.modules.Property.FlowControllers.AddBatchRunner import AddBatchRunner
+from wild_code.python.request_executor import RequestExecutor
+
+
+class _Writes:
+    """Backend writes that block until the test releases them."""
+
+    def __init__(self):
+        self.started = {}
+        self.release = {}
+
+    def run(self, plan):
+        tunnus = plan["tunnus"]
+        self.started.setdefault(tunnus, threading.Event()).set()
+        self.release.setdefault(tunnus, threading.Event()).wait(2)
+        return None
+
+    def wait_started(self, tunnus):
+        assert self.started.setdefault(tunnus, threading.Event()).wait(2)
+
+    def finish(self, runner, tunnus):
+        self.release.setdefault(tunnus, threading.Event()).set()
+        for _plan, future in runner._in_flight:
+            future.exception(2)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    executor = RequestExecutor(max_concurrency=2)
+    monkeypatch.setattr(RequestExecutor, "_instance", executor)
+    writes = _Writes()
+    copied = []
+    flow = runner_module.MainAddPropertiesFlow
+    monkeypatch.setattr(flow, "run_backend_plan", staticmethod(writes.run))
+    monkeypatch.setattr(flow, "finish_backend_plan", staticmethod(lambda plan, failed_step, lm: failed_step is None))
+    monkeypatch.setattr(flow, "copy_plans_to_layer", staticmethod(lambda batch, layer, lm: copied.extend(p["tunnus"] for p in batch)))
+    monkeypatch.setattr(flow, "request_cancel", staticmethod(lambda: None))
+
+    runner = AddBatchRunner(None, max_in_flight=1)
+    runner._target_layer = object()
+    runner._total = 2
+    runner._to_backend.extend(
+        {"tunnus": tunnus, "action": "create", "copy": object()} for tunnus in ("A", "B")
+    )
+    results = []
+    runner.finished.connect(results.append)
+    yield runner, writes, copied, results
+    for event in writes.release.values():
+        event.set()
+    executor.shutdown(timeout=2)
+
+
+def test_pause_holds_finished_write_until_resume(pipeline):
+    runner, writes, copied, results = pipeline
+    runner._pump()
+    writes.wait_started("A")
+
+    runner.pause()
+    writes.finish(runner, "A")
+    runner._pump()
+
+    assert copied == [] and [plan["tunnus"] for plan in runner._to_backend] == ["B"]
+
+    runner.resume()
+    runner._pump()
+    writes.wait_started("B")
+    writes.finish(runner, "B")
+    runner._pump()
+
+    assert copied == ["A", "B"]
+    assert results == [{"canceled": False, "done": 2, "total": 2}]
+
+
+def test_cancel_awaits_running_write_and_drops_queued(pipeline):
+    runner, writes, copied, results = pipeline
+    runner._pump()
+    writes.wait_started("A")
+
+    runner.cancel()
+
+    assert results == []
+    assert not runner._to_backend
+
+    writes.finish(runner, "A")
+    runner._pump()
+
+    assert copied == ["A"]
+    assert "B" not in writes.started
+    assert results == [{"canceled": True, "done": 1, "total": 2}]
+
+
+def test_lookups_wait_for_status_warmup(monkeypatch):
+    from concurrent.futures import Future
+
+    fetched = []
+    monkeypatch.setattr(runner_module.PropertyFeatureFetcher, "fetch", staticmethod(lambda fids: fetched.extend(fids) or []))
+    runner = AddBatchRunner(None)
+    runner._queue.extend([1, 2])
+    runner._warmup = Future()
+
+    runner._start_lookups()
+    assert fetched == [] and list(runner._queue) == [1, 2]
+
+    runner._warmup.set_result({})
+    runner._start_lookups()
+    assert fetched == [1, 2]
@@ -0,0 +1,62 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.modules.Property.FlowControllers.UpdatePropertyData import UpdatePropertyData
+from wild_code.utils.TagsEngines import TagsEngines
+
+ARCHIVED_STREET = TagsEngines.ARHIVEERITUD_NAME_ADDITION + " - Main"
+
+
+def _state(tag_ids, street):
+    return {
+        "tags": {"tags": {"edges": [{"node": {"id": tag}} for tag in tag_ids]}},
+        "street": {"address": {"street": street}},
+    }
+
+
+@pytest.fixture
+def archive(monkeypatch):
+    retried = []
+    monkeypatch.setattr(UpdatePropertyData, "_resolve_archive_tag_id", staticmethod(lambda tag: "t1"))
+
+    def _fail_batch(ids, tag_id):
+        raise RuntimeError("mutation failed")
+
+    def _archive_one(pid, archive_tag=None):
+        retried.append(pid)
+        return True
+
+    monkeypatch.setattr(UpdatePropertyData, "_archive_batch", staticmethod(_fail_batch))
+    monkeypatch.setattr(UpdatePropertyData, "_archive_a_propertie", staticmethod(_archive_one))
+    return retried, monkeypatch
+
+
+def test_failed_batch_retries_only_unapplied_properties(archive):
+    retried, monkeypatch = archive
+    applied, pending = _state(["t1"], ARCHIVED_STREET), _state([], "Main")
+    current = {
+        "tags0": applied["tags"], "name0": applied["street"],
+        "tags1": pending["tags"], "name1": pending["street"],
+    }
+    monkeypatch.setattr(UpdatePropertyData, "_read_archive_state", staticmethod(lambda ids: current))
+
+    results = UpdatePropertyData.archive_properties_bulk(["p0", "p1"])
+
+    assert results == {"p0": True, "p1": True}
+    assert retried == ["p1"]
+
+
+def test_failed_recheck_stops_without_replaying_writes(archive, fail_log):
+    retried, monkeypatch = archive
+
+    def _read_fails(ids):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(UpdatePropertyData, "_read_archive_state", staticmethod(_read_fails))
+
+    results = UpdatePropertyData.archive_properties_bulk(["p0", "p1", "p2"], batch_size=2)
+
+    assert results == {"p0": False, "p1": False, "p2": False}
+    assert retried == []
+    assert "property_bulk_archive_recheck_failed" in [event for event, _kwargs in fail_log]
@@ -0,0 +1,129 @@
+import logging
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.python.async_api_client import AsyncAPIClient
+from wild_code.modules.Property.property_service import PropertyDataService
+
+
+@pytest.fixture
+def callback_errors(caplog):
+    """Exceptions raised inside Future done-callbacks are only logged by concurrent.futures."""
+    caplog.set_level(logging.ERROR, logger="concurrent.futures")
+    return lambda: [record for record in caplog.records if record.name == "concurrent.futures"]
+
+
+def test_then_cancel_propagates_to_source():
+    source = Future()
+    chained = AsyncAPIClient.then(source, lambda value: value * 2)
+
+    chained.cancel()
+
+    assert source.cancelled()
+
+
+def test_then_ignores_result_after_cancel(callback_errors):
+    source = Future()
+    source.set_running_or_notify_cancel()  # a running source cannot be cancelled
+    chained = AsyncAPIClient.then(source, lambda value: value * 2)
+
+    chained.cancel()
+    source.set_result(21)
+
+    assert chained.cancelled()
+    assert callback_errors() == []
+
+
+def test_gather_cancel_propagates_to_inputs():
+    first, second = Future(), Future()
+    combined = AsyncAPIClient.gather([first, second])
+
+    combined.cancel()
+
+    assert first.cancelled() and second.cancelled()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = PropertyDataService()
+    monkeypatch.setattr(service, "_session_signature", lambda: "token")
+    lookup, modules = Future(), Future()
+    monkeypatch.setattr(service._lookup, "property_id_by_cadastral_async", lambda number: lookup)
+    monkeypatch.setattr(service._connections, "fetch_all_module_data_async", lambda property_id: modules)
+    return service, lookup, modules
+
+
+def test_cancel_aborts_pending_lookup(service):
+    service, lookup, _modules = service
+    result = service.build_connections_for_cadastral_async("12345:001:0001")
+
+    result.cancel()
+
+    assert lookup.cancelled()
+
+
+def test_cancel_after_lookup_aborts_module_fetch(service, callback_errors):
+    service, lookup, modules = service
+    result = service.build_connections_for_cadastral_async("12345:001:0001")
+    lookup.set_result("property-1")
+
+    result.cancel()
+
+    assert modules.cancelled()
+    assert callback_errors() == []
+
+
+def test_late_reply_after_cancel_is_ignored(service, callback_errors):
+    service, lookup, _modules = service
+    lookup.set_running_or_notify_cancel()
+    result = service.build_connections_for_cadastral_async("12345:001:0001")
+
+    result.cancel()
+    lookup.set_result("property-1")
+
+    assert result.cancelled()
+    assert callback_errors() == []
+
+
+
+def test_error_while_handling_modules_fails_the_result(service, monkeypatch, callback_errors):
+    service, lookup, modules = service
+    monkeypatch.setattr(service._formatter, "build_entry", lambda *args: 1 / 0)
+    result = service.build_connections_for_cadastral_async("12345:001:0001")
+
+    lookup.set_result("property-1")
+    modules.set_result({})
+
+    assert isinstance(result.exception(timeout=0), ZeroDivisionError)
+    assert callback_errors() == []
+
+def test_unauthenticated_batch_invalidates_session_once(monkeypatch):
+    from wild_code.python.async_api_client import _QueryCall
+
+    invalidations = []
+
+    class _Lang:
+        def translate(self, key):
+            return "Session expired"
+
+    class _Client:
+        lang = _Lang()
+
+        def _handle_unauthenticated(self):
+            invalidations.append(True)
+            return False
+
+    monkeypatch.setattr(AsyncAPIClient, "_unauthenticated_token", None)
+    calls = []
+    for _ in range(3):
+        call = _QueryCall.__new__(_QueryCall)
+        call.client, call.require_auth, call.with_success = _Client(), True, True
+        call.token, call.future = "token-1", Future()
+        call._fail_unauthenticated()
+        calls.append(call)
+
+    assert len(invalidations) == 1
+    assert all(call.future.result()["success"] is False for call in calls)
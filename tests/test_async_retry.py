@@ -0,0 +1,77 @@
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.python import async_api_client as async_module
+from wild_code.python.async_api_client import _QueryCall
+from wild_code.python.retry_policy import CircuitBreaker
+
+
+class _Reply:
+    def __init__(self, status):
+        self.status = status
+
+    def attribute(self, _name):
+        return self.status
+
+    def rawHeader(self, _name):
+        return b""
+
+    def errorString(self):
+        return "timed out"
+
+    def readAll(self):
+        return b""
+
+    def deleteLater(self):
+        pass
+
+
+class _Lang:
+    def translate(self, key):
+        return None
+
+
+class _Client:
+    lang = _Lang()
+
+
+@pytest.fixture
+def retries(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(async_module.QTimer, "singleShot", lambda ms, cb: scheduled.append(cb))
+    return scheduled
+
+
+def _finish(status, *, is_mutation):
+    call = _QueryCall.__new__(_QueryCall)
+    call.client, call.with_success, call.is_mutation = _Client(), True, is_mutation
+    call.breaker = CircuitBreaker("https://retry.example")
+    call.future, call.attempt, call.reply = Future(), 1, _Reply(status)
+    call._on_finished()
+    return call
+
+
+@pytest.mark.parametrize("status", [None, 502])
+def test_mutation_is_not_reposted_after_timeout_or_5xx(retries, status):
+    call = _finish(status, is_mutation=True)
+
+    assert retries == []
+    assert call.future.result()["success"] is False
+
+
+@pytest.mark.parametrize("status", [None, 502, 429])
+def test_query_is_retried_after_transient_failure(retries, status):
+    call = _finish(status, is_mutation=False)
+
+    assert len(retries) == 1
+    assert not call.future.done()
+
+
+def test_mutation_is_retried_on_429(retries):
+    call = _finish(429, is_mutation=True)
+
+    assert len(retries) == 1
+    assert not call.future.done()
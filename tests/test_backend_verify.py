@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.modules.Property.FlowControllers import BackendVerifyWorker as worker_module
+from wild_code.modules.Property.FlowControllers.BackendVerifyWorker import BackendVerifyWorker
+from wild_code.modules.Property.FlowControllers.MainAddProperties import BackendPropertyVerifier
+
+
+class _PagedClient:
+    def __init__(self, pages, cursors=None):
+        self.pages = pages
+        self.cursors = cursors or [f"c{index}" for index in range(len(pages))]
+        self.calls = 0
+
+    def send_query_stream(self, query, *, variables, path, siblings):
+        index = self.calls
+        self.calls += 1
+        siblings["pageInfo"] = {"hasNextPage": index < len(self.pages) - 1, "endCursor": self.cursors[index]}
+        return iter(self.pages[index])
+
+
+def test_fetch_follows_every_page():
+    pages = [[{"id": f"{page}-{row}"} for row in range(50)] for page in range(6)]
+    client = _PagedClient(pages)
+
+    nodes = BackendPropertyVerifier._fetch_property_nodes(client, "query", {})
+
+    assert len(nodes) == 300
+    assert client.calls == 6
+
+
+def test_fetch_raises_when_cursor_stops_advancing():
+    client = _PagedClient([[{"id": "1"}], [{"id": "2"}], [{"id": "3"}]], cursors=["same", "same", "end"])
+
+    with pytest.raises(RuntimeError):
+        BackendPropertyVerifier._fetch_property_nodes(client, "query", {})
+
+
+def test_worker_reports_lookup_failure_per_row(monkeypatch):
+    def _fail(numbers, **kwargs):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(worker_module.BackendPropertyVerifier, "verify_properties_bulk", staticmethod(_fail))
+    worker = BackendVerifyWorker([(0, "111", ""), (1, "222", "")], source="test")
+    results = []
+    worker.rowResult.connect(lambda row, tunnus, result: results.append((row, tunnus, result)))
+
+    worker.run()
+
+    assert [(row, tunnus) for row, tunnus, _result in results] == [(0, "111"), (1, "222")]
+    assert all(result["causes"] == ["backend lookup failed"] for _row, _tunnus, result in results)
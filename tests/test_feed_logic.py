@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.feed import FeedLogic as feed_module
+from wild_code.feed.FeedLogic import UnifiedFeedLogic
+
+
+class _Loader:
+    def load_query_by_module(self, module_name, query_name):
+        return f"query {query_name}"
+
+
+def _page(cursor, *ids):
+    return {
+        "data": {
+            "projects": {
+                "pageInfo": {"endCursor": cursor, "hasNextPage": True, "total": 10},
+                "edges": [{"node": {"id": item_id, "name": f"P{item_id}"}} for item_id in ids],
+            }
+        }
+    }
+
+
+@pytest.fixture
+def logic(monkeypatch):
+    monkeypatch.setattr(feed_module, "APIClient", lambda: None)
+    monkeypatch.setattr(feed_module, "GraphQLQueryLoader", _Loader)
+    logic = UnifiedFeedLogic("project", "ListFilteredProjects.graphql", batch_size=2)
+    pages = []
+    monkeypatch.setattr(logic, "_fetch_page_payload", lambda query, variables: pages.pop(0))
+    return logic, pages
+
+
+def test_run_fetch_leaves_pagination_state_to_finish(logic):
+    logic, pages = logic
+    pages.append(_page("c1", "1", "2"))
+
+    fetch = logic.run_fetch(logic.begin_fetch())
+
+    assert logic.end_cursor is None and logic.is_loading
+    records = logic.finish_fetch(fetch)
+    assert [record.item_id for record in records] == ["1", "2"]
+    assert logic.end_cursor == "c1" and not logic.is_loading
+
+
+def test_reset_between_fetch_and_finish_drops_the_page(logic):
+    logic, pages = logic
+    pages.append(_page("stale", "1"))
+    fetch = logic.run_fetch(logic.begin_fetch())
+
+    logic.set_where({"column": "NAME"})
+
+    assert logic.finish_fetch(fetch) == []
+    assert logic.end_cursor is None and logic.has_more and not logic.is_loading
+    assert logic.begin_fetch().variables["after"] is None
+
+
+def test_stale_error_is_not_stored(logic):
+    logic, _pages = logic
+    fetch = logic.begin_fetch()
+    fetch.error = Exception("backend down")
+
+    logic.reset()
+
+    assert logic.finish_fetch(fetch) == []
+    assert logic.last_error is None and logic.last_error_message is None
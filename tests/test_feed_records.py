@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("requests")
+
+from wild_code.python.feed_records import FeedRecordDecoder
+
+
+def _node(**overrides):
+    node = {
+        "id": 42,
+        "number": "P-7",
+        "name": "Harbour",
+        "status": {"id": "s1", "name": "Active", "color": "00ff00"},
+        "dueAt": "2026-03-01",
+        "client": {"displayName": "City"},
+        "geometry": {"type": "Point"},
+        "__typename": "Project",
+        "members": {"edges": []},
+    }
+    node.update(overrides)
+    return node
+
+
+def test_decode_reads_row_fields_and_keeps_only_card_keys():
+    record = FeedRecordDecoder.decode(_node())
+
+    assert record.item_id == "42"
+    assert record.title == "P-7 Harbour"
+    assert record.status_name == "Active"
+    assert record.status_color == "#00ff00"
+    assert record.due_at == "2026-03-01"
+    assert record.client_name == "City"
+    assert set(record.node) == {"id", "number", "name", "status", "dueAt", "client", "members"}
+
+
+def test_decode_defaults_for_sparse_nodes():
+    record = FeedRecordDecoder.decode({"id": "x"})
+
+    assert record.title == "-"
+    assert record.status_name == ""
+    assert record.status_color == "#cccccc"
+    assert record.due_at is None
+    assert record.client_name == ""
+
+
+def test_decode_page_skips_nodes_without_id():
+    records = FeedRecordDecoder.decode_page([_node(), {"name": "no id"}, None, _node(id=43)])
+
+    assert [record.item_id for record in records] == ["42", "43"]
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.python.graphql_batch import GraphQLBatcher
+from wild_code.utils.api_error_handling import ApiErrorKind, tag_message
+
+QUERY = "query item($id: ID!) { item(id: $id) { id } }"
+
+
+def _batcher(count):
+    batcher = GraphQLBatcher("Items")
+    for index in range(count):
+        batcher.add(QUERY, {"id": str(index)})
+    return batcher
+
+
+def test_graphql_error_bisects_down_to_the_failing_operation():
+    batcher = _batcher(4)
+    documents = []
+
+    def _send(document, variables):
+        documents.append(document)
+        if "b2_id" in variables:
+            raise Exception(tag_message(ApiErrorKind.GRAPHQL, "bad id"))
+        return {name.split("_")[0]: {"id": value} for name, value in variables.items()}
+
+    results = batcher.execute(_send)
+
+    assert [result["item"] for result in results[:2]] == [{"id": "0"}, {"id": "1"}]
+    assert isinstance(results[2], Exception) and results[3] == {"item": {"id": "3"}}
+    assert len(documents) == 5
+
+
+def test_transport_error_fails_the_whole_document_without_bisecting():
+    batcher = _batcher(4)
+    documents = []
+    error = Exception(tag_message(ApiErrorKind.NETWORK, "Connection refused"))
+
+    def _send(document, variables):
+        documents.append(document)
+        raise error
+
+    results = batcher.execute(_send)
+
+    assert results == [error] * 4
+    assert len(documents) == 1
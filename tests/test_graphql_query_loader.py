@@ -0,0 +1,30 @@
+import hashlib
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.python.GraphQLQueryLoader import GraphQLQueryLoader
+
+
+def test_dynamic_documents_are_hashed_without_caching(monkeypatch):
+    monkeypatch.setattr(GraphQLQueryLoader, "_hash_by_text", {})
+    query = "query { dynamic }"
+
+    digest = GraphQLQueryLoader.query_hash(query)
+
+    assert digest == hashlib.sha256(query.encode("utf-8")).hexdigest()
+    assert GraphQLQueryLoader._hash_by_text == {}
+
+
+def test_registry_reload_replaces_stale_digest(tmp_path, monkeypatch):
+    monkeypatch.setattr(GraphQLQueryLoader, "_hash_by_text", {})
+    monkeypatch.setattr(GraphQLQueryLoader, "_registry", {})
+    path = tmp_path / "me.graphql"
+    path.write_text("query { v1 }", encoding="utf-8")
+    GraphQLQueryLoader._read(str(path))
+    path.write_text("query { v2 }", encoding="utf-8")
+
+    entry = GraphQLQueryLoader._read(str(path))
+
+    assert GraphQLQueryLoader._hash_by_text == {"query { v2 }": entry.sha256}
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+pytest.importorskip("qgis.core")
+pytest.importorskip("requests")
+
+from wild_code.python.http_session import HttpSessionPool
+
+
+class _FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    created = []
+
+    def _new_session():
+        session = _FakeSession()
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(HttpSessionPool, "_idle", [])
+    monkeypatch.setattr(HttpSessionPool, "_leased", set())
+    monkeypatch.setattr(HttpSessionPool, "_new_session", staticmethod(_new_session))
+    return created
+
+
+def test_sequential_leases_reuse_one_session(pool):
+    for _ in range(3):
+        with HttpSessionPool.lease():
+            pass
+
+    assert len(pool) == 1
+    assert HttpSessionPool._idle == pool
+
+
+def test_sessions_from_finished_threads_are_capped(pool):
+    barrier = threading.Barrier(HttpSessionPool.MAX_IDLE + 2)
+
+    def _worker():
+        with HttpSessionPool.lease():
+            barrier.wait()
+
+    threads = [threading.Thread(target=_worker) for _ in range(HttpSessionPool.MAX_IDLE + 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(HttpSessionPool._idle) == HttpSessionPool.MAX_IDLE
+    assert sum(session.closed for session in pool) == 2
+    assert HttpSessionPool._leased == set()
+
+
+def test_close_all_closes_leased_session_on_return(pool):
+    with HttpSessionPool.lease() as session:
+        HttpSessionPool.close_all()
+        assert not session.closed
+
+    assert session.closed
+    assert HttpSessionPool._idle == []
@@ -0,0 +1,132 @@
+import importlib
+import io
+import json
+import sys
+import types
+
+import pytest
+
+from wild_code.python import json_stream
+
+DOCUMENT = {
+    "data": {
+        "tasks": {
+            "edges": [{"node": {"id": "1", "tags": ["a"]}}, {"node": {"id": "2", "score": 1.5}}],
+            "pageInfo": {"hasNextPage": True, "endCursor": "c2"},
+        }
+    },
+    "errors": [{"message": "partial"}],
+}
+
+
+class _ObjectBuilder:
+    """ijson.ObjectBuilder equivalent: rebuilds a value from parse events."""
+
+    def __init__(self):
+        self.value = None
+        self.key = None
+
+        def _initial(value):
+            self.value = value
+
+        self.containers = [_initial]
+
+    def event(self, event, value):
+        if event == "map_key":
+            self.key = value
+        elif event == "start_map":
+            mapping = {}
+            self.containers[-1](mapping)
+            self.containers.append(lambda item, mapping=mapping: mapping.__setitem__(self.key, item))
+        elif event == "start_array":
+            array = []
+            self.containers[-1](array)
+            self.containers.append(array.append)
+        elif event in ("end_map", "end_array"):
+            self.containers.pop()
+        else:
+            self.containers[-1](value)
+
+
+def _events(value, prefix=""):
+    if isinstance(value, dict):
+        yield prefix, "start_map", None
+        for key, item in value.items():
+            yield prefix, "map_key", key
+            yield from _events(item, f"{prefix}.{key}" if prefix else key)
+        yield prefix, "end_map", None
+    elif isinstance(value, list):
+        yield prefix, "start_array", None
+        for item in value:
+            yield from _events(item, f"{prefix}.item" if prefix else "item")
+        yield prefix, "end_array", None
+    elif value is None:
+        yield prefix, "null", None
+    elif isinstance(value, bool):
+        yield prefix, "boolean", value
+    elif isinstance(value, (int, float)):
+        yield prefix, "number", value
+    else:
+        yield prefix, "string", value
+
+
+@pytest.fixture
+def fake_ijson(monkeypatch):
+    consumed = []
+
+    def _parse(source, use_float=False):
+        for parse_event in _events(json.loads(source.read())):
+            consumed.append(parse_event)
+            yield parse_event
+
+    module = types.ModuleType("ijson")
+    module.parse = _parse
+    module.ObjectBuilder = _ObjectBuilder
+    monkeypatch.setitem(sys.modules, "ijson", module)
+    importlib.reload(json_stream)
+    yield consumed
+    monkeypatch.undo()
+    importlib.reload(json_stream)
+
+
+def _stream(**kwargs):
+    return json_stream.iter_array_items(io.BytesIO(json.dumps(DOCUMENT).encode()), ["data", "tasks", "edges"], **kwargs)
+
+
+def test_ijson_path_yields_items_siblings_and_errors(fake_ijson):
+    siblings, errors = {}, []
+
+    items = list(_stream(siblings=siblings, errors=errors))
+
+    assert json_stream.streaming_available()
+    assert items == DOCUMENT["data"]["tasks"]["edges"]
+    assert siblings == {"pageInfo": {"hasNextPage": True, "endCursor": "c2"}}
+    assert errors == [{"message": "partial"}]
+
+
+def test_ijson_path_yields_before_the_document_is_parsed(fake_ijson):
+    first = next(_stream())
+
+    assert first == {"node": {"id": "1", "tags": ["a"]}}
+    assert ("data.tasks.pageInfo", "start_map", None) not in fake_ijson
+
+
+def test_fallback_path_matches_the_streaming_contract(monkeypatch):
+    monkeypatch.setattr(json_stream, "ijson", None)
+    siblings, errors = {}, []
+
+    items = list(_stream(siblings=siblings, errors=errors))
+
+    assert not json_stream.streaming_available()
+    assert items == DOCUMENT["data"]["tasks"]["edges"]
+    assert siblings == {"pageInfo": {"hasNextPage": True, "endCursor": "c2"}}
+    assert errors == [{"message": "partial"}]
+
+
+def test_fallback_path_handles_bytes_and_missing_arrays(monkeypatch):
+    monkeypatch.setattr(json_stream, "ijson", None)
+
+    assert list(json_stream.iter_array_items(b'{"data": {"tasks": null}}', ["data", "tasks", "edges"])) == []
+    assert list(json_stream.iter_array_items(b"", ["data"])) == []
+    with pytest.raises(ValueError):
+        list(json_stream.iter_array_items(b"{}", []))
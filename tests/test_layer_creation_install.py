@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.engines import LayerCreationEngine as engine_module
+from wild_code.engines.LayerCreationEngine import LayerCreationEngine
+
+
+class _FakeLayer:
+    def __init__(self, source, name="imported", provider="ogr"):
+        self._source = source
+        self._name = name
+        self._valid = os.path.exists(source.split("|", 1)[0])
+
+    def id(self):
+        return f"id:{self._source}"
+
+    def source(self):
+        return self._source
+
+    def isValid(self):
+        return self._valid
+
+
+class _FakeGroup:
+    def __init__(self):
+        self.layers = []
+
+    def addLayer(self, layer):
+        self.layers.append(layer)
+
+
+class _FakeProject:
+    def __init__(self, layers):
+        self.layers = {layer.id(): layer for layer in layers}
+        self.removed = []
+
+    def mapLayers(self):
+        return dict(self.layers)
+
+    def removeMapLayers(self, ids):
+        self.removed.extend(ids)
+        for layer_id in ids:
+            self.layers.pop(layer_id, None)
+
+    def addMapLayer(self, layer, _add_to_legend):
+        self.layers[layer.id()] = layer
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "import.gpkg")
+    with open(file_path, "w") as handle:
+        handle.write("old")
+    old_layer = _FakeLayer(f"{file_path}|layername=imported")
+    engine = LayerCreationEngine.__new__(LayerCreationEngine)
+    engine.project = _FakeProject([old_layer])
+    group = _FakeGroup()
+    monkeypatch.setattr(engine_module, "QgsVectorLayer", _FakeLayer)
+    monkeypatch.setattr(engine, "_resolve_target_group", lambda name: group)
+    monkeypatch.setattr(engine, "apply_qml_style", lambda layer, style: True)
+    part_path = file_path + ".part"
+    with open(part_path, "w") as handle:
+        handle.write("new")
+    return engine, part_path, file_path, old_layer, group
+
+
+def test_replaces_file_then_swaps_layers(engine):
+    engine, part_path, file_path, old_layer, group = engine
+
+    layer = engine.install_geopackage(part_path, file_path, "imported", "Imports")
+
+    assert layer is not None and group.layers == [layer]
+    assert engine.project.removed == [old_layer.id()]
+    assert open(file_path).read() == "new"
+
+
+def test_locked_file_installs_under_sibling_name_and_keeps_old_data(engine, monkeypatch):
+    engine, part_path, file_path, old_layer, _group = engine
+    real_replace = os.replace
+
+    def _replace(source, target):
+        if target == file_path:
+            raise PermissionError("file in use")
+        real_replace(source, target)
+
+    monkeypatch.setattr(engine_module.os, "replace", _replace)
+
+    layer = engine.install_geopackage(part_path, file_path, "imported", "Imports")
+
+    sibling = file_path[: -len(".gpkg")] + "-1.gpkg"
+    assert layer.source().startswith(sibling)
+    assert open(file_path).read() == "old"
+    assert open(sibling).read() == "new"
+    assert engine.project.removed == [old_layer.id()]
+
+
+def test_failed_install_keeps_old_layer(engine, monkeypatch):
+    engine, part_path, file_path, old_layer, _group = engine
+
+    def _replace(source, target):
+        raise PermissionError("file in use")
+
+    monkeypatch.setattr(engine_module.os, "replace", _replace)
+
+    assert engine.install_geopackage(part_path, file_path, "imported", "Imports") is None
+    assert engine.project.removed == []
+    assert old_layer.id() in engine.project.layers
+    assert not os.path.exists(part_path)
+
+
+def test_is_import_file_matches_fallback_names(tmp_path):
+    file_path = str(tmp_path / "import.gpkg")
+
+    assert LayerCreationEngine._is_import_file(file_path, file_path)
+    assert LayerCreationEngine._is_import_file(str(tmp_path / "import-3.gpkg"), file_path)
+    assert not LayerCreationEngine._is_import_file(str(tmp_path / "import-old.gpkg"), file_path)
+    assert not LayerCreationEngine._is_import_file(str(tmp_path / "other.gpkg"), file_path)
@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.utils.layers import layer_feature_index as index_module
+from wild_code.utils.layers.layer_feature_index import LayerFeatureIndex
+
+
+class _FakeVariant:
+    def __init__(self, value=None):
+        self._value = value
+
+    def isNull(self):
+        return self._value is None
+
+    def __str__(self):
+        return "NULL" if self._value is None else str(self._value)
+
+
+@pytest.fixture
+def index(monkeypatch):
+    monkeypatch.setattr(index_module, "QVariant", _FakeVariant)
+    index = LayerFeatureIndex.__new__(LayerFeatureIndex)
+    index._ids_by_value, index._value_by_id = {}, {}
+    return index
+
+
+def test_null_values_are_not_indexed(index):
+    index._add(1, _FakeVariant())
+    index._add(2, None)
+    index._add(3, _FakeVariant("abc"))
+
+    assert index._ids_by_value == {"abc": [3]}
+    assert LayerFeatureIndex.normalize(_FakeVariant()) == ""
+
+
+class _Request:
+    def __init__(self, target=None):
+        self.target = target
+
+    def setLimit(self, _limit):
+        pass
+
+
+class _Expression:
+    @staticmethod
+    def createFieldEqualityExpression(field_name, value):
+        return (field_name, value)
+
+
+class _Feature:
+    def __init__(self, fid, values):
+        self._fid, self._values = fid, values
+
+    def id(self):
+        return self._fid
+
+    def attribute(self, name):
+        return self._values.get(name)
+
+
+class _Layer:
+    def __init__(self, features):
+        self.features = features
+
+    def id(self):
+        return "layer-1"
+
+    def getFeatures(self, request):
+        if isinstance(request.target, tuple):
+            field_name, value = request.target
+            return iter([f for f in self.features if str(f.attribute(field_name)) == value])
+        return iter([f for f in self.features if f.id() == request.target])
+
+
+def test_find_feature_falls_back_when_index_is_stale(monkeypatch, index):
+    monkeypatch.setattr(index_module, "QgsFeatureRequest", _Request)
+    monkeypatch.setattr(index_module, "QgsExpression", _Expression)
+    index._dirty, index._field_index = False, 0
+    index._add(1, "task-1")
+    discarded = []
+    monkeypatch.setattr(LayerFeatureIndex, "for_field", classmethod(lambda cls, layer, field: index))
+    monkeypatch.setattr(LayerFeatureIndex, "discard_layer", classmethod(lambda cls, layer_id: discarded.append(layer_id)))
+    layer = _Layer([_Feature(1, {"ext_id": "task-9"}), _Feature(2, {"ext_id": "task-1"})])
+
+    feature = LayerFeatureIndex.find_feature(layer, [("ext_id", "task-1")])
+
+    assert feature.id() == 2
+    assert discarded == ["layer-1"]
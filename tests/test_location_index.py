@@ -0,0 +1,172 @@
+import os
+import re
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.constants.cadastral_fields import Katastriyksus
+from wild_code.utils.mapandproperties.PropertyDataLoader import PropertyDataLoader
+from wild_code.utils.mapandproperties.location_index import PropertyLocationIndex
+
+FIELDS = [Katastriyksus.mk_nimi, Katastriyksus.ov_nimi, Katastriyksus.ay_nimi]
+ROWS = {
+    1: ("Harju maakond", "Tallinn", "Kesklinn"),
+    2: ("Harju maakond", "Tallinn", " Pirita "),
+    3: ("Harju maakond", "Saue vald", "O'Brieni küla"),
+    4: (" Harju maakond", "Saue vald", None),
+    5: ("Tartu maakond", "Tartu linn", "Kesklinn"),
+    6: ("Tartu maakond", "Elva vald", "Elva linn"),
+}
+
+
+class _Feature:
+    def __init__(self, fid, attrs):
+        self._fid, self._attrs = fid, list(attrs)
+
+    def id(self):
+        return self._fid
+
+    def attributes(self):
+        return self._attrs
+
+
+class _Fields:
+    def lookupField(self, name):
+        return FIELDS.index(name) if name in FIELDS else -1
+
+
+class _Layer:
+    def fields(self):
+        return _Fields()
+
+    def name(self):
+        return "import"
+
+    def getFeatures(self, _request):
+        return [_Feature(fid, attrs) for fid, attrs in ROWS.items()]
+
+
+_CLAUSE = re.compile(r'\((?P<trim>trim\()?"(?P<field>[^"]+)"\)? (?:= (?P<value>\'(?:[^\']|\'\')*\')|IN \((?P<values>.*)\))\)')
+_LITERAL = re.compile(r"'((?:[^']|'')*)'")
+
+
+def _matches(expression, attrs):
+    """Evaluate the AND-of-comparisons expressions build_scope_expression emits."""
+    if not expression:
+        return False
+    for clause in expression.split(" AND "):
+        match = _CLAUSE.fullmatch(clause)
+        assert match, clause
+        literals = _LITERAL.findall(match.group("value") or match.group("values"))
+        wanted = {literal.replace("''", "'") for literal in literals}
+        value = attrs[FIELDS.index(match.group("field"))]
+        if value is not None and match.group("trim"):
+            value = str(value).strip()
+        if value not in wanted:
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "scope",
+    [
+        {"county_name": "Harju maakond"},
+        {"county_name": "Harju maakond", "municipality_name": "Tallinn"},
+        {"county_name": "Harju maakond", "municipality_name": "Tallinn", "settlements": ["Pirita"]},
+        {"county_name": "Harju maakond", "municipality_name": "Saue vald", "settlements": ["O'Brieni küla"]},
+        {"municipality_name": "Tallinn", "settlements": ["Kesklinn", "Pirita"]},
+        {"settlements": ["Kesklinn"]},
+        {"county_name": "", "municipality_name": "Elva vald"},
+        {"county_name": "Harju maakond", "settlements": [" ", ""]},
+        {"county_name": "Puudub"},
+    ],
+)
+def test_index_and_map_expression_select_the_same_features(scope):
+    index = PropertyLocationIndex.build(_Layer())
+    expression = PropertyDataLoader.build_scope_expression(**scope)
+
+    expected = {fid for fid, attrs in ROWS.items() if _matches(expression, attrs)}
+
+    assert set(index.feature_ids(**scope)) == expected
+
+
+def test_no_scope_selects_nothing_on_either_side():
+    index = PropertyLocationIndex.build(_Layer())
+
+    assert index.feature_ids() == []
+    assert PropertyDataLoader.build_scope_expression() == ""
+
+
+class _Signal:
+    def __init__(self):
+        self.callbacks = []
+
+    def connect(self, callback):
+        self.callbacks.append(callback)
+
+    def emit(self):
+        for callback in self.callbacks:
+            callback()
+
+
+class _FileLayer(_Layer):
+    def __init__(self, path):
+        self.path = path
+        self.builds = 0
+        self.dataChanged = _Signal()
+        self.willBeDeleted = _Signal()
+
+    def id(self):
+        return "import-layer"
+
+    def source(self):
+        return f"{self.path}|layername=import"
+
+    def providerType(self):
+        return "ogr"
+
+    def isModified(self):
+        return False
+
+    def featureCount(self):
+        return len(ROWS)
+
+    def getFeatures(self, request):
+        self.builds += 1
+        return super().getFeatures(request)
+
+
+@pytest.fixture
+def file_layer(tmp_path, monkeypatch):
+    monkeypatch.setattr(PropertyLocationIndex, "_by_layer", {})
+    monkeypatch.setattr(PropertyLocationIndex, "_watched", set())
+    path = tmp_path / "import.gpkg"
+    path.write_bytes(b"gpkg")
+    return _FileLayer(str(path))
+
+
+def test_wal_write_invalidates_the_sidecar(file_layer):
+    PropertyLocationIndex.for_layer(file_layer)
+    PropertyLocationIndex.invalidate(file_layer.id())
+    PropertyLocationIndex.for_layer(file_layer)
+    assert file_layer.builds == 1
+
+    with open(f"{file_layer.path}-wal", "wb") as handle:
+        handle.write(b"committed edit")
+    PropertyLocationIndex.invalidate(file_layer.id())
+    PropertyLocationIndex.for_layer(file_layer)
+
+    assert file_layer.builds == 2
+
+
+def test_data_change_removes_the_sidecar(file_layer):
+    PropertyLocationIndex.for_layer(file_layer)
+    sidecar = file_layer.path + PropertyLocationIndex.SIDECAR_SUFFIX
+    assert os.path.isfile(sidecar)
+
+    file_layer.dataChanged.emit()
+
+    assert not os.path.exists(sidecar)
+    PropertyLocationIndex.for_layer(file_layer)
+    assert file_layer.builds == 2
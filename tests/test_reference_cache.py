@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.python import reference_cache as cache_module
+from wild_code.python.reference_cache import ReferenceCache
+
+
+class _Session:
+    loggedInUser = {"id": "u1"}
+
+
+def test_scope_follows_endpoint_changes(monkeypatch):
+    endpoint = ["https://a.example/graphql"]
+    monkeypatch.setattr(cache_module, "SessionManager", _Session)
+    monkeypatch.setattr(cache_module.GraphQLSettings, "graphql_endpoint", staticmethod(lambda: endpoint[0]))
+
+    first = ReferenceCache._scope()
+    endpoint[0] = "https://b.example/graphql"
+
+    assert ReferenceCache._scope() != first
+
+
+def test_refresh_stores_under_registered_kind(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "SessionManager", _Session)
+    monkeypatch.setattr(cache_module.GraphQLSettings, "graphql_endpoint", staticmethod(lambda: "https://a.example"))
+    monkeypatch.setattr(ReferenceCache, "_db_path", str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(ReferenceCache, "_fetchers", {"kind": lambda key: [key]})
+
+    assert ReferenceCache.refresh("kind", "k") == (["k"], True)
+    assert ReferenceCache.refresh("kind", "k") == (["k"], False)
+    assert ReferenceCache.peek("kind", "k") == ["k"]
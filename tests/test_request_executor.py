@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from wild_code.python.request_executor import RequestExecutor
+
+
+def test_shutdown_joins_idle_workers():
+    executor = RequestExecutor(max_concurrency=3)
+    assert executor.map(lambda value: value * 2, [1, 2, 3]) == [2, 4, 6]
+
+    executor.shutdown(timeout=2)
+
+    assert executor._threads and not any(thread.is_alive() for thread in executor._threads)
+
+
+def test_shutdown_cancels_queued_and_lets_running_finish():
+    executor = RequestExecutor(max_concurrency=1)
+    started, release = threading.Event(), threading.Event()
+
+    def _blocking():
+        started.set()
+        release.wait(2)
+        return "done"
+
+    running = executor.submit(_blocking)
+    started.wait(2)
+    queued = executor.submit(lambda: "never")
+    threading.Timer(0.05, release.set).start()
+
+    executor.shutdown(timeout=2)
+
+    assert running.result(0) == "done"
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_shutdown_instance_resets_shared_pool():
+    shared = RequestExecutor.instance()
+
+    RequestExecutor.shutdown_instance(timeout=1)
+
+    assert RequestExecutor.instance() is not shared
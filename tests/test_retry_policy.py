@@ -0,0 +1,173 @@
+from contextlib import contextmanager
+
+import pytest
+
+from wild_code.python import retry_policy as retry_module
+from wild_code.python.retry_policy import CircuitBreaker, RetryPolicy
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(retry_module.time, "monotonic", clock)
+    return clock
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(clock):
+    breaker = CircuitBreaker("https://a.example")
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker("https://a.example")
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+    clock.now += CircuitBreaker.RESET_SECONDS
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert breaker.snapshot()["state"] == CircuitBreaker.HALF_OPEN
+
+
+def test_probe_outcome_closes_or_reopens(clock):
+    breaker = CircuitBreaker("https://a.example")
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+    clock.now += CircuitBreaker.RESET_SECONDS
+    breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+    assert breaker.snapshot()["times_opened"] == 2
+
+    clock.now += CircuitBreaker.RESET_SECONDS
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.snapshot()["state"] == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_lost_probe_does_not_pin_half_open(clock):
+    breaker = CircuitBreaker("https://a.example")
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+    clock.now += CircuitBreaker.RESET_SECONDS
+    assert breaker.allow()
+
+    clock.now += CircuitBreaker.RESET_SECONDS
+
+    assert breaker.allow()
+
+
+def test_mutations_retry_only_when_the_request_was_not_processed():
+    policy = RetryPolicy()
+
+    assert [code for code in (408, 429, 500, 502, 503) if policy.is_retryable_status(code, mutation=True)] == [408, 429]
+    assert all(policy.is_retryable_status(code) for code in (408, 429, 500, 502, 503, 504))
+
+
+def test_retry_after_caps_delay_and_parses_seconds():
+    policy = RetryPolicy(max_delay=8.0)
+
+    assert policy.delay(1, retry_after=3.0) == 3.0
+    assert policy.delay(1, retry_after=60.0) == 8.0
+    assert RetryPolicy.parse_retry_after("5") == 5.0
+    assert RetryPolicy.parse_retry_after("soon") is None
+
+
+class _Response:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": "0"}
+        self._body = body or {}
+        self.text = str(self._body)
+
+    def json(self):
+        return self._body
+
+
+@pytest.fixture
+def client(monkeypatch):
+    pytest.importorskip("qgis.core")
+    from wild_code.python import api_client as api_module
+    from wild_code.python.api_client import APIClient
+
+    responses = []
+    posts = []
+
+    class _Http:
+        def post(self, url, **kwargs):
+            posts.append(kwargs)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    @contextmanager
+    def _lease():
+        yield _Http()
+
+    class _Session:
+        def get_token(self):
+            return "token"
+
+    monkeypatch.setattr(api_module.HttpSessionPool, "lease", staticmethod(_lease))
+    monkeypatch.setattr(api_module.GraphQLSettings, "graphql_endpoint", staticmethod(lambda: "https://retry.example"))
+    monkeypatch.setattr(APIClient, "_on_main_thread", staticmethod(lambda: False))
+    monkeypatch.setattr(APIClient, "_use_persisted_queries", classmethod(lambda cls: False))
+    monkeypatch.setattr(APIClient, "_retry_policy", RetryPolicy(base_delay=0.0))
+    monkeypatch.setattr(api_module.CircuitBreaker, "_breakers", {})
+    client = APIClient.__new__(APIClient)
+    client.session_manager = _Session()
+    return client, responses, posts
+
+
+@pytest.mark.parametrize("status", [408, 429])
+def test_mutation_is_retried_after_unprocessed_status(client, status):
+    client, responses, posts = client
+    responses.extend([_Response(status), _Response(200, {"data": {"ok": True}})])
+
+    assert client.send_query("mutation { ok }") == {"ok": True}
+    assert len(posts) == 2
+
+
+def test_mutation_is_not_replayed_after_server_error(client):
+    client, responses, posts = client
+    client.lang = type("_Lang", (), {"translate": lambda self, key: None})()
+    responses.extend([_Response(503), _Response(200, {"data": {"ok": True}})])
+
+    with pytest.raises(Exception):
+        client.send_query("mutation { ok }")
+    assert len(posts) == 1
+
+
+def test_mutation_is_resent_only_when_the_connection_was_never_made(client):
+    from wild_code.python.api_client import requests_exceptions
+
+    client, responses, posts = client
+    client.lang = type("_Lang", (), {"translate": lambda self, key: None})()
+    responses.extend([requests_exceptions.ConnectTimeout("connect"), _Response(200, {"data": {"ok": True}})])
+    assert client.send_query("mutation { ok }") == {"ok": True}
+    assert len(posts) == 2
+
+    posts.clear()
+    responses[:] = [requests_exceptions.ReadTimeout("read"), _Response(200, {"data": {"ok": True}})]
+    with pytest.raises(Exception):
+        client.send_query("mutation { ok }")
+    assert len(posts) == 1
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.engines.ShapefileImportTask import ShapefileImportTask
+from wild_code.utils.SHPLayerLoader import SHPLayerLoader
+
+
+def test_background_import_refuses_while_a_task_is_running(monkeypatch, fail_log):
+    monkeypatch.setattr(ShapefileImportTask, "_active", {object()})
+    loader = SHPLayerLoader.__new__(SHPLayerLoader)
+    monkeypatch.setattr(loader, "_select_source", lambda: pytest.fail("must not ask for a file"))
+
+    assert loader.load_shp_layer_in_background() is False
+    assert [event for event, _ in fail_log] == ["shp_loader_import_already_running"]
+
+
+def test_is_running_tracks_active_tasks(monkeypatch):
+    monkeypatch.setattr(ShapefileImportTask, "_active", set())
+    assert not ShapefileImportTask.is_running()
+
+    ShapefileImportTask._active.add(object())
+    assert ShapefileImportTask.is_running()
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from wild_code.python.single_flight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    monkeypatch.setattr(SingleFlight, "_in_flight", {})
+    monkeypatch.setattr(SingleFlight, "_memo", {})
+    monkeypatch.setattr(SingleFlight, "_stats", {"executed": 0, "coalesced": 0, "memo_hits": 0})
+
+
+def _start_leader(key, result):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def _slow():
+        calls.append(key)
+        started.set()
+        release.wait(2)
+        return result
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(SingleFlight.do(key, _slow)))
+    thread.start()
+    started.wait(2)
+    return thread, release, results, calls
+
+
+def _wait_for_followers(count):
+    for _ in range(200):
+        if SingleFlight.stats()["coalesced"] >= count:
+            return
+        threading.Event().wait(0.01)
+
+
+def test_concurrent_callers_share_one_call():
+    thread, release, results, calls = _start_leader("q", {"value": 1})
+    followers = []
+    follower_threads = [
+        threading.Thread(target=lambda: followers.append(SingleFlight.do("q", lambda: {"value": 2})))
+        for _ in range(3)
+    ]
+    for follower in follower_threads:
+        follower.start()
+    _wait_for_followers(3)
+    release.set()
+    for joined in [thread, *follower_threads]:
+        joined.join(2)
+
+    assert calls == ["q"]
+    assert results == [{"value": 1}] and followers == [{"value": 1}] * 3
+    assert followers[0] is not followers[1]
+    assert SingleFlight.stats()["coalesced"] == 3
+
+
+def test_errors_reach_every_waiting_caller():
+    started, release = threading.Event(), threading.Event()
+
+    def _fail():
+        started.set()
+        release.wait(2)
+        raise ValueError("backend down")
+
+    errors = []
+
+    def _call(fn):
+        try:
+            SingleFlight.do("q", fn)
+        except ValueError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=_call, args=(_fail,))
+    leader.start()
+    started.wait(2)
+    follower = threading.Thread(target=_call, args=(lambda: "unused",))
+    follower.start()
+    _wait_for_followers(1)
+    release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert len(errors) == 2
+    assert SingleFlight.stats()["memo"] == 0
+
+
+def test_forget_during_flight_keeps_stale_result_out_of_memo():
+    thread, release, results, _calls = _start_leader("q", "before write")
+
+    SingleFlight.forget()
+    after_write = SingleFlight.do("q", lambda: "after write")
+    release.set()
+    thread.join(2)
+
+    assert results == ["before write"]
+    assert after_write == "after write"
+    assert SingleFlight.do("q", lambda: "fresh read") == "after write"
+    assert SingleFlight.stats()["in_flight"] == 0
+
+
+def test_memo_is_skipped_when_remember_rejects():
+    SingleFlight.do("q", lambda: {"success": False}, remember=lambda result: result["success"])
+
+    assert SingleFlight.do("q", lambda: {"success": True}) == {"success": True}
+
+
+def test_leader_gets_its_own_result_and_memo_hits_get_copies():
+    result = {"rows": [1, 2]}
+
+    assert SingleFlight.do("q", lambda: result) is result
+    hit = SingleFlight.do("q", lambda: {"rows": []})
+    assert hit == result and hit is not result
@@ -0,0 +1,146 @@
+"""Works sync must not advance its updatedAt watermark past tasks it did not receive."""
+
+import pytest
+
+pytest.importorskip("qgis.core")
+
+from wild_code.modules.works import works_sync_service  # noqa: E402
+from wild_code.modules.works.works_sync_service import WorksSyncService  # noqa: E402
+from wild_code.python import api_actions  # noqa: E402
+
+TASK_IDS = [f"task-{index}" for index in range(60)]
+FAILING_TASK = "task-30"
+
+
+class _FakeLoader:
+    def load_query_by_module(self, module, file_name):
+        return "query ListFilteredTasks { tasks { edges { node { id } } } }"
+
+
+def _fake_client(fail_chunk_with=None):
+    class _FakeClient:
+        def send_query_stream(self, query, variables=None, path=None, siblings=None):
+            chunk = variables["where"]["AND"][0]["value"]
+            if fail_chunk_with in chunk:
+                raise RuntimeError("chunk failed")
+            for task_id in chunk:
+                yield {"id": task_id, "updatedAt": f"2026-01-01T00:00:{TASK_IDS.index(task_id):02d}"}
+
+    return _FakeClient
+
+
+class _FakeFeature:
+    def __init__(self, fid, task_id):
+        self._fid = fid
+        self._task_id = task_id
+
+    def id(self):
+        return self._fid
+
+    def attribute(self, name):
+        return self._task_id
+
+
+class _FakeLayer:
+    def __init__(self):
+        self.properties = {}
+
+    def isValid(self):
+        return True
+
+    def isEditable(self):
+        return False
+
+    def name(self):
+        return "works"
+
+    def customProperty(self, key):
+        return self.properties.get(key)
+
+    def setCustomProperty(self, key, value):
+        self.properties[key] = value
+
+    def getFeatures(self, request=None):
+        return [_FakeFeature(fid, task_id) for fid, task_id in enumerate(TASK_IDS)]
+
+
+class _FakeIndex:
+    def ids_by_value(self):
+        return {task_id: [fid] for fid, task_id in enumerate(TASK_IDS)}
+
+
+@pytest.fixture
+def sync_env(monkeypatch):
+    layer = _FakeLayer()
+    monkeypatch.setattr(api_actions, "GraphQLQueryLoader", _FakeLoader)
+    monkeypatch.setattr(works_sync_service, "QgsVectorLayer", _FakeLayer)
+    monkeypatch.setattr(works_sync_service.LayerFeatureIndex, "for_field", staticmethod(lambda lyr, field: _FakeIndex()))
+    monkeypatch.setattr(
+        works_sync_service.WorksLayerService,
+        "resolve_task_id_field_name",
+        staticmethod(lambda lyr: "ext_job_id"),
+    )
+    monkeypatch.setattr(works_sync_service.WorksLayerService, "geometry_from_payload", staticmethod(lambda payload: None))
+    monkeypatch.setattr(WorksSyncService, "_build_layer_updates", staticmethod(lambda task: {}))
+
+    service = WorksSyncService(lang_manager=object())
+    monkeypatch.setattr(service, "attach", lambda: layer)
+    return service, layer
+
+
+def test_get_tasks_by_ids_raises_when_a_chunk_fails(monkeypatch):
+    monkeypatch.setattr(api_actions, "GraphQLQueryLoader", _FakeLoader)
+    monkeypatch.setattr(api_actions, "APIClient", _fake_client(fail_chunk_with=FAILING_TASK))
+
+    with pytest.raises(RuntimeError):
+        api_actions.APIModuleActions.get_tasks_by_ids(TASK_IDS)
+
+
+def test_full_sync_with_failing_chunk_keeps_watermark_unset(monkeypatch, sync_env, fail_log):
+    service, layer = sync_env
+    monkeypatch.setattr(api_actions, "APIClient", _fake_client(fail_chunk_with=FAILING_TASK))
+
+    service.sync_from_backend(full_resync=True)
+
+    assert WorksSyncService.SYNC_WATERMARK_PROPERTY not in layer.properties
+    assert "works_sync_fetch_failed" in [event for event, _ in fail_log]
+
+
+def test_full_sync_stores_newest_updated_at(monkeypatch, sync_env):
+    service, layer = sync_env
+    monkeypatch.setattr(api_actions, "APIClient", _fake_client())
+
+    service.sync_from_backend(full_resync=True)
+
+    assert layer.properties[WorksSyncService.SYNC_WATERMARK_PROPERTY] == "2026-01-01T00:00:59"
+
+
+def test_get_tasks_updated_since_raises_on_repeated_cursor(monkeypatch):
+    class _LoopingClient:
+        def send_query_stream(self, query, variables=None, path=None, siblings=None):
+            siblings["pageInfo"] = {"endCursor": "same", "hasNextPage": True}
+            yield {"id": "task-0"}
+
+    monkeypatch.setattr(api_actions, "GraphQLQueryLoader", _FakeLoader)
+    monkeypatch.setattr(api_actions, "APIClient", _LoopingClient)
+
+    with pytest.raises(RuntimeError):
+        api_actions.APIModuleActions.get_tasks_updated_since("2026-01-01T00:00:00")
+
+
+def test_first_sync_after_attach_ignores_the_watermark(monkeypatch, sync_env):
+    service, layer = sync_env
+    layer.properties[WorksSyncService.SYNC_WATERMARK_PROPERTY] = "2026-01-01T00:00:10"
+    calls = []
+    monkeypatch.setattr(api_actions.APIModuleActions, "get_tasks_by_ids", staticmethod(lambda ids: calls.append("full") or {}))
+    monkeypatch.setattr(
+        api_actions.APIModuleActions,
+        "get_tasks_updated_since",
+        staticmethod(lambda since: calls.append("incremental") or {}),
+    )
+    service._full_resync_pending = True
+
+    service.sync_from_backend()
+    service.sync_from_backend()
+
+    assert calls == ["full", "incremental"]
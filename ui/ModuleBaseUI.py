@@ -8,15 +8,18 @@ Põhimõtted:
 - Esmatäide: tilguta kuni scrollbar aktiveerub (või andmed lõppevad).
 - Scrolli sündmused on idempotentselt ühendatud.
 - Kaarti lisades ei käivita scroll-handlerit (_ignore_scroll_event).
+- Feed on virtualiseeritud (FeedListView): joonistatakse ainult nähtavad read,
+  päris kaardividin ehitatakse ainult avatud reale.
 """
-from typing import Optional, Callable, TYPE_CHECKING, Protocol, Any
+from typing import Optional, Callable, TYPE_CHECKING, Protocol
 import gc
-from PyQt5.QtCore import Qt, QTimer, QCoreApplication
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QScrollArea
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 
 from ..ui.ToolbarArea import ModuleToolbarArea
 from ..widgets.FeedCounterWidget import FeedCounterWidget
 from ..ui.module_card_factory import ModuleCardFactory
+from ..ui.feed_list_view import FeedListModel, FeedListView
 from ..widgets.theme_manager import ThemeManager, styleExtras
 from ..constants.file_paths import QssPaths
 from ..widgets.Filters.filter_refresh_helper import FilterRefreshHelper
@@ -24,6 +27,7 @@ from .mixins.dedupe_mixin import DedupeMixin
 from .mixins.feed_counter_mixin import FeedCounterMixin
 from .mixins.progressive_load_mixin import ProgressiveLoadMixin
 from ..feed.feed_load_engine import FeedLoadEngine
+from ..python.feed_records import FeedItemRecord
 from ..modules.Settings.SettinsUtils.SettingsLogic import SettingsLogic
 from ..Logs.switch_logger import SwitchLogger
 from ..Logs.python_fail_logger import PythonFailLogger
@@ -32,6 +36,7 @@ from ..languages.translation_keys import TranslationKeys
 from .mixins.token_mixin import TokenMixin
 
 if TYPE_CHECKING:
+    from ..feed.FeedLogic import FeedFetch
     from ..utils.api_error_handling import ApiErrorKind
     class EmptyStateWidgetProtocol(Protocol):
         def setText(self, text: str) -> None: ...
@@ -43,8 +48,12 @@ if TYPE_CHECKING:
         last_response: Optional[object]
         last_error_kind: Optional[ApiErrorKind]
         last_error_message: Optional[str]
+        on_revalidated: Optional[Callable[[list[FeedItemRecord]], None]]
 
-        def fetch_next_batch(self) -> list[dict[str, Any]]: ...
+        def fetch_next_batch(self) -> list[FeedItemRecord]: ...
+        def begin_fetch(self) -> Optional[FeedFetch]: ...
+        def run_fetch(self, fetch: FeedFetch) -> FeedFetch: ...
+        def finish_fetch(self, fetch: FeedFetch) -> list[FeedItemRecord]: ...
         def set_single_item_mode(self, value: bool) -> None: ...
         def set_extra_arguments(self, *args, **kwargs) -> None: ...
         def reset_pagination(self) -> None: ...
@@ -61,13 +70,7 @@ class FeedSessionController:
         self.reset_feed_ui_state()
 
     def reset_feed_ui_state(self) -> None:
-        layout = self._ui.feed_layout
-        if layout:
-            while layout.count() > 2:
-                item = layout.takeAt(1)
-                widget = item.widget() if item else None
-                if widget:
-                    widget.deleteLater()
+        self._ui.feed_view.clear_rows()
 
         self._ui._reset_dedupe()
 
@@ -88,16 +91,12 @@ class FeedSessionController:
                 except Exception:
                     pass
 
-    def clear_feed(self, feed_layout: Optional[QVBoxLayout], empty_state: Optional["EmptyStateWidgetProtocol"] = None) -> None:
-        if getattr(self._ui, "_clearing_feed", False) or feed_layout is None:
+    def clear_feed(self, feed_view: Optional[FeedListView], empty_state: Optional["EmptyStateWidgetProtocol"] = None) -> None:
+        if getattr(self._ui, "_clearing_feed", False) or feed_view is None:
             return
         self._ui._clearing_feed = True
         try:
-            while feed_layout.count() > 2:
-                item = feed_layout.takeAt(1)
-                widget = item.widget() if item else None
-                if widget:
-                    widget.deleteLater()
+            feed_view.clear_rows()
             if empty_state:
                 empty_state.setVisible(False)
             self._ui._reset_dedupe()
@@ -112,8 +111,8 @@ class FeedSessionController:
             engine.progressive_insert_func = None
             engine.parent_ui = None
 
-        # Aggressively drop UI widgets and dedupe state to free memory when module hides
-        self.clear_feed(self._ui.feed_layout, self._ui.empty_state)
+        # Aggressively drop rows, the live card and dedupe state to free memory when module hides
+        self.clear_feed(self._ui.feed_view, self._ui.empty_state)
 
         # Release cached responses/extra args so objects can be collected
         feed_logic = self._ui.feed_logic
@@ -133,6 +132,9 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     PREFETCH_PX: int = 300  # default; ProgressiveLoadMixin also uses this
     LOAD_DEBOUNCE_MS: int = 80
 
+    # Emitted from feed revalidation workers; queued onto the UI thread.
+    feedItemsRevalidated = pyqtSignal(object)
+
 
     def __init__(self, parent: Optional[QWidget] = None, lang_manager=None) -> None:
         QWidget.__init__(self, parent)
@@ -158,8 +160,6 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
         self._type_preferences_loaded = False
         self._tags_preferences_loaded = False
 
-        self.feed_layout: Optional[QVBoxLayout] = None
-
         self.feed_load_engine: Optional[FeedLoadEngine] = None
         self.feed_logic: FeedLogicProtocol | None = None
         self._empty_state: Optional["EmptyStateWidgetProtocol"] = None
@@ -167,9 +167,15 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
 
         self.layout = QVBoxLayout(self)
         self.toolbar_area = ModuleToolbarArea(self)
-        self.scroll_area = QScrollArea(self)
-        self.scroll_area.setObjectName("ModuleScrollArea")
-        self.scroll_area.setWidgetResizable(True)
+        self.feed_model = FeedListModel(self)
+        self.feed_view = FeedListView(
+            self.feed_model,
+            lambda item: ModuleCardFactory.create_card(item, self.lang_manager),
+            self,
+        )
+        self.feed_view.setObjectName("ModuleScrollArea")
+        # The list view is the feed's scroll area; scroll mixins and filters use this name.
+        self.scroll_area = self.feed_view
 
         toolbar_layout = QHBoxLayout()
         toolbar_layout.setContentsMargins(4, 2, 4, 2)
@@ -192,10 +198,11 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
         self._activated = False
         self._active_token = 0
         self._visible_once = False
+        self.feedItemsRevalidated.connect(self._replace_revalidated_cards)
 
-    def _extract_item_id(self, item: dict[str, Any]) -> Optional[str]:  # pragma: no cover - default hook
-        """Subclasses can override to provide stable IDs for dedupe."""
-        return None
+    def _extract_item_id(self, item: FeedItemRecord) -> Optional[str]:  # pragma: no cover - default hook
+        """Stable id for dedupe; feed records carry it pre-extracted. Subclasses may override."""
+        return item.item_id
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -246,6 +253,11 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     def empty_state(self) -> EmptyStateWidgetProtocol | None:
         return self._empty_state
 
+    def _init_feed_view(self, empty_text: str) -> None:
+        """Use the feed view's overlay label as the module's empty state."""
+        self._empty_state = self.feed_view.empty_state
+        self._empty_state.setText(empty_text)
+
 
 
 
@@ -254,7 +266,13 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     # Feed engine wiring
     # ------------------------------------------------------------------
     def init_feed_engine(self, batch_loader: Callable, debounce_ms: int = 80) -> None:
-        self.feed_load_engine = FeedLoadEngine(batch_loader, debounce_ms=debounce_ms)
+        self.feed_load_engine = FeedLoadEngine(
+            batch_loader,
+            debounce_ms=debounce_ms,
+            prepare_batch=self.prepare_next_batch,
+            fetch_batch=self.fetch_next_batch_items,
+            apply_batch=self.apply_fetched_batch,
+        )
         self.feed_load_engine.attach(parent_ui=self)
         # Ensure dedupe state is fresh when engine is initialized to avoid
         # skipping items that may have been marked seen during a previous session.
@@ -267,44 +285,74 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     # ------------------------------------------------------------------
     # Card insertion
     # ------------------------------------------------------------------
-    def _progressive_insert_card(self, item: dict[str, Any], insert_at_top: bool = False) -> None:
-        layout = self.feed_layout
-        if layout is None:
-            return
+    def _progressive_insert_card(self, item: FeedItemRecord, insert_at_top: bool = False) -> None:
+        model = self.feed_model
         stable_id = self._safe_extract_item_id(item)
-        force_accept = layout.count() <= 2
-        is_duplicate = False
-        if not force_accept:
-            if self._mark_or_skip_duplicate(item):
-                is_duplicate = True
-        if is_duplicate:
+        force_accept = model.rowCount() == 0
+        if not force_accept and self._mark_or_skip_duplicate(item):
             return
         if force_accept and stable_id is not None:
-            if stable_id not in self._seen_item_ids:
-                self._seen_item_ids.add(stable_id)
-        insert_index = 1 if insert_at_top else max(0, layout.count() - 1)
+            self._seen_item_ids.add(stable_id)
         self._ignore_scroll_event = True
         try:
-            card = ModuleCardFactory.create_card(item, self.lang_manager)
-            layout.insertWidget(insert_index, card)
-            QCoreApplication.processEvents()
+            if insert_at_top:
+                model.prepend_item(item)
+            else:
+                model.append_item(item)
             self._hide_loading_placeholder()
             self._update_feed_counter_live()
         finally:
             self._ignore_scroll_event = False
 
+    def _replace_revalidated_cards(self, items: list[FeedItemRecord]) -> None:
+        """Refresh only the rows whose item content changed after a background revalidation."""
+        if not getattr(self, "_activated", False):
+            return
+        self._ignore_scroll_event = True
+        try:
+            self.feed_model.update_items(items)
+        finally:
+            self._ignore_scroll_event = False
+
     # ------------------------------------------------------------------
     # Batch processing API
     # ------------------------------------------------------------------
     def process_next_batch(self,
                            revision: Optional[int] = None,
-                           insert_at_top: bool = False) -> list[dict[str, Any]]:
+                           insert_at_top: bool = False) -> list[FeedItemRecord]:
+        """Synchronous prepare + fetch + apply; FeedLoadEngine runs the fetch step on a worker instead."""
         if not getattr(self, "_activated", False):
             return []
+        fetch = self.prepare_next_batch()
+        return self.apply_fetched_batch(
+            self.fetch_next_batch_items(fetch) if fetch is not None else None,
+            insert_at_top=insert_at_top,
+        )
+
+    def prepare_next_batch(self) -> Optional[FeedFetch]:
+        """Claim the next page on the UI thread; None when there is nothing to fetch."""
+        feed_logic = self.active_feed_logic
+        if feed_logic is None:
+            return None
+        feed_logic.on_revalidated = self.feedItemsRevalidated.emit
+        return feed_logic.begin_fetch()
+
+    def fetch_next_batch_items(self, fetch: FeedFetch) -> FeedFetch:
+        """Network half of a batch load. Safe to run on a worker thread: touches no widgets or feed state."""
+        feed_logic = self.active_feed_logic
+        if feed_logic is None:
+            return fetch
+        return feed_logic.run_fetch(fetch)
+
+    def apply_fetched_batch(self, fetch: Optional[FeedFetch], insert_at_top: bool = False) -> list[FeedItemRecord]:
+        """UI half of a batch load: feed state, empty state, dedupe and post-batch updates. Main thread only."""
         feed_logic = self.active_feed_logic
         if feed_logic is None:
             return []
-        items = feed_logic.fetch_next_batch() or []
+        # Finish even when inactive so the page releases is_loading (a stale one is dropped).
+        items = feed_logic.finish_fetch(fetch) if fetch is not None else []
+        if not getattr(self, "_activated", False):
+            return []
         try:
             module_key = getattr(self, "module_key", None) or getattr(self, "name", None) or ""
             SwitchLogger.log(
@@ -341,8 +389,7 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     def _show_empty_state(self, message: Optional[str] = None) -> None:
         """Display a friendly empty-state card when no items are returned."""
         empty_state = self.empty_state
-        feed_layout = self.feed_layout
-        if not empty_state or not feed_layout:
+        if not empty_state:
             return
         if not message:
             lang_manager = self.lang_manager or LanguageManager()
@@ -371,7 +418,7 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
         except Exception:
             pass
 
-    def _filter_new_items(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _filter_new_items(self, items: list[FeedItemRecord]) -> list[FeedItemRecord]:
         if not items:
             return []
 
@@ -400,8 +447,8 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
         loaded = self._compute_loaded_cards()
         self._set_feed_counter(loaded, total)
 
-    def clear_feed(self, feed_layout: Optional[QVBoxLayout], empty_state: Optional["EmptyStateWidgetProtocol"] = None) -> None:
-        self._feed_session.clear_feed(feed_layout, empty_state)
+    def clear_feed(self, feed_view: Optional[FeedListView], empty_state: Optional["EmptyStateWidgetProtocol"] = None) -> None:
+        self._feed_session.clear_feed(feed_view, empty_state)
 
     def reset_feed_session(self) -> None:
         """Hard reset before (re)opening a feed: clears UI cards, dedupe, engine buffer, and pagination."""
@@ -430,7 +477,8 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
 
         FilterRefreshHelper.retheme_refresh_widget(getattr(self, "_filter_refresh_widget", None))
 
-        for card in self.scroll_area.findChildren(QWidget, "ModuleInfoCard"):
+        self.feed_view.apply_theme()
+        for card in self.feed_view.findChildren(QWidget, "ModuleInfoCard"):
             ThemeManager.apply_module_style(card, [QssPaths.MODULE_CARD])
             styleExtras.apply_chip_shadow(card)
             for child in card.findChildren(QWidget):
@@ -445,7 +493,7 @@ class ModuleBaseUI(DedupeMixin, FeedCounterMixin, ProgressiveLoadMixin, TokenMix
     # Helpers
     # ------------------------------------------------------------------
 
-    def _safe_extract_item_id(self, item: dict[str, Any]) -> Optional[str]:
+    def _safe_extract_item_id(self, item: FeedItemRecord) -> Optional[str]:
         return self._extract_item_id(item)
 
 
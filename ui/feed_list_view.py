@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+from typing import Any, Callable, NamedTuple, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QEvent, QLocale, QModelIndex, QRect, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen
+from PyQt5.QtWidgets import QAbstractItemView, QFrame, QLabel, QListView, QStyle, QStyledItemDelegate
+
+from ..Logs.python_fail_logger import PythonFailLogger
+from ..python.feed_records import FeedItemRecord
+from ..widgets.DateHelpers import DateHelpers
+from ..widgets.theme_manager import Theme, ThemeManager, is_dark
+
+
+ITEM_ROLE = Qt.UserRole + 1
+ITEM_ID_ROLE = Qt.UserRole + 2
+
+
+class FeedRow(NamedTuple):
+    """A feed record plus its painted subtitle, formatted once on insert."""
+
+    record: FeedItemRecord
+    subtitle: str
+
+    @property
+    def item_id(self) -> str:
+        return self.record.item_id
+
+    @property
+    def title(self) -> str:
+        return self.record.title
+
+    @property
+    def status_color(self) -> str:
+        return self.record.status_color
+
+
+class FeedListModel(QAbstractListModel):
+    """Row store for module feeds: one FeedRow per FeedItemRecord, looked up by id."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[FeedRow] = []
+        self._row_by_id: dict[str, int] = {}
+        self._locale = QLocale()
+
+    # Qt model API ------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.title
+        if role == Qt.ToolTipRole:
+            return row.title
+        if role == ITEM_ROLE:
+            return row.record
+        if role == ITEM_ID_ROLE:
+            return row.item_id
+        return None
+
+    # Row store ---------------------------------------------------------
+    def row(self, row: int) -> Optional[FeedRow]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def row_for_id(self, item_id: Any) -> int:
+        return self._row_by_id.get(str(item_id), -1)
+
+    def append_item(self, item: FeedItemRecord) -> None:
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(self._make_row(item))
+        self._row_by_id[self._rows[-1].item_id] = position
+        self.endInsertRows()
+
+    def prepend_item(self, item: FeedItemRecord) -> None:
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, self._make_row(item))
+        self._reindex()
+        self.endInsertRows()
+
+    def update_items(self, items: list[FeedItemRecord]) -> list[int]:
+        """Replace rows whose id matches one of ``items``; returns the touched row numbers."""
+        touched: list[int] = []
+        for item in items or []:
+            if not isinstance(item, FeedItemRecord):
+                continue
+            position = self.row_for_id(item.item_id)
+            if position < 0:
+                continue
+            self._rows[position] = self._make_row(item)
+            model_index = self.index(position)
+            self.dataChanged.emit(model_index, model_index)
+            touched.append(position)
+        return touched
+
+    def clear(self) -> None:
+        if not self._rows:
+            return
+        self.beginResetModel()
+        self._rows = []
+        self._row_by_id = {}
+        self.endResetModel()
+
+    def _reindex(self) -> None:
+        self._row_by_id = {row.item_id: position for position, row in enumerate(self._rows)}
+
+    def _make_row(self, record: FeedItemRecord) -> FeedRow:
+        due_at = DateHelpers.parse_iso(record.due_at)
+        parts = (
+            record.client_name,
+            record.status_name,
+            DateHelpers.format_short_date(due_at, self._locale) if due_at else "",
+        )
+        return FeedRow(record=record, subtitle=" · ".join(part for part in parts if part))
+
+
+class FeedCardDelegate(QStyledItemDelegate):
+    """Paints a compact card for each visible row; expanded rows host a real card widget."""
+
+    ROW_HEIGHT = 64
+    STRIPE_WIDTH = 4
+    PADDING = 10
+
+    # Row colours per theme, matching QFrame#ModuleInfoCard and its ModuleRow* labels in ModuleCard.qss.
+    THEME_COLORS = {
+        Theme.LIGHT: {
+            "background": QColor("#ffffff"),
+            "hover": QColor("#fafbfc"),
+            "border": QColor(0, 120, 212, 115),
+            "title": QColor("#111416"),
+            "subtitle": QColor("#4a5568"),
+        },
+        Theme.DARK: {
+            "background": QColor("#1f262d"),
+            "hover": QColor("#232b33"),
+            "border": QColor(9, 144, 143, 140),
+            "title": QColor("#f2f5f8"),
+            "subtitle": QColor("#9aa7b8"),
+        },
+    }
+
+    def __init__(self, view: "FeedListView") -> None:
+        super().__init__(view)
+        self._view = view
+        self.apply_theme()
+
+    def apply_theme(self) -> None:
+        """Pick the row colours for the current theme; call again after a theme switch."""
+        self._colors = self.THEME_COLORS[Theme.DARK if is_dark(ThemeManager.effective_theme()) else Theme.LIGHT]
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        width = self._view.viewport().width()
+        height = self._view.expanded_height(index.row())
+        return QSize(width, height or self.ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        if self._view.expanded_height(index.row()):
+            return  # covered by the live card widget
+        row = index.model().row(index.row())
+        if row is None:
+            return
+
+        colors = self._colors
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(QPen(colors["border"], 1) if hovered else Qt.NoPen)
+        painter.setBrush(colors["hover"] if hovered else colors["background"])
+        painter.drawRoundedRect(rect, 6, 6)
+
+        stripe = QRect(rect.left(), rect.top(), self.STRIPE_WIDTH, rect.height())
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(row.status_color))
+        painter.drawRoundedRect(stripe, 2, 2)
+
+        text_left = rect.left() + self.STRIPE_WIDTH + self.PADDING
+        text_width = max(0, rect.right() - self.PADDING - text_left)
+        line_height = (rect.height() - 2 * self.PADDING) // 2
+
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(colors["title"])
+        title_rect = QRect(text_left, rect.top() + self.PADDING, text_width, line_height)
+        title = painter.fontMetrics().elidedText(row.title, Qt.ElideRight, text_width)
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        painter.setFont(option.font)
+        painter.setPen(colors["subtitle"])
+        subtitle_rect = QRect(text_left, title_rect.bottom(), text_width, line_height)
+        subtitle = painter.fontMetrics().elidedText(row.subtitle, Qt.ElideRight, text_width)
+        painter.drawText(subtitle_rect, Qt.AlignLeft | Qt.AlignVCenter, subtitle)
+        painter.restore()
+
+
+class FeedListView(QListView):
+    """Virtualized module feed.
+
+    Only rows inside the viewport are painted, by FeedCardDelegate. The full
+    interactive card (ModuleCardFactory) is built for the expanded row alone
+    and dropped again when another row is expanded or the feed is cleared.
+    """
+
+    def __init__(self, model: FeedListModel, card_factory: Callable[[Any], Any], parent=None) -> None:
+        super().__init__(parent)
+        self._card_factory = card_factory
+        self._expanded_id: Optional[str] = None
+        self._expanded_height = 0
+
+        self.setModel(model)
+        self.setItemDelegate(FeedCardDelegate(self))
+        self.setFrameShape(QFrame.NoFrame)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        self.setSpacing(3)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover, True)
+
+        self.empty_state = QLabel(self.viewport())
+        self.empty_state.setAlignment(Qt.AlignCenter)
+        self.empty_state.setWordWrap(True)
+        self.empty_state.setVisible(False)
+
+        self.clicked.connect(self._toggle_expanded)
+        model.modelAboutToBeReset.connect(self.collapse)
+        model.rowsAboutToBeRemoved.connect(lambda *_args: self.collapse())
+        model.dataChanged.connect(self._on_data_changed)
+
+    def feed_model(self) -> FeedListModel:
+        return self.model()
+
+    # Expanded row --------------------------------------------------------
+    def expanded_height(self, row: int) -> int:
+        if self._expanded_id is None:
+            return 0
+        return self._expanded_height if self.feed_model().row_for_id(self._expanded_id) == row else 0
+
+    def expand_row(self, row: int) -> None:
+        feed_row = self.feed_model().row(row)
+        if feed_row is None:
+            return
+        self.collapse()
+        try:
+            card = self._card_factory(feed_row.record)
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="ui",
+                event="feed_view_card_build_failed",
+                extra={"item_id": feed_row.item_id},
+            )
+            return
+        card.setProperty("feedItemId", feed_row.item_id)
+        self._expanded_id = feed_row.item_id
+        self._expanded_height = self._card_height(card)
+        model_index = self.feed_model().index(row)
+        self.setIndexWidget(model_index, card)
+        # Re-measure when the card's content changes height (e.g. ExtraInfoFrame's toggle).
+        card.installEventFilter(self)
+        self.itemDelegate().sizeHintChanged.emit(model_index)
+        self.scrollTo(model_index, QAbstractItemView.EnsureVisible)
+
+    def collapse(self) -> None:
+        if self._expanded_id is None:
+            return
+        row = self.feed_model().row_for_id(self._expanded_id)
+        self._expanded_id = None
+        self._expanded_height = 0
+        if row < 0:
+            return
+        model_index = self.feed_model().index(row)
+        self.setIndexWidget(model_index, None)
+        self.itemDelegate().sizeHintChanged.emit(model_index)
+
+    def expanded_card(self):
+        if self._expanded_id is None:
+            return None
+        row = self.feed_model().row_for_id(self._expanded_id)
+        return self.indexWidget(self.feed_model().index(row)) if row >= 0 else None
+
+    @staticmethod
+    def _card_height(card) -> int:
+        return max(FeedCardDelegate.ROW_HEIGHT, card.sizeHint().height())
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() in (QEvent.LayoutRequest, QEvent.Resize) and watched is self.expanded_card():
+            height = self._card_height(watched)
+            if height != self._expanded_height:
+                self._expanded_height = height
+                row = self.feed_model().row_for_id(self._expanded_id)
+                self.itemDelegate().sizeHintChanged.emit(self.feed_model().index(row))
+        return super().eventFilter(watched, event)
+
+    def apply_theme(self) -> None:
+        self.itemDelegate().apply_theme()
+        self.viewport().update()
+
+    def _toggle_expanded(self, model_index: QModelIndex) -> None:
+        if self.expanded_height(model_index.row()):
+            self.collapse()
+        else:
+            self.expand_row(model_index.row())
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, *_roles) -> None:
+        # Revalidated data for the expanded row: rebuild its live card.
+        if self._expanded_id is None:
+            return
+        row = self.feed_model().row_for_id(self._expanded_id)
+        if top_left.row() <= row <= bottom_right.row():
+            self.expand_row(row)
+
+    # Viewport --------------------------------------------------------------
+    def clear_rows(self) -> None:
+        self.collapse()
+        self.feed_model().clear()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.empty_state.setGeometry(self.viewport().rect())
@@ -4,14 +4,14 @@
 Relies on attributes provided by consumer class:
 - feed_counter widget exposing set_loaded_total(loaded, total)
 - feed_logic (optional) with has_more, total_count
-- feed_layout (QVBoxLayout pattern: [empty_label, cards..., stretch])
+- feed_model (FeedListModel) holding one row per loaded item
 """
 from typing import Optional
 
 class FeedCounterMixin:
     feed_counter = None  # type: ignore[attr-defined]
     feed_logic = None  # type: ignore[attr-defined]
-    feed_layout = None  # type: ignore[attr-defined]
+    feed_model = None  # type: ignore[attr-defined]
 
     def _set_feed_counter(self, loaded: int, total: Optional[int]) -> None:
         counter = self.feed_counter  # type: ignore[attr-defined]
@@ -25,26 +25,8 @@ class FeedCounterMixin:
         counter.set_loaded_total(loaded, display_total)
 
     def _compute_loaded_cards(self) -> int:
-        layout = self.feed_layout  # type: ignore[attr-defined]
-        if layout is None:
-            return 0
-        count = layout.count()
-        if count == 0:
-            return 0
-        real_cards = 0
-        for i in range(count):
-            item = layout.itemAt(i)
-            if not item:
-                continue
-            w = item.widget()
-            if not w:
-                continue
-            name = w.objectName() or ""
-            if name == "ModuleInfoCard":
-                real_cards += 1
-        if real_cards == 0 and count >= 3:
-            return count - 2
-        return real_cards
+        model = self.feed_model  # type: ignore[attr-defined]
+        return model.rowCount() if model is not None else 0
 
     def _update_feed_counter_live(self) -> None:
         feed_logic = self.feed_logic  # type: ignore[attr-defined]
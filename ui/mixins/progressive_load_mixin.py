@@ -4,7 +4,7 @@
 Consumer must define / provide:
 - feed_load_engine (FeedLoadEngine) after init
 - scroll_area with verticalScrollBar()
-- feed_layout layout structure
+- feed_model row store behind the scroll_area list view
 - _progressive_insert_card(item, insert_at_top=False) method or override
 """
 from PyQt5.QtCore import QTimer
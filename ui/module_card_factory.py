@@ -3,6 +3,7 @@ from __future__ import annotations
 from PyQt5.QtWidgets import QWidget
 
 from ..Logs.python_fail_logger import PythonFailLogger
+from ..python.feed_records import FeedItemRecord
 from ..utils.url_manager import Module
 
 
@@ -298,13 +299,13 @@ class ModuleCardFactory:
         return card
 
     @staticmethod
-    def create_card(item, lang_manager):
+    def create_card(record: FeedItemRecord, lang_manager):
         from ..module_manager import ModuleManager
 
         module_manager = ModuleManager()
         module_name = module_manager.getActiveModuleName()
         return ModuleCardFactory.create_item_card(
-            item,
+            record.node,
             module_name=module_name,
             lang_manager=lang_manager,
         )
@@ -7,6 +7,7 @@ from ...modules.Settings.SettinsUtils.SettingsLogic import SettingsLogic
 from ...python.GraphQLQueryLoader import GraphQLQueryLoader
 from ...python.responses import JsonResponseHandler
 from ...python.api_client import APIClient
+from ...python.reference_cache import ReferenceCache
 from ...Logs.python_fail_logger import PythonFailLogger
 
 
@@ -85,6 +86,16 @@ class FilterHelper:
                     entries.append((label, sid))
             return entries
 
+    @staticmethod
+    def cached_filter_edges(key, module):
+        """Filter options stored on disk by a previous load, or None. No network."""
+        return ReferenceCache.peek(f"filter.{key}", str(module))
+
+    @staticmethod
+    def refresh_filter_edges(key, module):
+        """Fetch and store filter options; returns ``(entries, changed_since_stored_copy)``."""
+        return ReferenceCache.refresh(f"filter.{key}", str(module))
+
     @staticmethod
     def set_selected_ids(widget, ids: Sequence[str], emit: bool = True) -> None:
         ids_set = {str(v) for v in ids or []}
@@ -181,7 +192,6 @@ class FilterHelper:
         return [{"relation": "TAGS", "mode": mode, "ids": ids}]
 
 
-
 class FilterRefreshService:
     """Shared filter refresh pipeline for module UIs."""
 
@@ -347,10 +357,10 @@ class FilterRefreshService:
             setattr(module, "_current_where", where)
 
         clear_feed = getattr(module, "clear_feed", None)
-        feed_layout = getattr(module, "feed_layout", None)
+        feed_view = getattr(module, "feed_view", None)
         empty_state = getattr(module, "_empty_state", None)
-        if callable(clear_feed) and feed_layout is not None:
-            clear_feed(feed_layout, empty_state)
+        if callable(clear_feed) and feed_view is not None:
+            clear_feed(feed_view, empty_state)
 
         scroll_area = getattr(module, "scroll_area", None)
         if scroll_area is not None and scroll_area.verticalScrollBar() is not None:
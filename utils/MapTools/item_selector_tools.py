@@ -155,18 +155,7 @@ class PropertiesSelectors:
 
         try:
             started = perf_counter()
-            features = PropertyTableManager().get_selected_features(table)
-            feature_ids = []
-            seen_ids = set()
-            for feature in features or []:
-                try:
-                    fid = int(feature.id())
-                except Exception:
-                    continue
-                if fid in seen_ids:
-                    continue
-                seen_ids.add(fid)
-                feature_ids.append(fid)
+            feature_ids = PropertyTableManager.get_selected_feature_ids(table)
 
             if not feature_ids:
                 return layer
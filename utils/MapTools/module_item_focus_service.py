@@ -7,6 +7,7 @@ from qgis.core import QgsVectorLayer
 from ...constants.settings_keys import SettingsService
 from ...Logs.python_fail_logger import PythonFailLogger
 from ...utils.url_manager import Module
+from ..layers.layer_feature_index import LayerFeatureIndex
 from .MapHelpers import MapHelpers
 
 
@@ -68,17 +69,13 @@ class ModuleItemFocusService:
             return False
 
         try:
-            target_feature = None
-            for feature in layer.getFeatures():
-                current_id = str(feature.attribute(identity_field) or "").strip()
-                if current_id == item_id_text:
-                    target_feature = feature
-                    break
-            if target_feature is None:
+            index = LayerFeatureIndex.for_field(layer, identity_field)
+            target_feature_id = index.first_feature_id(item_id_text) if index is not None else None
+            if target_feature_id is None:
                 return False
 
             MapHelpers.ensure_layer_visible(layer, make_active=True)
-            MapHelpers.select_features_by_ids(layer, [int(target_feature.id())], zoom=True)
+            MapHelpers.select_features_by_ids(layer, [int(target_feature_id)], zoom=True)
             return True
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -2,16 +2,22 @@
 
 
 import os
-from typing import Optional
+from typing import Callable, Optional, Tuple
 from PyQt5.QtWidgets import QFileDialog
 from qgis.core import QgsVectorLayer
-from qgis.PyQt.QtCore import QCoreApplication
+from qgis.PyQt.QtCore import Qt
 
 from ..engines.LayerCreationEngine import get_layer_engine, MailablGroupFolders
+from ..engines.ShapefileImportTask import ShapefileImportTask
 from ..languages.language_manager import LanguageManager
-from ..constants.layer_constants import IMPORT_PROPERTY_TAG
+from ..languages.translation_keys import TranslationKeys
+from ..constants.layer_constants import (
+    IMPORT_PROPERTY_TAG,
+    SHP_IMPORT_MODE_MEMORY,
+)
 from ..constants.file_paths import QmlPaths
 from .messagesHelper import ModernMessageDialog
+from ..widgets.ProgressDialogModern import ProgressDialogModern
 from ..Logs.python_fail_logger import PythonFailLogger
 
 
@@ -27,100 +33,132 @@ class SHPLayerLoader:
     - Settings persistence
     """
 
-    def __init__(self, parent_widget=None, target_group=None):
+    def __init__(self, parent_widget=None, target_group=None, import_mode=None):
         """
         Initialize the SHPLayerLoader.
 
         Args:
             parent_widget: Parent widget for dialogs
             target_group: Target group name (defaults to NEW_PROPERTIES)
+            import_mode: SHP_IMPORT_MODE_MEMORY (default) or SHP_IMPORT_MODE_GEOPACKAGE
         """
         self.parent = parent_widget
         self.target_group = target_group or MailablGroupFolders.NEW_PROPERTIES
+        self.import_mode = import_mode or SHP_IMPORT_MODE_MEMORY
         self.lang_manager = LanguageManager()
         self.engine = get_layer_engine()
 
-    def load_shp_layer(self) -> bool:
+    def load_shp_layer_in_background(self, on_finished: Optional[Callable[[bool, bool], None]] = None) -> bool:
         """
-        Load a Shapefile as a memory layer with data import.
+        Load a Shapefile through a background ShapefileImportTask.
+
+        The feature copy runs off the UI thread on a detached copy of the source;
+        the layer is added to the project only when the copy completes, so a
+        cancel leaves no partial layer behind.
+
+        Args:
+            on_finished: Called on the main thread as on_finished(success, cancelled)
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the import was started, False if another import is still
+            running or no valid file was chosen
+        """
+        if ShapefileImportTask.is_running():
+            # A second task would write the same <gpkg>.part side file
+            PythonFailLogger.log("shp_loader_import_already_running", module="property")
+            return False
+        source = self._select_source()
+        if source is None:
+            return False
+        file_path, layer_name, shp_layer = source
+        total_features = max(int(shp_layer.featureCount()), 0)
+        del shp_layer  # The task opens its own copy of the source
+
+        task = ShapefileImportTask(file_path, layer_name, self.target_group, self.import_mode)
+
+        # Non-modal so the canvas stays usable; QGIS also shows the task in its status bar
+        progress = ProgressDialogModern(
+            title=self.lang_manager.translate(TranslationKeys.IMPORTING_SHAPEFILE),
+            maximum=max(total_features, 1),
+            parent=self.parent,
+        )
+        progress.setWindowModality(Qt.NonModal)
+        progress.canceled.connect(task.cancel)
+        # Closing the window only hides progress; the task keeps running in the task manager
+        dialog_open = [True]
+        progress.finished.connect(lambda _result: dialog_open.__setitem__(0, False))
+
+        def close_progress() -> None:
+            if dialog_open[0]:
+                progress.close()
+
+        def on_features(done: int, total: int) -> None:
+            if not dialog_open[0]:
+                return
+            progress_pct = int(done / max(total, 1) * 100)
+            progress.update(
+                value=done,
+                text1=f"{self.lang_manager.translate(TranslationKeys.PROCESSING_FEATURES)}: {done}/{total} ({progress_pct}%)",
+                text2=f"{self.lang_manager.translate(TranslationKeys.FEATURES_COPIED)}: {task.features_written}",
+            )
+
+        def on_imported(layer) -> None:
+            close_progress()
+            success = self._finalize_import(layer, layer_name)
+            if on_finished:
+                on_finished(success, False)
+
+        def on_failed(cancelled: bool) -> None:
+            close_progress()
+            PythonFailLogger.log(
+                "shp_loader_task_cancelled" if cancelled else "shp_loader_task_failed",
+                module="property",
+                extra={"file": file_path, "mode": self.import_mode},
+            )
+            if on_finished:
+                on_finished(False, cancelled)
+
+        task.featuresProcessed.connect(on_features)
+        task.imported.connect(on_imported)
+        task.failed.connect(on_failed)
+        progress.show()
+        task.start()
+        return True
+
+    def _select_source(self) -> Optional[Tuple[str, str, QgsVectorLayer]]:
+        """
+        Ask for a Shapefile and open it.
+
+        Returns:
+            Optional[Tuple[str, str, QgsVectorLayer]]: (file path, layer name, layer) or None
         """
-        print("[SHPLayerLoader] Starting load_shp_layer")
         PythonFailLogger.log("shp_loader_start", module="property")
         # Show file dialog for SHP files
         file_path = self._get_shp_file_path()
         if not file_path:
-            print("[SHPLayerLoader] No file selected (cancelled)")
             PythonFailLogger.log("shp_loader_cancelled", module="property")
-            return False  # User cancelled
+            return None  # User cancelled
 
         # Validate and load the Shapefile
         layer_name = os.path.splitext(os.path.basename(file_path))[0]
         shp_layer = QgsVectorLayer(file_path, layer_name, 'ogr')
 
         if not shp_layer.isValid():
-            print("[SHPLayerLoader] QgsVectorLayer is not valid")
             PythonFailLogger.log(
                 "shp_loader_invalid_source_layer",
                 module="property",
                 extra={"file": file_path},
             )
-            return False
-
-        print("[SHPLayerLoader] Importing shapefile to memory layer")
-        memory_layer = self.engine.import_shapefile_to_memory_layer(
-                shp_layer=shp_layer,
-                layer_name=layer_name,
-                group_name=self.target_group,
-                parent_widget=self.parent
-            )
-        print(f"[SHPLayerLoader] Import result layer: {memory_layer}")
-        PythonFailLogger.log(
-            "shp_loader_import_result",
-            module="property",
-            extra={"result_type": type(memory_layer).__name__},
-        )
+            return None
+        return file_path, layer_name, shp_layer
 
-        # If engine returns a layer name (str), resolve it to the actual layer object
-        if isinstance(memory_layer, str):
-            layers = self.engine.project.mapLayersByName(memory_layer)
-            memory_layer = layers[0] if layers else None
-
-        if memory_layer is None:
-            # Best-effort fallback resolution for legacy return paths/race conditions
-            for _ in range(3):
-                QCoreApplication.processEvents()
-
-            candidates = self.engine.project.mapLayersByName(f"{layer_name}_memory")
-            if candidates:
-                memory_layer = candidates[-1]
-
-        if memory_layer is None:
-            try:
-                tagged = []
-                for layer in self.engine.project.mapLayers().values():
-                    if layer.customProperty(IMPORT_PROPERTY_TAG):
-                        tagged.append(layer)
-                if tagged:
-                    memory_layer = tagged[-1]
-            except Exception:
-                memory_layer = None
-
-        if not memory_layer:
-            print("[SHPLayerLoader] Import did not return a valid memory layer")
-            try:
-                names = [layer.name() for layer in self.engine.project.mapLayers().values()]
-            except Exception:
-                names = []
-            PythonFailLogger.log(
-                "shp_loader_memory_layer_missing",
-                module="property",
-                extra={"expected_name": f"{layer_name}_memory", "project_layers": len(names)},
-            )
-            return False
+    def _finalize_import(self, memory_layer: QgsVectorLayer, layer_name: str) -> bool:
+        """
+        Tag and style an imported layer and tell the user.
 
+        Returns:
+            bool: True (the layer is ready)
+        """
         print(f"[SHPLayerLoader] Memory layer found; setting tag and applying style. Feature count pre-style: {memory_layer.featureCount()}")
         # Set the property tag on the newly created layer
         memory_layer.setCustomProperty(IMPORT_PROPERTY_TAG, "true")
@@ -1,5 +1,6 @@
 from ..python.GraphQLQueryLoader import GraphQLQueryLoader
 from ..python.api_client import APIClient
+from ..python.reference_cache import ReferenceCache
 from ..utils.url_manager import ModuleSupports
 
 
@@ -56,6 +57,7 @@ class TagsEngines:
         data = _unwrap_data(response)
         created_tag = (data or {}).get("createTag") or {}
         created_tag_id = created_tag["id"]
+        ReferenceCache.invalidate(f"filter.{module_tags}")
         print(f"Tag created: ID {created_tag_id} -> Name: {created_tag['name']}")
         return created_tag_id
 
@@ -81,13 +83,7 @@ class TagsEngines:
         data = _unwrap_data(response)
         tags_data = (data or {}).get("tags") or {}
         edges = tags_data.get("edges") or []
-        tags = [edge.get("node") for edge in edges if isinstance(edge, dict) and edge.get("node")]
-
-        print(f"Loaded {len(tags)} tags for {module} module:")
-        for tag in tags:
-            print(f" - {tag['id']}: {tag['name']}")
-
-        return tags
+        return [edge.get("node") for edge in edges if isinstance(edge, dict) and edge.get("node")]
 
     @staticmethod
     def get_modules_tag_id_by_name(tag_name: str,module: str) -> str: 
@@ -133,4 +129,4 @@ class TagsHelpers:
             if res is not False:
                 tag_id=res
 
-        return tag_id
\ No newline at end of file
+        return tag_id
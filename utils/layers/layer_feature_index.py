@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from qgis.core import QgsExpression, QgsFeatureRequest, QgsVectorLayer
+from qgis.PyQt.QtCore import QVariant
+
+from ...Logs.python_fail_logger import PythonFailLogger
+
+
+class LayerFeatureIndex:
+    """Attribute value -> feature ids for one field of a vector layer.
+
+    Built once with an attribute-only, no-geometry request and then kept
+    current from the layer's edit signals, so lookups by backend id never
+    scan the layer. Rollbacks and schema changes mark the index dirty and
+    it is rebuilt on the next lookup.
+    """
+
+    _indexes: dict[tuple[str, str], "LayerFeatureIndex"] = {}
+
+    def __init__(self, layer: QgsVectorLayer, field_name: str) -> None:
+        self._layer = layer
+        self._layer_id = layer.id()
+        self._field_name = field_name
+        self._field_index = -1
+        self._ids_by_value: dict[str, list[int]] = {}
+        self._value_by_id: dict[int, str] = {}
+        self._dirty = True
+        self._connect()
+
+    @classmethod
+    def for_field(cls, layer: Optional[QgsVectorLayer], field_name: Optional[str]) -> Optional["LayerFeatureIndex"]:
+        if not isinstance(layer, QgsVectorLayer) or not layer.isValid() or not field_name:
+            return None
+        key = (layer.id(), str(field_name).lower())
+        index = cls._indexes.get(key)
+        if index is None:
+            index = cls(layer, field_name)
+            cls._indexes[key] = index
+        return index
+
+    @classmethod
+    def find_feature(cls, layer: Optional[QgsVectorLayer], lookups):
+        """First feature matching any ``(field_name, value)`` pair, tried in order.
+
+        Callers pass identity lookups by priority (backend id, then number,
+        then name); empty field names or values are skipped. A hit whose
+        attribute no longer matches (an edit the signals missed) drops the
+        layer's indexes and is answered with a filtered request instead.
+        """
+        for field_name, value in lookups:
+            key = cls.normalize(value)
+            if not field_name or not key:
+                continue
+            index = cls.for_field(layer, field_name)
+            feature_id = index.first_feature_id(value) if index is not None else None
+            if feature_id is None:
+                continue
+            feature = next(layer.getFeatures(QgsFeatureRequest(feature_id)), None)
+            if feature is not None and cls.normalize(feature.attribute(field_name)) == key:
+                return feature
+            cls.discard_layer(layer.id())
+            return cls._find_by_expression(layer, lookups)
+        return None
+
+    @classmethod
+    def _find_by_expression(cls, layer: QgsVectorLayer, lookups):
+        for field_name, value in lookups:
+            key = cls.normalize(value)
+            if not field_name or not key:
+                continue
+            request = QgsFeatureRequest(QgsExpression.createFieldEqualityExpression(field_name, key))
+            request.setLimit(1)
+            feature = next(layer.getFeatures(request), None)
+            if feature is not None:
+                return feature
+        return None
+
+    @classmethod
+    def discard_layer(cls, layer_id: str) -> None:
+        for key in [key for key in cls._indexes if key[0] == layer_id]:
+            cls._indexes.pop(key)._disconnect()
+
+    @staticmethod
+    def normalize(value) -> str:
+        """Lookup key for an attribute value; NULL (None or a null QVariant) maps to "" and is never indexed."""
+        if value is None or (isinstance(value, QVariant) and value.isNull()):
+            return ""
+        return str(value).strip()
+
+    def feature_ids(self, value) -> list[int]:
+        self._ensure_built()
+        return list(self._ids_by_value.get(self.normalize(value), ()))
+
+    def first_feature_id(self, value) -> Optional[int]:
+        feature_ids = self.feature_ids(value)
+        return feature_ids[0] if feature_ids else None
+
+    def ids_by_value(self) -> dict[str, list[int]]:
+        self._ensure_built()
+        return {value: list(feature_ids) for value, feature_ids in self._ids_by_value.items()}
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def _ensure_built(self) -> None:
+        if not self._dirty:
+            return
+        self._ids_by_value = {}
+        self._value_by_id = {}
+        self._field_index = self._layer.fields().lookupField(self._field_name)
+        self._dirty = False
+        if self._field_index < 0:
+            return
+
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([self._field_index])
+        try:
+            for feature in self._layer.getFeatures(request):
+                self._add(int(feature.id()), feature.attribute(self._field_index))
+        except Exception as exc:
+            self._dirty = True
+            PythonFailLogger.log_exception(
+                exc,
+                module="layers",
+                event="layer_feature_index_build_failed",
+                extra={"layer": self._layer_id, "field": self._field_name},
+            )
+
+    def _add(self, feature_id: int, value) -> None:
+        key = self.normalize(value)
+        if not key:
+            return
+        self._value_by_id[feature_id] = key
+        self._ids_by_value.setdefault(key, []).append(feature_id)
+
+    def _remove(self, feature_id: int) -> None:
+        key = self._value_by_id.pop(feature_id, None)
+        if key is None:
+            return
+        feature_ids = self._ids_by_value.get(key) or []
+        if feature_id in feature_ids:
+            feature_ids.remove(feature_id)
+        if not feature_ids:
+            self._ids_by_value.pop(key, None)
+
+    def _on_feature_added(self, feature_id: int) -> None:
+        if self._dirty or feature_id < 0:
+            return
+        feature = next(self._layer.getFeatures(QgsFeatureRequest(feature_id)), None)
+        if feature is not None:
+            self._add(int(feature_id), feature.attribute(self._field_index))
+
+    def _on_committed_features_added(self, _layer_id: str, features) -> None:
+        if self._dirty:
+            return
+        for feature in features or []:
+            self._remove(int(feature.id()))
+            self._add(int(feature.id()), feature.attribute(self._field_index))
+
+    def _on_feature_deleted(self, feature_id: int) -> None:
+        if not self._dirty:
+            self._remove(int(feature_id))
+
+    def _on_attribute_value_changed(self, feature_id: int, field_index: int, value) -> None:
+        if self._dirty or feature_id < 0 or field_index != self._field_index:
+            return
+        self._remove(int(feature_id))
+        self._add(int(feature_id), value)
+
+    def _on_layer_deleted(self) -> None:
+        self.discard_layer(self._layer_id)
+
+    def _signal_map(self) -> tuple:
+        layer = self._layer
+        return (
+            (layer.featureAdded, self._on_feature_added),
+            (layer.committedFeaturesAdded, self._on_committed_features_added),
+            (layer.featureDeleted, self._on_feature_deleted),
+            (layer.attributeValueChanged, self._on_attribute_value_changed),
+            (layer.afterRollBack, self.invalidate),
+            (layer.updatedFields, self.invalidate),
+            (layer.dataSourceChanged, self.invalidate),
+            (layer.willBeDeleted, self._on_layer_deleted),
+        )
+
+    def _connect(self) -> None:
+        for signal, slot in self._signal_map():
+            signal.connect(slot)
+
+    def _disconnect(self) -> None:
+        for signal, slot in self._signal_map():
+            try:
+                signal.disconnect(slot)
+            except Exception:
+                pass
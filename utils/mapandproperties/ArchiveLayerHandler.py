@@ -3,13 +3,15 @@ import os
 from typing import Optional, Tuple
 
 from qgis.core import (
-    QgsFields, QgsVectorFileWriter, QgsWkbTypes,
+    QgsFeature, QgsFeatureRequest, QgsFields, QgsVectorFileWriter, QgsWkbTypes,
     QgsCoordinateReferenceSystem, QgsProject, QgsVectorLayer
 )
 from osgeo import ogr
 from ...constants.file_paths import QmlPaths
+from ...Logs.python_fail_logger import PythonFailLogger
 
 from ...engines.LayerCreationEngine import MailablGroupFolders
+from ..MapTools.MapHelpers import MapHelpers
 
 
 def _safe_layer_edit_commit(layer: QgsVectorLayer) -> tuple[bool, str]:
@@ -283,6 +285,99 @@ class ArchiveLayerHandler:
         gc.collect()
         return new_layer
 
+    ARCHIVE_BATCH_SIZE = 500
+
+    @staticmethod
+    def features_by_field_values(
+        layer: QgsVectorLayer,
+        field_name: str,
+        values: list[str],
+        *,
+        chunk_size: int = ARCHIVE_BATCH_SIZE,
+    ) -> dict[str, list]:
+        """Fetch only the features whose `field_name` is in `values`.
+
+        Runs one `"field" IN (...)` request per chunk instead of scanning the
+        layer once per value. Keys are the stripped attribute text.
+        """
+        cleaned = list(dict.fromkeys(str(v).strip() for v in (values or []) if str(v).strip()))
+        if layer is None or not layer.isValid() or not cleaned or layer.fields().indexOf(field_name) < 0:
+            return {}
+
+        chunk = max(1, int(chunk_size))
+        features_by_value: dict[str, list] = {}
+        for start in range(0, len(cleaned), chunk):
+            segment = cleaned[start:start + chunk]
+            request = QgsFeatureRequest().setFilterExpression(
+                MapHelpers.build_subset_in_clause(field_name, segment, chunk_size=len(segment))
+            )
+            for feature in layer.getFeatures(request):
+                value = str(feature.attribute(field_name)).strip()
+                features_by_value.setdefault(value, []).append(feature)
+        return features_by_value
+
+    @staticmethod
+    def _archive_pk_indexes(archive_layer: QgsVectorLayer) -> list[int]:
+        try:
+            pk_indexes = list(archive_layer.dataProvider().pkAttributeIndexes() or [])
+        except Exception:
+            pk_indexes = []
+        if pk_indexes:
+            return pk_indexes
+
+        # Fallback for common GPKG/OGR conventions.
+        archive_fields = archive_layer.fields()
+        for candidate in ("fid", "id"):
+            index = archive_fields.lookupField(candidate)
+            if index >= 0:
+                return [index]
+        return []
+
+    @staticmethod
+    def copy_features_to_archive(
+        archive_layer: QgsVectorLayer,
+        features: list,
+        *,
+        batch_size: int = ARCHIVE_BATCH_SIZE,
+    ) -> tuple[list[int], list[str]]:
+        """Add copies of `features` to the (editable) archive layer in batches.
+
+        Attributes are mapped by field name and primary-key values are never
+        carried over, otherwise GeoPackage fails with UNIQUE constraint
+        errors. Returns (source ids that were copied, errors).
+        """
+        archive_fields = archive_layer.fields()
+        pk_indexes = set(ArchiveLayerHandler._archive_pk_indexes(archive_layer))
+        copied_ids: list[int] = []
+        errors: list[str] = []
+        source_index_map: Optional[list[int]] = None
+
+        batch = max(1, int(batch_size))
+        for start in range(0, len(features), batch):
+            segment = features[start:start + batch]
+            prepared = []
+            for src_feat in segment:
+                if source_index_map is None:
+                    source_fields = src_feat.fields()
+                    source_index_map = [
+                        -1 if i in pk_indexes else source_fields.lookupField(archive_fields.field(i).name())
+                        for i in range(archive_fields.count())
+                    ]
+                new_feat = QgsFeature(archive_fields)
+                new_feat.setGeometry(src_feat.geometry())
+                source_attrs = src_feat.attributes()
+                new_feat.setAttributes([
+                    source_attrs[src_idx] if 0 <= src_idx < len(source_attrs) else None
+                    for src_idx in source_index_map
+                ])
+                prepared.append(new_feat)
+
+            if archive_layer.addFeatures(prepared):
+                copied_ids.extend(int(src_feat.id()) for src_feat in segment)
+            else:
+                errors.append(f"archive_layer.addFeatures() failed for {len(prepared)} features")
+        return copied_ids, errors
+
     @staticmethod
     def archive_features_by_field_values(
         source_layer: QgsVectorLayer,
@@ -348,9 +443,14 @@ class ArchiveLayerHandler:
                 # Avoid duplicating if already present.
                 if root.findLayer(archive_layer.id()) is None:
                     group.addLayer(archive_layer)
-            except Exception as e:
+            except Exception as exc:
                 # Non-fatal; layer may already be in the tree or group ops might fail.
-                print(f"⚠️ Failed to add archive layer to group: {e}")
+                PythonFailLogger.log_exception(
+                    exc,
+                    module="property",
+                    event="archive_layer_group_add_failed",
+                    extra={"archive_layer": archive_layer_name},
+                )
 
         archived_count = 0
         deleted_count = 0
@@ -358,104 +458,26 @@ class ArchiveLayerHandler:
         errors: list[str] = []
 
         try:
-            source_features = list(source_layer.getFeatures())
-        except Exception:
-            source_features = []
+            matches_by_value = ArchiveLayerHandler.features_by_field_values(source_layer, field_name, values)
+        except Exception as e:
+            matches_by_value = {}
+            errors.append(f"source lookup failed: {e}")
 
-        # Build lookup of source features by field value.
-        source_features_by_value: dict[str, object] = {}
+        source_features = []
         for v in values:
-            found = None
-            for f in source_features:
-                try:
-                    if str(f.attribute(field_name)).strip() == v:
-                        found = f
-                        break
-                except Exception:
-                    continue
-
-            if found is None:
-                missing.append(v)
+            matches = matches_by_value.get(v)
+            if matches:
+                source_features.append(matches[0])
             else:
-                source_features_by_value[v] = found
-
-        if not source_features_by_value:
-            return {
-                "ok": True,
-                "archived": 0,
-                "deleted": 0,
-                "missing": missing,
-                "errors": [],
-                "archive_layer": archive_layer.name() if archive_layer else archive_layer_name,
-            }
-
-        # Prepare archive features.
-        archive_fields = archive_layer.fields()
-        try:
-            pk_indexes = list(archive_layer.dataProvider().pkAttributeIndexes() or [])
-        except Exception:
-            pk_indexes = []
-
-        if not pk_indexes:
-            # Fallback for common GPKG/OGR conventions.
-            name_to_idx = {}
-            for i in range(archive_fields.count()):
-                try:
-                    name_to_idx[str(archive_fields.field(i).name()).strip().lower()] = int(i)
-                except Exception:
-                    continue
-            for candidate in ("fid", "id"):
-                if candidate in name_to_idx:
-                    pk_indexes = [name_to_idx[candidate]]
-                    break
-
-        features_to_add = []
-        source_ids_to_delete = []
-
-        for v, src_feat in source_features_by_value.items():
-            try:
-                from qgis.core import QgsFeature
-
-                new_feat = QgsFeature(archive_fields)
-                new_feat.setGeometry(src_feat.geometry())
-
-                # Try direct attribute copy when schemas match.
-                try:
-                    new_feat.setAttributes(src_feat.attributes())
-                except Exception:
-                    # Map attributes by field name.
-                    attrs = []
-                    for i in range(archive_fields.count()):
-                        fname = archive_fields.field(i).name()
-                        try:
-                            attrs.append(src_feat.attribute(fname))
-                        except Exception:
-                            attrs.append(None)
-                    new_feat.setAttributes(attrs)
-
-                # Critical: never carry over PK values (e.g. fid) into the archive layer.
-                # Otherwise GeoPackage will fail with UNIQUE constraint errors.
-                for pk_idx in pk_indexes:
-                    try:
-                        new_feat.setAttribute(int(pk_idx), None)
-                    except Exception:
-                        continue
-
-                features_to_add.append(new_feat)
-                try:
-                    source_ids_to_delete.append(int(src_feat.id()))
-                except Exception as e:
-                    errors.append(f"failed to read source feature id for {v}: {e}")
-            except Exception as e:
-                errors.append(f"failed to prepare feature for {v}: {e}")
+                missing.append(v)
 
-        if not features_to_add:
+        if not source_features:
             return {
-                "ok": False,
+                "ok": not errors,
                 "archived": 0,
                 "deleted": 0,
                 "missing": missing,
-                "errors": errors or ["no features prepared"],
+                "errors": errors,
                 "archive_layer": archive_layer.name() if archive_layer else archive_layer_name,
             }
 
@@ -463,9 +485,9 @@ class ArchiveLayerHandler:
         try:
             if not archive_layer.isEditable():
                 archive_layer.startEditing()
-            ok_add = bool(archive_layer.addFeatures(features_to_add))
-            if not ok_add:
-                errors.append("archive_layer.addFeatures() failed")
+            source_ids_to_delete, add_errors = ArchiveLayerHandler.copy_features_to_archive(archive_layer, source_features)
+            if add_errors:
+                errors.extend(add_errors)
                 rb_err = _layer_rollback_error(archive_layer)
                 if rb_err:
                     errors.append(f"archive rollback failed: {rb_err}")
@@ -494,7 +516,7 @@ class ArchiveLayerHandler:
                     "archive_layer": archive_layer.name() if archive_layer else archive_layer_name,
                 }
 
-            archived_count = len(features_to_add)
+            archived_count = len(source_ids_to_delete)
         except Exception as e:
             errors.append(f"archive write exception: {e}")
             rb_err = _layer_rollback_error(archive_layer)
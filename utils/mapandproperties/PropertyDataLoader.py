@@ -10,13 +10,15 @@ from qgis.core import QgsFeatureRequest
 from PyQt5.QtCore import QCoreApplication
 from ...widgets.DateHelpers import DateHelpers
 from .property_row_builder import PropertyRowBuilder
+from .location_index import PropertyLocationIndex
 from ...Logs.python_fail_logger import PythonFailLogger
 
 
 class PropertyDataLoader:
     """
     Kiirem ja hooldatum andmete laadija kinnistute kihilt.
-    - Kasutab filter-avaldisi (ei käi kogu kihti läbi)
+    - Asukohavalikud tulevad asukohaindeksist (PropertyLocationIndex), mitte kihi skaneerimisest
+    - Objektid loetakse indeksi feature ID-de järgi (setFilterFids)
     - Loeb ainult vajalikud väljad (NoGeometry + subsetOfAttributes)
     - Kontrollib väljade olemasolu ja käsitleb tühiväärtusi
     """
@@ -57,22 +59,26 @@ class PropertyDataLoader:
         return f"'{v}'"
 
     @staticmethod
-    def _eq_expr(field, value):
+    def _field_ref(field, trimmed=False):
+        return f'trim("{field}")' if trimmed else f'"{field}"'
+
+    @staticmethod
+    def _eq_expr(field, value, trimmed=False):
         """Turvaline = avaldis (tringid ülakomadega, ülakomade escape)."""
         if value is None:
             # mitte kunagi ei sobi, tagastame false avaldise
             return 'FALSE'
-        return f'"{field}" = {PropertyDataLoader._sql_quote(value)}'
+        return f'{PropertyDataLoader._field_ref(field, trimmed)} = {PropertyDataLoader._sql_quote(value)}'
 
     @staticmethod
-    def _in_expr(field, values):
+    def _in_expr(field, values, trimmed=False):
         cleaned = [str(v).strip() for v in (values or []) if v is not None and str(v).strip()]
         if not cleaned:
             return 'FALSE'
         if len(cleaned) == 1:
-            return PropertyDataLoader._eq_expr(field, cleaned[0])
+            return PropertyDataLoader._eq_expr(field, cleaned[0], trimmed)
         literals = ",".join(PropertyDataLoader._sql_quote(v) for v in cleaned)
-        return f'"{field}" IN ({literals})'
+        return f'{PropertyDataLoader._field_ref(field, trimmed)} IN ({literals})'
 
     @staticmethod
     def _and(*parts):
@@ -83,14 +89,15 @@ class PropertyDataLoader:
 
     @staticmethod
     def build_scope_expression(*, county_name=None, municipality_name=None, settlements=None) -> str:
+        """Sama ulatus mis PropertyLocationIndex.feature_ids: tühi tase ei piira, väärtusi võrreldakse trimmituna."""
         cleaned_settlements = [str(v).strip() for v in (settlements or []) if str(v).strip()]
         settlement_clause = None
         if cleaned_settlements:
-            settlement_clause = PropertyDataLoader._in_expr(Katastriyksus.ay_nimi, cleaned_settlements)
+            settlement_clause = PropertyDataLoader._in_expr(Katastriyksus.ay_nimi, cleaned_settlements, trimmed=True)
 
         expression = PropertyDataLoader._and(
-            PropertyDataLoader._eq_expr(Katastriyksus.mk_nimi, county_name),
-            PropertyDataLoader._eq_expr(Katastriyksus.ov_nimi, municipality_name),
+            PropertyDataLoader._eq_expr(Katastriyksus.mk_nimi, str(county_name or "").strip() or None, trimmed=True),
+            PropertyDataLoader._eq_expr(Katastriyksus.ov_nimi, str(municipality_name or "").strip() or None, trimmed=True),
             settlement_clause,
         )
         return expression or ""
@@ -130,11 +137,7 @@ class PropertyDataLoader:
     def load_counties(self, layer):
         """Tagasta unikaalsed maakonnad."""
         try:
-            idx = self._ensure_field(self.county_field)
-            # uniqueValues on QGIS-is optimeeritud ja kasutab vajadusel DB poolset DISTINCT-i
-            values = layer.uniqueValues(idx)
-            counties = {str(v).strip() for v in values if v is not None and str(v).strip()}
-            return sorted(counties)
+            return PropertyLocationIndex.for_layer(layer).counties()
         except Exception as e:
             print(f"Error loading counties: {e}")
             raise
@@ -144,49 +147,17 @@ class PropertyDataLoader:
         if not self.property_layer:
             return []
         try:
-            expr = self._eq_expr(self.county_field, county_name)
-            req = self._request([self.county_field, self.municipality_field], expr)
-            municipalities = set()
-            for feat in self.property_layer.getFeatures(req):
-                val = feat.attribute(self.municipality_field)
-                if val is not None:
-                    s = str(val).strip()
-                    if s:
-                        municipalities.add(s)
-            return sorted(municipalities)
+            return PropertyLocationIndex.for_layer(self.property_layer).municipalities(county_name)
         except Exception as e:
             print(f"Error loading municipalities: {e}")
             raise
 
     def load_settlements_for_municipality(self, county_name, municipality_name):
         """Tagasta asulad valitud vallas/linnas (unikaalsed, sorditud)."""
-        #print(f"DEBUG: load_settlements_for_municipality called with county: {county_name}, municipality: {municipality_name}")
         if not self.property_layer:
-            print("DEBUG: No property layer")
             return []
         try:
-            expr = self._and(
-                self._eq_expr(self.county_field, county_name),
-                self._eq_expr(self.municipality_field, municipality_name),
-            )
-            #print(f"DEBUG: Filter expression: {expr}")
-            req = self._request(
-                [self.county_field, self.municipality_field, self.settlement_field],
-                expr,
-            )
-            settlements = set()
-            count = 0
-            for feat in self.property_layer.getFeatures(req):
-                val = feat.attribute(self.settlement_field)
-                if val is not None:
-                    s = str(val).strip()
-                    if s:
-                        settlements.add(s)
-                        count += 1
-            #print(f"DEBUG: Found {count} settlement values, unique: {len(settlements)}")
-            result = sorted(settlements)
-            #print(f"DEBUG: Returning settlements: {result}")
-            return result
+            return PropertyLocationIndex.for_layer(self.property_layer).settlements(county_name, municipality_name)
         except Exception as e:
             print(f"Error loading settlements: {e}")
             raise
@@ -203,12 +174,13 @@ class PropertyDataLoader:
         if not self.property_layer:
             return []
         try:
-            expr = PropertyDataLoader.build_scope_expression(
+            # indeks annab ulatuse feature ID-d; kihti ei skaneerita
+            fids = PropertyLocationIndex.for_layer(self.property_layer).feature_ids(
                 county_name=county_name,
                 municipality_name=municipality_name,
                 settlements=settlements,
             )
-            if not expr:
+            if not fids:
                 return []
 
             fields = [
@@ -218,8 +190,10 @@ class PropertyDataLoader:
                 self.settlement_field,
                 self.county_field,
                 self.municipality_field,
+                self.last_upd_date_field,
             ]
-            req = self._request(fields, expr)
+            req = self._request(fields)
+            req.setFilterFids(fids)
 
             properties = []
             for i, feat in enumerate(self.property_layer.getFeatures(req), start=1):
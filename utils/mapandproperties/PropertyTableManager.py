@@ -12,6 +12,7 @@ from PyQt5.QtWidgets import (
 )
 
 from .property_table_model import PropertyTableModel
+from .property_feature_fetcher import PropertyFeatureFetcher
 from ...Logs.python_fail_logger import PythonFailLogger
  
 class PropertyTableManager:
@@ -78,15 +79,14 @@ class PropertyTableManager:
             settlement_item = QTableWidgetItem(str(property_data['settlement']))
             properties_table.setItem(row, 3, settlement_item)
 
-            # Store feature data in the row
-            feature = property_data['feature']
+            # Store the feature id (not the feature) on all cells so selectedItems() always yields ids.
+            fid = property_data.get('fid')
+            cadastral_item.setData(Qt.UserRole, fid)
+            address_item.setData(Qt.UserRole, fid)
+            area_item.setData(Qt.UserRole, fid)
+            settlement_item.setData(Qt.UserRole, fid)
+            cadastral_item.setData(PropertyTableModel.ATTRIBUTES_ROLE, property_data.get('attributes') or {})
 
-            # Store feature on all cells so selectedItems() always yields feature payloads.
-            cadastral_item.setData(Qt.UserRole, feature)
-            address_item.setData(Qt.UserRole, feature)
-            area_item.setData(Qt.UserRole, feature)
-            settlement_item.setData(Qt.UserRole, feature)
-    
 
             # Process events periodically to keep UI responsive during table population
             if row % 50 == 0:
@@ -107,59 +107,56 @@ class PropertyTableManager:
             table.clearSelection()
 
     @staticmethod
-    def get_selected_features(table=None):
-        """Get the selected features from the table"""
+    def get_selected_feature_ids(table=None) -> list[int]:
+        """Unique feature ids of the selected rows, in table order."""
         if not table:
             return []
 
         if isinstance(table, QTableView):
-            selected_rows = table.selectionModel().selectedRows() if table.selectionModel() else []
-            selected_features = set()
-            for index in selected_rows:
-                feature = PropertyTableManager.get_cell_data(table, index.row(), 0, role=Qt.UserRole)
-                if feature:
-                    selected_features.add(feature)
-            return list(selected_features)
-            
-        selected_items = table.selectedItems()
-        if not selected_items:
-            return []
-
-        # Get unique selected features
-        selected_features = set()
-        for item in selected_items:
-            feature = item.data(Qt.UserRole)
-            if feature:
-                selected_features.add(feature)
-
-        return list(selected_features)
+            rows = PropertyTableManager.get_selected_row_indices(table)
+            values = [PropertyTableManager.get_cell_data(table, row, 0, role=Qt.UserRole) for row in rows]
+        else:
+            items = sorted(table.selectedItems() or [], key=lambda item: (item.row(), item.column()))
+            values = [item.data(Qt.UserRole) for item in items]
+        return PropertyTableManager._unique_ids(values)
 
     @staticmethod
-    def get_all_features(table=None):
-        """Get all feature payloads currently visible in the table."""
+    def get_all_feature_ids(table=None) -> list[int]:
+        """Unique feature ids of all rows currently in the table."""
         if not table:
             return []
+        values = [
+            PropertyTableManager.get_cell_data(table, row, 0, role=Qt.UserRole)
+            for row in range(PropertyTableManager.row_count(table))
+        ]
+        return PropertyTableManager._unique_ids(values)
 
-        features = []
-        seen = set()
+    @staticmethod
+    def get_selected_features(table=None, *, layer=None):
+        """Fetch the selected rows' features (with geometry) from the import layer."""
+        return PropertyFeatureFetcher.fetch(PropertyTableManager.get_selected_feature_ids(table), layer=layer)
 
-        def _feature_key(feature):
-            try:
-                return ("fid", int(feature.id()))
-            except Exception:
-                return ("obj", id(feature))
+    @staticmethod
+    def get_all_features(table=None, *, layer=None):
+        """Fetch all rows' features (with geometry) from the import layer."""
+        return PropertyFeatureFetcher.fetch(PropertyTableManager.get_all_feature_ids(table), layer=layer)
 
-        for row in range(PropertyTableManager.row_count(table)):
-            feature = PropertyTableManager.get_cell_data(table, row, 0, role=Qt.UserRole)
-            if not feature:
+    @staticmethod
+    def _unique_ids(values) -> list[int]:
+        ids: list[int] = []
+        seen: set[int] = set()
+        for value in values:
+            if value is None:
                 continue
-            key = _feature_key(feature)
-            if key in seen:
+            try:
+                fid = int(value)
+            except (TypeError, ValueError):
                 continue
-            seen.add(key)
-            features.append(feature)
-
-        return features
+            if fid in seen:
+                continue
+            seen.add(fid)
+            ids.append(fid)
+        return ids
 
     @staticmethod
     def get_selected_row_indices(table) -> list[int]:
@@ -291,11 +288,18 @@ class PropertyTableManager:
 
     @staticmethod
     def get_payload_field_value(table, row: int, payload_col: int, field_key: object, *, role=Qt.UserRole) -> Any:
-        """Read a field value from the payload stored in a table cell.
+        """Read a field value kept for a table row.
 
-        Supports QgsFeature and other dict-like payloads implementing `__getitem__`.
+        Rows keep compare attributes (e.g. muudet) in `PropertyTableModel.ATTRIBUTES_ROLE`;
+        other payloads implementing `__getitem__` are read directly.
         """
 
+        attributes = PropertyTableManager.get_cell_data(
+            table, row, payload_col, role=PropertyTableModel.ATTRIBUTES_ROLE
+        )
+        if isinstance(attributes, dict) and field_key in attributes:
+            return attributes.get(field_key)
+
         payload = PropertyTableManager.get_cell_data(table, row, payload_col, role=role)
         if payload is None:
             return None
@@ -391,7 +395,10 @@ class PropertyTableManager:
                         "address": PropertyTableManager.get_cell_text(source_table, src_row_idx, 1),
                         "area": PropertyTableManager.get_cell_text(source_table, src_row_idx, 2),
                         "settlement": PropertyTableManager.get_cell_text(source_table, src_row_idx, 3),
-                        "feature": PropertyTableManager.get_cell_data(source_table, src_row_idx, 0, role=Qt.UserRole),
+                        "fid": PropertyTableManager.get_cell_data(source_table, src_row_idx, 0, role=Qt.UserRole),
+                        "attributes": PropertyTableManager.get_cell_data(
+                            source_table, src_row_idx, 0, role=PropertyTableModel.ATTRIBUTES_ROLE
+                        ),
                     }
                 )
 
@@ -0,0 +1,238 @@
+"""County → municipality → settlement → feature id index for the import layer.
+
+Built once per layer in a single attribute-only pass and kept per layer id;
+any data change on the layer drops it together with its sidecar. File-backed
+layers also get a JSON sidecar next to their data source, so re-opening the
+project does not need another pass while the source file (and its SQLite
+write-ahead log) is unchanged.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from qgis.core import QgsFeatureRequest
+
+from ...constants.cadastral_fields import Katastriyksus
+from ...Logs.python_fail_logger import PythonFailLogger
+
+
+class PropertyLocationIndex:
+    """Location hierarchy of one layer; lookups cost O(result), not O(layer)."""
+
+    FORMAT_VERSION = 1
+    SIDECAR_SUFFIX = ".location_index.json"
+
+    _lock = threading.Lock()
+    _by_layer: Dict[str, "PropertyLocationIndex"] = {}
+    _watched: set = set()
+
+    def __init__(self, tree: Dict[str, Dict[str, Dict[str, List[int]]]]):
+        self._tree = tree
+
+    # --- Lookups -----------------------------------------------------------
+
+    def counties(self) -> List[str]:
+        return sorted(county for county in self._tree if county)
+
+    def municipalities(self, county_name) -> List[str]:
+        county = self._tree.get(self._key(county_name), {})
+        return sorted(municipality for municipality in county if municipality)
+
+    def settlements(self, county_name, municipality_name) -> List[str]:
+        county = self._tree.get(self._key(county_name), {})
+        municipality = county.get(self._key(municipality_name), {})
+        return sorted(settlement for settlement in municipality if settlement)
+
+    def feature_ids(self, *, county_name=None, municipality_name=None, settlements=None) -> List[int]:
+        """Feature ids in scope; a missing level matches everything, no level matches nothing."""
+        county_key = self._key(county_name)
+        municipality_key = self._key(municipality_name)
+        settlement_keys = {self._key(v) for v in (settlements or []) if self._key(v)}
+        if not (county_key or municipality_key or settlement_keys):
+            return []
+
+        counties = [self._tree.get(county_key, {})] if county_key else self._tree.values()
+        fids: List[int] = []
+        for county in counties:
+            municipalities = [county.get(municipality_key, {})] if municipality_key else county.values()
+            for municipality in municipalities:
+                for settlement, ids in municipality.items():
+                    if not settlement_keys or settlement in settlement_keys:
+                        fids.extend(ids)
+        return fids
+
+    # --- Registry ----------------------------------------------------------
+
+    @classmethod
+    def for_layer(cls, layer) -> "PropertyLocationIndex":
+        """Index of ``layer``: cached, else read from its sidecar, else built now."""
+        layer_id = layer.id()
+        with cls._lock:
+            index = cls._by_layer.get(layer_id)
+        if index is not None:
+            return index
+
+        # With unsaved edits the file on disk is not what the layer shows: skip the sidecar
+        signature = None if layer.isModified() else cls._signature(layer)
+        index = cls._load_sidecar(layer, signature)
+        if index is None:
+            index = cls.build(layer)
+            cls._save_sidecar(layer, signature, index)
+
+        cls._watch(layer)
+        with cls._lock:
+            cls._by_layer[layer_id] = index
+        return index
+
+    @classmethod
+    def invalidate(cls, layer_id: str) -> None:
+        with cls._lock:
+            cls._by_layer.pop(layer_id, None)
+
+    @classmethod
+    def build(cls, layer) -> "PropertyLocationIndex":
+        """One pass without geometry, reading only the three location columns."""
+        fields = layer.fields()
+        names = (Katastriyksus.mk_nimi, Katastriyksus.ov_nimi, Katastriyksus.ay_nimi)
+        idxs = [fields.lookupField(name) for name in names]
+        if -1 in idxs:
+            missing = [name for name, idx in zip(names, idxs) if idx == -1]
+            raise ValueError(f"Location fields missing on layer '{layer.name()}': {', '.join(missing)}")
+
+        req = QgsFeatureRequest()
+        req.setFlags(QgsFeatureRequest.NoGeometry)
+        req.setSubsetOfAttributes(idxs)
+
+        county_idx, municipality_idx, settlement_idx = idxs
+        tree: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+        for feat in layer.getFeatures(req):
+            attrs = feat.attributes()
+            county = tree.setdefault(cls._key(attrs[county_idx]), {})
+            municipality = county.setdefault(cls._key(attrs[municipality_idx]), {})
+            municipality.setdefault(cls._key(attrs[settlement_idx]), []).append(int(feat.id()))
+        return cls(tree)
+
+    # --- Internals ---------------------------------------------------------
+
+    @staticmethod
+    def _key(value) -> str:
+        if value is None:
+            return ""
+        text = str(value).strip()
+        return "" if text.upper() == "NULL" else text
+
+    @classmethod
+    def _watch(cls, layer) -> None:
+        layer_id = layer.id()
+        with cls._lock:
+            if layer_id in cls._watched:
+                return
+            cls._watched.add(layer_id)
+
+        source_path = cls._source_path(layer)
+        sidecar = source_path + cls.SIDECAR_SUFFIX if source_path else None
+
+        def _changed() -> None:
+            cls.invalidate(layer_id)
+            cls._remove_sidecar(sidecar)
+
+        def _forget() -> None:
+            cls.invalidate(layer_id)
+            with cls._lock:
+                cls._watched.discard(layer_id)
+
+        layer.dataChanged.connect(_changed)
+        layer.willBeDeleted.connect(_forget)
+
+    @staticmethod
+    def _source_path(layer) -> Optional[str]:
+        if layer.providerType() != "ogr":
+            return None
+        path = layer.source().split("|", 1)[0]
+        return path if os.path.isfile(path) else None
+
+    @classmethod
+    def _signature(cls, layer) -> Optional[dict]:
+        """Identity of the layer's current on-disk content; None when not file-backed."""
+        path = cls._source_path(layer)
+        if path is None:
+            return None
+        stat = os.stat(path)
+        # Committed GeoPackage edits can sit in the -wal file with the main file untouched.
+        wal_path = f"{path}-wal"
+        wal = os.stat(wal_path) if os.path.isfile(wal_path) else None
+        return {
+            "source": layer.source(),
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "wal": [wal.st_mtime, wal.st_size] if wal is not None else None,
+            "features": int(layer.featureCount()),
+            "fields": [Katastriyksus.mk_nimi, Katastriyksus.ov_nimi, Katastriyksus.ay_nimi],
+        }
+
+    @classmethod
+    def _load_sidecar(cls, layer, signature: Optional[dict]) -> Optional["PropertyLocationIndex"]:
+        if signature is None:
+            return None
+        sidecar = cls._source_path(layer) + cls.SIDECAR_SUFFIX
+        if not os.path.isfile(sidecar):
+            return None
+        try:
+            with open(sidecar, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="property",
+                event="location_index_sidecar_read_failed",
+                extra={"path": sidecar},
+            )
+            return None
+        if payload.get("version") != cls.FORMAT_VERSION or payload.get("signature") != signature:
+            return None
+        return cls(payload.get("tree") or {})
+
+    @staticmethod
+    def _remove_sidecar(sidecar: Optional[str]) -> None:
+        if not sidecar:
+            return
+        try:
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+        except OSError as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="property",
+                event="location_index_sidecar_remove_failed",
+                extra={"path": sidecar},
+            )
+
+    @classmethod
+    def _save_sidecar(cls, layer, signature: Optional[dict], index: "PropertyLocationIndex") -> None:
+        if signature is None:
+            return
+        sidecar = cls._source_path(layer) + cls.SIDECAR_SUFFIX
+        tmp_path = f"{sidecar}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(
+                    {"version": cls.FORMAT_VERSION, "signature": signature, "tree": index._tree},
+                    handle,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, sidecar)
+        except Exception as exc:
+            PythonFailLogger.log_exception(
+                exc,
+                module="property",
+                event="location_index_sidecar_write_failed",
+                extra={"path": sidecar},
+            )
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
+
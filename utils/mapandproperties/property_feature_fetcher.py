@@ -0,0 +1,60 @@
+from typing import Iterable, Iterator, List, Optional
+
+from qgis.core import QgsFeatureRequest
+
+from ...constants.layer_constants import IMPORT_PROPERTY_TAG
+from ...Logs.python_fail_logger import PythonFailLogger
+from ..MapTools.MapHelpers import MapHelpers
+
+
+class PropertyFeatureFetcher:
+    """Materialize import-layer features (with geometry) by id, batch by batch.
+
+    Property table rows keep only feature ids and display text; flows that
+    need the full feature (add, copy to map) fetch it here when they run.
+    """
+
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def iter_batches(
+        feature_ids: Iterable[int],
+        *,
+        layer=None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List]:
+        """Yield lists of features in the order of ``feature_ids``; ids not found are skipped."""
+        layer = layer or MapHelpers.get_layer_by_tag(IMPORT_PROPERTY_TAG)
+        if layer is None:
+            return
+        size = max(1, int(batch_size or PropertyFeatureFetcher.BATCH_SIZE))
+
+        chunk: List[int] = []
+        for fid in feature_ids or []:
+            if fid is None:
+                continue
+            chunk.append(int(fid))
+            if len(chunk) >= size:
+                yield PropertyFeatureFetcher._fetch_chunk(layer, chunk)
+                chunk = []
+        if chunk:
+            yield PropertyFeatureFetcher._fetch_chunk(layer, chunk)
+
+    @staticmethod
+    def fetch(feature_ids: Iterable[int], *, layer=None, batch_size: Optional[int] = None) -> List:
+        features: List = []
+        for batch in PropertyFeatureFetcher.iter_batches(feature_ids, layer=layer, batch_size=batch_size):
+            features.extend(batch)
+        return features
+
+    @staticmethod
+    def _fetch_chunk(layer, feature_ids: List[int]) -> List:
+        request = QgsFeatureRequest().setFilterFids(feature_ids)
+        by_id = {int(feature.id()): feature for feature in layer.getFeatures(request)}
+        if len(by_id) < len(set(feature_ids)):
+            PythonFailLogger.log(
+                "property_feature_fetch_missing",
+                module="property",
+                extra={"requested": len(feature_ids), "found": len(by_id), "layer": layer.name()},
+            )
+        return [by_id[fid] for fid in feature_ids if fid in by_id]
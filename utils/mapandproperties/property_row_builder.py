@@ -24,15 +24,39 @@ class PropertyRowBuilder:
             warn(f"{log_prefix}: failed to stringify field '{field_key}': {exc}")
             return ""
 
+    @staticmethod
+    def _raw_attr(feature, field_key):
+        try:
+            if feature.fields().lookupField(field_key) == -1:
+                return None
+            return feature[field_key]
+        except Exception:
+            return None
+
+    @staticmethod
+    def _feature_id(feature):
+        try:
+            fid = int(feature.id())
+        except Exception:
+            return None
+        # QgsFeature() without a provider id reports a negative/FID_NULL id.
+        return fid if fid >= 0 else None
+
     @staticmethod
     def row_from_feature(feature, *, log_prefix: str = "PropertyRowBuilder") -> Dict[str, Any]:
+        """Display row for the property table.
+
+        Keeps only the feature id and the attributes the table shows or compares;
+        the feature itself (and its geometry) is fetched again by id when needed.
+        """
         if feature is None:
             return {
                 "cadastral_id": "",
                 "address": "",
                 "area": "",
                 "settlement": "",
-                "feature": None,
+                "fid": None,
+                "attributes": {},
             }
 
         return {
@@ -40,7 +64,10 @@ class PropertyRowBuilder:
             "address": PropertyRowBuilder._safe_attr(feature, Katastriyksus.l_aadress, log_prefix=log_prefix),
             "area": PropertyRowBuilder._safe_attr(feature, Katastriyksus.pindala, log_prefix=log_prefix),
             "settlement": PropertyRowBuilder._safe_attr(feature, Katastriyksus.ay_nimi, log_prefix=log_prefix),
-            "feature": feature,
+            "fid": PropertyRowBuilder._feature_id(feature),
+            "attributes": {
+                Katastriyksus.muudet: PropertyRowBuilder._raw_attr(feature, Katastriyksus.muudet),
+            },
         }
 
     @staticmethod
@@ -8,6 +8,11 @@ from ...constants.base_paths import PLUGIN_ROOT, RESOURCE, ICON_FOLDER
 
 
 class PropertyTableModel(QAbstractTableModel):
+    """Property rows: display text, status icons, feature id (UserRole) and compare attributes."""
+
+    # Column 0 only: dict of non-display attributes kept for checks (e.g. muudet).
+    ATTRIBUTES_ROLE = Qt.UserRole + 1
+
     def __init__(self, headers: list[str], parent=None):
         super().__init__(parent)
         self._headers = headers
@@ -60,7 +65,12 @@ class PropertyTableModel(QAbstractTableModel):
 
         if role == Qt.UserRole:
             if col == 0:
-                return row_data.get("feature")
+                return row_data.get("fid")
+            return None
+
+        if role == self.ATTRIBUTES_ROLE:
+            if col == 0:
+                return row_data.get("attributes") or {}
             return None
 
         if col <= 3:
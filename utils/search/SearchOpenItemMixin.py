@@ -20,10 +20,10 @@ class SearchOpenItemMixin:
                 buffer.clear()
 
         clear_feed = getattr(self, "clear_feed", None)
-        feed_layout = getattr(self, "feed_layout", None)
+        feed_view = getattr(self, "feed_view", None)
         empty_state = getattr(self, "_empty_state", None)
-        if callable(clear_feed) and feed_layout is not None:
-            clear_feed(feed_layout, empty_state)
+        if callable(clear_feed) and feed_view is not None:
+            clear_feed(feed_view, empty_state)
 
         feed_logic = getattr(self, "feed_logic", None)
         feed_logic_cls = getattr(self, "FEED_LOGIC_CLS", None)
@@ -756,7 +756,7 @@ class AddPropertyDialog(QDialog):
         try:
             for index in table.selectionModel().selectedRows():
                 feature = PropertyTableManager.get_cell_data(table, index.row(), 0, role=Qt.UserRole)
-                if feature:
+                if feature is not None:
                     selected_features.add(feature)
         except Exception as exc:
             PythonFailLogger.log_exception(
@@ -330,38 +330,18 @@ class StatusWidget(QWidget):
     def _replace_current_card(self, item_data: dict) -> None:
         if self._is_deleted(self):
             return
-        card = self._find_parent_card()
-        if self._is_deleted(card):
-            return
-
-        container = card.parentWidget()
-        if self._is_deleted(container):
-            return
-        layout = container.layout() if container is not None else None
-        insert_widget = getattr(layout, "insertWidget", None)
-        remove_widget = getattr(layout, "removeWidget", None)
-        index_of = getattr(layout, "indexOf", None)
-        if not callable(insert_widget) or not callable(remove_widget) or not callable(index_of):
-            return
-
-        index = index_of(card)
-        if index < 0:
+        feed_view = self._find_parent_feed_view()
+        if feed_view is None:
             return
 
         try:
-            from ...ui.module_card_factory import ModuleCardFactory
+            from ...python.feed_records import FeedRecordDecoder
 
-            replacement = ModuleCardFactory.create_item_card(
-                item_data,
-                module_name=self._module_name,
-                lang_manager=self._lang,
-            )
-            container.setUpdatesEnabled(False)
-            remove_widget(card)
-            card.hide()
-            card.setParent(None)
-            insert_widget(index, replacement)
-            card.deleteLater()
+            record = FeedRecordDecoder.decode(item_data)
+            if record is None:
+                return
+            # The row update repaints the collapsed row and rebuilds the expanded card (this one).
+            feed_view.feed_model().update_items([record])
         except Exception as exc:
             PythonFailLogger.log_exception(
                 exc,
@@ -369,15 +349,13 @@ class StatusWidget(QWidget):
                 event="status_widget_replace_card_failed",
                 extra={"item_id": str(item_data.get("id") or "")},
             )
-        finally:
-            if not self._is_deleted(container):
-                container.setUpdatesEnabled(True)
 
-    def _find_parent_card(self) -> Optional[QFrame]:
+    def _find_parent_feed_view(self):
+        from ...ui.feed_list_view import FeedListView
+
         current = self.parentWidget()
         while current is not None:
-            if isinstance(current, QFrame) and current.objectName() == "ModuleInfoCard":
+            if isinstance(current, FeedListView):
                 return current
             current = current.parentWidget()
         return None
-
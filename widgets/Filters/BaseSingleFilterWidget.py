@@ -23,6 +23,7 @@ from ...utils.FilterHelpers.FilterHelper import FilterHelper
 from ...utils.logger import error
 from ...modules.Settings.SettinsUtils.SettingsLogic import SettingsLogic
 from ..theme_manager import ThemeManager
+from .cached_load_mixin import CachedLoadMixin
 from .select_all_checkbox import SelectAllCheckBox
 
 
@@ -226,7 +227,7 @@ class _SimplePickerPopup(QWidget):
         )
 
 
-class BaseSingleFilterWidget(QWidget):
+class BaseSingleFilterWidget(CachedLoadMixin, QWidget):
     """Shared base for single-combo filters (status/tags)."""
 
     selectionChanged = pyqtSignal(list, list)
@@ -381,14 +382,19 @@ class BaseSingleFilterWidget(QWidget):
         token = self._current_token()
         request_id = self._load_request_id
 
+        # Paint the options stored on disk right away, then revalidate them off the UI thread.
+        cached = FilterHelper.cached_filter_edges(self._support_key, self._module)
+        if cached is not None:
+            self._handle_load_success(cached, token, request_id)
+
         worker = FunctionWorker(
-            lambda: FilterHelper.get_filter_edges_by_key_and_module(
+            lambda: FilterHelper.refresh_filter_edges(
                 self._support_key, self._module
             )
         )
         worker.active_token = token
         worker.finished.connect(
-            lambda payload, tok=token, req=request_id: self._handle_load_success(payload, tok, req)
+            lambda result, tok=token, req=request_id: self._handle_load_refreshed(result, tok, req)
         )
         worker.error.connect(
             lambda message, tok=token, req=request_id: self._handle_load_error(message, tok, req)
@@ -408,6 +414,8 @@ class BaseSingleFilterWidget(QWidget):
             return
         if not self._is_token_active(token):
             return
+        # A silent refresh over cached options keeps what the user has ticked since.
+        current_ids = FilterHelper.selected_ids(self) if self._loaded else None
         self.combo.clear()
         for label, value in payload:
             self.combo.addItem(label, value)
@@ -416,7 +424,9 @@ class BaseSingleFilterWidget(QWidget):
         self._control.setEnabled(True)
         self._loaded = True
         self.all_cb.setEnabled(True)
-        if callable(self._selected_ids_loader):
+        if current_ids is not None:
+            saved_ids = current_ids
+        elif callable(self._selected_ids_loader):
             try:
                 saved_ids = self._selected_ids_loader() or []
             except Exception:
@@ -440,6 +450,8 @@ class BaseSingleFilterWidget(QWidget):
             return
         if not self._is_token_active(token):
             return
+        if self._loaded:
+            return  # keep the cached options when revalidation fails
         self.combo.clear()
         self.combo.addItem(f"{self._lang.translate(TranslationKeys.ERROR)}: {message[:60]}…")
         self.combo.setEnabled(False)
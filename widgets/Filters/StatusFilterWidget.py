@@ -15,9 +15,10 @@ from ...python.workers import FunctionWorker, start_worker
 from ...utils.FilterHelpers.FilterHelper import FilterHelper
 from ...utils.url_manager import ModuleSupports
 from ..status_select_widget import StatusMultiSelectWidget
+from .cached_load_mixin import CachedLoadMixin
 
 
-class StatusFilterWidget(QWidget):
+class StatusFilterWidget(CachedLoadMixin, QWidget):
     """Status-specific filter backed by the custom status multi-select."""
 
     selectionChanged = pyqtSignal(list, list)
@@ -129,10 +130,16 @@ class StatusFilterWidget(QWidget):
         token = self._current_token()
         request_id = self._load_request_id
 
-        worker = FunctionWorker(lambda: APIModuleActions.get_module_status_options(str(self._module or "")))
+        module_name = str(self._module or "")
+        # Paint the statuses stored on disk right away, then revalidate them off the UI thread.
+        cached = APIModuleActions.peek_module_status_options(module_name)
+        if cached is not None:
+            self._handle_load_success(cached, token, request_id)
+
+        worker = FunctionWorker(lambda: APIModuleActions.refresh_module_status_options(module_name))
         worker.active_token = token
         worker.finished.connect(
-            lambda payload, tok=token, req=request_id: self._handle_load_success(payload, tok, req)
+            lambda result, tok=token, req=request_id: self._handle_load_refreshed(result, tok, req)
         )
         worker.error.connect(
             lambda message, tok=token, req=request_id: self._handle_load_error(message, tok, req)
@@ -154,7 +161,8 @@ class StatusFilterWidget(QWidget):
             return
 
         status_options = [entry for entry in (payload or []) if isinstance(entry, dict)]
-        selected_ids = self._initial_selected_ids()
+        # A silent refresh over cached statuses keeps what the user has ticked since.
+        selected_ids = self.selected_ids() if self._loaded else self._initial_selected_ids()
 
         self.selector.set_options(status_options, selected_ids=selected_ids)
         self.selector.setEnabled(bool(status_options))
@@ -169,6 +177,8 @@ class StatusFilterWidget(QWidget):
             return
         if not self._is_token_active(token):
             return
+        if self._loaded:
+            return  # keep the cached statuses when revalidation fails
         error_text = self._lang.translate(TranslationKeys.ERROR)
         self.selector.set_error(f"{error_text}: {str(message or '')[:60]}...")
         self._loaded = False
@@ -25,6 +25,7 @@ from ...utils.FilterHelpers.FilterHelper import FilterHelper
 from ...utils.logger import error
 from ...modules.Settings.SettinsUtils.SettingsLogic import SettingsLogic
 from ..theme_manager import ThemeManager
+from .cached_load_mixin import CachedLoadMixin
 from .select_all_checkbox import SelectAllCheckBox
 
 
@@ -285,7 +286,7 @@ class _TypePickerPopup(QWidget):
         )
 
 
-class TypeFilterWidget(QWidget):
+class TypeFilterWidget(CachedLoadMixin, QWidget):
     """Simple group/type multi-select without shared base class."""
 
     selectionChanged = pyqtSignal(list, list)
@@ -664,10 +665,15 @@ class TypeFilterWidget(QWidget):
         request_id = self._load_request_id
 
         key = ModuleSupports.TYPES.value
-        worker = FunctionWorker(lambda: FilterHelper.get_filter_edges_by_key_and_module(key, self._module))
+        # Paint the types stored on disk right away, then revalidate them off the UI thread.
+        cached = FilterHelper.cached_filter_edges(key, self._module)
+        if cached is not None:
+            self._handle_load_success(cached, token, request_id)
+
+        worker = FunctionWorker(lambda: FilterHelper.refresh_filter_edges(key, self._module))
         worker.active_token = token
         worker.finished.connect(
-            lambda payload, tok=token, req=request_id: self._handle_types_loaded(payload, tok, req)
+            lambda result, tok=token, req=request_id: self._handle_load_refreshed(result, tok, req)
         )
         worker.error.connect(
             lambda message, tok=token, req=request_id: self._handle_types_failed(message, tok, req)
@@ -675,7 +681,7 @@ class TypeFilterWidget(QWidget):
         self._worker = worker
         self._worker_thread = start_worker(worker, on_thread_finished=self._cleanup_worker)
 
-    def _handle_types_loaded(
+    def _handle_load_success(
         self,
         payload: List[Dict[str, Optional[str]]],
         token: int | None,
@@ -687,6 +693,8 @@ class TypeFilterWidget(QWidget):
             return
         if not self._is_token_active(token):
             return
+        # A silent refresh over cached types keeps what the user has ticked since.
+        current_ids = list(self.selected_ids()) if self._loaded else None
         self.type_combo.clear()
         self.group_combo.clear()
         self._group_map.clear()
@@ -717,6 +725,8 @@ class TypeFilterWidget(QWidget):
         self._loaded = True
         self.all_cb.setEnabled(True)
         self._apply_preferred_types()
+        if current_ids is not None:
+            self.set_selected_ids(current_ids, emit=False)
         if self._pending_type_ids:
             pending_ids = list(self._pending_type_ids)
             self.set_selected_ids(pending_ids, emit=False)
@@ -733,6 +743,8 @@ class TypeFilterWidget(QWidget):
             return
         if not self._is_token_active(token):
             return
+        if self._loaded:
+            return  # keep the cached types when revalidation fails
         self.group_combo.clear()
         self.type_combo.clear()
         self.group_combo.addItem(f"Error: {message[:40]}...")
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+
+class CachedLoadMixin:
+    """Revalidation step shared by filters that paint cached options first.
+
+    The combining widget keeps `_loaded` and implements
+    `_handle_load_success(payload, token, request_id)`; a background refresh
+    returns `(payload, changed)` and only repaints when the options changed
+    or nothing was painted yet.
+    """
+
+    def _handle_load_refreshed(
+        self,
+        result: Tuple[Any, bool],
+        token: int | None,
+        request_id: int,
+    ) -> None:
+        payload, changed = result
+        if changed or not self._loaded:
+            self._handle_load_success(payload, token, request_id)
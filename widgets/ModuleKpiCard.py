@@ -512,6 +512,28 @@ class ModuleKpiCard(QFrame):
             include_breakdown=self.show_breakdown,
         )
 
+    def kpi_spec(self) -> dict[str, object] | None:
+        """Spec for ``ModuleKpiService.fetch_snapshots``; None when the card needs no fetch."""
+        if self.snapshot_override is not None:
+            return None
+        return {
+            "module_key": self.module_key,
+            "query_name": self.query_name,
+            "include_due_counts": self.show_breakdown,
+        }
+
+    def show_loading(self) -> None:
+        self._cancel_worker()
+        self._set_loading_state()
+
+    def show_snapshot(self, snapshot) -> None:
+        """Apply a snapshot fetched by the page-level batch request."""
+        self._cancel_worker()
+        if not snapshot or snapshot.get("error"):
+            self._gauge.set_error_state()
+            return
+        self._apply_snapshot(snapshot)
+
     def refresh(self) -> None:
         if self.snapshot_override is not None:
             self._cancel_worker()
@@ -528,8 +550,6 @@ class ModuleKpiCard(QFrame):
                 ModuleKpiService.fetch_snapshot,
                 self.module_key,
                 self.query_name,
-                self.lang_manager,
-                root_field=self.root_field,
                 include_due_counts=self.show_breakdown,
             )
         )
@@ -298,10 +298,10 @@ class OverdueDueSoonPillsActionHelper:
         if where_has_filter is not None:
             feed_logic.set_extra_arguments(whereHas=where_has_filter)
 
-        feed_layout = getattr(module, "feed_layout", None)
+        feed_view = getattr(module, "feed_view", None)
         empty_state = getattr(module, "_empty_state", None)
         if hasattr(module, "clear_feed"):
-            module.clear_feed(feed_layout, empty_state)
+            module.clear_feed(feed_view, empty_state)
 
         scroll_area = getattr(module, "scroll_area", None)
         if scroll_area is not None and scroll_area.verticalScrollBar() is not None:
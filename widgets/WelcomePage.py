@@ -1,9 +1,11 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QFrame
 from ..languages.language_manager import LanguageManager
+from ..python.workers import FunctionWorker, start_worker
 from ..ui.mixins.token_mixin import TokenMixin
 from ..utils.url_manager import Module
 from ..widgets.theme_manager import ThemeManager
 from .ModuleKpiCard import ModuleKpiCard
+from .module_kpi_service import ModuleKpiService
 
 
 class WelcomePage(TokenMixin, QWidget):
@@ -14,6 +16,8 @@ class WelcomePage(TokenMixin, QWidget):
         self.setObjectName("WelcomePage")
         self.lang_manager = lang_manager or LanguageManager()
         self._kpi_cards = []
+        self._kpi_worker = None
+        self._kpi_worker_thread = None
 
         self._kpi_grid = QGridLayout()
         self._kpi_grid.setContentsMargins(0, 0, 0, 0)
@@ -91,12 +95,55 @@ class WelcomePage(TokenMixin, QWidget):
         self.retheme()
 
     def activate(self):
+        token = self.mark_activated()
+        specs = []
         for card in self._kpi_cards:
-            refresh = getattr(card, "refresh", None)
-            if callable(refresh):
-                refresh()
+            spec = card.kpi_spec()
+            if spec is None:
+                card.refresh()
+                continue
+            card.show_loading()
+            specs.append(spec)
+        self._detach_kpi_worker()
+        if not specs:
+            return
+
+        worker = FunctionWorker(ModuleKpiService.fetch_snapshots, specs)
+        worker.token = token
+        worker.finished.connect(self._handle_kpi_success)
+        worker.error.connect(self._handle_kpi_error)
+        self._kpi_worker = worker
+        self._kpi_worker_thread = start_worker(worker)
+
+    def _handle_kpi_success(self, snapshots) -> None:
+        self._apply_kpi_snapshots(snapshots or {})
+
+    def _handle_kpi_error(self, _message: str) -> None:
+        self._apply_kpi_snapshots({})
+
+    def _apply_kpi_snapshots(self, snapshots: dict) -> None:
+        worker = self._kpi_worker
+        self._detach_kpi_worker()
+        if worker is None or not self.is_token_active(getattr(worker, "token", None)):
+            return
+        for card in self._kpi_cards:
+            if card.kpi_spec() is not None:
+                card.show_snapshot(snapshots.get(card.module_key))
+
+    def _detach_kpi_worker(self) -> None:
+        worker = self._kpi_worker
+        if worker is not None:
+            for signal, slot in ((worker.finished, self._handle_kpi_success), (worker.error, self._handle_kpi_error)):
+                try:
+                    signal.disconnect(slot)
+                except Exception:
+                    pass
+        self._kpi_worker = None
+        self._kpi_worker_thread = None
 
     def deactivate(self):
+        self.mark_deactivated()
+        self._detach_kpi_worker()
         for card in self._kpi_cards:
             deactivate = getattr(card, "deactivate", None)
             if callable(deactivate):
@@ -1,38 +1,33 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 from typing import Any
 
-from ..feed.FeedLogic import UnifiedFeedLogic
+from ..Logs.python_fail_logger import PythonFailLogger
 from ..module_manager import ModuleManager
 from ..modules.Settings.SettinsUtils.SettingsLogic import SettingsLogic
+from ..python.api_client import APIClient
+from ..python.GraphQLQueryLoader import GraphQLQueryLoader
+from ..python.graphql_batch import AliasedOperation, alias_operation, build_aliased_document
 from ..utils.FilterHelpers.FilterHelper import FilterHelper
 from ..utils.url_manager import ModuleSupports
 from .OverdueDueSoonPillsWidget import OverdueDueSoonPillsUtils
 
 
 class ModuleKpiService:
-    @staticmethod
-    def _fetch_count(
-        module_key: str,
-        query_name: str,
-        lang_manager,
-        where: dict[str, Any] | None,
-        extra_args: dict[str, Any] | None,
-        root_field: str | None = None,
-    ) -> int:
-        feed_logic = UnifiedFeedLogic(module_key, query_name, lang_manager, batch_size=1, root_field=root_field)
-        feed_logic.set_where(where)
-        if extra_args:
-            feed_logic.set_extra_arguments(**extra_args)
-
-        items = feed_logic.fetch_next_batch() or []
-        if feed_logic.last_error is not None:
-            raise feed_logic.last_error
-
-        total_count = feed_logic.total_count
-        if total_count is None:
-            total_count = len(items)
-        return max(0, int(total_count or 0))
+    """Counts for the welcome page KPI cards.
+
+    Every card's total, overdue and due-soon counts are aliased into one
+    GraphQL document so the whole welcome page costs a single request.
+    Snapshots are cached per filter signature for ``SNAPSHOT_TTL_SECONDS``.
+    """
+
+    SNAPSHOT_TTL_SECONDS = 30.0
+
+    _snapshot_cache: dict[str, tuple[float, dict[str, int]]] = {}
+    _cache_lock = threading.Lock()
 
     @staticmethod
     def _saved_filter_ids(module_key: str, support_key: str) -> list[str]:
@@ -64,50 +59,139 @@ class ModuleKpiService:
         return where, extra_args, active_groups
 
     @staticmethod
-    def fetch_snapshot(
-        module_key: str,
-        query_name: str,
-        lang_manager=None,
-        *,
-        root_field: str | None = None,
-        include_due_counts: bool = True,
-    ) -> dict[str, Any]:
+    def _count_variants(where: dict[str, Any] | None, include_due_counts: bool) -> list[tuple[str, dict[str, Any] | None]]:
+        variants = [("count", where)]
+        if include_due_counts:
+            variants.append(("overdue_count", OverdueDueSoonPillsUtils.build_overdue_where(where)))
+            variants.append(("due_soon_count", OverdueDueSoonPillsUtils.build_due_soon_where(where)))
+        return variants
+
+    @staticmethod
+    def _total_from_root(root: Any) -> int:
+        if not isinstance(root, dict):
+            return 0
+        total = root.get("totalCount")
+        if total is None:
+            total = (root.get("pageInfo") or {}).get("total")
+        if total is None:
+            total = len(root.get("edges") or [])
+        return max(0, int(total or 0))
+
+    @staticmethod
+    def _plan(index: int, spec: dict[str, Any]) -> dict[str, Any]:
+        module_key = str(spec.get("module_key") or "").strip().lower()
+        query_name = spec.get("query_name")
+        include_due_counts = bool(spec.get("include_due_counts", True))
         where, extra_args, active_groups = ModuleKpiService._build_filters(module_key)
-        total_count = ModuleKpiService._fetch_count(
-            module_key,
-            query_name,
-            lang_manager,
-            where,
-            extra_args,
-            root_field=root_field,
+        variants = ModuleKpiService._count_variants(where, include_due_counts)
+        signature = json.dumps(
+            [module_key, query_name, [variant_where for _, variant_where in variants], extra_args],
+            sort_keys=True,
+            default=str,
         )
+        return {
+            "module_key": module_key,
+            "query_name": query_name,
+            "alias": f"kpi{index}",
+            "variants": variants,
+            "extra_args": extra_args,
+            "active_groups": active_groups,
+            "signature": signature,
+        }
 
-        overdue_count = 0
-        due_soon_count = 0
-        if include_due_counts and total_count > 0:
-            overdue_where = OverdueDueSoonPillsUtils.build_overdue_where(where)
-            due_soon_where = OverdueDueSoonPillsUtils.build_due_soon_where(where)
-            overdue_count = ModuleKpiService._fetch_count(
-                module_key,
-                query_name,
-                lang_manager,
-                overdue_where,
-                extra_args,
-                root_field=root_field,
-            )
-            due_soon_count = ModuleKpiService._fetch_count(
-                module_key,
-                query_name,
-                lang_manager,
-                due_soon_where,
-                extra_args,
-                root_field=root_field,
-            )
+    @staticmethod
+    def _operations(plan: dict[str, Any]) -> list[AliasedOperation]:
+        query = GraphQLQueryLoader().load_query_by_module(plan["module_key"], plan["query_name"])
+        operations = []
+        for variant, variant_where in plan["variants"]:
+            variables: dict[str, Any] = {"first": 1, **plan["extra_args"]}
+            if variant_where:
+                variables["where"] = variant_where
+            operations.append(alias_operation(query, f"{plan['alias']}_{variant}", variables))
+        return operations
 
+    @staticmethod
+    def _send(plans: list[dict[str, Any]]) -> dict[str, dict[str, int]]:
+        operations = [operation for plan in plans for operation in ModuleKpiService._operations(plan)]
+        document, variables = build_aliased_document("WelcomeKpiSnapshot", operations)
+        data = APIClient().send_query(document, variables) or {}
         return {
-            "count": total_count,
-            "overdue_count": overdue_count,
-            "due_soon_count": due_soon_count,
-            "filtered": bool(active_groups),
-            "filter_groups": active_groups,
+            plan["signature"]: {
+                variant: ModuleKpiService._total_from_root(data.get(f"{plan['alias']}_{variant}"))
+                for variant, _ in plan["variants"]
+            }
+            for plan in plans
         }
+
+    @classmethod
+    def _cached_counts(cls, signature: str) -> dict[str, int] | None:
+        with cls._cache_lock:
+            entry = cls._snapshot_cache.get(signature)
+        if entry is None or time.monotonic() - entry[0] > cls.SNAPSHOT_TTL_SECONDS:
+            return None
+        return entry[1]
+
+    @classmethod
+    def _store_counts(cls, counts_by_signature: dict[str, dict[str, int]]) -> None:
+        now = time.monotonic()
+        with cls._cache_lock:
+            for signature, counts in counts_by_signature.items():
+                cls._snapshot_cache[signature] = (now, counts)
+
+    @classmethod
+    def fetch_snapshots(cls, specs: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Snapshots keyed by module key for every spec, fetched with one request.
+
+        Each spec carries ``module_key``, ``query_name`` and ``include_due_counts``.
+        If the combined document fails, modules are retried one by one so a
+        single broken query only blanks its own card; those snapshots carry
+        an ``error`` message instead of counts.
+        """
+        plans = [cls._plan(index, spec) for index, spec in enumerate(specs or [])]
+        counts_by_signature: dict[str, dict[str, int]] = {}
+        errors: dict[str, str] = {}
+        pending = []
+        for plan in plans:
+            cached = cls._cached_counts(plan["signature"])
+            if cached is not None:
+                counts_by_signature[plan["signature"]] = cached
+            else:
+                pending.append(plan)
+
+        if pending:
+            try:
+                fetched = cls._send(pending)
+            except Exception as exc:
+                if len(pending) == 1:
+                    raise
+                PythonFailLogger.log_exception(exc, module="welcome", event="kpi_batch_failed")
+                fetched = {}
+                for plan in pending:
+                    try:
+                        fetched.update(cls._send([plan]))
+                    except Exception as plan_exc:
+                        errors[plan["module_key"]] = str(plan_exc)
+            cls._store_counts(fetched)
+            counts_by_signature.update(fetched)
+
+        snapshots: dict[str, dict[str, Any]] = {}
+        for plan in plans:
+            module_key = plan["module_key"]
+            if module_key in errors:
+                snapshots[module_key] = {"error": errors[module_key]}
+                continue
+            counts = counts_by_signature.get(plan["signature"]) or {}
+            snapshots[module_key] = {
+                "count": counts.get("count", 0),
+                "overdue_count": counts.get("overdue_count", 0),
+                "due_soon_count": counts.get("due_soon_count", 0),
+                "filtered": bool(plan["active_groups"]),
+                "filter_groups": plan["active_groups"],
+            }
+        return snapshots
+
+    @staticmethod
+    def fetch_snapshot(module_key: str, query_name: str, *, include_due_counts: bool = True) -> dict[str, Any]:
+        spec = {"module_key": module_key, "query_name": query_name, "include_due_counts": include_due_counts}
+        snapshots = ModuleKpiService.fetch_snapshots([spec])
+        return snapshots[str(module_key or "").strip().lower()]